@@ -0,0 +1,36 @@
+"""Add call_log_replay_chunks for idempotent Redis log-buffer replay.
+
+``CallLogger.flush_redis_buffer`` replays the Redis log buffer in chunks,
+one transaction each. Every chunk transaction also inserts the chunk's id
+here, so a chunk whose transaction committed but whose in-flight Redis
+list was not cleared (crash in between) is recognized and dropped on the
+next run instead of inserting its turns twice. Rows older than a day are
+pruned by the replay itself.
+
+Revision ID: 059
+Revises: 058
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "059"
+down_revision: str | None = "058"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS call_log_replay_chunks (
+            chunk_id VARCHAR(64) PRIMARY KEY,
+            entries INTEGER NOT NULL,
+            replayed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS call_log_replay_chunks")
@@ -0,0 +1,70 @@
+"""Add call_stats_hourly rollup with its watermark and dirty-hours queue.
+
+``call_stats_hourly`` keeps per-hour, per-tenant call aggregates (sums and
+counts, so averages re-aggregate exactly, plus scenario / transfer-reason
+histograms). ``src.tasks.call_stats_rollup`` recomputes whole hours from
+``calls`` up to the watermark in ``call_stats_rollup_state``; readers
+combine the rollup with a live tail of ``calls`` past the watermark.
+Hours whose calls change after being rolled up (late quality scores) are
+queued in ``call_stats_dirty_hours``.
+
+Revision ID: 060
+Revises: 059
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "060"
+down_revision: str | None = "059"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS call_stats_hourly (
+            bucket TIMESTAMP WITH TIME ZONE NOT NULL,
+            tenant_id UUID,
+            total_calls INTEGER NOT NULL DEFAULT 0,
+            resolved_by_bot INTEGER NOT NULL DEFAULT 0,
+            transferred INTEGER NOT NULL DEFAULT 0,
+            duration_count INTEGER NOT NULL DEFAULT 0,
+            duration_sum BIGINT NOT NULL DEFAULT 0,
+            quality_count INTEGER NOT NULL DEFAULT 0,
+            quality_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+            total_cost_usd DOUBLE PRECISION NOT NULL DEFAULT 0,
+            scenario_counts JSONB NOT NULL DEFAULT '{}',
+            transfer_reasons JSONB NOT NULL DEFAULT '{}'
+        )
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_call_stats_hourly_bucket_tenant
+            ON call_stats_hourly (
+                bucket, COALESCE(tenant_id, '00000000-0000-0000-0000-000000000000'::uuid)
+            )
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_call_stats_hourly_tenant_bucket
+            ON call_stats_hourly (tenant_id, bucket) WHERE tenant_id IS NOT NULL
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS call_stats_rollup_state (
+            name VARCHAR(50) PRIMARY KEY,
+            watermark TIMESTAMP WITH TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+        )
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS call_stats_dirty_hours (
+            bucket TIMESTAMP WITH TIME ZONE PRIMARY KEY
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS call_stats_dirty_hours")
+    op.execute("DROP TABLE IF EXISTS call_stats_rollup_state")
+    op.execute("DROP TABLE IF EXISTS call_stats_hourly")
@@ -0,0 +1,69 @@
+"""Add llm_usage_daily rollup and its dirty-days queue.
+
+``llm_usage_daily`` keeps per-day usage per task type, provider and tenant
+(call and token counts, latency sums). ``src.tasks.llm_usage_rollup``
+recomputes days from ``llm_usage_log`` up to its watermark in
+``call_stats_rollup_state``; the cost API combines the rollup with a live
+tail of the log past the watermark and applies current prices. Days that
+receive rows after being rolled up (usage replayed from the Redis spill
+buffer) are queued in ``llm_usage_dirty_days``. A BRIN index on
+``llm_usage_log.created_at`` keeps the rollup's and the live tail's time
+range scans cheap on the append-only log.
+
+Revision ID: 061
+Revises: 060
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "061"
+down_revision: str | None = "060"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS llm_usage_daily (
+            day DATE NOT NULL,
+            task_type VARCHAR(50) NOT NULL,
+            provider_key VARCHAR(100) NOT NULL,
+            tenant_id UUID,
+            call_count INTEGER NOT NULL DEFAULT 0,
+            input_tokens BIGINT NOT NULL DEFAULT 0,
+            output_tokens BIGINT NOT NULL DEFAULT 0,
+            cached_input_tokens BIGINT NOT NULL DEFAULT 0,
+            latency_count INTEGER NOT NULL DEFAULT 0,
+            latency_sum BIGINT NOT NULL DEFAULT 0
+        )
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_llm_usage_daily_key
+            ON llm_usage_daily (
+                day, task_type, provider_key,
+                COALESCE(tenant_id, '00000000-0000-0000-0000-000000000000'::uuid)
+            )
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_llm_usage_daily_tenant_day
+            ON llm_usage_daily (tenant_id, day) WHERE tenant_id IS NOT NULL
+    """)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS llm_usage_dirty_days (
+            day DATE PRIMARY KEY
+        )
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_llm_usage_log_created_brin
+            ON llm_usage_log USING brin (created_at)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_llm_usage_log_created_brin")
+    op.execute("DROP TABLE IF EXISTS llm_usage_dirty_days")
+    op.execute("DROP TABLE IF EXISTS llm_usage_daily")
+    op.execute("DELETE FROM call_stats_rollup_state WHERE name = 'llm_usage_daily'")
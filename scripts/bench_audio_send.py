@@ -0,0 +1,151 @@
+"""Microbenchmark: per-frame CPU cost of the outbound AudioSocket path.
+
+Three variants are compared:
+
+  legacy   — the previous per-call loop (``struct.pack`` + concat per
+             frame, one ``asyncio.sleep`` pacing timer per call)
+  bytes    — current ``send_audio`` with plain PCM bytes (framed per send)
+  framed   — current ``send_audio`` with a cached ``FramedAudio`` clip
+
+``send_audio`` is paced by the shared audio clock (one 20 ms tick for all
+calls), so the "paced" table also compares per-call timers vs one clock.
+
+Two measurements are printed:
+
+  1. framing — the write path alone (packet build + writer.write), no
+     event loop, so the per-frame cost of framing is visible on its own;
+  2. paced — N concurrent simulated calls playing the clip in real time
+     on one event loop; process CPU time per 20 ms frame, which also
+     includes the pacing wakeups.
+
+Writers are in-process sinks (no sockets), so the numbers isolate the
+Python-side cost from kernel I/O.
+
+Usage:
+
+    python -m scripts.bench_audio_send --calls 100 --clip-sec 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import timeit
+import uuid
+
+from src.core.audio_socket import (
+    AUDIO_FRAME_BYTES,
+    AUDIO_FRAME_DURATION_MS,
+    AUDIO_PACKET_BYTES,
+    AudioSocketConnection,
+    FramedAudio,
+    build_audio_packet,
+    frame_audio_packets,
+)
+
+
+class _SinkWriter:
+    """StreamWriter stand-in that counts bytes and never applies backpressure."""
+
+    def __init__(self) -> None:
+        self.bytes_written = 0
+
+    def write(self, data: bytes | memoryview) -> None:
+        self.bytes_written += len(data)
+
+    async def drain(self) -> None:
+        return None
+
+    def is_closing(self) -> bool:
+        return False
+
+
+async def _legacy_send(writer: _SinkWriter, audio_data: bytes) -> None:
+    """The pre-FramedAudio send loop, kept here as the baseline."""
+    frame_duration = AUDIO_FRAME_DURATION_MS / 1000
+    start_time = time.monotonic()
+    frame_index = 0
+    offset = 0
+    while offset < len(audio_data):
+        chunk = audio_data[offset : offset + AUDIO_FRAME_BYTES]
+        writer.write(build_audio_packet(chunk))
+        await writer.drain()
+        offset += AUDIO_FRAME_BYTES
+        frame_index += 1
+        sleep_for = start_time + frame_index * frame_duration - time.monotonic()
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+
+
+def _framing_ns_per_frame(variant: str, clip: bytes) -> float:
+    """Time only the framing + write calls for one clip, in ns per frame."""
+    writer = _SinkWriter()
+    framed = FramedAudio(clip)
+    framed.packets  # noqa: B018 — warm the cached packets like a replayed clip
+
+    def _legacy() -> None:
+        offset = 0
+        while offset < len(clip):
+            writer.write(build_audio_packet(clip[offset : offset + AUDIO_FRAME_BYTES]))
+            offset += AUDIO_FRAME_BYTES
+
+    def _sliced() -> None:
+        packets = memoryview(framed.packets if variant == "framed" else frame_audio_packets(clip))
+        offset = 0
+        while offset < len(packets):
+            writer.write(packets[offset : offset + AUDIO_PACKET_BYTES])
+            offset += AUDIO_PACKET_BYTES
+
+    fn = _legacy if variant == "legacy" else _sliced
+    frames = -(-len(clip) // AUDIO_FRAME_BYTES)
+    best = min(timeit.repeat(fn, number=50, repeat=5))
+    return best / 50 / frames * 1e9
+
+
+async def _run(variant: str, calls: int, clip: bytes) -> tuple[float, float, int]:
+    """Play *clip* on *calls* simulated connections; return (cpu_s, wall_s, frames)."""
+    framed = FramedAudio(clip)
+    writers = [_SinkWriter() for _ in range(calls)]
+
+    async def _one(writer: _SinkWriter) -> None:
+        if variant == "legacy":
+            await _legacy_send(writer, clip)
+            return
+        conn = AudioSocketConnection(asyncio.StreamReader(), writer, uuid.uuid4())  # type: ignore[arg-type]
+        await conn.send_audio(framed if variant == "framed" else clip)
+
+    cpu0, wall0 = time.process_time(), time.monotonic()
+    await asyncio.gather(*(_one(w) for w in writers))
+    cpu, wall = time.process_time() - cpu0, time.monotonic() - wall0
+    frames = calls * -(-len(clip) // AUDIO_FRAME_BYTES)
+    return cpu, wall, frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--clip-sec", type=float, default=2.0)
+    args = parser.parse_args()
+
+    frames_per_clip = int(args.clip_sec * 1000 / AUDIO_FRAME_DURATION_MS)
+    clip = bytes(range(256)) * (frames_per_clip * AUDIO_FRAME_BYTES // 256 + 1)
+    clip = clip[: frames_per_clip * AUDIO_FRAME_BYTES]
+
+    variants = ("legacy", "bytes", "framed")
+
+    print(f"framing only ({frames_per_clip} frames/clip)")
+    print(f"{'variant':<8} {'ns/frame':>9}")
+    for variant in variants:
+        print(f"{variant:<8} {_framing_ns_per_frame(variant, clip):>9.0f}")
+
+    print()
+    print(f"paced: {args.calls} calls × {frames_per_clip} frames ({args.clip_sec:.1f}s clip)")
+    print(f"{'variant':<8} {'cpu ms':>9} {'wall s':>7} {'µs/frame':>9}")
+    for variant in variants:
+        cpu, wall, frames = asyncio.run(_run(variant, args.calls, clip))
+        print(f"{variant:<8} {cpu * 1000:>9.1f} {wall:>7.2f} {cpu / frames * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""Benchmark: tire search / availability, in-memory catalog index vs PostgreSQL.
+
+Generates a synthetic 1C catalog shaped like the production one — by
+default 50k SKUs over ~120 brands, a few hundred tire sizes with a long-tail
+popularity, three seasons, and stock/prices for both trading networks (some
+SKUs without a stock row or price) — and replays a ``search_tires`` /
+``check_availability`` query mix against it:
+
+* ``size+season`` — the typical call: full size and season, no brand
+  (precomputed answer).
+* ``size`` / ``size+brand`` / ``partial`` (width + diameter + season).
+* ``availability`` — lookup of a random SKU.
+
+Without ``--database`` only the in-memory index is measured (build time and
+per-query latency). With ``--database`` the catalog is also written to a
+scratch schema ``bench_catalog_index`` (copies of ``tire_models``,
+``tire_products`` and ``tire_stock``) and the same queries go through
+``StoreClient._search_tires_db`` without an index; the time of a full
+``CatalogIndexStore.rebuild`` from that database is reported as well. The
+scratch schema is dropped afterwards unless ``--keep`` is given.
+
+Usage::
+
+    python -m scripts.bench_catalog_index --skus 50000 --queries 20000
+
+    # Against PostgreSQL (inside a container that has DATABASE_URL)
+    python -m scripts.bench_catalog_index --database --queries 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+
+from src.store_client.catalog_index import CatalogIndex, CatalogIndexStore
+from src.store_client.client import StoreClient
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_SCHEMA = "bench_catalog_index"
+_NETWORKS = ("ProKoleso", "Tshina")
+_SEASONS = (("summer", 0.45), ("winter", 0.40), ("all_season", 0.15))
+
+
+def _generate(skus: int, seed: int) -> tuple[list[tuple], list[tuple], list[tuple]]:
+    """Models, products and stock rows of a synthetic catalog."""
+    rng = random.Random(seed)
+    brands = [(f"Brand{i:03d}", rng.uniform(0.6, 3.0)) for i in range(120)]  # name, price tier
+    sizes = sorted(
+        {
+            (rng.randrange(155, 320, 10), rng.randrange(30, 85, 5), rng.randrange(13, 23))
+            for _ in range(900)
+        }
+    )
+    size_weights = [1 / (rank + 1) ** 0.9 for rank in range(len(sizes))]
+    seasons, season_weights = zip(*_SEASONS, strict=True)
+
+    models: list[tuple] = []
+    products: list[tuple] = []
+    stock: list[tuple] = []
+    while len(products) < skus:
+        brand, tier = brands[min(int(rng.paretovariate(1.2)) - 1, len(brands) - 1)]
+        model_id = f"m{len(models)}"
+        season = rng.choices(seasons, season_weights)[0]
+        models.append((model_id, f"Model {len(models)}", brand, brand, season))
+        # A model comes in several sizes; popular sizes get more models
+        for width, profile, diameter in set(rng.choices(sizes, size_weights, k=rng.randint(3, 12))):
+            sku = f"{len(products):011d}"
+            size = f"{width}/{profile} R{diameter}"
+            products.append((sku, model_id, diameter, width, profile, size))
+            base = (900 + diameter * 160 + width * 4) * tier
+            for network in _NETWORKS:
+                if rng.random() < 0.15:
+                    continue  # not sold by this network
+                price = None if rng.random() < 0.02 else int(base * rng.uniform(0.9, 1.1))
+                quantity = rng.choice((0, 0, 0, 2, 4, 8, 12, 20, 40))
+                stock.append((sku, network, price, quantity, "Україна", "2024"))
+            if len(products) >= skus:
+                break
+    return models, products, stock
+
+
+def _index_rows(models: list[tuple], products: list[tuple]) -> list[tuple[Any, ...]]:
+    """Products as ``CatalogIndex`` expects them (the 2-table join)."""
+    by_id = {m[0]: m for m in models}
+    rows = []
+    for sku, model_id, diameter, width, profile, size in products:
+        _, name, _, brand, season = by_id[model_id]
+        rows.append((sku, width, profile, diameter, size, brand, name, season))
+    return rows
+
+
+def _queries(index_rows: list[tuple], count: int, seed: int) -> dict[str, list[dict[str, Any]]]:
+    """Query mix drawn from the catalog itself (sizes callers actually ask for)."""
+    rng = random.Random(seed)
+    picks = [rng.choice(index_rows) for _ in range(count)]
+    seasons = [s for s, _ in _SEASONS]
+    return {
+        "size+season": [
+            {"width": r[1], "profile": r[2], "diameter": r[3], "season": r[7]} for r in picks
+        ],
+        "size": [{"width": r[1], "profile": r[2], "diameter": r[3]} for r in picks],
+        "size+brand": [
+            {"width": r[1], "profile": r[2], "diameter": r[3], "brand": r[5].lower()} for r in picks
+        ],
+        "partial": [
+            {"width": r[1], "diameter": r[3], "season": rng.choice(seasons)} for r in picks
+        ],
+    }
+
+
+def _summary(samples_us: list[float]) -> str:
+    samples_us.sort()
+    p99 = samples_us[min(len(samples_us) - 1, int(len(samples_us) * 0.99))]
+    return f"p50 {statistics.median(samples_us):>9.1f} µs   p99 {p99:>9.1f} µs"
+
+
+def _bench_index(
+    index: CatalogIndex, queries: dict[str, list[dict[str, Any]]], skus: list[str]
+) -> None:
+    for kind, params in queries.items():
+        samples = []
+        for network, query in zip(_NETWORKS * len(params), params, strict=False):
+            t0 = time.perf_counter()
+            index.search(network, **query)
+            samples.append((time.perf_counter() - t0) * 1e6)
+        print(f"  index  {kind:<13} {_summary(samples)}")
+    samples = []
+    for sku in skus:
+        t0 = time.perf_counter()
+        index.availability(sku, "ProKoleso")
+        samples.append((time.perf_counter() - t0) * 1e6)
+    print(f"  index  {'availability':<13} {_summary(samples)}")
+
+
+async def _time_async(fn: Callable[[], Awaitable[Any]]) -> float:
+    t0 = time.perf_counter()
+    await fn()
+    return (time.perf_counter() - t0) * 1e6
+
+
+async def _setup_db(
+    engine: Any, models: list[tuple], products: list[tuple], stock: list[tuple]
+) -> None:
+    from sqlalchemy import text
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {_SCHEMA}"))
+        for table in ("tire_models", "tire_products", "tire_stock"):
+            await conn.execute(
+                text(f"CREATE TABLE {_SCHEMA}.{table} (LIKE public.{table} INCLUDING ALL)")
+            )
+    statements = (
+        (
+            "INSERT INTO tire_models (id, name, manufacturer_id, manufacturer, seasonality) "
+            "VALUES (:id, :name, :manufacturer_id, :manufacturer, :seasonality)",
+            ("id", "name", "manufacturer_id", "manufacturer", "seasonality"),
+            models,
+        ),
+        (
+            "INSERT INTO tire_products (sku, model_id, diameter, width, profile, size) "
+            "VALUES (:sku, :model_id, :diameter, :width, :profile, :size)",
+            ("sku", "model_id", "diameter", "width", "profile", "size"),
+            products,
+        ),
+        (
+            "INSERT INTO tire_stock "
+            "(sku, trading_network, price, stock_quantity, country, year_issue) "
+            "VALUES (:sku, :trading_network, :price, :stock_quantity, :country, :year_issue)",
+            ("sku", "trading_network", "price", "stock_quantity", "country", "year_issue"),
+            stock,
+        ),
+    )
+    t0 = time.perf_counter()
+    for sql, columns, rows in statements:
+        for start in range(0, len(rows), 5000):
+            chunk = [dict(zip(columns, row, strict=True)) for row in rows[start : start + 5000]]
+            async with engine.begin() as conn:
+                await conn.execute(text(sql), chunk)
+    async with engine.begin() as conn:
+        for table in ("tire_models", "tire_products", "tire_stock"):
+            await conn.execute(text(f"ANALYZE {_SCHEMA}.{table}"))
+    print(f"  loaded into {_SCHEMA} in {time.perf_counter() - t0:.1f} s")
+
+
+async def _bench_db(
+    args: argparse.Namespace,
+    catalog: tuple[list[tuple], list[tuple], list[tuple]],
+    queries: dict[str, list[dict[str, Any]]],
+) -> None:
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from src.config import get_settings
+
+    engine = create_async_engine(
+        get_settings().database.url,
+        connect_args={"server_settings": {"search_path": f"{_SCHEMA},public"}},
+    )
+    try:
+        await _setup_db(engine, *catalog)
+        client = StoreClient(base_url="http://unused", api_key="", db_engine=engine)
+        for kind, params in queries.items():
+            samples = [
+                await _time_async(lambda q=query, n=network: client._search_tires_db(n, **q))
+                for network, query in zip(_NETWORKS * len(params), params, strict=False)
+            ]
+            print(f"  db     {kind:<13} {_summary(samples)}")
+
+        store = CatalogIndexStore(engine, redis=None)  # type: ignore[arg-type]
+        t0 = time.perf_counter()
+        await store.rebuild()
+        print(f"  rebuild from PostgreSQL: {(time.perf_counter() - t0) * 1000:.0f} ms")
+    finally:
+        if not args.keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--skus", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=20_000, help="queries per kind")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--database", action="store_true", help="also measure PostgreSQL")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch schema")
+    args = parser.parse_args()
+
+    models, products, stock = _generate(args.skus, args.seed)
+    index_rows = _index_rows(models, products)
+    print(
+        f"catalog: {len(products):,} SKUs, {len(models):,} models, "
+        f"{len({r[1:4] for r in index_rows}):,} sizes, {len(stock):,} stock rows"
+    )
+
+    t0 = time.perf_counter()
+    index = CatalogIndex(index_rows, stock)
+    print(f"  index build: {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    queries = _queries(index_rows, args.queries, args.seed)
+    rng = random.Random(args.seed)
+    _bench_index(index, queries, [rng.choice(products)[0] for _ in range(args.queries)])
+
+    if args.database:
+        db_queries = {kind: params[: min(len(params), 2000)] for kind, params in queries.items()}
+        asyncio.run(_bench_db(args, (models, products, stock), db_queries))
+
+
+if __name__ == "__main__":
+    main()
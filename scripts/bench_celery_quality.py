@@ -0,0 +1,144 @@
+"""Benchmark: ``evaluate_call_quality`` tasks/second, per-task engine vs worker runtime.
+
+Runs the task body sequentially in one process, the way a prefork Celery
+child does, in two modes:
+
+* ``per-task`` — no worker runtime: every task gets a fresh event loop and
+  a fresh ``AsyncEngine`` (new PostgreSQL connection + auth) that is
+  disposed at the end. This is the behaviour before ``worker_runtime``.
+* ``runtime`` — ``init_worker_runtime()`` as on ``worker_process_init``:
+  one long-lived loop, one pooled engine shared by all tasks.
+
+The LLM call is replaced by a canned response (optionally delayed with
+``--llm-ms``) so the numbers isolate the database/loop overhead. The
+benchmark writes ``quality_score`` / ``quality_details`` of the sampled
+calls; the original values are restored at the end. Point it at a local
+database.
+
+Usage (inside a container that has DATABASE_URL and asyncpg available)::
+
+    python -m scripts.bench_celery_quality --calls 200 --rounds 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+from unittest.mock import patch
+
+from src.tasks import quality_evaluator, worker_runtime
+
+_CANNED = json.dumps({c: 0.9 for c in quality_evaluator.QUALITY_CRITERIA})
+
+
+async def _sample_calls(n: int) -> list[tuple[str, Any, Any]]:
+    """Recent call ids that have turns, with their current quality columns."""
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from src.config import get_settings
+
+    engine = create_async_engine(get_settings().database.url)
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text("""
+                    SELECT c.id, c.quality_score, c.quality_details
+                      FROM calls c
+                     WHERE EXISTS (SELECT 1 FROM call_turns t WHERE t.call_id = c.id)
+                  ORDER BY c.started_at DESC
+                     LIMIT :n
+                """),
+                {"n": n},
+            )
+            return [(str(r.id), r.quality_score, r.quality_details) for r in result]
+    finally:
+        await engine.dispose()
+
+
+async def _restore(calls: list[tuple[str, Any, Any]]) -> None:
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from src.config import get_settings
+
+    engine = create_async_engine(get_settings().database.url)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("""
+                    UPDATE calls
+                    SET quality_score = :score, quality_details = CAST(:details AS jsonb)
+                    WHERE id = :call_id
+                """),
+                [
+                    {
+                        "call_id": call_id,
+                        "score": score,
+                        "details": details
+                        if details is None or isinstance(details, str)
+                        else json.dumps(details),
+                    }
+                    for call_id, score, details in calls
+                ],
+            )
+    finally:
+        await engine.dispose()
+
+
+def _run(call_ids: list[str]) -> float:
+    """Evaluate every call once; tasks per second."""
+    t0 = time.perf_counter()
+    for call_id in call_ids:
+        result = worker_runtime.run_async(
+            quality_evaluator._evaluate_call_quality_async(
+                quality_evaluator.evaluate_call_quality, call_id
+            )
+        )
+        if "quality_score" not in result:
+            raise SystemExit(f"unexpected result for {call_id}: {result}")
+    return len(call_ids) / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=200, help="calls to evaluate per round")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--llm-ms", type=float, default=0.0, help="simulated LLM latency")
+    args = parser.parse_args()
+
+    calls = asyncio.run(_sample_calls(args.calls))
+    if not calls:
+        raise SystemExit("no calls with turns in the database")
+    call_ids = [c[0] for c in calls]
+    print(f"calls: {len(call_ids)}, rounds: {args.rounds}, llm: {args.llm_ms:.0f} ms")
+
+    async def _fake_llm(*_args: Any, **_kwargs: Any) -> str:
+        if args.llm_ms:
+            await asyncio.sleep(args.llm_ms / 1000)
+        return _CANNED
+
+    try:
+        with patch.object(quality_evaluator, "llm_complete", _fake_llm):
+            per_task = max(_run(call_ids) for _ in range(args.rounds))
+
+            worker_runtime.init_worker_runtime()
+            try:
+                _run(call_ids[:5])  # open the pool
+                shared = max(_run(call_ids) for _ in range(args.rounds))
+            finally:
+                worker_runtime.shutdown_worker_runtime()
+    finally:
+        asyncio.run(_restore(calls))
+
+    print(f"{'mode':>9} {'tasks/s':>9} {'ms/task':>9}")
+    print(f"{'per-task':>9} {per_task:>9.1f} {1000 / per_task:>9.2f}")
+    print(f"{'runtime':>9} {shared:>9.1f} {1000 / shared:>9.2f}")
+    print(f"speedup: {shared / per_task:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Benchmark: /analytics/summary latency, live GROUP BY over calls vs hourly rollup.
+
+For each dataset size a scratch schema ``bench_call_stats`` is created with
+a monthly-partitioned copy of ``calls`` filled with synthetic calls spread
+over ``--days`` days and ``--tenants`` tenants, plus empty rollup tables.
+Then it measures:
+
+* ``live`` — the previous summary query (``GROUP BY DATE(started_at)`` over
+  the whole range of ``calls``).
+* ``rollup`` — ``fetch_daily_stats`` (``call_stats_hourly`` + live tail)
+  after a full backfill, for all tenants and for a single tenant.
+
+The time of the initial backfill is reported as well. The scratch schema is
+dropped afterwards unless ``--keep`` is given. Point it at a local database
+— generating 10M calls takes a while and a few GB of disk.
+
+Usage (inside a container that has DATABASE_URL and asyncpg available)::
+
+    python -m scripts.bench_dashboard_summary --sizes 1000000,10000000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.config import get_settings
+from src.reports.call_stats import fetch_daily_stats
+from src.tasks.call_stats_rollup import _rollup_chunk
+
+_SCHEMA = "bench_call_stats"
+
+_LIVE_SQL = """
+    SELECT
+        DATE(started_at) AS stat_date,
+        COUNT(*) AS total_calls,
+        COUNT(*) FILTER (WHERE NOT transferred_to_operator) AS resolved_by_bot,
+        COUNT(*) FILTER (WHERE transferred_to_operator) AS transferred,
+        AVG(duration_seconds) AS avg_duration_seconds,
+        AVG(quality_score) AS avg_quality_score,
+        SUM(total_cost_usd) AS total_cost_usd
+    FROM calls
+    WHERE started_at >= :date_from AND started_at < :date_to_end
+    GROUP BY DATE(started_at)
+    ORDER BY stat_date DESC
+    LIMIT :limit
+"""
+
+
+async def _setup(engine: AsyncEngine, calls: int, days: int, tenants: int) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {_SCHEMA}"))
+        await conn.execute(
+            text(
+                f"CREATE TABLE {_SCHEMA}.calls (LIKE public.calls INCLUDING DEFAULTS) "
+                "PARTITION BY RANGE (started_at)"
+            )
+        )
+        month = (date.today() - timedelta(days=days)).replace(day=1)
+        last = date.today().replace(day=1)
+        while month <= last:
+            nxt = (month + timedelta(days=32)).replace(day=1)
+            await conn.execute(
+                text(
+                    f"CREATE TABLE {_SCHEMA}.calls_{month.year}_{month.month:02d} "
+                    f"PARTITION OF {_SCHEMA}.calls "
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{nxt.isoformat()}')"
+                )
+            )
+            month = nxt
+        for table in ("call_stats_hourly", "call_stats_rollup_state", "call_stats_dirty_hours"):
+            await conn.execute(
+                text(f"CREATE TABLE {_SCHEMA}.{table} (LIKE public.{table} INCLUDING ALL)")
+            )
+
+    tenant_ids = [f"'00000000-0000-4000-8000-{i:012d}'::uuid" for i in range(tenants)]
+    t0 = time.perf_counter()
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(f"""
+                INSERT INTO {_SCHEMA}.calls (
+                    id, caller_id, started_at, ended_at, duration_seconds, scenario,
+                    transferred_to_operator, transfer_reason, quality_score,
+                    total_cost_usd, tenant_id
+                )
+                SELECT gen_random_uuid(),
+                       '+38050' || lpad((g % 10000000)::text, 7, '0'),
+                       s.ts, s.ts + make_interval(secs => 30 + (g % 300)),
+                       30 + (g % 300),
+                       (ARRAY['tire_search', 'order_status', 'fitting', 'consultation'])[1 + g % 4],
+                       g % 5 = 0,
+                       CASE WHEN g % 5 = 0
+                            THEN (ARRAY['complex_request', 'customer_request', 'no_stock'])[1 + g % 3]
+                       END,
+                       CASE WHEN g % 3 <> 0 THEN random() END,
+                       random() * 0.05,
+                       (ARRAY[{", ".join(tenant_ids)}])[1 + g % {tenants}]
+                  FROM generate_series(1, :calls) AS g,
+                       LATERAL (SELECT now() - random() * make_interval(days => :days) AS ts) s
+            """),
+            {"calls": calls, "days": days},
+        )
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE INDEX ON {_SCHEMA}.calls (started_at)"))
+        await conn.execute(text(f"CREATE INDEX ON {_SCHEMA}.calls (tenant_id)"))
+        await conn.execute(text(f"ANALYZE {_SCHEMA}.calls"))
+    print(f"  generated {calls:,} calls in {time.perf_counter() - t0:.1f} s")
+
+
+async def _backfill(engine: AsyncEngine) -> float:
+    t0 = time.perf_counter()
+    while True:
+        stats: dict[str, Any] = {"hours_refreshed": 0, "dirty_hours": 0, "rows_written": 0}
+        async with engine.begin() as conn:
+            if await _rollup_chunk(conn, stats):
+                break
+    async with engine.begin() as conn:
+        await conn.execute(text(f"ANALYZE {_SCHEMA}.call_stats_hourly"))
+    return time.perf_counter() - t0
+
+
+async def _time(fn: Any, rounds: int) -> float:
+    """Median latency in ms."""
+    samples = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+async def _bench(engine: AsyncEngine, days: int, tenants: int, rounds: int) -> dict[str, float]:
+    date_from = date.today() - timedelta(days=days)
+    date_to_end = date.today() + timedelta(days=1)
+    tenant = f"00000000-0000-4000-8000-{tenants - 1:012d}"
+
+    async def live() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(
+                text(_LIVE_SQL),
+                {"date_from": date_from, "date_to_end": date_to_end, "limit": days + 1},
+            )
+
+    async def rollup(tenant_id: str | None = None) -> None:
+        async with engine.connect() as conn:
+            await fetch_daily_stats(
+                conn,
+                date_from=date_from,
+                date_to_end=date_to_end,
+                tenant_id=tenant_id,
+                limit=days + 1,
+            )
+
+    return {
+        "live": await _time(live, rounds),
+        "rollup": await _time(rollup, rounds),
+        "rollup_tenant": await _time(lambda: rollup(tenant), rounds),
+    }
+
+
+async def _run(args: argparse.Namespace) -> None:
+    engine = create_async_engine(
+        get_settings().database.url,
+        connect_args={"server_settings": {"search_path": f"{_SCHEMA},public"}},
+    )
+    try:
+        print(
+            f"{'calls':>11} {'backfill s':>11} {'live ms':>9} {'rollup ms':>10} {'tenant ms':>10}"
+        )
+        for size in args.sizes:
+            print(f"dataset: {size:,} calls over {args.days} days")
+            await _setup(engine, size, args.days, args.tenants)
+            backfill = await _backfill(engine)
+            r = await _bench(engine, args.days, args.tenants, args.rounds)
+            print(
+                f"{size:>11,} {backfill:>11.1f} {r['live']:>9.1f} "
+                f"{r['rollup']:>10.1f} {r['rollup_tenant']:>10.1f}"
+                f"   speedup {r['live'] / r['rollup']:.0f}x"
+            )
+    finally:
+        if not args.keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {_SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda s: [int(x) for x in s.split(",")],
+        default=[1_000_000, 10_000_000],
+        help="comma-separated dataset sizes (calls)",
+    )
+    parser.add_argument("--days", type=int, default=365, help="range covered by the calls")
+    parser.add_argument("--tenants", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="keep the scratch schema")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
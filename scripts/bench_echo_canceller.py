@@ -0,0 +1,153 @@
+"""Microbenchmark: per-frame CPU cost of the echo canceller.
+
+Compares the previous implementation (deque of per-frame ``bytes``,
+``struct.unpack`` + generator RMS, one frame per ``process`` call) with
+the current one (preallocated ring buffer, vectorized RMS, batched
+``process_batch``) in two modes:
+
+  gate   — energy gate only (no pyaec)
+  aec    — pyaec + energy gate (skipped when pyaec is not installed)
+
+Batch sizes > 1 feed several back-to-back 20 ms frames per call, as when
+the reader drains a backlog of packets after a stall.
+
+Usage:
+
+    python -m scripts.bench_echo_canceller --frames 2000 --batch 1 4 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import array
+import math
+import struct
+import time
+from collections import deque
+
+from src.core import echo_canceller as ec_mod
+from src.core.echo_canceller import (
+    _FRAME_BYTES,
+    _FRAME_SIZE,
+    _SILENCE_FRAME,
+    EchoCanceller,
+    EchoCancellerConfig,
+    FarEndBuffer,
+)
+from src.monitoring.metrics import aec_frames_processed, aec_frames_suppressed, aec_processing_us
+
+
+class _LegacyFarEndBuffer:
+    """The pre-ring-buffer FarEndBuffer, kept here as the baseline."""
+
+    def __init__(self, maxlen: int = 256) -> None:
+        self._buffer: deque[bytes] = deque(maxlen=maxlen)
+
+    def push(self, audio_data: bytes) -> None:
+        offset = 0
+        while offset < len(audio_data):
+            chunk = audio_data[offset : offset + _FRAME_BYTES]
+            if len(chunk) < _FRAME_BYTES:
+                chunk = chunk + b"\x00" * (_FRAME_BYTES - len(chunk))
+            self._buffer.append(chunk)
+            offset += _FRAME_BYTES
+
+    def pop_frame(self) -> bytes:
+        if self._buffer:
+            return self._buffer.popleft()
+        return _SILENCE_FRAME
+
+
+def _legacy_rms(frame: bytes) -> float:
+    n_samples = len(frame) // 2
+    if n_samples == 0:
+        return 0.0
+    samples = struct.unpack(f"<{n_samples}h", frame[: n_samples * 2])
+    return math.sqrt(sum(s * s for s in samples) / n_samples)
+
+
+def _legacy_process(aec: object | None, buf: _LegacyFarEndBuffer, frame: bytes) -> bytes:
+    """The pre-batch ``EchoCanceller.process`` hot path, metrics included."""
+    t0 = time.monotonic()
+    result = frame
+    if aec is not None:
+        far = buf.pop_frame()
+        near_samples = list(array.array("h", frame))
+        far_samples = list(array.array("h", far))
+        cleaned = aec.cancel_echo(near_samples, far_samples)  # type: ignore[attr-defined]
+        result = array.array("h", cleaned).tobytes()
+        aec_frames_processed.labels(mode="aec").inc()
+    else:
+        aec_frames_processed.labels(mode="gate").inc()
+    if _legacy_rms(result) < 50.0:
+        result = _SILENCE_FRAME
+        aec_frames_suppressed.inc()
+    aec_processing_us.observe((time.monotonic() - t0) * 1_000_000)
+    return result
+
+
+def _make_audio(frames: int) -> bytes:
+    """Speech-like test signal: alternating loud and near-silent frames."""
+    out = bytearray()
+    for i in range(frames):
+        amp = 800 if i % 3 else 5
+        out += struct.pack(
+            f"<{_FRAME_SIZE}h",
+            *(int(amp * math.sin(j * 0.3 + i)) for j in range(_FRAME_SIZE)),
+        )
+    return bytes(out)
+
+
+def _new_aec() -> object | None:
+    try:
+        import pyaec
+    except ImportError:
+        return None
+    return pyaec.Aec(_FRAME_SIZE, 2048, 8000)
+
+
+def _bench_legacy(mode: str, near: bytes, far: bytes, frames: int) -> float:
+    aec = _new_aec() if mode == "aec" else None
+    buf = _LegacyFarEndBuffer()
+    t0 = time.process_time()
+    for i in range(0, frames * _FRAME_BYTES, _FRAME_BYTES):
+        buf.push(far[i : i + _FRAME_BYTES])
+        _legacy_process(aec, buf, near[i : i + _FRAME_BYTES])
+    return (time.process_time() - t0) / frames * 1e6
+
+
+def _bench_current(mode: str, batch: int, near: bytes, far: bytes, frames: int) -> float:
+    config = EchoCancellerConfig(enabled=True, energy_gate_only=mode == "gate")
+    canceller = EchoCanceller(config, FarEndBuffer())
+    step = batch * _FRAME_BYTES
+    t0 = time.process_time()
+    for i in range(0, frames * _FRAME_BYTES, step):
+        canceller.record_far_end(far[i : i + step])
+        canceller.process(near[i : i + step], speaking=True)
+    return (time.process_time() - t0) / frames * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--batch", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    frames = args.frames - args.frames % max(args.batch)
+    near = _make_audio(frames)
+    far = _make_audio(frames)[::-1]
+
+    print(f"numpy: {'yes' if ec_mod.np is not None else 'no (array fallback)'}")
+    print(f"{'mode':<5} {'variant':<10} {'µs/frame':>9}")
+    for mode in ("gate", "aec"):
+        if mode == "aec" and _new_aec() is None:
+            print("aec   skipped (pyaec not installed)")
+            continue
+        print(f"{mode:<5} {'legacy':<10} {_bench_legacy(mode, near, far, frames):>9.2f}")
+        for batch in args.batch:
+            us = _bench_current(mode, batch, near, far, frames)
+            print(f"{mode:<5} {f'batch={batch}':<10} {us:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
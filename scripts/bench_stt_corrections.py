@@ -0,0 +1,191 @@
+"""Microbenchmark: per-turn CPU cost of the post-STT correction rules.
+
+Compares the previous runtime (every enabled rule applied in sequence via
+``re.subn`` on every transcript) with the compiled bundle
+(``CompiledCorrections``: per-``context_hint`` buckets + literal prefilter)
+at several rule-set sizes.
+
+The corpus is real customer utterances from ``call_turns``, each paired
+with the ``context_hint`` the pipeline would infer from the preceding bot
+turn. Rule sets are generated from the corpus vocabulary in the shapes
+``scripts/mine_stt_candidates.py`` produces (``\\bword\\b``, numeral +
+word, two-word alternations), spread over the context hints, so a
+realistic share of them actually fires.
+
+Usage (inside a container that has DATABASE_URL and asyncpg available)::
+
+    python -m scripts.bench_stt_corrections --days 14 --rules 100 1000 5000
+
+    # Without a database: one utterance per line (optional "ctx<TAB>text")
+    python -m scripts.bench_stt_corrections --corpus /tmp/turns.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import random
+import re
+import time
+from pathlib import Path
+from typing import Any
+
+from src.core.pipeline import _infer_context_hint
+from src.stt import corrections
+from src.stt.corrections import VALID_CONTEXTS, CompiledCorrections
+
+_WORD_RE = re.compile(r"[^\W\d_]{4,}")
+
+
+def _legacy_apply(
+    text: str, rules: list[dict[str, Any]], context_hint: str | None
+) -> tuple[str, list[str]]:
+    """The pre-bundle ``apply_rules`` loop, kept here as the baseline."""
+    ctx = (context_hint or "").strip().lower()
+    result = text
+    applied: list[str] = []
+    for rule in rules:
+        if not rule.get("enabled", True):
+            continue
+        rule_ctx = str(rule.get("context_hint") or "").strip().lower()
+        if rule_ctx and rule_ctx != "any" and rule_ctx != ctx:
+            continue
+        flags = re.IGNORECASE if "i" in str(rule.get("flags") or "").lower() else 0
+        try:
+            new_result, count = re.subn(rule["pattern"], rule["replacement"], result, flags=flags)
+        except re.error:
+            continue
+        if count > 0 and new_result != result:
+            result = new_result
+            applied.append(str(rule.get("id")))
+    return result, applied
+
+
+async def _fetch_corpus(days: int, limit: int) -> list[tuple[str | None, str]]:
+    """Customer turns from ``call_turns`` with the context of the preceding bot turn."""
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from src.config import get_settings
+
+    sql = """
+        SELECT ct.content,
+               (SELECT prev.content
+                  FROM call_turns prev
+                 WHERE prev.call_id = ct.call_id
+                   AND prev.speaker = 'bot'
+                   AND prev.turn_number < ct.turn_number
+              ORDER BY prev.turn_number DESC
+                 LIMIT 1) AS bot_before
+          FROM call_turns ct
+         WHERE ct.created_at >= NOW() - make_interval(days => :days)
+           AND ct.speaker = 'customer'
+           AND ct.content IS NOT NULL
+           AND ct.content <> ''
+      ORDER BY ct.created_at DESC
+         LIMIT :limit
+    """
+    engine = create_async_engine(get_settings().database.url)
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(text(sql), {"days": days, "limit": limit})
+            return [(_infer_context_hint(str(r.bot_before or "")), str(r.content)) for r in result]
+    finally:
+        await engine.dispose()
+
+
+def _read_corpus(path: Path) -> list[tuple[str | None, str]]:
+    corpus: list[tuple[str | None, str]] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        ctx, sep, text = line.partition("\t")
+        if not sep:
+            ctx, text = "", ctx
+        if text.strip():
+            corpus.append((ctx.strip() or None, text.strip()))
+    return corpus
+
+
+def _make_rules(corpus: list[tuple[str | None, str]], n: int, seed: int) -> list[dict[str, Any]]:
+    """``n`` mined-style rules over the corpus vocabulary (plus unseen words)."""
+    rng = random.Random(seed)
+    vocab = sorted({w.lower() for _, text in corpus for w in _WORD_RE.findall(text)})
+    if not vocab:
+        raise SystemExit("corpus has no words")
+    contexts = ["", "", "", *VALID_CONTEXTS]
+    rules: list[dict[str, Any]] = []
+    for i in range(n):
+        # Most mined rules target rare mishears: ~90% never occur in the corpus
+        word = rng.choice(vocab) if rng.random() < 0.1 else f"{rng.choice(vocab)}x{i}"
+        shape = rng.random()
+        if shape < 0.7:
+            pattern = rf"\b{re.escape(word)}\b"
+        elif shape < 0.85:
+            pattern = rf"(\d+)\s*{re.escape(word)}\b"
+        else:
+            pattern = rf"\b({re.escape(word)}|{re.escape(rng.choice(vocab))}y{i})\b"
+        rules.append(
+            {
+                "id": f"r{i}",
+                "pattern": pattern,
+                "replacement": rf"\g<0>{i}" if shape >= 0.7 else word.upper(),
+                "flags": "i",
+                "context_hint": rng.choice(contexts),
+                "enabled": True,
+            }
+        )
+    return rules
+
+
+def _bench(fn: Any, corpus: list[tuple[str | None, str]], repeat: int) -> float:
+    """Best-of-``repeat`` CPU µs per turn."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.process_time()
+        for ctx, text in corpus:
+            fn(text, context_hint=ctx)
+        best = min(best, (time.process_time() - t0) / len(corpus) * 1e6)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--limit", type=int, default=2000, help="max turns to load")
+    parser.add_argument("--corpus", type=Path, help="read utterances from a file instead")
+    parser.add_argument("--rules", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = _read_corpus(args.corpus)
+    else:
+        corpus = asyncio.run(_fetch_corpus(args.days, args.limit))
+    if not corpus:
+        raise SystemExit("empty corpus")
+    print(f"corpus: {len(corpus)} turns")
+    print(f"{'rules':>6} {'legacy µs':>10} {'compiled µs':>12} {'speedup':>8} {'build ms':>9}")
+
+    for n in args.rules:
+        rules = _make_rules(corpus, n, args.seed)
+        corrections._pattern_cache.clear()  # measure a cold build
+        t0 = time.process_time()
+        bundle = CompiledCorrections(rules)
+        for ctx in (None, *VALID_CONTEXTS):
+            bundle.apply("x", ctx)  # build every bucket
+        build_ms = (time.process_time() - t0) * 1e3
+
+        for ctx, text in corpus:
+            if _legacy_apply(text, rules, ctx) != bundle.apply(text, ctx):
+                raise SystemExit(f"result mismatch at {n} rules on {text!r} (ctx={ctx})")
+
+        legacy = _bench(functools.partial(_legacy_apply, rules=rules), corpus, args.repeat)
+        compiled = _bench(bundle.apply, corpus, args.repeat)
+        print(
+            f"{n:>6} {legacy:>10.1f} {compiled:>12.1f} {legacy / compiled:>7.1f}x {build_ms:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 
 Reads brand/model/kit/tire-size CSVs from the external db_size_auto directory
 and bulk-inserts into PostgreSQL tables created by migration 014.
+Running call processors are then told (Redis pub/sub) to rebuild their
+in-memory vehicle index.
 
 Usage: python -m scripts.import_vehicle_db [--csv-dir /path/to/csvs]
 """
@@ -22,6 +24,8 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from src.config import get_settings
+from src.core.redis_client import close_redis
+from src.store_client.vehicle_index import publish_change
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -419,6 +423,9 @@ async def import_data(engine: AsyncEngine, csv_dir: Path) -> None:
         len(tire_sizes),
     )
 
+    # Running call processors rebuild their in-memory vehicle index
+    await publish_change("import")
+
 
 async def main() -> None:
     parser = argparse.ArgumentParser(description="Import vehicle tire size DB from CSV")
@@ -436,6 +443,7 @@ async def main() -> None:
         await import_data(engine, csv_dir)
     finally:
         await engine.dispose()
+        await close_redis()
 
 
 if __name__ == "__main__":
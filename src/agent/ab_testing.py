@@ -1,14 +1,20 @@
 """A/B testing for prompt variants.
 
-Randomly assigns calls to prompt variants and tracks metrics.
+Assigns calls to prompt variants by hashing the call id and tracks metrics.
 Provides statistical significance calculation for test results.
+
+The call-setup path never writes to ``prompt_ab_tests``: the active test is
+served from an in-process cache and per-variant assignment counts are
+accumulated in memory, then added to ``calls_a`` / ``calls_b`` by
+``ABTestManager.flush_counts`` (periodic task in ``main.py``).
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import math
-import random
+import time
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import text
@@ -32,6 +38,46 @@ QUALITY_CRITERIA = [
 ]
 
 
+# ── Active test cache ──────────────────────────────────────
+_ACTIVE_TEST_TTL = 30.0  # seconds
+
+_active_test: dict[str, Any] | None = None
+_active_test_ts: float = 0.0  # 0 = not loaded (a cached "no active test" is a valid entry)
+
+AB_TEST_CACHE_REDIS_KEY = "ab_tests:cache_ts"
+
+# Unflushed assignment counts: test_id -> [calls_a, calls_b]
+_pending_counts: dict[str, list[int]] = {}
+
+
+def invalidate_cache() -> None:
+    """Drop the in-process active test descriptor."""
+    global _active_test, _active_test_ts
+    _active_test = None
+    _active_test_ts = 0.0
+
+
+def assignment_bucket(test_id: Any, call_id: str) -> float:
+    """Map a call to a stable point in [0, 1) for the given test.
+
+    Salted with the test id so consecutive tests do not split the same
+    callers the same way.
+    """
+    digest = hashlib.sha256(f"{test_id}:{call_id}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
+
+
+def is_variant_a(test: dict[str, Any], call_id: str) -> bool:
+    """Deterministic assignment: the same call always lands in the same variant."""
+    return assignment_bucket(test["id"], call_id) < float(test["traffic_split"])
+
+
+def pending_counts(test_id: Any) -> tuple[int, int]:
+    """Assignments recorded in this process but not yet flushed to PostgreSQL."""
+    counts = _pending_counts.get(str(test_id))
+    return (counts[0], counts[1]) if counts else (0, 0)
+
+
 class ABTestManager:
     """Manages A/B tests for prompt variants."""
 
@@ -39,7 +85,7 @@ class ABTestManager:
         self._engine = engine
 
     async def get_active_test(self) -> dict[str, Any] | None:
-        """Get the currently active A/B test."""
+        """Get the currently active A/B test (with both variants' prompts)."""
         async with self._engine.begin() as conn:
             result = await conn.execute(
                 text("""
@@ -48,7 +94,9 @@ class ABTestManager:
                         t.traffic_split, t.calls_a, t.calls_b,
                         t.quality_a, t.quality_b, t.status, t.started_at,
                         a.name AS variant_a_name,
-                        b.name AS variant_b_name
+                        b.name AS variant_b_name,
+                        a.system_prompt AS variant_a_prompt,
+                        b.system_prompt AS variant_b_prompt
                     FROM prompt_ab_tests t
                     JOIN prompt_versions a ON t.variant_a_id = a.id
                     JOIN prompt_versions b ON t.variant_b_id = b.id
@@ -60,35 +108,53 @@ class ABTestManager:
             row = result.first()
             return dict(row._mapping) if row else None
 
-    async def assign_variant(self, call_id: str) -> dict[str, Any] | None:
+    async def get_cached_active_test(self, redis: Any = None) -> dict[str, Any] | None:
+        """Active test descriptor, cached in-process for ``_ACTIVE_TEST_TTL``.
+
+        Invalidated early when the Redis timestamp key changes (admin
+        create/stop/delete on any instance).
+        """
+        global _active_test, _active_test_ts
+
+        if redis is not None and _active_test_ts:
+            try:
+                raw = await redis.get(AB_TEST_CACHE_REDIS_KEY)
+                remote_ts = float(raw) if raw else 0.0
+            except Exception:
+                remote_ts = 0.0
+            if remote_ts > _active_test_ts:
+                invalidate_cache()
+
+        if _active_test_ts and time.time() - _active_test_ts < _ACTIVE_TEST_TTL:
+            return _active_test
+
+        _active_test = await self.get_active_test()
+        _active_test_ts = time.time()
+        return _active_test
+
+    async def assign_variant(self, call_id: str, redis: Any = None) -> dict[str, Any] | None:
         """Assign a prompt variant to a call based on active A/B test.
 
+        Lock-free: reads the cached test descriptor and bumps an in-memory
+        counter; ``flush_counts`` persists the counters. The assignment is a
+        pure function of (test id, call id), so it can be recomputed later
+        with ``is_variant_a``.
+
         Returns:
-            Dict with variant info (prompt_version_id, variant_name),
-            or None if no active test.
+            Dict with variant info (prompt_version_id, variant_name,
+            system_prompt), or None if no active test.
         """
-        test = await self.get_active_test()
+        test = await self.get_cached_active_test(redis)
         if not test:
             return None
 
-        # Random assignment based on traffic split
-        is_variant_a = random.random() < test["traffic_split"]
+        variant_a = is_variant_a(test, call_id)
+        suffix = "a" if variant_a else "b"
+        variant_name = test[f"variant_{suffix}_name"]
+        variant_label = suffix.upper()
 
-        variant_id = test["variant_a_id"] if is_variant_a else test["variant_b_id"]
-        variant_name = test["variant_a_name"] if is_variant_a else test["variant_b_name"]
-        variant_label = "A" if is_variant_a else "B"
-
-        # Increment call count
-        count_field = "calls_a" if is_variant_a else "calls_b"
-        async with self._engine.begin() as conn:
-            await conn.execute(
-                text(f"""
-                    UPDATE prompt_ab_tests
-                    SET {count_field} = {count_field} + 1
-                    WHERE id = :test_id
-                """),
-                {"test_id": str(test["id"])},
-            )
+        counts = _pending_counts.setdefault(str(test["id"]), [0, 0])
+        counts[0 if variant_a else 1] += 1
 
         logger.info(
             "A/B test assignment: call=%s, test=%s, variant=%s (%s)",
@@ -100,11 +166,45 @@ class ABTestManager:
 
         return {
             "test_id": test["id"],
-            "prompt_version_id": variant_id,
+            "prompt_version_id": test[f"variant_{suffix}_id"],
             "variant_name": variant_name,
             "variant_label": variant_label,
+            "system_prompt": test[f"variant_{suffix}_prompt"],
         }
 
+    async def flush_counts(self) -> int:
+        """Add this process's pending assignment counts to ``prompt_ab_tests``.
+
+        One UPDATE per test with pending counts. On failure the counts are
+        merged back so the next flush retries them.
+
+        Returns:
+            Number of assignments persisted.
+        """
+        global _pending_counts
+        if not _pending_counts:
+            return 0
+        batch, _pending_counts = _pending_counts, {}
+        try:
+            async with self._engine.begin() as conn:
+                for test_id, (calls_a, calls_b) in batch.items():
+                    await conn.execute(
+                        text("""
+                            UPDATE prompt_ab_tests
+                            SET calls_a = calls_a + :calls_a,
+                                calls_b = calls_b + :calls_b
+                            WHERE id = :test_id
+                        """),
+                        {"calls_a": calls_a, "calls_b": calls_b, "test_id": test_id},
+                    )
+        except Exception:
+            for test_id, (calls_a, calls_b) in batch.items():
+                counts = _pending_counts.setdefault(test_id, [0, 0])
+                counts[0] += calls_a
+                counts[1] += calls_b
+            raise
+        return sum(a + b for a, b in batch.values())
+
     async def update_quality(self, test_id: UUID) -> dict[str, Any]:
         """Recalculate quality scores for both variants of a test."""
         async with self._engine.begin() as conn:
@@ -198,12 +298,15 @@ class ABTestManager:
             if row is None:
                 msg = "Expected row from INSERT RETURNING"
                 raise RuntimeError(msg)
-            return dict(row._mapping)
+        invalidate_cache()
+        return dict(row._mapping)
 
     async def stop_test(self, test_id: UUID) -> dict[str, Any]:
         """Stop an A/B test and record the end time."""
-        # Update quality scores first
+        # Persist pending assignment counts and update quality scores first
+        await self.flush_counts()
         await self.update_quality(test_id)
+        invalidate_cache()
 
         async with self._engine.begin() as conn:
             result = await conn.execute(
@@ -281,7 +384,18 @@ class ABTestManager:
             )
 
     async def get_report(self, test_id: UUID) -> dict[str, Any]:
-        """Generate a detailed analytics report for an A/B test."""
+        """Generate a detailed analytics report for an A/B test.
+
+        ``test.assigned_a`` / ``assigned_b`` are the reconciled assignment
+        counters: the persisted ``calls_a`` / ``calls_b`` plus whatever this
+        process could not flush yet.
+        """
+        try:
+            await self.flush_counts()
+        except Exception:
+            logger.warning("A/B counter flush before report failed", exc_info=True)
+        pending_a, pending_b = pending_counts(test_id)
+
         async with self._engine.begin() as conn:
             # 1. Test metadata + summary
             result = await conn.execute(
@@ -468,6 +582,9 @@ class ABTestManager:
                 "status": test_data["status"],
                 "started_at": str(test_data["started_at"]) if test_data["started_at"] else None,
                 "ended_at": str(test_data["ended_at"]) if test_data["ended_at"] else None,
+                "traffic_split": float(test_data["traffic_split"]),
+                "assigned_a": int(test_data["calls_a"] or 0) + pending_a,
+                "assigned_b": int(test_data["calls_b"] or 0) + pending_b,
             },
             "summary": summary,
             "per_criterion": per_criterion,
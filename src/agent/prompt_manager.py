@@ -49,6 +49,18 @@ SAFETY_CACHE_REDIS_KEY = "training:safety_cache_ts"
 PROMOS_CACHE_REDIS_KEY = "promotions:cache_ts"
 
 
+def invalidate_caches() -> None:
+    """Drop the in-process dialogue, safety and promotions caches."""
+    global _dialogue_cache, _dialogue_cache_ts, _safety_cache, _safety_cache_ts
+    global _promos_cache, _promos_cache_ts
+    _dialogue_cache = {}
+    _dialogue_cache_ts = 0.0
+    _safety_cache = []
+    _safety_cache_ts = 0.0
+    _promos_cache = {}
+    _promos_cache_ts = 0.0
+
+
 class PromptManager:
     """Manages prompt versions stored in PostgreSQL."""
 
@@ -166,6 +178,15 @@ class PromptManager:
             Dict mapping template_key → content.
             Falls back to hardcoded constants from prompts.py if DB unavailable.
         """
+        variants = await self.get_template_variants()
+        return {key: random.choice(options) for key, options in variants.items()}
+
+    async def get_template_variants(self) -> dict[str, list[str]]:
+        """Get all active response template variants grouped by template_key.
+
+        Keys without an active DB variant (all keys, if the DB is
+        unavailable) get the hardcoded constant from prompts.py.
+        """
         fallback = {
             "greeting": GREETING_TEXT,
             "farewell": FAREWELL_TEXT,
@@ -175,6 +196,7 @@ class PromptManager:
             "wait": WAIT_TEXT,
             "order_cancelled": ORDER_CANCELLED_TEXT,
         }
+        by_key: dict[str, list[str]] = {}
 
         try:
             async with self._engine.begin() as conn:
@@ -187,25 +209,17 @@ class PromptManager:
                 )
                 rows = result.fetchall()
 
-            if rows:
-                # Group variants by key
-                by_key: dict[str, list[str]] = {}
-                for row in rows:
-                    by_key.setdefault(row.template_key, []).append(row.content)
-
-                # Pick one random variant per key
-                templates = {key: random.choice(variants) for key, variants in by_key.items()}
-
-                # Fill in any missing keys from fallback
-                for key, value in fallback.items():
-                    if key not in templates:
-                        templates[key] = value
-                return templates
+            # Group variants by key
+            for row in rows:
+                by_key.setdefault(row.template_key, []).append(row.content)
 
         except Exception:
             logger.warning("Failed to load templates from DB, using hardcoded fallback")
 
-        return fallback
+        # Fill in any missing keys from fallback
+        for key, value in fallback.items():
+            by_key.setdefault(key, [value])
+        return by_key
 
     async def delete_version(self, version_id: UUID) -> None:
         """Delete a prompt version.
@@ -14,6 +14,8 @@ import datetime
 import logging
 from typing import Any
 
+from src.llm.models import SystemPrompt
+
 logger = logging.getLogger(__name__)
 
 # Current prompt version
@@ -1448,7 +1450,7 @@ def build_system_prompt_with_context(
     offered_slots: list[dict[str, str]] | None = None,
     fitting_progress: dict[str, Any] | None = None,
     enabled_tools: set[str] | None = None,
-) -> str:
+) -> SystemPrompt:
     """Build the final system prompt with all dynamic context injected.
 
     This replaces the duplicated _build_system_prompt() methods in agent.py
@@ -1470,7 +1472,9 @@ def build_system_prompt_with_context(
                          Used to add modules when customer switches topics.
 
     Returns:
-        Final system prompt string ready to send to LLM.
+        Final system prompt ready to send to LLM — a ``SystemPrompt`` whose
+        stable prefix (everything up to the DYNAMIC sections) gets an
+        explicit cache breakpoint on providers that need one (Anthropic).
     """
     # Replace default agent name with tenant-specific name
     if agent_name and agent_name != "Олена":
@@ -1533,7 +1537,8 @@ def build_system_prompt_with_context(
     #   DYNAMIC suffix (changes every turn).
     # The LLM provider caches the longest matching prefix, so putting
     # stable content first maximises cache hits and saves ~90% on
-    # cached tokens.
+    # cached tokens. Anthropic caches only up to a declared breakpoint,
+    # so the split point is carried on the returned SystemPrompt.
     # ---------------------------------------------------------------
 
     parts = [base_prompt]
@@ -1626,6 +1631,7 @@ def build_system_prompt_with_context(
         parts.append("\n" + storage_context)
 
     # --- DYNAMIC sections (change between turns) ---
+    stable_count = len(parts)
 
     # Stage-aware injection (modular prompts only)
     if is_modular and order_stage:
@@ -1715,7 +1721,7 @@ def build_system_prompt_with_context(
         if progress_text:
             parts.append(progress_text)
 
-    return "\n".join(parts)
+    return SystemPrompt("\n".join(parts[:stable_count]), "\n".join(parts[stable_count:]))
 
 
 def _render_fitting_progress(p: dict[str, Any]) -> str:
@@ -8,9 +8,12 @@ and loop back to the LLM with results.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import copy
 import json
 import logging
 import random
+import re
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
@@ -36,8 +39,8 @@ from src.agent.prompts import (
 from src.agent.tool_result_compressor import compress_tool_result
 from src.agent.tools import filter_tools_by_state
 from src.core.audio_sender import send_audio_stream
-from src.core.sentence_buffer import buffer_sentences
-from src.llm.models import LLMTask, Usage
+from src.core.sentence_buffer import SentenceReady, buffer_sentences
+from src.llm.models import LLMTask, StreamDone, TextDelta, ToolCallDelta, Usage
 from src.monitoring.metrics import (
     history_compression_mode,
     history_messages_count,
@@ -47,7 +50,7 @@ from src.monitoring.metrics import (
     tool_rounds_exhausted_total,
     tool_rounds_per_turn,
 )
-from src.tts.streaming_tts import synthesize_stream
+from src.tts.streaming_tts import prewarm_sentence, synthesize_stream
 
 # Per-tool execution timeout (seconds). Prevents a single slow 1C/API call
 # from blocking the entire agent turn. On timeout, tool returns an error
@@ -73,10 +76,21 @@ _FILLER_PRESYNTH_TIMEOUT_SEC = 1.5
 # automatically switch to a fallback provider.
 _MAX_EMPTY_RETRIES = 2
 
+# Rough prompt size → token estimate for speculations cancelled before the
+# provider reported usage.
+_APPROX_CHARS_PER_TOKEN = 4
+
+# Interim vs final transcripts differ in punctuation and casing; a
+# speculation is reused when the words match.
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from src.agent.agent import ToolRouter
     from src.core.audio_socket import AudioSocketConnection
     from src.core.echo_canceller import EchoCanceller
+    from src.llm.models import StreamEvent
     from src.llm.router import LLMRouter
     from src.logging.pii_vault import PIIVault
     from src.tts.base import TTSEngine
@@ -124,6 +138,140 @@ class TurnResult:
     wait_phrase: str = ""
 
 
+def _comparable_text(text: str) -> str:
+    return " ".join(_NON_WORD_RE.sub(" ", text).casefold().split())
+
+
+class SpeculativeTurn:
+    """First LLM round of a turn, started from a stable interim transcript.
+
+    Created by ``StreamingAgentLoop.speculate``. The LLM stream is consumed
+    in the background into an in-memory buffer; ``replay()`` yields the
+    buffered events and then follows the live stream, so an adopted
+    speculation keeps whatever head start it already has. Nothing is
+    spoken and no tool runs until the turn is adopted by ``run_turn``.
+    """
+
+    def __init__(
+        self,
+        user_text: str,
+        context: dict[str, Any],
+        base_history: list[dict[str, Any]],
+        history: list[dict[str, Any]],
+        system: str,
+        tools: list[dict[str, Any]],
+        compression: str,
+    ) -> None:
+        self.user_text = user_text
+        self.context = copy.deepcopy(context)
+        self.history = history
+        self.system = system
+        self.tools = tools
+        self.compression = compression
+        self.started_at = time.monotonic()
+        self._base_history = list(base_history)
+        self._events: list[StreamEvent] = []
+        self._updated = asyncio.Event()
+        self._finished_at: float | None = None
+        self._error: Exception | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._warm_task: asyncio.Task[None] | None = None
+
+    @property
+    def failed(self) -> bool:
+        """True when the LLM request errored (the speculation is unusable)."""
+        return self._error is not None
+
+    @property
+    def saved_ms(self) -> float:
+        """LLM time already spent — the latency an adopting turn skips."""
+        end = self._finished_at if self._finished_at is not None else time.monotonic()
+        return (end - self.started_at) * 1000
+
+    def start(self, stream: AsyncIterator[StreamEvent], tts: TTSEngine) -> None:
+        self._task = asyncio.create_task(self._consume(stream, tts))
+
+    def matches(
+        self,
+        user_text: str,
+        conversation_history: list[dict[str, Any]],
+        context: dict[str, Any],
+    ) -> bool:
+        """Whether the final turn would have sent exactly this request."""
+        return (
+            _comparable_text(user_text) == _comparable_text(self.user_text)
+            and context == self.context
+            and conversation_history == self._base_history
+        )
+
+    async def replay(self) -> AsyncIterator[StreamEvent]:
+        """Buffered events first, then the rest of the live stream."""
+        i = 0
+        try:
+            while True:
+                while i < len(self._events):
+                    yield self._events[i]
+                    i += 1
+                if self._finished_at is not None:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                self._updated.clear()
+                await self._updated.wait()
+        finally:
+            # Consumer stopped early (barge-in / hangup) — stop the request too
+            if self._task is not None and not self._task.done():
+                self._task.cancel()
+
+    async def cancel(self) -> tuple[Usage, str]:
+        """Discard the speculation; return (tokens it cost, provider key).
+
+        Usage is exact when the provider already reported it, otherwise it
+        is estimated from the prompt and generated character counts —
+        providers bill the prompt even for a cancelled request.
+        """
+        for task in (self._task, self._warm_task):
+            if task is not None and not task.done():
+                task.cancel()
+        if self._task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        for event in self._events:
+            if isinstance(event, StreamDone):
+                return event.usage, event.provider_key
+        prompt_chars = len(self.system) + len(json.dumps(self.history, ensure_ascii=False))
+        output_chars = sum(
+            len(e.text) if isinstance(e, TextDelta) else len(e.arguments_chunk)
+            for e in self._events
+            if isinstance(e, TextDelta | ToolCallDelta)
+        )
+        usage = Usage(
+            prompt_chars // _APPROX_CHARS_PER_TOKEN,
+            output_chars // _APPROX_CHARS_PER_TOKEN,
+        )
+        return usage, ""
+
+    async def _record(self, stream: AsyncIterator[StreamEvent]) -> AsyncIterator[StreamEvent]:
+        async for event in stream:
+            self._events.append(event)
+            self._updated.set()
+            yield event
+
+    async def _consume(self, stream: AsyncIterator[StreamEvent], tts: TTSEngine) -> None:
+        try:
+            async for event in buffer_sentences(self._record(stream)):
+                # Warm the TTS cache with the first sentence so an adopted
+                # turn starts playing without a synthesis round-trip.
+                if isinstance(event, SentenceReady) and self._warm_task is None:
+                    self._warm_task = asyncio.create_task(prewarm_sentence(tts, event.text))
+        except Exception as exc:
+            logger.warning("Speculative LLM request failed: %s", exc)
+            self._error = exc
+        finally:
+            self._finished_at = time.monotonic()
+            self._updated.set()
+
+
 class StreamingAgentLoop:
     """Streaming agent loop — LLM ↔ tool execution with real-time audio.
 
@@ -231,10 +379,11 @@ class StreamingAgentLoop:
 
         return _fallback_text
 
-    async def run_turn(
+    def _prepare_turn(
         self,
         user_text: str,
         conversation_history: list[dict[str, Any]],
+        *,
         caller_phone: str | None = None,
         order_id: str | None = None,
         pattern_context: str | None = None,
@@ -250,11 +399,15 @@ class StreamingAgentLoop:
         selected_slot: dict[str, str] | None = None,
         offered_slots: list[dict[str, str]] | None = None,
         fitting_progress: dict[str, Any] | None = None,
-    ) -> TurnResult:
-        """Run a full conversation turn with streaming audio output.
+    ) -> tuple[str, list[dict[str, Any]], str]:
+        """Append the user message, compress history and build the prompt.
 
-        May loop multiple times if the LLM returns tool calls.
-        Mutates conversation_history in place.
+        Mutates conversation_history in place. Deterministic for the same
+        inputs, so a speculative turn prepared on a copy of the history
+        ends up with exactly what ``run_turn`` would have sent.
+
+        Returns:
+            (system prompt, filtered tools, history compression mode).
         """
         # Mask PII before sending to LLM
         if self._pii_vault is not None:
@@ -277,13 +430,13 @@ class StreamingAgentLoop:
         )
         post_len = len(conversation_history)
 
-        # Record compression mode metric
+        # Compression mode (recorded as a metric by run_turn)
         if post_len < pre_len and post_len > 0 and conversation_history[0].get("content", "").startswith("(Резюме"):
-            history_compression_mode.labels(mode="summarize").inc()
+            compression = "summarize"
         elif post_len < pre_len:
-            history_compression_mode.labels(mode="compress").inc()
+            compression = "compress"
         else:
-            history_compression_mode.labels(mode="none").inc()
+            compression = "none"
 
         # Safety-net trim: if history is still too long after summarization
         if len(conversation_history) > MAX_HISTORY_MESSAGES:
@@ -319,14 +472,113 @@ class StreamingAgentLoop:
             enabled_tools={t["name"] for t in (self._tools or [])},
         )
 
-        # Record prompt and history metrics
-        system_prompt_chars.observe(len(system))
-        history_messages_count.observe(len(conversation_history))
-
         # Filter tools by conversation state (remove irrelevant tools)
         tools = filter_tools_by_state(
             self._tools or [], order_stage=order_stage, fitting_booked=fitting_booked
         )
+        return system, tools, compression
+
+    def speculate(
+        self,
+        user_text: str,
+        conversation_history: list[dict[str, Any]],
+        **context: Any,
+    ) -> SpeculativeTurn:
+        """Start the first LLM round for *user_text* with all output held back.
+
+        Used on a stable interim transcript, before the final arrives. The
+        history is prepared on a copy (``conversation_history`` is not
+        touched), the LLM stream is buffered in memory and its first
+        sentence is synthesized into the TTS cache. Nothing is played and
+        no tools run until ``run_turn(..., speculation=...)`` adopts it.
+
+        Args:
+            user_text: Corrected interim text.
+            conversation_history: The call's LLM history (read only).
+            **context: The same keyword arguments ``run_turn`` would get.
+        """
+        history = list(conversation_history)
+        system, tools, compression = self._prepare_turn(user_text, history, **context)
+        spec = SpeculativeTurn(
+            user_text,
+            context,
+            conversation_history,
+            history,
+            system,
+            tools,
+            compression,
+        )
+        stream = self._llm_router.complete_stream(
+            LLMTask.AGENT,
+            history,
+            system=system,
+            tools=tools,
+            max_tokens=1024,
+            provider_override=self._provider_override,
+        )
+        spec.start(stream, self._tts)
+        return spec
+
+    async def run_turn(
+        self,
+        user_text: str,
+        conversation_history: list[dict[str, Any]],
+        caller_phone: str | None = None,
+        order_id: str | None = None,
+        pattern_context: str | None = None,
+        order_stage: str | None = None,
+        caller_history: str | None = None,
+        storage_context: str | None = None,
+        customer_profile: str | None = None,
+        fitting_booked: bool = False,
+        tools_called: set[str] | None = None,
+        scenario: str | None = None,
+        active_scenarios: set[str] | None = None,
+        selected_station: dict[str, Any] | None = None,
+        selected_slot: dict[str, str] | None = None,
+        offered_slots: list[dict[str, str]] | None = None,
+        fitting_progress: dict[str, Any] | None = None,
+        speculation: SpeculativeTurn | None = None,
+    ) -> TurnResult:
+        """Run a full conversation turn with streaming audio output.
+
+        May loop multiple times if the LLM returns tool calls.
+        Mutates conversation_history in place.
+
+        When *speculation* is given (already checked with
+        ``SpeculativeTurn.matches``), its prepared history and system
+        prompt are adopted and its buffered LLM stream replaces the first
+        LLM request of the turn.
+        """
+        if speculation is not None:
+            conversation_history[:] = speculation.history
+            system, tools = speculation.system, speculation.tools
+            compression = speculation.compression
+        else:
+            system, tools, compression = self._prepare_turn(
+                user_text,
+                conversation_history,
+                caller_phone=caller_phone,
+                order_id=order_id,
+                pattern_context=pattern_context,
+                order_stage=order_stage,
+                caller_history=caller_history,
+                storage_context=storage_context,
+                customer_profile=customer_profile,
+                fitting_booked=fitting_booked,
+                tools_called=tools_called,
+                scenario=scenario,
+                active_scenarios=active_scenarios,
+                selected_station=selected_station,
+                selected_slot=selected_slot,
+                offered_slots=offered_slots,
+                fitting_progress=fitting_progress,
+            )
+
+        # Record prompt and history metrics
+        history_compression_mode.labels(mode=compression).inc()
+        system_prompt_chars.observe(len(system))
+        history_messages_count.observe(len(conversation_history))
 
         spoken_parts: list[str] = []
         has_llm_text = False  # True when LLM produced real text (not just wait-phrases)
@@ -341,6 +593,7 @@ class StreamingAgentLoop:
         disconnected = False
         empty_retries = 0
         current_provider_override = self._provider_override
+        prefetched = speculation
 
         turn_start = time.monotonic()
 
@@ -348,14 +601,18 @@ class StreamingAgentLoop:
         while tool_round < self._max_tool_rounds:
             # Stream LLM → sentence buffer → TTS → audio sender
             try:
-                stream = self._llm_router.complete_stream(
-                    LLMTask.AGENT,
-                    conversation_history,
-                    system=system,
-                    tools=tools,
-                    max_tokens=1024,
-                    provider_override=current_provider_override,
-                )
+                if prefetched is not None:
+                    stream = prefetched.replay()
+                    prefetched = None
+                else:
+                    stream = self._llm_router.complete_stream(
+                        LLMTask.AGENT,
+                        conversation_history,
+                        system=system,
+                        tools=tools,
+                        max_tokens=1024,
+                        provider_override=current_provider_override,
+                    )
                 buffered = buffer_sentences(stream)
                 tts_stream = synthesize_stream(buffered, self._tts)
 
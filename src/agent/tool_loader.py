@@ -28,6 +28,13 @@ _tools_cache_ts: float = 0.0
 TOOLS_CACHE_REDIS_KEY = "tools:overrides_cache_ts"
 
 
+def invalidate_cache() -> None:
+    """Drop the in-process tools cache."""
+    global _tools_cache, _tools_cache_ts
+    _tools_cache = []
+    _tools_cache_ts = 0.0
+
+
 async def get_tools_with_overrides(engine: AsyncEngine, redis: Any = None) -> list[dict[str, Any]]:
     """Load ALL_TOOLS and merge active DB overrides.
 
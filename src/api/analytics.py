@@ -9,7 +9,7 @@ from __future__ import annotations
 import logging
 from datetime import date as date_type
 from datetime import timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID  # noqa: TC003 - FastAPI needs UUID at runtime for path params
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -17,6 +17,11 @@ from sqlalchemy import text
 
 from src.api.auth import require_permission
 from src.api.database import get_engine as _get_engine
+from src.api.export_stream import keyset_pages, streaming_download
+from src.reports.call_stats import fetch_daily_stats
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analytics", tags=["analytics"])
@@ -254,10 +259,12 @@ async def get_call_details(call_id: UUID, _: dict[str, Any] = _perm_r) -> dict[s
 
 
 @router.get("/calls/{call_id}/transcript")
-async def download_call_transcript(call_id: UUID, _: dict[str, Any] = _perm_r) -> Any:
-    """Download call transcription as a plain-text file."""
-    from fastapi.responses import Response
-
+async def download_call_transcript(
+    call_id: UUID,
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    _: dict[str, Any] = _perm_r,
+) -> Any:
+    """Download call transcription as a plain-text file, streamed turn page by turn page."""
     engine = await _get_engine()
 
     async with engine.begin() as conn:
@@ -276,17 +283,23 @@ async def download_call_transcript(call_id: UUID, _: dict[str, Any] = _perm_r) -
 
         c = call._mapping
 
-        # Turns
-        turns_result = await conn.execute(
-            text("""
-                SELECT turn_number, speaker, content, created_at
-                FROM call_turns
-                WHERE call_id = :call_id
-                ORDER BY turn_number
-            """),
-            {"call_id": str(call_id)},
-        )
-        turns = [row._mapping for row in turns_result]
+    # Turns are written after the call started: bound created_at for partition pruning
+    conditions = ["call_id = :call_id"]
+    params: dict[str, Any] = {"call_id": str(call_id)}
+    if c["started_at"] is not None:
+        conditions.append("created_at >= :started_at")
+        params["started_at"] = c["started_at"]
+    pages = keyset_pages(
+        engine,
+        select=(
+            "SELECT id, COALESCE(turn_number, 0) AS turn_order, speaker, content FROM call_turns"
+        ),
+        where=conditions,
+        params=params,
+        # turn_number is nullable; a NULL in the row-value comparison would end paging early
+        order=("turn_order", "id"),
+        expressions={"turn_order": "COALESCE(turn_number, 0)"},
+    )
 
     # Build text
     lines: list[str] = []
@@ -301,21 +314,20 @@ async def download_call_transcript(call_id: UUID, _: dict[str, Any] = _perm_r) -
     lines.append("")
 
     speaker_map = {"bot": "Бот", "customer": "Клієнт"}
-    for t_row in turns:
-        speaker = speaker_map.get(t_row["speaker"], t_row["speaker"] or "?")
-        lines.append(f"[{speaker}]")
-        lines.append(t_row["content"] or "")
-        lines.append("")
 
-    content = "\n".join(lines)
+    async def _chunks() -> AsyncIterator[bytes]:
+        yield "\n".join(lines).encode("utf-8")
+        async for page in pages:
+            parts: list[str] = []
+            for t_row in page:
+                speaker = speaker_map.get(t_row["speaker"], t_row["speaker"] or "?")
+                parts.append(f"\n[{speaker}]\n{t_row['content'] or ''}\n")
+            yield "".join(parts).encode("utf-8")
+
     date_part = started[:10] if started else "unknown"
     filename = f"transcript_{date_part}_{call_id}.txt"
 
-    return Response(
-        content=content.encode("utf-8"),
-        media_type="text/plain; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return streaming_download(_chunks(), filename, "text/plain; charset=utf-8", gzip=gzip)
 
 
 @router.get("/summary")
@@ -330,45 +342,16 @@ async def get_summary(
     limit: int = Query(90, ge=1, le=365, description="Max days to return"),
     _: dict[str, Any] = _perm_r,
 ) -> dict[str, Any]:
-    """Aggregated daily statistics from daily_stats table or live from calls."""
+    """Aggregated daily statistics: hourly rollup plus a live tail of recent calls."""
     engine = await _get_engine()
 
-    # Always aggregate live from calls table (daily_stats may be empty)
-    conditions = ["1=1"]
-    params: dict[str, Any] = {"limit": limit}
-
-    if tenant_id:
-        conditions.append("tenant_id = CAST(:tenant_id AS uuid)")
-        params["tenant_id"] = tenant_id
-
-    if date_from:
-        conditions.append("started_at >= :date_from")
-        params["date_from"] = date_type.fromisoformat(date_from)
-    if date_to:
-        conditions.append("started_at < :date_to_end")
-        params["date_to_end"] = date_type.fromisoformat(date_to) + timedelta(days=1)
-
-    where_clause = " AND ".join(conditions)
-
     async with engine.begin() as conn:
-        result = await conn.execute(
-            text(f"""
-                SELECT
-                    DATE(started_at) AS stat_date,
-                    COUNT(*) AS total_calls,
-                    COUNT(*) FILTER (WHERE NOT transferred_to_operator) AS resolved_by_bot,
-                    COUNT(*) FILTER (WHERE transferred_to_operator) AS transferred,
-                    AVG(duration_seconds) AS avg_duration_seconds,
-                    AVG(quality_score) AS avg_quality_score,
-                    SUM(total_cost_usd) AS total_cost_usd
-                FROM calls
-                WHERE {where_clause}
-                GROUP BY DATE(started_at)
-                ORDER BY stat_date DESC
-                LIMIT :limit
-            """),
-            params,
+        stats = await fetch_daily_stats(
+            conn,
+            date_from=date_type.fromisoformat(date_from) if date_from else None,
+            date_to_end=(date_type.fromisoformat(date_to) + timedelta(days=1) if date_to else None),
+            tenant_id=tenant_id,
+            limit=limit,
         )
-        stats = [dict(row._mapping) for row in result]
 
     return {"daily_stats": stats}
@@ -1,60 +1,108 @@
-"""Export API endpoints — CSV and PDF downloads.
+"""Export API endpoints — CSV/NDJSON/Parquet and PDF downloads.
 
-Provides CSV export for calls and daily statistics,
-and PDF report download for weekly summaries.
+Provides streamed exports for calls and daily statistics (see
+``src.api.export_stream``), and PDF report download for weekly summaries.
 """
 
 from __future__ import annotations
 
-import csv
-import io
+import json
 import logging
 from datetime import date as date_type
 from datetime import timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import Response, StreamingResponse
-from sqlalchemy import text
 
 from src.api.auth import require_permission
 from src.api.database import get_engine as _get_engine
+from src.api.export_stream import EXPORT_FORMAT_PATTERN, export_response, keyset_pages
 from src.logging.pii_sanitizer import sanitize_phone
+from src.reports.call_stats import fetch_daily_stats
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
-_MAX_EXPORT_ROWS = 10000
-
 # Module-level dependency to satisfy B008 lint rule
 _perm_export = Depends(require_permission("analytics:export"))
 
-
-def _csv_streaming_response(
-    rows: list[dict[str, Any]],
-    columns: list[str],
-    filename: str,
-) -> StreamingResponse:
-    """Build a StreamingResponse that yields CSV lines."""
-
-    def _generate() -> Any:
-        buf = io.StringIO()
-        writer = csv.DictWriter(buf, fieldnames=columns)
-        writer.writeheader()
-        yield buf.getvalue()
-        buf.seek(0)
-        buf.truncate(0)
-        for row in rows:
-            writer.writerow(row)
-            yield buf.getvalue()
-            buf.seek(0)
-            buf.truncate(0)
-
-    return StreamingResponse(
-        _generate(),
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+_CALL_COLUMNS = [
+    "call_id",
+    "started_at",
+    "duration_sec",
+    "caller_id",
+    "scenario",
+    "transferred",
+    "transfer_reason",
+    "quality_score",
+    "total_cost",
+]
+_CALL_TYPES = {
+    "duration_sec": "int64",
+    "transferred": "bool",
+    "quality_score": "float64",
+    "total_cost": "float64",
+}
+
+_SUMMARY_COLUMNS = [
+    "date",
+    "total_calls",
+    "resolved_by_bot",
+    "transferred",
+    "avg_duration_sec",
+    "avg_quality",
+    "total_cost",
+    "top_scenario",
+]
+_SUMMARY_TYPES = {
+    "total_calls": "int64",
+    "resolved_by_bot": "int64",
+    "transferred": "int64",
+    "avg_duration_sec": "float64",
+    "avg_quality": "float64",
+    "total_cost": "float64",
+}
+
+
+def _format_call_row(r: dict[str, Any]) -> dict[str, Any]:
+    """Export row for a call, with the caller's phone masked."""
+    return {
+        "call_id": str(r["id"]),
+        "started_at": str(r["started_at"] or ""),
+        "duration_sec": r["duration_seconds"] or 0,
+        "caller_id": sanitize_phone(str(r["caller_id"] or "")),
+        "scenario": r["scenario"] or "",
+        "transferred": r["transferred_to_operator"] or False,
+        "transfer_reason": r["transfer_reason"] or "",
+        "quality_score": r["quality_score"],
+        "total_cost": r["total_cost_usd"],
+    }
+
+
+def _format_summary_row(r: dict[str, Any]) -> dict[str, Any]:
+    # Extract top scenario from scenario_breakdown JSON
+    breakdown = r.get("scenario_breakdown")
+    top_scenario = ""
+    if breakdown:
+        if isinstance(breakdown, str):
+            breakdown = json.loads(breakdown)
+        if isinstance(breakdown, dict) and breakdown:
+            top_scenario = max(breakdown, key=breakdown.get)  # type: ignore[arg-type]
+
+    return {
+        "date": str(r["stat_date"]),
+        "total_calls": r["total_calls"] or 0,
+        "resolved_by_bot": r["resolved_by_bot"] or 0,
+        "transferred": r["transferred"] or 0,
+        "avg_duration_sec": round(float(r["avg_duration_seconds"] or 0), 1),
+        "avg_quality": round(float(r["avg_quality_score"] or 0), 3),
+        "total_cost": round(float(r["total_cost_usd"] or 0), 4),
+        "top_scenario": top_scenario,
+    }
 
 
 @router.get("/calls/export")
@@ -69,13 +117,17 @@ async def export_calls_csv(
     transferred: bool | None = Query(None, description="Filter transferred calls"),
     min_quality: float | None = Query(None, description="Minimum quality score"),
     tenant_id: str | None = Query(None, description="Filter by tenant UUID"),
+    fmt: str = Query(
+        "csv", alias="format", pattern=EXPORT_FORMAT_PATTERN, description="csv, ndjson or parquet"
+    ),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
     _: dict[str, Any] = _perm_export,
 ) -> StreamingResponse:
-    """Export calls as CSV with masked PII."""
+    """Export calls with masked PII, streamed newest first without a row cap."""
     engine = await _get_engine()
 
-    conditions = ["1=1"]
-    params: dict[str, Any] = {"limit": _MAX_EXPORT_ROWS}
+    conditions: list[str] = []
+    params: dict[str, Any] = {}
 
     if date_from:
         conditions.append("started_at >= :date_from")
@@ -96,59 +148,34 @@ async def export_calls_csv(
         conditions.append("tenant_id = CAST(:tenant_id AS uuid)")
         params["tenant_id"] = tenant_id
 
-    where_clause = " AND ".join(conditions)
-
-    async with engine.begin() as conn:
-        result = await conn.execute(
-            text(f"""
-                SELECT
-                    id, started_at, duration_seconds, caller_id,
-                    scenario, transferred_to_operator, transfer_reason,
-                    quality_score, total_cost_usd
-                FROM calls
-                WHERE {where_clause}
-                ORDER BY started_at DESC
-                LIMIT :limit
-            """),
-            params,
-        )
-        rows_raw = [dict(row._mapping) for row in result]
-
-    # Mask PII and format rows
-    rows: list[dict[str, Any]] = []
-    for r in rows_raw:
-        rows.append(
-            {
-                "call_id": str(r["id"]),
-                "started_at": str(r["started_at"] or ""),
-                "duration_sec": r["duration_seconds"] or 0,
-                "caller_id": sanitize_phone(str(r["caller_id"] or "")),
-                "scenario": r["scenario"] or "",
-                "transferred": r["transferred_to_operator"] or False,
-                "transfer_reason": r["transfer_reason"] or "",
-                "quality_score": r["quality_score"] if r["quality_score"] is not None else "",
-                "total_cost": r["total_cost_usd"] if r["total_cost_usd"] is not None else "",
-            }
-        )
-
-    columns = [
-        "call_id",
-        "started_at",
-        "duration_sec",
-        "caller_id",
-        "scenario",
-        "transferred",
-        "transfer_reason",
-        "quality_score",
-        "total_cost",
-    ]
+    pages = keyset_pages(
+        engine,
+        select="""
+            SELECT
+                id, started_at, duration_seconds, caller_id,
+                scenario, transferred_to_operator, transfer_reason,
+                quality_score, total_cost_usd
+            FROM calls
+        """,
+        where=conditions,
+        params=params,
+        order=("started_at", "id"),
+        descending=True,
+    )
 
     # Build filename from date range
     d_from = date_from or "all"
     d_to = date_to or "all"
-    filename = f"calls_{d_from}_{d_to}.csv"
 
-    return _csv_streaming_response(rows, columns, filename)
+    return export_response(
+        pages,
+        columns=_CALL_COLUMNS,
+        format_row=_format_call_row,
+        filename_stem=f"calls_{d_from}_{d_to}",
+        fmt=fmt,
+        gzip=gzip,
+        types=_CALL_TYPES,
+    )
 
 
 @router.get("/summary/export")
@@ -160,90 +187,40 @@ async def export_summary_csv(
         None, description="End date (YYYY-MM-DD)", pattern=r"^\d{4}-\d{2}-\d{2}$"
     ),
     tenant_id: str | None = Query(None, description="Filter by tenant UUID"),
+    fmt: str = Query(
+        "csv", alias="format", pattern=EXPORT_FORMAT_PATTERN, description="csv, ndjson or parquet"
+    ),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
     _: dict[str, Any] = _perm_export,
 ) -> StreamingResponse:
-    """Export daily statistics as CSV."""
+    """Export daily statistics (from the hourly rollup)."""
     engine = await _get_engine()
 
-    # Always aggregate from calls table (daily_stats may be empty)
-    conditions = ["1=1"]
-    params: dict[str, Any] = {"limit": _MAX_EXPORT_ROWS}
-
-    if tenant_id:
-        conditions.append("tenant_id = CAST(:tenant_id AS uuid)")
-        params["tenant_id"] = tenant_id
-    if date_from:
-        conditions.append("started_at >= :date_from")
-        params["date_from"] = date_type.fromisoformat(date_from)
-    if date_to:
-        conditions.append("started_at < :date_to_end")
-        params["date_to_end"] = date_type.fromisoformat(date_to) + timedelta(days=1)
-
-    where_clause = " AND ".join(conditions)
-
-    async with engine.begin() as conn:
-        result = await conn.execute(
-            text(f"""
-                SELECT
-                    DATE(started_at) AS stat_date,
-                    COUNT(*) AS total_calls,
-                    COUNT(*) FILTER (WHERE NOT transferred_to_operator) AS resolved_by_bot,
-                    COUNT(*) FILTER (WHERE transferred_to_operator) AS transferred,
-                    AVG(duration_seconds) AS avg_duration_seconds,
-                    AVG(quality_score) AS avg_quality_score,
-                    SUM(total_cost_usd) AS total_cost_usd
-                FROM calls
-                WHERE {where_clause}
-                GROUP BY DATE(started_at)
-                ORDER BY stat_date DESC
-                LIMIT :limit
-            """),
-            params,
-        )
-        rows_raw = [dict(row._mapping) for row in result]
-
-    import json
-
-    rows: list[dict[str, Any]] = []
-    for r in rows_raw:
-        # Extract top scenario from scenario_breakdown JSON
-        breakdown = r.get("scenario_breakdown")
-        top_scenario = ""
-        if breakdown:
-            if isinstance(breakdown, str):
-                breakdown = json.loads(breakdown)
-            if isinstance(breakdown, dict) and breakdown:
-                top_scenario = max(breakdown, key=breakdown.get)  # type: ignore[arg-type]
-
-        rows.append(
-            {
-                "date": str(r["stat_date"]),
-                "total_calls": r["total_calls"] or 0,
-                "resolved_by_bot": r["resolved_by_bot"] or 0,
-                "transferred": r["transferred"] or 0,
-                "avg_duration_sec": round(float(r["avg_duration_seconds"] or 0), 1),
-                "avg_quality": round(float(r["avg_quality_score"] or 0), 3),
-                "total_cost": round(float(r["total_cost_usd"] or 0), 4),
-                "top_scenario": top_scenario,
-            }
-        )
-
-    columns = [
-        "date",
-        "total_calls",
-        "resolved_by_bot",
-        "transferred",
-        "avg_duration_sec",
-        "avg_quality",
-        "total_cost",
-        "top_scenario",
-    ]
+    async def _pages() -> AsyncIterator[list[dict[str, Any]]]:
+        async with engine.begin() as conn:
+            rows = await fetch_daily_stats(
+                conn,
+                date_from=date_type.fromisoformat(date_from) if date_from else None,
+                date_to_end=(
+                    date_type.fromisoformat(date_to) + timedelta(days=1) if date_to else None
+                ),
+                tenant_id=tenant_id,
+            )
+        if rows:
+            yield rows
 
     d_from = date_from or "all"
     d_to = date_to or "all"
-    filename = f"daily_stats_{d_from}_{d_to}.csv"
 
-    return _csv_streaming_response(rows, columns, filename)
+    return export_response(
+        _pages(),
+        columns=_SUMMARY_COLUMNS,
+        format_row=_format_summary_row,
+        filename_stem=f"daily_stats_{d_from}_{d_to}",
+        fmt=fmt,
+        gzip=gzip,
+        types=_SUMMARY_TYPES,
+    )
 
 
 @router.get("/report/pdf")
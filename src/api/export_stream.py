@@ -0,0 +1,236 @@
+"""Streaming export machinery — keyset-paginated reads and chunked encoders.
+
+Exports never hold the whole result in memory: rows are read page by page
+with keyset pagination (one short transaction per page, so no connection
+stays pinned for a slow download), formatted and encoded per page, and
+yielded to the client as they are produced. Output formats are CSV, NDJSON
+and Parquet (needs the optional ``pyarrow`` dependency); any of them can be
+gzip-compressed on the fly.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import logging
+import zlib
+from typing import TYPE_CHECKING, Any
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+EXPORT_PAGE_SIZE = 2000
+
+# Query-parameter pattern for the ``format`` of an export endpoint
+EXPORT_FORMAT_PATTERN = r"^(csv|ndjson|parquet)$"
+
+_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+async def keyset_pages(
+    engine: AsyncEngine,
+    *,
+    select: str,
+    where: list[str],
+    params: dict[str, Any],
+    order: tuple[str, ...],
+    expressions: dict[str, str] | None = None,
+    descending: bool = False,
+    page_size: int | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield the rows of ``select`` page by page, walking ``order`` columns.
+
+    ``order`` must be unique per row (e.g. ``("started_at", "id")``) and be
+    selected under those names; each page resumes after the last row of the
+    previous one instead of using OFFSET. Keys must never be NULL: a nullable
+    column is walked through an entry in ``expressions`` mapping its name to
+    a non-NULL SQL expression (e.g. ``COALESCE(turn_number, 0)``), selected
+    under that name.
+    """
+    page_size = page_size or EXPORT_PAGE_SIZE
+    op, direction = ("<", "DESC") if descending else (">", "ASC")
+    keys = [(expressions or {}).get(col, col) for col in order]
+    order_by = ", ".join(f"{key} {direction}" for key in keys)
+    after = f"({', '.join(keys)}) {op} ({', '.join(f':after_{col}' for col in order)})"
+    cursor: dict[str, Any] | None = None
+
+    while True:
+        conditions = [*where, after] if cursor is not None else list(where)
+        page_params = {**params, **(cursor or {}), "page_limit": page_size}
+        async with engine.begin() as conn:
+            result = await conn.execute(
+                text(f"""
+                    {select}
+                    WHERE {" AND ".join(conditions) or "TRUE"}
+                    ORDER BY {order_by}
+                    LIMIT :page_limit
+                """),
+                page_params,
+            )
+            rows = [dict(row._mapping) for row in result]
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        cursor = {f"after_{col}": rows[-1][col] for col in order}
+
+
+class _CsvEncoder:
+    def __init__(self, columns: list[str]) -> None:
+        self._buf = io.StringIO()
+        self._writer = csv.DictWriter(self._buf, fieldnames=columns)
+
+    def _take(self) -> bytes:
+        data = self._buf.getvalue().encode("utf-8")
+        self._buf.seek(0)
+        self._buf.truncate(0)
+        return data
+
+    def start(self) -> bytes:
+        self._writer.writeheader()
+        return self._take()
+
+    def encode(self, rows: list[dict[str, Any]]) -> bytes:
+        self._writer.writerows(rows)
+        return self._take()
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _NdjsonEncoder:
+    def __init__(self, columns: list[str]) -> None:
+        self._columns = columns
+
+    def start(self) -> bytes:
+        return b""
+
+    def encode(self, rows: list[dict[str, Any]]) -> bytes:
+        return "".join(
+            json.dumps({c: row.get(c) for c in self._columns}, ensure_ascii=False, default=str)
+            + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _ParquetEncoder:
+    """One Parquet row group per page, flushed as soon as it is written."""
+
+    def __init__(self, columns: list[str], types: dict[str, str]) -> None:
+        import pyarrow as pa  # type: ignore[import-not-found]
+        import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+        self._pa = pa
+        self._schema = pa.schema([(c, pa.type_for_alias(types.get(c, "string"))) for c in columns])
+        self._sink = io.BytesIO()
+        self._writer = pq.ParquetWriter(self._sink, self._schema)
+
+    def _take(self) -> bytes:
+        data = self._sink.getvalue()
+        self._sink.seek(0)
+        self._sink.truncate(0)
+        return data
+
+    def start(self) -> bytes:
+        return self._take()
+
+    def encode(self, rows: list[dict[str, Any]]) -> bytes:
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+        return self._take()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._take()
+
+
+def _make_encoder(fmt: str, columns: list[str], types: dict[str, str]) -> Any:
+    if fmt == "csv":
+        return _CsvEncoder(columns)
+    if fmt == "ndjson":
+        return _NdjsonEncoder(columns)
+    try:
+        return _ParquetEncoder(columns, types)
+    except ImportError:
+        raise HTTPException(
+            status_code=501, detail="Parquet export requires the pyarrow package"
+        ) from None
+
+
+def streaming_download(
+    chunks: AsyncIterator[bytes],
+    filename: str,
+    media_type: str,
+    *,
+    gzip: bool = False,
+) -> StreamingResponse:
+    """Stream ``chunks`` as a file download, optionally as ``<filename>.gz``."""
+
+    async def _body() -> AsyncIterator[bytes]:
+        compressor = zlib.compressobj(wbits=31) if gzip else None  # 31 = gzip container
+        try:
+            async for chunk in chunks:
+                out = compressor.compress(chunk) if compressor else chunk
+                if out:
+                    yield out
+        except Exception:
+            # Headers are already sent; the truncated body is all we can signal
+            logger.exception("Streaming export of %s failed", filename)
+            raise
+        if compressor:
+            yield compressor.flush()
+
+    if gzip:
+        filename, media_type = f"{filename}.gz", "application/gzip"
+    return StreamingResponse(
+        _body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def export_response(
+    pages: AsyncIterator[list[dict[str, Any]]],
+    *,
+    columns: list[str],
+    format_row: Callable[[dict[str, Any]], dict[str, Any]],
+    filename_stem: str,
+    fmt: str = "csv",
+    gzip: bool = False,
+    types: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """Encode ``pages`` of DB rows into a streamed CSV / NDJSON / Parquet download.
+
+    Args:
+        pages: Row pages, e.g. from ``keyset_pages``; consumed lazily.
+        columns: Output columns, in order.
+        format_row: Maps a DB row to an output row (PII masking etc.).
+        filename_stem: File name without extension.
+        fmt: Output format: ``csv``, ``ndjson`` or ``parquet``.
+        gzip: Compress the stream.
+        types: Arrow type aliases per column for Parquet (default ``string``).
+    """
+    encoder = _make_encoder(fmt, columns, types or {})
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        yield encoder.start()
+        async for page in pages:
+            yield encoder.encode([format_row(row) for row in page])
+        yield encoder.finish()
+
+    return streaming_download(_chunks(), f"{filename_stem}.{fmt}", _MEDIA_TYPES[fmt], gzip=gzip)
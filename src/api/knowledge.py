@@ -64,8 +64,11 @@ def _invalidate_promos_cache() -> None:
         settings = get_settings()
         from redis import Redis as SyncRedis
 
+        from src.core.tenant_context import INVALIDATE_CHANNEL as TENANT_CONTEXT_CHANNEL
+
         r = SyncRedis.from_url(settings.redis.url)
         r.set("promotions:cache_ts", str(_time.time()))
+        r.publish(TENANT_CONTEXT_CHANNEL, "promotions")
         r.close()
     except Exception:
         logger.debug("Could not invalidate promotions cache", exc_info=True)
@@ -18,6 +18,7 @@ from src.api.auth import require_permission
 from src.api.database import get_engine as _get_engine
 from src.monitoring.pricing_cache import invalidate as _invalidate_pricing
 from src.monitoring.pricing_cache import refresh_from_db as _refresh_pricing
+from src.reports.llm_usage import fetch_freshness, fetch_usage_totals
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin/llm-costs", tags=["llm-costs"])
@@ -486,49 +487,20 @@ async def usage_summary(
     tenant_id: str | None = _q_tenant_id,
     _: Any = _perm_r,
 ) -> dict[str, Any]:
-    """Aggregate LLM usage by task_type and provider for a period."""
-    conditions = ["1=1"]
-    params: dict[str, Any] = {}
-
-    if date_from:
-        conditions.append("u.created_at >= :df")
-        params["df"] = date_from
-    if date_to:
-        conditions.append("u.created_at < :dt")
-        params["dt"] = date_to + timedelta(days=1)
-    if task_type:
-        conditions.append("u.task_type = :tt")
-        params["tt"] = task_type
-    if tenant_id:
-        conditions.append("u.tenant_id = :tid")
-        params["tid"] = tenant_id
-
-    where = " AND ".join(conditions)
+    """Aggregate LLM usage by task_type and provider for a period.
 
+    Served from the daily usage rollup plus the live tail past it;
+    ``freshness`` tells how far the rollup reaches.
+    """
     engine = await _get_engine()
     async with engine.begin() as conn:
-        rows = await conn.execute(
-            text(f"""
-                SELECT
-                    u.task_type,
-                    u.provider_key,
-                    COUNT(*) AS call_count,
-                    SUM(u.input_tokens)  AS total_input_tokens,
-                    SUM(u.output_tokens) AS total_output_tokens,
-                    AVG(u.latency_ms)    AS avg_latency_ms,
-                    COALESCE(
-                        SUM(u.input_tokens)  / 1000000.0 * p.input_price_per_1m +
-                        SUM(u.output_tokens) / 1000000.0 * p.output_price_per_1m,
-                        0
-                    ) AS total_cost
-                FROM llm_usage_log u
-                LEFT JOIN llm_model_pricing p ON p.provider_key = u.provider_key
-                WHERE {where}
-                GROUP BY u.task_type, u.provider_key,
-                         p.input_price_per_1m, p.output_price_per_1m
-                ORDER BY total_cost DESC
-            """),
-            params,
+        freshness = await fetch_freshness(conn)
+        rows = await fetch_usage_totals(
+            conn,
+            date_from=date_from,
+            date_to_end=date_to + timedelta(days=1) if date_to else None,
+            task_type=task_type,
+            tenant_id=tenant_id,
         )
         items = [
             {
@@ -542,7 +514,11 @@ async def usage_summary(
             }
             for r in rows
         ]
-    return {"items": items, "period": {"from": str(date_from), "to": str(date_to)}}
+    return {
+        "items": items,
+        "period": {"from": str(date_from), "to": str(date_to)},
+        "freshness": freshness,
+    }
 
 
 @router.get("/usage/model-comparison")
@@ -555,46 +531,22 @@ async def model_comparison(
 ) -> dict[str, Any]:
     """Compare actual cost vs hypothetical cost on other models.
 
-    Takes real token usage from llm_usage_log and recalculates
-    what each model in llm_model_pricing would have cost.
+    Takes real token usage (daily usage rollup plus live tail) and
+    recalculates what each model in llm_model_pricing would have cost.
     Only includes models with include_in_comparison=true.
     """
-    conditions = ["1=1"]
-    params: dict[str, Any] = {}
-
-    if date_from:
-        conditions.append("created_at >= :df")
-        params["df"] = date_from
-    if date_to:
-        conditions.append("created_at < :dt")
-        params["dt"] = date_to + timedelta(days=1)
-    if task_type:
-        conditions.append("task_type = :tt")
-        params["tt"] = task_type
-    if tenant_id:
-        conditions.append("tenant_id = :tid")
-        params["tid"] = tenant_id
-
-    where = " AND ".join(conditions)
-
     engine = await _get_engine()
     async with engine.begin() as conn:
+        freshness = await fetch_freshness(conn)
         # Aggregate actual usage
-        agg = await conn.execute(
-            text(f"""
-                SELECT
-                    provider_key AS actual_provider,
-                    SUM(input_tokens)  AS total_input_tokens,
-                    SUM(output_tokens) AS total_output_tokens,
-                    COUNT(*) AS call_count
-                FROM llm_usage_log
-                WHERE {where}
-                GROUP BY provider_key
-                ORDER BY call_count DESC
-            """),
-            params,
+        usage_rows = await fetch_usage_totals(
+            conn,
+            date_from=date_from,
+            date_to_end=date_to + timedelta(days=1) if date_to else None,
+            task_type=task_type,
+            tenant_id=tenant_id,
+            by_task_type=False,
         )
-        usage_rows = agg.fetchall()
 
         if not usage_rows:
             return {
@@ -605,12 +557,13 @@ async def model_comparison(
                 "total_input_tokens": 0,
                 "total_output_tokens": 0,
                 "comparisons": [],
+                "freshness": freshness,
             }
 
         # Sum across providers for total tokens
         total_input = sum(r.total_input_tokens for r in usage_rows)
         total_output = sum(r.total_output_tokens for r in usage_rows)
-        actual_provider = usage_rows[0].actual_provider  # most-used provider
+        actual_provider = max(usage_rows, key=lambda r: r.call_count).provider_key  # most-used
 
         # Get pricing for comparison (only include_in_comparison=true)
         pricing = await conn.execute(
@@ -624,24 +577,8 @@ async def model_comparison(
         )
         pricing_rows = pricing.fetchall()
 
-        # Calculate actual cost from per-provider usage (use all pricing for actual calc)
-        all_pricing = await conn.execute(
-            text("""
-                SELECT provider_key, input_price_per_1m, output_price_per_1m
-                FROM llm_model_pricing
-            """)
-        )
-        all_pricing_rows = all_pricing.fetchall()
-        pricing_map = {r.provider_key: r for r in all_pricing_rows}
-
-        actual_cost = 0.0
-        for ur in usage_rows:
-            pr = pricing_map.get(ur.actual_provider)
-            if pr:
-                actual_cost += (
-                    ur.total_input_tokens / 1_000_000 * float(pr.input_price_per_1m)
-                    + ur.total_output_tokens / 1_000_000 * float(pr.output_price_per_1m)
-                )
+        # Actual cost: each provider's usage at its own price (priced in the usage query)
+        actual_cost = sum(float(r.total_cost) for r in usage_rows)
 
         # Calculate hypothetical cost for each comparison model
         comparisons = []
@@ -670,4 +607,5 @@ async def model_comparison(
         "total_input_tokens": total_input,
         "total_output_tokens": total_output,
         "comparisons": comparisons,
+        "freshness": freshness,
     }
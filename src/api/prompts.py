@@ -6,19 +6,23 @@ CRUD for prompt versions and A/B test management.
 from __future__ import annotations
 
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 from uuid import UUID  # noqa: TC003 - FastAPI needs UUID at runtime for path params
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 
-from src.agent.ab_testing import QUALITY_CRITERIA, ABTestManager
+from src.agent.ab_testing import AB_TEST_CACHE_REDIS_KEY, QUALITY_CRITERIA, ABTestManager
 from src.agent.prompt_manager import PromptManager
 from src.agent.prompts import PROMPT_VERSION, SYSTEM_PROMPT
 from src.api.auth import require_permission
 from src.api.database import get_engine as _get_engine
-from src.api.export import _csv_streaming_response
+from src.api.export_stream import export_response
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/prompts", tags=["prompts"])
@@ -29,6 +33,17 @@ _perm_w = Depends(require_permission("prompts:write"))
 _perm_d = Depends(require_permission("prompts:delete"))
 
 
+async def _invalidate_ab_test_cache() -> None:
+    """Signal other instances to reload the active A/B test."""
+    try:
+        from src.core.redis_client import get_redis
+
+        redis = await get_redis()
+        await redis.set(AB_TEST_CACHE_REDIS_KEY, str(time.time()))
+    except Exception:
+        logger.debug("Failed to invalidate A/B test cache", exc_info=True)
+
+
 # --- Request models ---
 
 
@@ -157,6 +172,7 @@ async def create_ab_test(
         variant_b_id=request.variant_b_id,
         traffic_split=request.traffic_split,
     )
+    await _invalidate_ab_test_cache()
     return {"test": test}
 
 
@@ -169,6 +185,7 @@ async def stop_ab_test(test_id: UUID, _: dict[str, Any] = _perm_w) -> dict[str,
         test = await ab_manager.stop_test(test_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
+    await _invalidate_ab_test_cache()
     return {"test": test}
 
 
@@ -244,9 +261,13 @@ async def export_ab_test_report_csv(test_id: UUID, _: dict[str, Any] = _perm_r)
         total_row[f"criterion_{c}_b"] = cr.get("avg_b", "")
     rows.append(total_row)
 
+    async def _pages() -> AsyncIterator[list[dict[str, Any]]]:
+        yield rows
+
     test_name = report.get("test", {}).get("test_name", "ab_test")
-    filename = f"ab_report_{test_name}.csv"
-    return _csv_streaming_response(rows, columns, filename)
+    return export_response(
+        _pages(), columns=columns, format_row=dict, filename_stem=f"ab_report_{test_name}"
+    )
 
 
 # --- Prompt Optimizer ---
@@ -16,6 +16,7 @@ from pydantic import BaseModel
 
 from src.agent.prompts import PRONUNCIATION_RULES
 from src.api.auth import require_permission
+from src.core.tenant_context import publish_change
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
@@ -66,6 +67,7 @@ async def update_pronunciation_rules(
     """Save pronunciation rules to Redis."""
     redis = await _get_redis()
     await redis.set(REDIS_KEY, json.dumps({"rules": request.rules}))
+    await publish_change("pronunciation_rules", redis)
     logger.info("Pronunciation rules updated (%d chars)", len(request.rules))
     return {"message": "Pronunciation rules saved"}
 
@@ -75,5 +77,6 @@ async def reset_pronunciation_rules(_: dict[str, Any] = _perm_w) -> dict[str, An
     """Reset pronunciation rules to hardcoded defaults."""
     redis = await _get_redis()
     await redis.delete(REDIS_KEY)
+    await publish_change("pronunciation_rules", redis)
     logger.info("Pronunciation rules reset to defaults")
     return {"message": "Pronunciation rules reset to defaults", "rules": PRONUNCIATION_RULES}
@@ -171,11 +171,13 @@ async def reset_stt_base_phrases(_: dict[str, Any] = _perm_w) -> dict[str, Any]:
 @router.post("/phrase-hints/reset")
 async def reset_stt_phrase_hints(_: dict[str, Any] = _perm_w) -> dict[str, Any]:
     """Delete Redis key — fall back to base phrases only."""
+    from src.core.tenant_context import publish_change
     from src.stt.phrase_hints import get_base_phrases, invalidate_cache
 
     redis = await _get_redis()
     await redis.delete("stt:phrase_hints")
     invalidate_cache()
+    await publish_change("stt_phrase_hints", redis)
 
     base = get_base_phrases()
     logger.info("STT phrase hints reset to base only (%d phrases)", len(base))
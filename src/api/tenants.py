@@ -20,6 +20,7 @@ from sqlalchemy import text
 from src.agent.tools import ALL_TOOLS
 from src.api.auth import require_permission
 from src.api.database import get_engine as _get_engine
+from src.core.tenant_context import publish_change
 from src.core.working_hours import validate_schema as _validate_working_hours
 
 logger = logging.getLogger(__name__)
@@ -245,6 +246,7 @@ async def create_tenant(request: TenantCreate, _: dict[str, Any] = _perm_w) -> d
         raise
 
     logger.info("Created tenant: %s (slug=%s)", tenant_id, request.slug)
+    await publish_change("tenants")
     return {"message": "Tenant created", "id": tenant_id}
 
 
@@ -325,6 +327,7 @@ async def update_tenant(
             raise HTTPException(status_code=404, detail="Tenant not found")
 
     logger.info("Updated tenant %s", tenant_id)
+    await publish_change("tenants")
     return {"message": "Tenant updated"}
 
 
@@ -347,4 +350,5 @@ async def delete_tenant(tenant_id: UUID, _: dict[str, Any] = _perm_d) -> dict[st
             raise HTTPException(status_code=404, detail="Tenant not found")
 
     logger.info("Soft-deleted tenant %s", tenant_id)
+    await publish_change("tenants")
     return {"message": "Tenant deactivated"}
@@ -27,6 +27,7 @@ from sqlalchemy import text
 
 from src.api.auth import require_permission
 from src.api.database import get_engine as _get_engine
+from src.core.tenant_context import publish_change
 from src.utils.phone import normalize_phone_ua
 
 if TYPE_CHECKING:
@@ -93,6 +94,7 @@ async def _load_phones(redis: Redis) -> dict[str, list[dict[str, Any]]]:
 async def _save_phones(redis: Redis, phones: dict[str, list[dict[str, Any]]]) -> None:
     """Save phones to Redis."""
     await redis.set(REDIS_KEY, json.dumps(phones))
+    await publish_change("test_phones", redis)
 
 
 @router.get("/config")
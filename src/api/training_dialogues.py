@@ -17,6 +17,7 @@ from sqlalchemy import text
 from src.agent.prompt_manager import DIALOGUE_CACHE_REDIS_KEY
 from src.api.auth import require_permission
 from src.api.database import get_engine as _get_engine
+from src.core.tenant_context import publish_change
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
@@ -51,6 +52,7 @@ async def _invalidate_dialogue_cache() -> None:
     try:
         redis = await _get_redis()
         await redis.set(DIALOGUE_CACHE_REDIS_KEY, str(time.time()))
+        await publish_change("dialogue_examples", redis)
     except Exception:
         logger.debug("Failed to invalidate dialogue cache", exc_info=True)
 
@@ -17,6 +17,7 @@ from sqlalchemy import text
 from src.agent.prompt_manager import SAFETY_CACHE_REDIS_KEY
 from src.api.auth import require_permission
 from src.api.database import get_engine as _get_engine
+from src.core.tenant_context import publish_change
 from src.llm.helpers import llm_complete
 from src.llm.models import LLMTask
 
@@ -53,6 +54,7 @@ async def _invalidate_safety_cache() -> None:
     try:
         redis = await _get_redis()
         await redis.set(SAFETY_CACHE_REDIS_KEY, str(time.time()))
+        await publish_change("safety_rules", redis)
     except Exception:
         logger.debug("Failed to invalidate safety cache", exc_info=True)
 
@@ -16,6 +16,7 @@ from sqlalchemy import text
 
 from src.api.auth import require_permission
 from src.api.database import get_engine as _get_engine
+from src.core.tenant_context import publish_change
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/training/templates", tags=["training"])
@@ -147,6 +148,7 @@ async def create_template(
             msg = "Expected row from INSERT RETURNING"
             raise RuntimeError(msg)
 
+    await publish_change("response_templates")
     return {"item": dict(row._mapping), "message": "Response template created"}
 
 
@@ -193,6 +195,7 @@ async def update_template(
         if not row:
             raise HTTPException(status_code=404, detail="Response template not found")
 
+    await publish_change("response_templates")
     return {"item": dict(row._mapping), "message": "Response template updated"}
 
 
@@ -235,4 +238,5 @@ async def delete_template(template_id: UUID, _: dict[str, Any] = _perm_d) -> dic
             {"id": str(template_id)},
         )
 
+    await publish_change("response_templates")
     return {"message": "Response template variant deleted"}
@@ -6,15 +6,18 @@ Manage DB overrides for tool descriptions used by the LLM agent.
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy import text
 
+from src.agent.tool_loader import TOOLS_CACHE_REDIS_KEY
 from src.agent.tools import ALL_TOOLS
 from src.api.auth import require_permission
 from src.api.database import get_engine as _get_engine
+from src.core.tenant_context import publish_change
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/training/tools", tags=["training"])
@@ -26,6 +29,18 @@ _perm_d = Depends(require_permission("training:delete"))
 _TOOL_NAMES = [t["name"] for t in ALL_TOOLS]
 
 
+async def _invalidate_tools_cache() -> None:
+    """Signal cache invalidation via Redis timestamp."""
+    try:
+        from src.core.redis_client import get_redis
+
+        redis = await get_redis()
+        await redis.set(TOOLS_CACHE_REDIS_KEY, str(time.time()))
+        await publish_change("tool_overrides", redis)
+    except Exception:
+        logger.debug("Failed to invalidate tools cache", exc_info=True)
+
+
 class ToolOverrideRequest(BaseModel):
     description: str | None = None
     input_schema_override: dict[str, Any] | None = None
@@ -117,6 +132,7 @@ async def update_tool_override(
             msg = "Expected row from INSERT RETURNING"
             raise RuntimeError(msg)
 
+    await _invalidate_tools_cache()
     return {"item": dict(row._mapping), "message": f"Tool override for '{tool_name}' saved"}
 
 
@@ -143,4 +159,5 @@ async def delete_tool_override(tool_name: str, _: dict[str, Any] = _perm_d) -> d
         if not row:
             raise HTTPException(status_code=404, detail=f"No override found for tool '{tool_name}'")
 
+    await _invalidate_tools_cache()
     return {"message": f"Override for '{tool_name}' removed, using code default"}
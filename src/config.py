@@ -36,6 +36,13 @@ class GoogleSTTSettings(BaseSettings):
     # and merge them into one turn. Compensates for aggressive STT endpointing.
     # Safe to change — does not touch Google's stream config.
     transcript_buffer_sec: float = 1.2
+    # Speculative LLM turn (streaming pipeline only): once an interim
+    # transcript has not changed for speculative_stable_ms, start the LLM on
+    # it with output held back; the final transcript adopts it when the
+    # words match, otherwise it is cancelled. Off by default — misses cost
+    # LLM tokens (see callcenter_speculative_* metrics).
+    speculative_turn_enabled: bool = False
+    speculative_stable_ms: int = 300
 
     model_config = {"env_prefix": "GOOGLE_STT_"}
 
@@ -58,6 +65,27 @@ class GoogleTTSSettings(BaseSettings):
     model_config = {"env_prefix": "GOOGLE_TTS_"}
 
 
+class TTSCacheSettings(BaseSettings):
+    """Two-tier TTS audio cache: in-process LRU + shared Redis store."""
+
+    memory_max_mb: int = 32
+    shared_enabled: bool = True
+    shared_max_mb: int = 256
+    shared_ttl_days: int = 30
+
+    model_config = {"env_prefix": "TTS_CACHE_"}
+
+
+class TTSStreamingSettings(BaseSettings):
+    """Sentence → audio streaming between the LLM and the AudioSocket."""
+
+    chunked: bool = False  # stream sub-sentence PCM chunks (Chirp3-HD voices)
+    lookahead_sentences: int = 1  # sentences synthesized ahead of playback, per call
+    max_concurrent_per_process: int = 32  # TTS syntheses in flight across all calls
+
+    model_config = {"env_prefix": "TTS_STREAM_"}
+
+
 class AnthropicSettings(BaseSettings):
     api_key: str = ""
     model: str = "claude-haiku-4-5-20251001"
@@ -89,6 +117,9 @@ class OneCSettings(BaseSettings):
     full_sync_timeout: int = 1200  # Separate timeout for full catalog upload (~60K items)
     sync_interval_minutes: int = 5
     stock_cache_ttl: int = 300  # Redis TTL for stock cache (seconds)
+    schedule_cache_ttl: int = 180  # Redis TTL for fitting station schedules (>= 2x interval)
+    schedule_prefetch_days: int = 3  # Business days kept warm per station (0 = off)
+    schedule_prefetch_interval: int = 90  # Seconds between schedule prefetch round starts
     soap_wsdl_path: str = "/Trade/ws/TireAssemblyExchange.1cws"
     soap_timeout: int = 30  # Interactive SOAP timeout (shorter than REST sync)
 
@@ -143,6 +174,9 @@ class LoggingSettings(BaseSettings):
 class CelerySettings(BaseSettings):
     broker_url: str = "redis://localhost:6379/1"
     result_backend: str = "redis://localhost:6379/1"
+    # Per worker process: shared SQLAlchemy pool for all tasks
+    worker_db_pool_size: int = 5
+    worker_db_max_overflow: int = 5
 
     model_config = {"env_prefix": "CELERY_"}
 
@@ -150,6 +184,11 @@ class CelerySettings(BaseSettings):
 class QualitySettings(BaseSettings):
     llm_model: str = "claude-haiku-4-5-20251001"
     score_threshold: float = 0.5
+    # Off-peak batch scoring (evaluate_quality_batch); batch_mode=True stops per-call dispatch
+    batch_mode: bool = False
+    batch_size: int = 50
+    batch_concurrency: int = 8
+    batch_max_calls: int = 5000
 
     model_config = {"env_prefix": "QUALITY_"}
 
@@ -299,6 +338,8 @@ class Settings(BaseSettings):
     audio_socket: AudioSocketSettings = AudioSocketSettings()
     google_stt: GoogleSTTSettings = GoogleSTTSettings()
     google_tts: GoogleTTSSettings = GoogleTTSSettings()
+    tts_cache: TTSCacheSettings = TTSCacheSettings()
+    tts_stream: TTSStreamingSettings = TTSStreamingSettings()
     anthropic: AnthropicSettings = AnthropicSettings()
     openai: OpenAISettings = OpenAISettings()
     store_api: StoreAPISettings = StoreAPISettings()
@@ -407,6 +448,15 @@ class Settings(BaseSettings):
                 "Рекомендуется <= 30с: export ONEC_SOAP_TIMEOUT=30",
             )
 
+        # ONEC_SCHEDULE_CACHE_TTL — prefetched days must outlive the gap between rounds
+        ttl, interval = self.onec.schedule_cache_ttl, self.onec.schedule_prefetch_interval
+        if self.onec.schedule_prefetch_days > 0 and ttl < 2 * interval:
+            result.add(
+                "ONEC_SCHEDULE_CACHE_TTL",
+                f"TTL {ttl}с меньше двух интервалов предзагрузки расписаний ({interval}с)",
+                f"Установите >= {2 * interval}с: export ONEC_SCHEDULE_CACHE_TTL={2 * interval}",
+            )
+
         return result
 
 
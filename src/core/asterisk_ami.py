@@ -6,10 +6,14 @@ Application (like ``AudioSocket()``): both ``/channels/{id}/redirect`` and
 AMI operates at a lower level and its ``Redirect`` action can move any
 active channel to a different dialplan extension.
 
-The client is one-shot per transfer: connect → login → redirect → logoff.
-Transfers are rare (once per call at most), so the ~200ms setup cost is
-irrelevant and we avoid the complexity of a persistent connection with
-reconnect/heartbeat logic.
+The client keeps one logged-in AMI session (``Events: off``) open for the
+life of the process, so a transfer costs a single action round-trip instead
+of connect → login → redirect → logoff. Concurrent actions share the socket
+and are matched to their responses by ``ActionID``. A background task owns
+the connection: it pings Asterisk periodically, and when the session drops
+(or a ping goes unanswered) it reconnects with exponential backoff. A
+transfer arriving while disconnected triggers an immediate reconnect attempt
+and waits for it up to ``connect_timeout``.
 
 Protocol reference:
   https://docs.asterisk.org/Latest_API/API_Documentation/AMI_Actions/Redirect/
@@ -20,13 +24,28 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import time
 import uuid
 
+from src.monitoring.metrics import (
+    ami_connected,
+    asterisk_action_latency_ms,
+    asterisk_connections_total,
+)
+
 logger = logging.getLogger(__name__)
 
+_PING_INTERVAL_SEC = 20.0
+_RECONNECT_MIN_DELAY_SEC = 1.0
+_RECONNECT_MAX_DELAY_SEC = 30.0
+
 
 class AsteriskAMIClient:
-    """Minimal one-shot Asterisk AMI client for blind operator transfers."""
+    """Persistent Asterisk AMI session for blind operator transfers.
+
+    ``start()`` opens the session in the background (``redirect`` also does
+    so lazily); ``close()`` logs off and stops reconnecting.
+    """
 
     def __init__(
         self,
@@ -36,6 +55,9 @@ class AsteriskAMIClient:
         secret: str,
         connect_timeout: float = 3.0,
         action_timeout: float = 5.0,
+        *,
+        ping_interval: float = _PING_INTERVAL_SEC,
+        reconnect_max_delay: float = _RECONNECT_MAX_DELAY_SEC,
     ) -> None:
         self._host = host
         self._port = port
@@ -43,6 +65,42 @@ class AsteriskAMIClient:
         self._secret = secret
         self._connect_timeout = connect_timeout
         self._action_timeout = action_timeout
+        self._ping_interval = ping_interval
+        self._reconnect_max_delay = reconnect_max_delay
+        self._writer: asyncio.StreamWriter | None = None
+        self._write_lock = asyncio.Lock()
+        self._pending: dict[str, asyncio.Future[dict[str, str]]] = {}
+        self._run_task: asyncio.Task[None] | None = None
+        # Outcome of the next connection attempt (True = logged in)
+        self._attempt: asyncio.Future[bool] | None = None
+        self._wake = asyncio.Event()
+        self._closing = False
+
+    @property
+    def connected(self) -> bool:
+        """True while the AMI session is logged in."""
+        return self._writer is not None
+
+    async def start(self) -> None:
+        """Start the background connection loop (no-op without credentials)."""
+        if self._user and self._secret:
+            self._ensure_running()
+
+    def _ensure_running(self) -> None:
+        if self._run_task is None or self._run_task.done():
+            self._closing = False
+            loop = asyncio.get_running_loop()
+            self._attempt = loop.create_future()
+            self._run_task = loop.create_task(self._run())
+
+    async def close(self) -> None:
+        """Log off, close the connection and stop reconnecting."""
+        self._closing = True
+        task, self._run_task = self._run_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
 
     async def redirect(
         self,
@@ -64,23 +122,140 @@ class AsteriskAMIClient:
             logger.error("AMI not configured (AMI_USER/AMI_SECRET empty)")
             return False
 
-        writer: asyncio.StreamWriter | None = None
         try:
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, self._port),
-                timeout=self._connect_timeout,
+            if not await asyncio.wait_for(self._wait_connected(), self._connect_timeout):
+                return False
+            msg = await self._send_action(
+                "Redirect",
+                {
+                    "Channel": channel_name,
+                    "Context": context,
+                    "Exten": extension,
+                    "Priority": str(priority),
+                },
+            )
+        except TimeoutError:
+            logger.error(
+                "AMI Redirect timeout (channel=%s, host=%s:%d)",
+                channel_name,
+                self._host,
+                self._port,
             )
+            return False
+        except OSError as exc:
+            logger.error("AMI connection error: %s (host=%s:%d)", exc, self._host, self._port)
+            return False
 
+        if msg.get("Response", "").lower() == "success":
+            logger.info(
+                "AMI Redirect ok: channel=%s → %s,%s,%d",
+                channel_name,
+                context,
+                extension,
+                priority,
+            )
+            return True
+        logger.warning(
+            "AMI Redirect rejected: channel=%s response=%s message=%s",
+            channel_name,
+            msg.get("Response"),
+            msg.get("Message"),
+        )
+        return False
+
+    async def _wait_connected(self) -> bool:
+        """Wait for a logged-in session; False if the next attempt fails."""
+        while not self.connected:
+            self._ensure_running()
+            self._wake.set()  # skip the reconnect backoff
+            if self._attempt is None or not await asyncio.shield(self._attempt):
+                return False
+        return True
+
+    async def _send_action(self, action: str, fields: dict[str, str]) -> dict[str, str]:
+        """Send an action on the shared session and wait for its response.
+
+        Raises:
+            ConnectionError: If the session is down or drops before the response.
+            TimeoutError: If no response arrives within ``action_timeout``.
+        """
+        writer = self._writer
+        if writer is None:
+            raise ConnectionError("AMI session not connected")
+
+        action_id = uuid.uuid4().hex[:12]
+        future: asyncio.Future[dict[str, str]] = asyncio.get_running_loop().create_future()
+        self._pending[action_id] = future
+        lines = [f"Action: {action}"]
+        lines.extend(f"{key}: {value}" for key, value in fields.items())
+        lines.append(f"ActionID: {action_id}")
+        start = time.monotonic()
+        try:
+            async with self._write_lock:
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("utf-8"))
+                await writer.drain()
+            return await asyncio.wait_for(future, self._action_timeout)
+        finally:
+            self._pending.pop(action_id, None)
+            asterisk_action_latency_ms.labels(client="ami", action=action.lower()).observe(
+                (time.monotonic() - start) * 1000
+            )
+
+    async def _run(self) -> None:
+        """Own the AMI connection: connect, serve, reconnect with backoff."""
+        delay = _RECONNECT_MIN_DELAY_SEC
+        try:
+            while not self._closing:
+                self._wake.clear()
+                try:
+                    reader, writer = await self._connect()
+                except Exception as exc:
+                    asterisk_connections_total.labels(client="ami", outcome="failed").inc()
+                    logger.warning(
+                        "AMI connect failed: %s (host=%s:%d), retrying in %.0fs",
+                        str(exc) or type(exc).__name__,
+                        self._host,
+                        self._port,
+                        delay,
+                    )
+                    self._finish_attempt(False)
+                else:
+                    delay = _RECONNECT_MIN_DELAY_SEC
+                    await self._serve(reader, writer)
+                    if self._closing:
+                        break
+                    asterisk_connections_total.labels(client="ami", outcome="lost").inc()
+                    logger.warning(
+                        "AMI session lost (host=%s:%d), reconnecting", self._host, self._port
+                    )
+
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                delay = min(delay * 2, self._reconnect_max_delay)
+        finally:
+            self._finish_attempt(False)
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open the socket and log in.
+
+        Raises:
+            ConnectionError: If Asterisk rejects the login.
+            TimeoutError: If connect or login exceeds the timeouts.
+        """
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port),
+            timeout=self._connect_timeout,
+        )
+        try:
             # Asterisk sends a banner on connect: ``Asterisk Call Manager/x.y.z\r\n``
             await asyncio.wait_for(reader.readline(), timeout=self._action_timeout)
 
-            action_id = uuid.uuid4().hex[:12]
             login = (
                 "Action: Login\r\n"
                 f"Username: {self._user}\r\n"
                 f"Secret: {self._secret}\r\n"
                 "Events: off\r\n"
-                f"ActionID: {action_id}\r\n"
+                f"ActionID: {uuid.uuid4().hex[:12]}\r\n"
                 "\r\n"
             )
             writer.write(login.encode("utf-8"))
@@ -95,70 +270,70 @@ class AsteriskAMIClient:
                     login_msg.get("Response"),
                     login_msg.get("Message"),
                 )
-                return False
-
-            action_id = uuid.uuid4().hex[:12]
-            redirect = (
-                "Action: Redirect\r\n"
-                f"Channel: {channel_name}\r\n"
-                f"Context: {context}\r\n"
-                f"Exten: {extension}\r\n"
-                f"Priority: {priority}\r\n"
-                f"ActionID: {action_id}\r\n"
-                "\r\n"
-            )
-            writer.write(redirect.encode("utf-8"))
-            await writer.drain()
+                raise ConnectionError("AMI login rejected")
+        except BaseException:
+            await self._close_writer(writer)
+            raise
+        return reader, writer
 
-            # Skip any events (Events: off should suppress them, but a stray
-            # Response to our ActionID is what we want).
-            for _ in range(5):
-                msg = await asyncio.wait_for(
-                    self._read_message(reader), timeout=self._action_timeout
-                )
-                if msg.get("ActionID") != action_id:
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Dispatch responses by ActionID until the session drops or ``close()``."""
+        self._writer = writer
+        asterisk_connections_total.labels(client="ami", outcome="connected").inc()
+        ami_connected.set(1)
+        logger.info("AMI session established: %s:%d", self._host, self._port)
+        self._finish_attempt(True)
+        pinger = asyncio.get_running_loop().create_task(self._ping_loop(writer))
+        try:
+            while True:
+                msg = await self._read_message(reader)
+                if not msg:
+                    if reader.at_eof():
+                        break
                     continue
-                if msg.get("Response", "").lower() == "success":
-                    logger.info(
-                        "AMI Redirect ok: channel=%s → %s,%s,%d",
-                        channel_name,
-                        context,
-                        extension,
-                        priority,
-                    )
-                    return True
-                logger.warning(
-                    "AMI Redirect rejected: channel=%s response=%s message=%s",
-                    channel_name,
-                    msg.get("Response"),
-                    msg.get("Message"),
-                )
-                return False
-
-            logger.warning("AMI Redirect: no matching Response after 5 messages")
-            return False
-
-        except TimeoutError:
-            logger.error(
-                "AMI Redirect timeout (channel=%s, host=%s:%d)",
-                channel_name,
-                self._host,
-                self._port,
-            )
-            return False
-        except OSError as exc:
-            logger.error(
-                "AMI connection error: %s (host=%s:%d)", exc, self._host, self._port
-            )
-            return False
+                # Events are off; anything without a waiting ActionID is noise
+                future = self._pending.get(msg.get("ActionID", ""))
+                if future is not None and not future.done():
+                    future.set_result(msg)
+        except (OSError, ConnectionError):
+            logger.debug("AMI read failed", exc_info=True)
         finally:
-            if writer is not None:
+            self._writer = None
+            ami_connected.set(0)
+            pinger.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await pinger
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("AMI session closed"))
+            if self._closing:
                 with contextlib.suppress(OSError, ConnectionError):
                     writer.write(b"Action: Logoff\r\n\r\n")
-                    await writer.drain()
-                writer.close()
-                with contextlib.suppress(OSError, ConnectionError):
-                    await writer.wait_closed()
+            await self._close_writer(writer)
+
+    async def _ping_loop(self, writer: asyncio.StreamWriter) -> None:
+        """Health check: drop the connection when a Ping goes unanswered."""
+        while True:
+            await asyncio.sleep(self._ping_interval)
+            try:
+                await self._send_action("Ping", {})
+            except (TimeoutError, OSError, ConnectionError):
+                logger.warning("AMI ping failed, dropping the session")
+                writer.close()  # the reader sees EOF and the loop reconnects
+                return
+
+    def _finish_attempt(self, ok: bool) -> None:
+        """Resolve the current attempt for waiters and arm the next one."""
+        if self._attempt is not None and not self._attempt.done():
+            self._attempt.set_result(ok)
+        if not self._closing:
+            self._attempt = asyncio.get_running_loop().create_future()
+
+    @staticmethod
+    async def _close_writer(writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        with contextlib.suppress(OSError, ConnectionError):
+            await writer.wait_closed()
 
     async def _read_message(self, reader: asyncio.StreamReader) -> dict[str, str]:
         """Read one AMI message (fields until blank line)."""
@@ -1,20 +1,44 @@
 """Asterisk ARI (Asterisk REST Interface) client.
 
 Provides CallerID lookup and channel management for the Call Center AI.
+One client is opened at startup and shared by all calls: its session keeps
+a small pool of keep-alive connections, so call-setup lookups skip the TCP
+(and auth) handshake.
 """
 
 from __future__ import annotations
 
 import contextlib
 import logging
+import time
+from typing import Any
 
 import aiohttp
 
+from src.monitoring.metrics import asterisk_action_latency_ms, asterisk_connections_total
+
 logger = logging.getLogger(__name__)
 
 # Anonymous/restricted CallerID values to treat as hidden
 _ANONYMOUS_IDS = {"anonymous", "restricted", "unavailable", "unknown", ""}
 
+_POOL_SIZE = 10
+_KEEPALIVE_SEC = 60.0
+
+
+async def _on_connection_new(*_: Any) -> None:
+    asterisk_connections_total.labels(client="ari", outcome="new").inc()
+
+
+async def _on_connection_reused(*_: Any) -> None:
+    asterisk_connections_total.labels(client="ari", outcome="reused").inc()
+
+
+def _observe(action: str, start: float) -> None:
+    asterisk_action_latency_ms.labels(client="ari", action=action).observe(
+        (time.monotonic() - start) * 1000
+    )
+
 
 class AsteriskARIClient:
     """HTTP client for Asterisk ARI.
@@ -24,16 +48,35 @@ class AsteriskARIClient:
       - Transferring calls to operator queue
     """
 
-    def __init__(self, url: str, user: str, password: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        user: str,
+        password: str,
+        *,
+        pool_size: int = _POOL_SIZE,
+        keepalive: float = _KEEPALIVE_SEC,
+    ) -> None:
         self._url = url.rstrip("/")
         self._auth = aiohttp.BasicAuth(user, password)
+        self._pool_size = pool_size
+        self._keepalive = keepalive
         self._session: aiohttp.ClientSession | None = None
 
     async def open(self) -> None:
-        """Open the HTTP session."""
+        """Open the HTTP session and its keep-alive connection pool."""
+        if self._session is not None:
+            return
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(_on_connection_new)
+        trace.on_connection_reuseconn.append(_on_connection_reused)
         self._session = aiohttp.ClientSession(
             auth=self._auth,
             timeout=aiohttp.ClientTimeout(total=5),
+            connector=aiohttp.TCPConnector(
+                limit=self._pool_size, keepalive_timeout=self._keepalive
+            ),
+            trace_configs=[trace],
         )
 
     async def close(self) -> None:
@@ -51,6 +94,7 @@ class AsteriskARIClient:
             logger.warning("ARI client not opened")
             return None
 
+        start = time.monotonic()
         try:
             async with self._session.get(f"{self._url}/channels/{channel_uuid}") as resp:
                 if resp.status != 200:
@@ -75,6 +119,8 @@ class AsteriskARIClient:
         except (aiohttp.ClientError, OSError) as exc:
             logger.warning("ARI unavailable: %s", exc)
             return None
+        finally:
+            _observe("get_channel", start)
 
     async def get_channel_variable(self, channel_uuid: str, variable_name: str) -> str | None:
         """Get a channel variable value via ARI.
@@ -87,6 +133,7 @@ class AsteriskARIClient:
         if self._session is None:
             return None
 
+        start = time.monotonic()
         try:
             async with self._session.get(
                 f"{self._url}/channels/{channel_uuid}/variable",
@@ -115,6 +162,8 @@ class AsteriskARIClient:
         except (aiohttp.ClientError, OSError) as exc:
             logger.debug("ARI variable lookup failed: %s", exc)
             return None
+        finally:
+            _observe("get_variable", start)
 
     async def transfer_to_queue(
         self,
@@ -143,6 +192,7 @@ class AsteriskARIClient:
             return False
 
         target = channel_id_override or channel_uuid
+        start = time.monotonic()
         try:
             async with self._session.post(
                 f"{self._url}/channels/{target}/continue",
@@ -170,3 +220,5 @@ class AsteriskARIClient:
         except (aiohttp.ClientError, OSError) as exc:
             logger.warning("ARI transfer error: %s", exc)
             return False
+        finally:
+            _observe("continue", start)
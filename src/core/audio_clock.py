@@ -0,0 +1,263 @@
+"""Process-wide 20 ms audio clock for paced AudioSocket playback.
+
+One asyncio task ticks every AUDIO_FRAME_DURATION_MS and, in a single
+pass, writes the next frame for every active AudioSocketConnection:
+queued TTS/filler audio first, otherwise a keepalive silence frame when
+the connection has been quiet for longer than its idle threshold.
+
+This replaces one ``asyncio.sleep`` pacing loop per ``send_audio`` call
+plus one keepalive poller per call — with N calls that was 2N timers
+waking 50 times a second and jittering each other under load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.core.audio_socket import (
+    AUDIO_FRAME_BYTES,
+    AUDIO_FRAME_DURATION_MS,
+    AUDIO_PACKET_BYTES,
+    frame_audio_packets,
+)
+from src.monitoring.metrics import (
+    audio_clock_late_frames_total,
+    audio_clock_streams,
+    audio_clock_tick_duration_ms,
+    audio_clock_tick_jitter_ms,
+)
+
+if TYPE_CHECKING:
+    from src.core.audio_socket import AudioSocketConnection
+
+logger = logging.getLogger(__name__)
+
+_TICK_SEC = AUDIO_FRAME_DURATION_MS / 1000
+
+# A tick that wakes up late by a whole frame period or more emits the
+# missed frames in the same pass (like the old per-call monotonic pacing
+# did), but never more than this many — beyond that the schedule is
+# re-based and the backlog is counted as late instead of burst to Asterisk.
+_MAX_CATCHUP_FRAMES = 3
+
+_SILENCE_PACKET = frame_audio_packets(b"\x00" * AUDIO_FRAME_BYTES)
+
+
+@dataclass
+class _Playback:
+    """One queued clip: pre-framed packets plus completion future."""
+
+    packets: memoryview
+    cancel_event: asyncio.Event | None
+    done: asyncio.Future[bool]
+    offset: int = 0
+
+
+@dataclass
+class _Stream:
+    """Per-connection clock state."""
+
+    conn: AudioSocketConnection
+    queue: deque[_Playback] = field(default_factory=deque)
+    keepalive_idle_sec: float | None = None
+    keepalive_frames_sent: int = 0
+
+
+class AudioClock:
+    """Single ticker that paces outbound audio for all connections.
+
+    Use the process-wide instance from ``get_audio_clock()``.
+    """
+
+    def __init__(self) -> None:
+        self._streams: dict[int, _Stream] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def active_streams(self) -> int:
+        """Number of connections currently registered with the clock."""
+        return len(self._streams)
+
+    async def play(
+        self,
+        conn: AudioSocketConnection,
+        packets: bytes,
+        cancel_event: asyncio.Event | None = None,
+    ) -> bool:
+        """Queue pre-framed *packets* for *conn* and wait until played.
+
+        Returns ``True`` if *cancel_event* (barge-in) interrupted playback —
+        it is checked on every tick — and ``False`` when fully sent or the
+        connection closed. Clips queued on one connection play in order.
+        """
+        if cancel_event is not None and cancel_event.is_set():
+            return True
+        if not packets:
+            return False
+        self._ensure_running()
+        loop = asyncio.get_running_loop()
+        playback = _Playback(memoryview(packets), cancel_event, loop.create_future())
+        self._stream(conn).queue.append(playback)
+        try:
+            return await playback.done
+        finally:
+            self._discard_if_idle(conn)
+
+    def start_keepalive(self, conn: AudioSocketConnection, idle_ms: int) -> None:
+        """Emit silence for *conn* whenever its audio flow is idle for *idle_ms*."""
+        self._ensure_running()
+        self._stream(conn).keepalive_idle_sec = idle_ms / 1000
+
+    def stop_keepalive(self, conn: AudioSocketConnection) -> None:
+        """Stop keepalive silence for *conn* and log how much was sent."""
+        stream = self._streams.get(id(conn))
+        if stream is None or stream.keepalive_idle_sec is None:
+            return
+        stream.keepalive_idle_sec = None
+        self._log_keepalive_stats(stream)
+        self._discard_if_idle(conn)
+
+    # --- internals ---
+
+    def _stream(self, conn: AudioSocketConnection) -> _Stream:
+        stream = self._streams.get(id(conn))
+        if stream is None:
+            stream = _Stream(conn)
+            self._streams[id(conn)] = stream
+            audio_clock_streams.set(len(self._streams))
+        return stream
+
+    def _discard_if_idle(self, conn: AudioSocketConnection) -> None:
+        stream = self._streams.get(id(conn))
+        if stream is not None and not stream.queue and stream.keepalive_idle_sec is None:
+            del self._streams[id(conn)]
+            audio_clock_streams.set(len(self._streams))
+
+    def _ensure_running(self) -> None:
+        """Start the ticker on the running loop (restarting it after a loop change)."""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        if self._loop is not loop:
+            # Streams from a previous (closed) loop can never be served.
+            self._streams.clear()
+        self._loop = loop
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        start = time.monotonic()
+        ticks = 0
+        while self._streams:
+            ticks += 1
+            sleep_for = start + ticks * _TICK_SEC - time.monotonic()
+            if sleep_for > 0:
+                await asyncio.sleep(sleep_for)
+
+            now = time.monotonic()
+            lag = now - (start + ticks * _TICK_SEC)
+            audio_clock_tick_jitter_ms.observe(lag * 1000)
+            frames = 1
+            if lag >= _TICK_SEC:
+                missed = int(lag / _TICK_SEC)
+                frames += min(missed, _MAX_CATCHUP_FRAMES - 1)
+                ticks += frames - 1
+                if missed >= _MAX_CATCHUP_FRAMES:
+                    start, ticks = now, 0
+            self._tick(now, frames, late=lag >= _TICK_SEC)
+            audio_clock_tick_duration_ms.observe((time.monotonic() - now) * 1000)
+
+    def _tick(self, now: float, frames: int, *, late: bool) -> None:
+        """Write up to *frames* frames for every registered connection."""
+        written = 0
+        for key, stream in list(self._streams.items()):
+            conn = stream.conn
+            if conn.is_closed:
+                self._close_stream(key, stream)
+                continue
+            try:
+                for _ in range(frames):
+                    frame = self._next_frame(stream, now)
+                    if frame is None:
+                        break
+                    if not conn.write_frame(frame, now):
+                        self._close_stream(key, stream)
+                        break
+                    written += 1
+            except Exception:
+                # One broken connection must not stall playback for the rest.
+                logger.exception("Audio clock failed to emit frame for %s", conn.channel_uuid)
+                self._close_stream(key, stream)
+                continue
+            if not stream.queue and stream.keepalive_idle_sec is None:
+                self._streams.pop(key, None)
+                audio_clock_streams.set(len(self._streams))
+        if late and written:
+            audio_clock_late_frames_total.inc(written)
+
+    def _next_frame(self, stream: _Stream, now: float) -> memoryview | bytes | None:
+        """Pick the next frame for *stream*: queued audio, then keepalive silence."""
+        while stream.queue:
+            playback = stream.queue[0]
+            if playback.done.done():
+                stream.queue.popleft()
+                continue
+            if playback.cancel_event is not None and playback.cancel_event.is_set():
+                stream.queue.popleft()
+                playback.done.set_result(True)
+                continue
+            start = playback.offset
+            if stream.conn.first_audio_at is None:
+                stream.conn.mark_first_audio(now)
+            playback.offset = start + AUDIO_PACKET_BYTES
+            if playback.offset >= len(playback.packets):
+                stream.queue.popleft()
+                playback.done.set_result(False)
+            return playback.packets[start : start + AUDIO_PACKET_BYTES]
+
+        idle_sec = stream.keepalive_idle_sec
+        if idle_sec is None or now - stream.conn.last_send_time < idle_sec:
+            return None
+        if stream.keepalive_frames_sent == 0:
+            logger.info(
+                "keepalive silence stream started for %s (idle threshold %d ms)",
+                stream.conn.channel_uuid,
+                round(idle_sec * 1000),
+            )
+        stream.keepalive_frames_sent += 1
+        return _SILENCE_PACKET
+
+    def _close_stream(self, key: int, stream: _Stream) -> None:
+        """Connection went away — release waiters with ``False`` (not interrupted)."""
+        while stream.queue:
+            playback = stream.queue.popleft()
+            if not playback.done.done():
+                playback.done.set_result(False)
+        self._streams.pop(key, None)
+        audio_clock_streams.set(len(self._streams))
+        self._log_keepalive_stats(stream)
+
+    @staticmethod
+    def _log_keepalive_stats(stream: _Stream) -> None:
+        if stream.keepalive_frames_sent:
+            logger.info(
+                "keepalive stats for %s: %d silence frames sent",
+                stream.conn.channel_uuid,
+                stream.keepalive_frames_sent,
+            )
+
+
+_clock: AudioClock | None = None
+
+
+def get_audio_clock() -> AudioClock:
+    """Return the process-wide audio clock (created on first use)."""
+    global _clock
+    if _clock is None:
+        _clock = AudioClock()
+    return _clock
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING
 
 from src.llm.models import StreamDone, ToolCallDelta, ToolCallEnd, ToolCallStart, Usage
 from src.monitoring.metrics import time_to_first_audio_ms, tts_delivery_ms
-from src.tts.streaming_tts import AudioReady
+from src.tts.streaming_tts import AudioChunk, AudioReady
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -57,6 +57,8 @@ class StreamingAudioSender:
     """Consumes TTSEvent stream, sends audio to AudioSocket.
 
     - AudioReady → conn.send_audio(), accumulates spoken text
+    - AudioChunk → conn.send_audio() per chunk as it arrives; the sentence
+      counts as spoken once its last chunk is sent
     - ToolCallStart/Delta/End → collects into CollectedToolCall list
     - StreamDone → captures stop_reason + usage
     - Checks barge_in_event and conn.is_closed between sends
@@ -82,6 +84,7 @@ class StreamingAudioSender:
         self._turn_start_time = turn_start_time
         self._echo_canceller = echo_canceller
         self._first_audio_sent = False
+        self._first_sentence_sent = False
         self._filler_audio = filler_audio
         self._filler_delay_sec = filler_delay_sec
         self._filler_repeat_sec = filler_repeat_sec
@@ -96,6 +99,11 @@ class StreamingAudioSender:
         async with self._send_lock:
             return await self._conn.send_audio(audio, cancel_event=self._barge_in)
 
+    def _observe_ttfa(self, stage: str) -> None:
+        if self._turn_start_time is not None:
+            ttfa = (time.monotonic() - self._turn_start_time) * 1000
+            time_to_first_audio_ms.labels(stage=stage).observe(ttfa)
+
     async def send(self, stream: AsyncIterator[TTSEvent]) -> SendResult:
         """Consume entire TTSEvent stream, return result."""
         spoken_parts: list[str] = []
@@ -142,33 +150,46 @@ class StreamingAudioSender:
 
             filler_task = asyncio.create_task(_filler_loop())
 
+        sentence_t0: float | None = None
+
         async for event in stream:
-            if isinstance(event, AudioReady):
+            if isinstance(event, (AudioReady, AudioChunk)):
                 if self._barge_in and self._barge_in.is_set():
                     interrupted = True
                     continue
                 if self._conn.is_closed:
                     disconnected = True
                     continue
-                if self._echo_canceller is not None:
-                    self._echo_canceller.record_far_end(event.audio)
-                t0 = time.monotonic()
-                was_interrupted = await self._send_audio_locked(event.audio)
-                tts_delivery_ms.observe((time.monotonic() - t0) * 1000)
-                if was_interrupted:
-                    interrupted = True
+                if event.audio:
+                    if self._echo_canceller is not None:
+                        self._echo_canceller.record_far_end(event.audio)
+                    t0 = time.monotonic()
+                    if sentence_t0 is None:
+                        sentence_t0 = t0
+                    was_interrupted = await self._send_audio_locked(event.audio)
+                    if was_interrupted:
+                        interrupted = True
+                        sentence_t0 = None
+                        continue
+
+                    # Record time-to-first-audio once per turn
+                    if not self._first_audio_sent:
+                        # Cancel filler — real audio arrived
+                        if filler_task is not None and not filler_task.done():
+                            filler_task.cancel()
+                        self._observe_ttfa("first_chunk")
+                        self._first_audio_sent = True
+
+                if isinstance(event, AudioChunk) and not event.last:
                     continue
+                # Sentence complete
+                if sentence_t0 is not None:
+                    tts_delivery_ms.observe((time.monotonic() - sentence_t0) * 1000)
+                    sentence_t0 = None
                 spoken_parts.append(event.text)
-
-                # Record time-to-first-audio once per turn
-                if not self._first_audio_sent:
-                    # Cancel filler — real audio arrived
-                    if filler_task is not None and not filler_task.done():
-                        filler_task.cancel()
-                    if self._turn_start_time is not None:
-                        ttfa = (time.monotonic() - self._turn_start_time) * 1000
-                        time_to_first_audio_ms.observe(ttfa)
-                    self._first_audio_sent = True
+                if self._first_audio_sent and not self._first_sentence_sent:
+                    self._observe_ttfa("full_sentence")
+                    self._first_sentence_sent = True
 
             elif isinstance(event, ToolCallStart):
                 pending_tool_calls[event.id] = _PendingToolCall(id=event.id, name=event.name)
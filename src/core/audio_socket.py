@@ -21,6 +21,8 @@ import uuid
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from src.monitoring.metrics import call_setup_latency_ms
+
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
 
@@ -31,6 +33,7 @@ HEADER_SIZE = 3  # 1 byte type + 2 bytes length
 AUDIO_SAMPLE_RATE = 8000  # Asterisk app_audiosocket uses slin (8kHz)
 AUDIO_FRAME_BYTES = 320  # 20 ms × 8000 Hz × 2 bytes/sample
 AUDIO_FRAME_DURATION_MS = 20
+AUDIO_PACKET_BYTES = HEADER_SIZE + AUDIO_FRAME_BYTES
 
 
 class PacketType(enum.IntEnum):
@@ -72,6 +75,50 @@ def build_audio_packet(audio_data: bytes) -> bytes:
     return header + audio_data
 
 
+# Header of a full-size audio frame — identical for every frame but the last,
+# so it is packed once instead of per frame.
+_FULL_FRAME_HEADER = struct.pack("!BH", PacketType.AUDIO, AUDIO_FRAME_BYTES)
+
+
+def frame_audio_packets(audio_data: bytes) -> bytes:
+    """Split PCM into AUDIO_FRAME_BYTES-sized 0x10 packets in one buffer.
+
+    Headers are interleaved with memoryview slices of *audio_data* and
+    joined in a single allocation, so the send loop only has to slice the
+    result — no per-frame ``struct.pack`` or bytes concatenation.
+    """
+    view = memoryview(audio_data)
+    total = len(audio_data)
+    full_end = total - total % AUDIO_FRAME_BYTES
+    parts: list[bytes | memoryview] = []
+    for offset in range(0, full_end, AUDIO_FRAME_BYTES):
+        parts.append(_FULL_FRAME_HEADER)
+        parts.append(view[offset : offset + AUDIO_FRAME_BYTES])
+    if full_end < total:
+        parts.append(struct.pack("!BH", PacketType.AUDIO, total - full_end))
+        parts.append(view[full_end:])
+    return b"".join(parts)
+
+
+class FramedAudio(bytes):
+    """PCM audio that remembers its pre-built AudioSocket packets.
+
+    Behaves exactly like the raw PCM ``bytes`` (echo canceller, length
+    checks, mocks), but ``packets`` is framed once on first use and reused
+    for every later send. TTS caches store clips as ``FramedAudio`` so a
+    greeting or filler replayed across many calls is framed only once.
+    """
+
+    _packets: bytes | None = None
+
+    @property
+    def packets(self) -> bytes:
+        """Framed 0x10 packets for this clip (built lazily, then cached)."""
+        if self._packets is None:
+            self._packets = frame_audio_packets(self)
+        return self._packets
+
+
 def parse_uuid(payload: bytes) -> uuid.UUID:
     """Parse UUID from a type-0x01 packet payload."""
     return uuid.UUID(bytes=payload[:16])
@@ -95,11 +142,15 @@ class AudioSocketConnection:
         self.channel_uuid = channel_uuid
         self._closed = False
         # Wall-clock monotonic ts of the last successful send. Used by the
-        # pipeline's keepalive loop to detect in-turn silence gaps (between
+        # audio clock's keepalive to detect in-turn silence gaps (between
         # filler audio and real LLM audio) that the _speaking flag alone
         # cannot catch — a turn holds _speaking=True for its whole duration
         # but the actual audio flow may pause for hundreds of ms.
         self.last_send_time: float = time.monotonic()
+        # Call-setup latency: UUID packet received → first outbound audio
+        # frame (the greeting). Keepalive silence does not count.
+        self.connected_at: float = self.last_send_time
+        self.first_audio_at: float | None = None
 
     @property
     def is_closed(self) -> bool:
@@ -135,8 +186,10 @@ class AudioSocketConnection:
     ) -> bool:
         """Send audio data back to Asterisk as 0x10 packets.
 
-        Splits data into AUDIO_FRAME_BYTES-sized chunks with 20 ms pacing
-        to match real-time playback rate and avoid Asterisk queue overflow.
+        Frames are paced at real-time rate (one per 20 ms) by the shared
+        process-wide audio clock, which serves all connections in a single
+        tick instead of one sleep loop per call. A ``FramedAudio`` clip
+        reuses its cached packets; plain bytes are framed once up front.
 
         If *cancel_event* is provided and becomes set, sending stops early
         and the method returns ``True`` (interrupted).  Returns ``False``
@@ -145,40 +198,62 @@ class AudioSocketConnection:
         if self._closed:
             return False
 
-        frame_duration = AUDIO_FRAME_DURATION_MS / 1000
-        start_time = time.monotonic()
-        frame_index = 0
-        offset = 0
-        while offset < len(audio_data):
-            if cancel_event is not None and cancel_event.is_set():
-                return True
+        from src.core.audio_clock import get_audio_clock
 
-            chunk = audio_data[offset : offset + AUDIO_FRAME_BYTES]
-            self.writer.write(build_audio_packet(chunk))
-            try:
-                await self.writer.drain()
-            except (ConnectionResetError, OSError) as exc:
-                self._closed = True
-                logger.info(
-                    "AudioSocket write failed for %s: %s (%s) — "
-                    "closing after %d bytes",
-                    self.channel_uuid,
-                    type(exc).__name__,
-                    str(exc)[:100] if str(exc) else "no message",
-                    offset,
-                )
-                return False
-            offset += AUDIO_FRAME_BYTES
-            frame_index += 1
-            self.last_send_time = time.monotonic()
-            # Monotonic clock-based pacing: sleep until the next frame's
-            # scheduled time to prevent cumulative drift from asyncio.sleep
-            next_time = start_time + frame_index * frame_duration
-            sleep_for = next_time - time.monotonic()
-            if sleep_for > 0:
-                await asyncio.sleep(sleep_for)
-
-        return False
+        if isinstance(audio_data, FramedAudio):
+            packets = audio_data.packets
+        else:
+            packets = frame_audio_packets(audio_data)
+        return await get_audio_clock().play(self, packets, cancel_event)
+
+    def write_frame(self, frame: bytes | memoryview, now: float) -> bool:
+        """Write one pre-framed packet (called by the audio clock each tick).
+
+        Returns ``False`` if the connection is closed or the transport is
+        shutting down. The frame is handed to the transport as-is (no copy
+        unless the kernel socket buffer is full).
+        """
+        if self._closed:
+            return False
+        if self.writer.is_closing():
+            self._closed = True
+            logger.info(
+                "AudioSocket transport closing for %s — stopping playback",
+                self.channel_uuid,
+            )
+            return False
+        try:
+            self.writer.write(frame)
+        except (ConnectionResetError, OSError) as exc:
+            self._closed = True
+            logger.info(
+                "AudioSocket write failed for %s: %s (%s)",
+                self.channel_uuid,
+                type(exc).__name__,
+                str(exc)[:100] if str(exc) else "no message",
+            )
+            return False
+        self.last_send_time = now
+        return True
+
+    def mark_first_audio(self, now: float) -> None:
+        """Record the first real audio frame and observe call-setup latency."""
+        if self.first_audio_at is not None:
+            return
+        self.first_audio_at = now
+        call_setup_latency_ms.observe((now - self.connected_at) * 1000)
+
+    def start_keepalive(self, idle_ms: int) -> None:
+        """Stream silence whenever outbound audio is idle for *idle_ms*."""
+        from src.core.audio_clock import get_audio_clock
+
+        get_audio_clock().start_keepalive(self, idle_ms)
+
+    def stop_keepalive(self) -> None:
+        """Stop the keepalive silence stream started by ``start_keepalive``."""
+        from src.core.audio_clock import get_audio_clock
+
+        get_audio_clock().stop_keepalive(self)
 
     async def close(self) -> None:
         """Close the connection."""
@@ -36,12 +36,15 @@ from src.agent.prompts import (
     compute_order_stage,
     detect_scenario_from_text,
 )
-from src.core.audio_socket import AUDIO_FRAME_BYTES, AudioSocketConnection, PacketType
+from src.core.audio_socket import AudioSocketConnection, PacketType
 from src.core.call_session import SILENCE_TIMEOUT_SEC, CallSession, CallState
 from src.monitoring.metrics import (
     audiosocket_to_stt_ms,
     barge_in_total,
     bot_filler_stripped_total,
+    speculative_discarded_tokens_total,
+    speculative_saved_ms,
+    speculative_turns_total,
     tts_delivery_ms,
 )
 from src.stt.base import STTConfig, STTEngine, Transcript
@@ -68,13 +71,13 @@ _FAREWELL_LLM_TIMEOUT_SEC = 3
 # Asterisk app_audiosocket forwards our TCP audio to the peer as RTP at 50
 # packets/sec (20 ms/frame); any gap in our TCP audio becomes a gap in the
 # outbound RTP that the peer's mobile carrier can interpret as end-of-call.
-# We fill the gap by streaming silence frames whenever `AudioSocketConnection.
-# last_send_time` shows the flow has been quiet for `_KEEPALIVE_IDLE_MS`.
+# The shared audio clock (src/core/audio_clock.py) fills the gap with silence
+# frames whenever `AudioSocketConnection.last_send_time` shows the flow has
+# been quiet for `_KEEPALIVE_IDLE_MS`.
 # Time-based (not `_speaking`-based) so it also covers in-turn gaps between
 # filler audio, tool execution, and real LLM audio — the `_speaking` flag
 # stays True for the whole turn but the actual audio flow can pause.
 _KEEPALIVE_IDLE_MS = 40  # start silence stream after 40 ms without audio
-_KEEPALIVE_POLL_SEC = 0.02  # check idle every 20 ms (one frame)
 
 # Minimum dialog turns before using contextual farewell
 _FAREWELL_MIN_TURNS = 3
@@ -421,6 +424,10 @@ def _infer_context_hint(bot_utterance: str) -> str | None:
     return None
 
 
+# Compact 3-4 digit time ("1120", "820") → "HH:MM" in the ``time`` context
+_TIME_COLON_RE = re.compile(r"(?<!\d)(0?[1-9]|1\d|2[0-3])([0-5]\d)(?!\d)")
+
+
 # --- Contextual farewell prompt ---
 
 # --- Scenario-specific greeting suffixes ---
@@ -446,7 +453,7 @@ _FAREWELL_SYSTEM_PROMPT = (
 
 if TYPE_CHECKING:
     from src.agent.agent import LLMAgent
-    from src.agent.streaming_loop import StreamingAgentLoop
+    from src.agent.streaming_loop import SpeculativeTurn, StreamingAgentLoop
     from src.core.call_session import SessionStore
     from src.core.echo_canceller import EchoCanceller
     from src.monitoring.cost_tracker import CostBreakdown
@@ -513,6 +520,12 @@ class CallPipeline:
         self._speaking = False
         self._barge_in_event = barge_in_event or asyncio.Event()
         self._final_transcript_queue: asyncio.Queue[Transcript | None] = asyncio.Queue()
+        # Speculative LLM turn on a stable interim (streaming path, opt-in)
+        self._speculation: SpeculativeTurn | None = None
+        self._speculation_timer: asyncio.Task[None] | None = None
+        # context_hint of the current turn, keyed by dialog_history length
+        self._context_hint_key = -1
+        self._context_hint: str | None = None
 
     @property
     def _tts(self) -> TTSEngine:
@@ -584,7 +597,6 @@ class CallPipeline:
 
     async def run(self) -> None:
         """Run the full call pipeline until hangup or transfer."""
-        keepalive_task: asyncio.Task[None] | None = None
         try:
             # Start STT and audio reader BEFORE greeting so that incoming
             # caller audio is fed to STT in real-time.  Without this, audio
@@ -592,7 +604,7 @@ class CallPipeline:
             # then flushed in a burst — which breaks latest_short model.
             await self._stt.start_stream(self._stt_config)
             audio_task = asyncio.create_task(self._audio_reader_loop())
-            keepalive_task = asyncio.create_task(self._keepalive_loop())
+            self._conn.start_keepalive(_KEEPALIVE_IDLE_MS)
 
             # Play greeting while STT is already consuming audio
             logger.info("Pipeline: starting greeting for %s", self._session.channel_uuid)
@@ -627,59 +639,13 @@ class CallPipeline:
             await self._log_turn("bot", error_msg)
             await self._speak(error_msg)
         finally:
-            if keepalive_task is not None:
-                keepalive_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await keepalive_task
+            if self._speculation_timer is not None:
+                self._speculation_timer.cancel()
+            await self._discard_speculation("abandoned")
+            self._conn.stop_keepalive()
             await self._stt.stop_stream()
             self._session.transition_to(CallState.ENDED)
 
-    async def _keepalive_loop(self) -> None:
-        """Fill any audio-flow gap longer than ``_KEEPALIVE_IDLE_MS`` with a
-        silence frame, so the outbound RTP stream to the SIP peer never
-        pauses. Time-based (uses ``conn.last_send_time``) so it covers both
-        between-turn gaps and in-turn gaps that the ``_speaking`` flag hides.
-        """
-        silence_frame = b"\x00" * AUDIO_FRAME_BYTES
-        idle_threshold = _KEEPALIVE_IDLE_MS / 1000
-        first_send_logged = False
-        keepalive_frames_sent = 0
-        try:
-            while not self._conn.is_closed:
-                await asyncio.sleep(_KEEPALIVE_POLL_SEC)
-                if self._conn.is_closed:
-                    break
-                idle = time.monotonic() - self._conn.last_send_time
-                if idle < idle_threshold:
-                    continue
-                try:
-                    await self._conn.send_audio(silence_frame)
-                    keepalive_frames_sent += 1
-                    if not first_send_logged:
-                        logger.info(
-                            "keepalive silence stream started for %s "
-                            "(idle threshold %d ms)",
-                            self._session.channel_uuid,
-                            _KEEPALIVE_IDLE_MS,
-                        )
-                        first_send_logged = True
-                except Exception:
-                    logger.debug(
-                        "keepalive silence send failed for %s",
-                        self._session.channel_uuid,
-                        exc_info=True,
-                    )
-                    await asyncio.sleep(0.1)
-        except asyncio.CancelledError:
-            pass
-        finally:
-            if first_send_logged:
-                logger.info(
-                    "keepalive stats for %s: %d silence frames sent",
-                    self._session.channel_uuid,
-                    keepalive_frames_sent,
-                )
-
     async def _play_greeting(self) -> None:
         """Play the greeting message, adapted to the time of day and agent name."""
         greeting = self._templates.get("greeting", GREETING_TEXT)
@@ -752,10 +718,103 @@ class CallPipeline:
                             transcript.text[:50],
                             self._session.channel_uuid,
                         )
+                        if self._speculation_enabled:
+                            self._schedule_speculation(transcript)
         finally:
             # Signal queue reader that STT stream has ended
             await self._final_transcript_queue.put(None)
 
+    @property
+    def _speculation_enabled(self) -> bool:
+        return self._streaming_loop is not None and self._stt_config.speculative_turn_enabled
+
+    def _schedule_speculation(self, interim: Transcript) -> None:
+        """(Re)arm the stability timer — every new interim restarts it."""
+        if self._speculation_timer is not None and not self._speculation_timer.done():
+            self._speculation_timer.cancel()
+        self._speculation_timer = asyncio.create_task(self._speculate_when_stable(interim))
+
+    async def _speculate_when_stable(self, interim: Transcript) -> None:
+        """Start a speculative LLM turn once *interim* has been stable long enough.
+
+        The interim goes through the same corrections and entity
+        normalization as a final transcript, and the turn context is built
+        without touching the session, so a matching final transcript
+        produces exactly the same LLM request.
+        """
+        await asyncio.sleep(self._stt_config.speculative_stable_ms / 1000)
+        if self._speaking or self._conn.is_closed or self._streaming_loop is None:
+            return
+        transcript = await self._apply_stt_corrections(interim, speculative=True)
+        transcript = self._apply_entity_normalization(transcript)
+        pattern_context = await self._search_patterns(transcript.text, record_usage=False)
+        context = self._turn_context(pattern_context)
+        if self._speaking:
+            return
+        current = self._speculation
+        if current is not None:
+            if current.matches(transcript.text, self._llm_history, context):
+                return
+            await self._discard_speculation("superseded")
+        self._speculation = self._streaming_loop.speculate(
+            transcript.text, self._llm_history, **context
+        )
+        logger.info(
+            "Speculative turn started: call=%s, interim='%s'",
+            self._session.channel_uuid,
+            transcript.text[:50],
+        )
+
+    async def _take_speculation(
+        self, user_text: str, context: dict[str, Any]
+    ) -> SpeculativeTurn | None:
+        """Hand the pending speculation to the turn if it matches, else discard it."""
+        if self._speculation_timer is not None and not self._speculation_timer.done():
+            self._speculation_timer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._speculation_timer
+        spec = self._speculation
+        if spec is None:
+            return None
+        if spec.failed:
+            await self._discard_speculation("failed")
+            return None
+        if not spec.matches(user_text, self._llm_history, context):
+            await self._discard_speculation("miss")
+            return None
+        self._speculation = None
+        speculative_turns_total.labels(outcome="hit").inc()
+        speculative_saved_ms.observe(spec.saved_ms)
+        logger.info(
+            "Speculative turn adopted: call=%s, saved=%.0fms",
+            self._session.channel_uuid,
+            spec.saved_ms,
+        )
+        return spec
+
+    async def _discard_speculation(self, outcome: str) -> None:
+        """Cancel the pending speculation and book its tokens as discarded."""
+        spec, self._speculation = self._speculation, None
+        if spec is None:
+            return
+        usage, provider_key = await spec.cancel()
+        speculative_turns_total.labels(outcome=outcome).inc()
+        speculative_discarded_tokens_total.labels(type="input").inc(usage.input_tokens)
+        speculative_discarded_tokens_total.labels(type="output").inc(usage.output_tokens)
+        if self._cost is not None:
+            self._cost.add_discarded_llm_usage(
+                usage.input_tokens,
+                usage.output_tokens,
+                provider_key=provider_key,
+                cached_input_tokens=usage.cached_input_tokens,
+            )
+        logger.info(
+            "Speculative turn discarded (%s): call=%s, interim='%s'",
+            outcome,
+            self._session.channel_uuid,
+            spec.user_text[:50],
+        )
+
     async def _drain_transcript_buffer(self, first: Transcript) -> Transcript:
         """Buffer multiple final transcripts arriving in quick succession.
 
@@ -802,13 +861,33 @@ class CallPipeline:
             )
         return first
 
-    async def _apply_stt_corrections(self, transcript: Transcript) -> Transcript:
+    def _turn_context_hint(self) -> str | None:
+        """Infer context_hint from the bot's last utterance (if any).
+
+        Computed once per turn — the interim (speculative) and final runs of
+        ``_apply_stt_corrections`` reuse it until the dialog history grows.
+        """
+        history = self._session.dialog_history
+        if self._context_hint_key != len(history):
+            context_hint: str | None = None
+            for turn in reversed(history):
+                if turn.speaker == "assistant" and turn.content:
+                    context_hint = _infer_context_hint(turn.content)
+                    break
+            self._context_hint = context_hint
+            self._context_hint_key = len(history)
+        return self._context_hint
+
+    async def _apply_stt_corrections(
+        self, transcript: Transcript, *, speculative: bool = False
+    ) -> Transcript:
         """Run regex substitutions from Redis on the transcript text.
 
         No-op if the corrections module fails to load — never let a bad
         rule break the pipeline. Any applied rules are logged (with the
         original text preserved in the log line for offline audit) and
-        counted per rule_id for Prometheus.
+        counted per rule_id for Prometheus (not for ``speculative`` runs
+        on interims, which would double-count).
         """
         if not transcript.text:
             return transcript
@@ -821,12 +900,7 @@ class CallPipeline:
         except Exception:
             return transcript
 
-        # Infer context_hint from the bot's last utterance (if any).
-        context_hint: str | None = None
-        for turn in reversed(self._session.dialog_history):
-            if turn.speaker == "assistant" and turn.content:
-                context_hint = _infer_context_hint(turn.content)
-                break
+        context_hint = self._turn_context_hint()
 
         try:
             new_text, applied = await apply_corrections(
@@ -851,8 +925,9 @@ class CallPipeline:
             transcript.text[:120],
             new_text[:120],
         )
-        for rule_id in applied:
-            stt_corrections_applied_total.labels(rule_id=rule_id).inc()
+        if not speculative:
+            for rule_id in applied:
+                stt_corrections_applied_total.labels(rule_id=rule_id).inc()
 
         # Ukrainian numeral-word → digit conversion. Enabled for plate/phone
         # (spoken numbers like «два одинадцять» → "211") and time (spoken
@@ -889,10 +964,7 @@ class CallPipeline:
         # single-digit hours. Skipped outside `time` ctx to keep plate
         # numbers («0211») intact.
         if context_hint == "time":
-            colon_re = re.compile(
-                r"(?<!\d)(0?[1-9]|1\d|2[0-3])([0-5]\d)(?!\d)"
-            )
-            new_text2 = colon_re.sub(r"\1:\2", new_text)
+            new_text2 = _TIME_COLON_RE.sub(r"\1:\2", new_text)
             if new_text2 != new_text:
                 logger.info(
                     "stt_time_colon: call=%s %r → %r",
@@ -950,6 +1022,115 @@ class CallPipeline:
             )
         return transcript
 
+    async def _search_patterns(self, text: str, *, record_usage: bool = True) -> str | None:
+        """Search conversation patterns relevant to *text*, formatted for the prompt.
+
+        ``record_usage=False`` (speculative turns) skips the usage counters.
+        """
+        pattern_context = None
+        if self._pattern_search is not None:
+            try:
+                tid = str(self._session.tenant_id) if self._session.tenant_id else None
+                patterns = await self._pattern_search.search(
+                    query=text,
+                    top_k=3,
+                    min_similarity=0.72,
+                    tenant_id=tid,
+                )
+                pattern_context = await self._pattern_search.format_for_prompt(patterns)
+                if patterns and record_usage:
+                    await self._pattern_search.increment_usage([p["id"] for p in patterns])
+                    logger.info(
+                        "Pattern injection: call=%s, patterns_found=%d, intents=%s",
+                        self._session.channel_uuid,
+                        len(patterns),
+                        [p["intent_label"] for p in patterns],
+                    )
+            except Exception:
+                logger.warning("Pattern search failed, continuing without", exc_info=True)
+        return pattern_context
+
+    def _turn_context(self, pattern_context: str | None) -> dict[str, Any]:
+        """Keyword arguments for ``run_turn`` / ``process_message`` from session state.
+
+        Reads the session only, so it can also be built for a speculative
+        turn on an interim transcript.
+        """
+        # Compute order stage for stage-aware prompt injection
+        order_stage = compute_order_stage(self._session.order_draft, self._session.order_id)
+
+        # If exactly one fitting station has been resolved for this call, inject
+        # its full details into the LLM prompt so the model doesn't hallucinate
+        # a different city/address (seen 2026-07-22 with Виктория/Запоріжжя
+        # drifting to Київ during a silence gap). Multiple stations = customer
+        # is still choosing, no injection.
+        # Priority: (1) the station the LLM last acted on via
+        # get_fitting_slots/book_fitting — that's the client's chosen one,
+        # regardless of how many were shown. (2) fallback: single-station
+        # case. (3) otherwise leave None so the LLM asks the client to pick.
+        selected_station: dict[str, Any] | None = None
+        last_used = self._session.last_fitting_station_id
+        if last_used:
+            selected_station = next(
+                (
+                    s
+                    for s in self._session.fitting_stations_seen
+                    if s.get("id") == last_used
+                ),
+                None,
+            )
+        if selected_station is None and len(self._session.fitting_stations_seen) == 1:
+            selected_station = self._session.fitting_stations_seen[0]
+
+        # Anti-hallucination: pin the slot the LLM must use. If the client
+        # already picked a specific (date, time) — inject as "selected".
+        # Otherwise inject the list of dates+times returned by the last
+        # get_fitting_slots call so the LLM can't invent a fresh one.
+        selected_slot: dict[str, str] | None = None
+        offered_slots: list[dict[str, str]] | None = None
+        if self._session.selected_fitting_date and self._session.selected_fitting_time:
+            selected_slot = {
+                "date": self._session.selected_fitting_date,
+                "time": self._session.selected_fitting_time,
+            }
+        elif self._session.fitting_slots_offered:
+            offered_slots = list(self._session.fitting_slots_offered)
+
+        # Fitting progress block: shows LLM what's already collected so it
+        # doesn't loop back to Krok 2/3/4 after passing through them.
+        fitting_progress: dict[str, Any] = {
+            "customer_name": self._session.fitting_customer_name,
+            "city": (selected_station or {}).get("city"),
+            "station_address": (selected_station or {}).get("address"),
+            "storage_choice": self._session.fitting_storage_choice,
+            "storage_contract": self._session.fitting_storage_contract,
+            "date": self._session.selected_fitting_date,
+            "time": self._session.selected_fitting_time,
+            "plate": self._session.fitting_plate,
+            "brand": self._session.fitting_vehicle_brand,
+            "caller_phone": self._session.caller_phone,
+            "booked": self._session.fitting_booked,
+            "requested_weekday": self._session.fitting_requested_weekday,
+        }
+
+        return {
+            "caller_phone": self._session.caller_phone,
+            "order_id": self._session.order_id,
+            "pattern_context": pattern_context,
+            "order_stage": order_stage,
+            "caller_history": self._caller_history,
+            "storage_context": self._storage_context,
+            "customer_profile": self._customer_profile,
+            "fitting_booked": self._session.fitting_booked,
+            "tools_called": self._session.tools_called,
+            "scenario": self._session.scenario,
+            "active_scenarios": self._session.active_scenarios,
+            "selected_station": selected_station,
+            "selected_slot": selected_slot,
+            "offered_slots": offered_slots,
+            "fitting_progress": fitting_progress,
+        }
+
     async def _transcript_processor_loop(self) -> None:
         """Process STT transcripts and drive the LLM → TTS flow."""
         logger.info(
@@ -1037,69 +1218,6 @@ class CallPipeline:
                         self._session.channel_uuid,
                     )
 
-            # Search for relevant conversation patterns
-            pattern_context = None
-            if self._pattern_search is not None:
-                try:
-                    tid = str(self._session.tenant_id) if self._session.tenant_id else None
-                    patterns = await self._pattern_search.search(
-                        query=transcript.text,
-                        top_k=3,
-                        min_similarity=0.72,
-                        tenant_id=tid,
-                    )
-                    pattern_context = await self._pattern_search.format_for_prompt(patterns)
-                    if patterns:
-                        await self._pattern_search.increment_usage([p["id"] for p in patterns])
-                        logger.info(
-                            "Pattern injection: call=%s, patterns_found=%d, intents=%s",
-                            self._session.channel_uuid,
-                            len(patterns),
-                            [p["intent_label"] for p in patterns],
-                        )
-                except Exception:
-                    logger.warning("Pattern search failed, continuing without", exc_info=True)
-
-            # Compute order stage for stage-aware prompt injection
-            order_stage = compute_order_stage(self._session.order_draft, self._session.order_id)
-
-            # If exactly one fitting station has been resolved for this call, inject
-            # its full details into the LLM prompt so the model doesn't hallucinate
-            # a different city/address (seen 2026-07-22 with Виктория/Запоріжжя
-            # drifting to Київ during a silence gap). Multiple stations = customer
-            # is still choosing, no injection.
-            # Priority: (1) the station the LLM last acted on via
-            # get_fitting_slots/book_fitting — that's the client's chosen one,
-            # regardless of how many were shown. (2) fallback: single-station
-            # case. (3) otherwise leave None so the LLM asks the client to pick.
-            selected_station: dict[str, Any] | None = None
-            last_used = self._session.last_fitting_station_id
-            if last_used:
-                selected_station = next(
-                    (
-                        s
-                        for s in self._session.fitting_stations_seen
-                        if s.get("id") == last_used
-                    ),
-                    None,
-                )
-            if selected_station is None and len(self._session.fitting_stations_seen) == 1:
-                selected_station = self._session.fitting_stations_seen[0]
-
-            # Anti-hallucination: pin the slot the LLM must use. If the client
-            # already picked a specific (date, time) — inject as "selected".
-            # Otherwise inject the list of dates+times returned by the last
-            # get_fitting_slots call so the LLM can't invent a fresh one.
-            selected_slot: dict[str, str] | None = None
-            offered_slots: list[dict[str, str]] | None = None
-            if self._session.selected_fitting_date and self._session.selected_fitting_time:
-                selected_slot = {
-                    "date": self._session.selected_fitting_date,
-                    "time": self._session.selected_fitting_time,
-                }
-            elif self._session.fitting_slots_offered:
-                offered_slots = list(self._session.fitting_slots_offered)
-
             # Server-side extract requested weekday from user text. Client
             # often names weekday early («на пʼятницю»), then bot goes through
             # storage/city clarifications and forgets. Store in session so
@@ -1253,22 +1371,8 @@ class CallPipeline:
                         exc_info=True,
                     )
 
-            # Fitting progress block: shows LLM what's already collected so it
-            # doesn't loop back to Krok 2/3/4 after passing through them.
-            fitting_progress: dict[str, Any] = {
-                "customer_name": self._session.fitting_customer_name,
-                "city": (selected_station or {}).get("city"),
-                "station_address": (selected_station or {}).get("address"),
-                "storage_choice": self._session.fitting_storage_choice,
-                "storage_contract": self._session.fitting_storage_contract,
-                "date": self._session.selected_fitting_date,
-                "time": self._session.selected_fitting_time,
-                "plate": self._session.fitting_plate,
-                "brand": self._session.fitting_vehicle_brand,
-                "caller_phone": self._session.caller_phone,
-                "booked": self._session.fitting_booked,
-                "requested_weekday": self._session.fitting_requested_weekday,
-            }
+            pattern_context = await self._search_patterns(transcript.text)
+            turn_context = self._turn_context(pattern_context)
 
             if self._streaming_loop is not None:
                 # STREAMING PATH — add user turn to session (streaming loop uses separate _llm_history)
@@ -1283,6 +1387,7 @@ class CallPipeline:
                     stt_confidence=transcript.confidence,
                     language=transcript.language,
                 )
+                speculation = await self._take_speculation(transcript.text, turn_context)
                 self._session.transition_to(CallState.SPEAKING)
                 self._speaking = True
                 self._barge_in_event.clear()
@@ -1292,21 +1397,8 @@ class CallPipeline:
                         self._streaming_loop.run_turn(
                             user_text=transcript.text,
                             conversation_history=self._llm_history,
-                            caller_phone=self._session.caller_phone,
-                            order_id=self._session.order_id,
-                            pattern_context=pattern_context,
-                            order_stage=order_stage,
-                            caller_history=self._caller_history,
-                            storage_context=self._storage_context,
-                            customer_profile=self._customer_profile,
-                            fitting_booked=self._session.fitting_booked,
-                            tools_called=self._session.tools_called,
-                            scenario=self._session.scenario,
-                            active_scenarios=self._session.active_scenarios,
-                            selected_station=selected_station,
-                            selected_slot=selected_slot,
-                            offered_slots=offered_slots,
-                            fitting_progress=fitting_progress,
+                            speculation=speculation,
+                            **turn_context,
                         ),
                         timeout=AGENT_PROCESSING_TIMEOUT_SEC,
                     )
@@ -1404,21 +1496,7 @@ class CallPipeline:
                         self._agent.process_message(
                             user_text=transcript.text,
                             conversation_history=self._session.messages_for_llm,
-                            caller_phone=self._session.caller_phone,
-                            order_id=self._session.order_id,
-                            pattern_context=pattern_context,
-                            order_stage=order_stage,
-                            caller_history=self._caller_history,
-                            storage_context=self._storage_context,
-                            customer_profile=self._customer_profile,
-                            fitting_booked=self._session.fitting_booked,
-                            tools_called=self._session.tools_called,
-                            scenario=self._session.scenario,
-                            active_scenarios=self._session.active_scenarios,
-                            selected_station=selected_station,
-                            selected_slot=selected_slot,
-                            offered_slots=offered_slots,
-                            fitting_progress=fitting_progress,
+                            **turn_context,
                         ),
                         timeout=AGENT_PROCESSING_TIMEOUT_SEC,
                     )
@@ -0,0 +1,445 @@
+"""Per-tenant call-setup context, assembled once and shared by every call.
+
+Everything ``handle_call`` needs before the greeting that only changes
+when an admin edits it — tenant rows, response templates, tools with DB
+overrides, few-shot / safety / promotions prompt sections, pronunciation
+rules, STT phrase hints and the test-phone table — is loaded into an
+immutable, versioned ``TenantContextSnapshot`` and rendered per
+tenant × scenario. Call setup then resolves the tenant and its prompt
+with dict lookups instead of a tenant SELECT, two DB loads and a round
+of Redis invalidation-key GETs.
+
+Admin write paths call ``publish_change``; ``TenantContextStore.run``
+rebuilds the snapshot on every message and on a slow backstop timer
+(for writers that only bump the legacy ``*_cache_ts`` keys). Until the
+first snapshot is built — or if building fails — ``handle_call`` loads
+the same data live and renders it through the same ``TenantContext``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import text
+
+from src.agent.prompt_manager import (
+    PromptManager,
+    fetch_tenant_promotions,
+    format_few_shot_section,
+    format_promotions_context,
+    format_safety_rules_section,
+    get_few_shot_examples,
+    get_pronunciation_rules,
+    get_safety_rules_for_prompt,
+    inject_pronunciation_rules,
+)
+from src.agent.prompts import assemble_prompt
+from src.agent.tool_loader import get_tools_with_overrides
+from src.monitoring.metrics import tenant_context_rebuild_ms, tenant_context_version
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping
+
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+INVALIDATE_CHANNEL = "tenant_context:invalidate"
+TEST_PHONES_REDIS_KEY = "test:phones"
+
+_REFRESH_INTERVAL = 300.0  # seconds — backstop rebuild
+_RESUBSCRIBE_DELAY = 5.0  # seconds
+
+TENANT_COLUMNS = (
+    "id, slug, name, network_id, agent_name, greeting, "
+    "enabled_tools, prompt_suffix, config, is_active, extensions, working_hours"
+)
+
+
+async def publish_change(reason: str, redis: Redis | None = None) -> None:
+    """Tell every process to rebuild its snapshot (best-effort).
+
+    Uses the shared Redis client when *redis* is not given.
+    """
+    try:
+        if redis is None:
+            from src.core.redis_client import get_redis
+
+            redis = await get_redis()
+        await redis.publish(INVALIDATE_CHANNEL, reason)
+    except Exception:
+        logger.debug("tenant_context: failed to publish change (%s)", reason, exc_info=True)
+
+
+def is_history_disabled(phones: Mapping[str, Any], caller_id: str, tenant_id: str | None) -> bool:
+    """Whether the test-phone table says to skip caller history for this call."""
+    if not phones:
+        return False
+    from src.utils.phone import normalize_phone_ua
+
+    raw_entry = phones.get(normalize_phone_ua(caller_id))
+    if raw_entry is None:
+        return False
+    # Normalize to list (backward compat)
+    if isinstance(raw_entry, str):
+        entries = [{"mode": raw_entry}]
+    elif isinstance(raw_entry, dict):
+        entries = [raw_entry]
+    else:
+        entries = raw_entry
+    for entry in entries:
+        if entry.get("mode") == "no_history":
+            cfg_tenant = entry.get("tenant_id")
+            if not cfg_tenant or cfg_tenant == tenant_id:
+                logger.info(
+                    "Test phone %s: skipping history (tenant=%s)",
+                    caller_id,
+                    cfg_tenant,
+                )
+                return True
+    return False
+
+
+@dataclass(frozen=True)
+class ScenarioContext:
+    """System prompt, tools and few-shot candidates for one tenant × scenario."""
+
+    system_prompt: str
+    tools: list[dict[str, Any]] | None
+    # Rendered few-shot sections grouped like format_few_shot_section picks
+    # them: the scenario's own dialogues, else one group per other scenario.
+    few_shot: tuple[tuple[str, ...], ...] = ()
+
+    def pick_few_shot(self) -> str | None:
+        """One rendered few-shot section, chosen at random per call."""
+        if not self.few_shot:
+            return None
+        return random.choice(random.choice(self.few_shot))
+
+
+@dataclass
+class TenantContext:
+    """Call-setup inputs of one tenant (or of "no tenant"), rendered on demand.
+
+    ``scenario()`` renders and memoizes the prompt/tools for a scenario;
+    ``pick_templates()`` and ``ScenarioContext.pick_few_shot()`` keep the
+    per-call random variant choice.
+    """
+
+    tenant: dict[str, Any] | None
+    templates: dict[str, tuple[str, ...]]
+    tools: list[dict[str, Any]] | None
+    few_shot_examples: dict[str, list[dict[str, Any]]]
+    safety_context: str | None
+    promotions_context: str | None
+    pronunciation: str
+    scenario_tools: Mapping[str, set[str]]
+    scenario_emphasis: Mapping[str, str]
+    _scenarios: dict[str | None, ScenarioContext] = field(default_factory=dict, repr=False)
+
+    def pick_templates(self) -> dict[str, str] | None:
+        """One random variant per template key (``None`` when nothing was loaded)."""
+        if not self.templates:
+            return None
+        return {key: random.choice(variants) for key, variants in self.templates.items()}
+
+    def scenario(self, scenario: str | None) -> ScenarioContext:
+        ctx = self._scenarios.get(scenario)
+        if ctx is None:
+            ctx = self._scenarios[scenario] = self._render(scenario)
+        return ctx
+
+    def decorate_prompt(self, system_prompt: str, scenario: str | None) -> str:
+        """Pronunciation rules, tenant prompt suffix and scenario emphasis."""
+        if self.pronunciation:
+            system_prompt = inject_pronunciation_rules(system_prompt, self.pronunciation)
+        suffix = self.tenant.get("prompt_suffix") if self.tenant else None
+        if suffix and system_prompt:
+            system_prompt = system_prompt + "\n\n" + suffix
+        if scenario and system_prompt:
+            emphasis = self.scenario_emphasis.get(scenario)
+            if emphasis:
+                system_prompt = system_prompt + emphasis
+        return system_prompt
+
+    def _render(self, scenario: str | None) -> ScenarioContext:
+        enabled: set[str] | None = None
+        if self.tenant and self.tenant.get("enabled_tools"):
+            enabled = set(self.tenant["enabled_tools"])
+        system_prompt = assemble_prompt(
+            scenario=scenario,
+            include_pronunciation=False,  # added separately via inject_pronunciation_rules
+            # Compact router path is unused now that we default scenario
+            # to "fitting" on new calls; kept for the rare restored session
+            # without a scenario.
+            compact=(scenario is None),
+            enabled_tools=enabled,
+        )
+
+        tools = self.tools
+        if enabled is not None and tools:
+            allowed = set(enabled)
+            # Callback is the natural companion to transfer_to_operator (after-hours
+            # / operator-unavailable flow) — auto-include so tenants don't need to
+            # remember to list it when they enable transfers.
+            if "transfer_to_operator" in allowed:
+                allowed.add("create_callback_request")
+            tools = [t for t in tools if t["name"] in allowed]
+        if scenario is not None and scenario in self.scenario_tools and tools:
+            allowed_scenario = self.scenario_tools[scenario]
+            tools = [t for t in tools if t["name"] in allowed_scenario]
+
+        return ScenarioContext(
+            system_prompt=self.decorate_prompt(system_prompt, scenario),
+            tools=tools,
+            few_shot=self._render_few_shot(scenario),
+        )
+
+    def _render_few_shot(self, scenario: str | None) -> tuple[tuple[str, ...], ...]:
+        def _rendered(scenario_type: str) -> tuple[str, ...]:
+            sections = (
+                format_few_shot_section({scenario_type: [dlg]}, scenario_type=scenario_type)
+                for dlg in self.few_shot_examples[scenario_type]
+            )
+            return tuple(s for s in sections if s)
+
+        if scenario and self.few_shot_examples.get(scenario):
+            groups = [_rendered(scenario)]
+        else:
+            groups = [_rendered(sc) for sc in self.few_shot_examples]
+        return tuple(g for g in groups if g)
+
+
+def build_tenant_context(
+    tenant: dict[str, Any] | None,
+    *,
+    templates: Mapping[str, Collection[str]] | None,
+    tools: list[dict[str, Any]] | None,
+    few_shot_examples: dict[str, list[dict[str, Any]]],
+    safety_rules: list[dict[str, Any]],
+    promotions: list[dict[str, str]],
+    pronunciation: str,
+    scenario_tools: Mapping[str, set[str]],
+    scenario_emphasis: Mapping[str, str],
+) -> TenantContext:
+    """Apply the tenant's overrides to freshly loaded call-setup inputs."""
+    variants = {key: tuple(options) for key, options in (templates or {}).items() if options}
+    if tenant and tenant.get("greeting") and variants:
+        variants["greeting"] = (tenant["greeting"],)
+    return TenantContext(
+        tenant=tenant,
+        templates=variants,
+        tools=tools,
+        few_shot_examples=few_shot_examples,
+        safety_context=format_safety_rules_section(safety_rules),
+        promotions_context=format_promotions_context(promotions),
+        pronunciation=pronunciation,
+        scenario_tools=scenario_tools,
+        scenario_emphasis=scenario_emphasis,
+    )
+
+
+@dataclass(frozen=True)
+class TenantContextSnapshot:
+    """Immutable view of every active tenant's call-setup context."""
+
+    version: int
+    built_at: float
+    tenants: list[dict[str, Any]]  # active tenants, oldest first
+    contexts: dict[str, TenantContext]  # tenant id → context
+    default: TenantContext  # calls without a resolved tenant
+    phrase_hints: tuple[str, ...]
+    test_phones: dict[str, Any]
+
+    def resolve_tenant(self, *, slug: str | None, exten: str | None) -> dict[str, Any] | None:
+        """Same precedence as the DB lookup: slug, then extension, then first active."""
+        if slug:
+            return next((t for t in self.tenants if t["slug"] == slug), None)
+        if exten:
+            return next((t for t in self.tenants if exten in (t.get("extensions") or ())), None)
+        return self.tenants[0] if self.tenants else None
+
+    def context(self, tenant: dict[str, Any] | None) -> TenantContext | None:
+        """Context of *tenant* (a row from ``resolve_tenant``) or the no-tenant default."""
+        if tenant is None:
+            return self.default
+        return self.contexts.get(str(tenant["id"]))
+
+
+class TenantContextStore:
+    """Builds and holds this process's current ``TenantContextSnapshot``.
+
+    Args:
+        engine: SQLAlchemy async engine.
+        redis: Redis client (pub/sub subscriber and loader caches).
+        scenarios: Scenarios rendered eagerly for every tenant.
+        scenario_tools: Scenario → allowed tool names.
+        scenario_emphasis: Scenario → text appended to the system prompt.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        redis: Redis,
+        *,
+        scenarios: Collection[str],
+        scenario_tools: Mapping[str, set[str]],
+        scenario_emphasis: Mapping[str, str],
+    ) -> None:
+        self._engine = engine
+        self._redis = redis
+        self._scenarios = tuple(scenarios)
+        self._scenario_tools = scenario_tools
+        self._scenario_emphasis = scenario_emphasis
+        self._version = 0
+        self._lock = asyncio.Lock()
+        self.snapshot: TenantContextSnapshot | None = None
+
+    async def rebuild(self) -> TenantContextSnapshot | None:
+        """Load everything afresh and swap the snapshot in atomically.
+
+        On failure the previous snapshot (if any) stays in place.
+        """
+        async with self._lock:
+            t0 = time.monotonic()
+            try:
+                snapshot = await self._build()
+            except Exception:
+                logger.warning("tenant_context: rebuild failed", exc_info=True)
+                return self.snapshot
+            self.snapshot = snapshot
+            tenant_context_version.set(snapshot.version)
+            tenant_context_rebuild_ms.observe((time.monotonic() - t0) * 1000)
+            logger.info(
+                "tenant_context: snapshot v%d built (%d tenants)",
+                snapshot.version,
+                len(snapshot.tenants),
+            )
+            return snapshot
+
+    async def run(self) -> None:
+        """Keep the snapshot current via Redis pub/sub (runs until cancelled).
+
+        Rebuilds after each (re)subscribe — so writes made while
+        disconnected are not missed — on every ``INVALIDATE_CHANNEL``
+        message, and every ``_REFRESH_INTERVAL`` seconds.
+        """
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATE_CHANNEL)
+                await self.rebuild()
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=_REFRESH_INTERVAL
+                    )
+                    if message is None:
+                        built_at = self.snapshot.built_at if self.snapshot else 0.0
+                        if time.monotonic() - built_at < _REFRESH_INTERVAL:
+                            continue
+                    else:
+                        logger.info("tenant_context: change published (%r)", message.get("data"))
+                    await self.rebuild()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("tenant_context: invalidation subscription lost", exc_info=True)
+            finally:
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()  # type: ignore[no-untyped-call]
+            await asyncio.sleep(_RESUBSCRIBE_DELAY)
+
+    async def _build(self) -> TenantContextSnapshot:
+        from src.agent import prompt_manager, tool_loader
+        from src.stt import phrase_hints
+
+        # A rebuild is the invalidation: drop the loaders' own caches so the
+        # snapshot never inherits stale rows.
+        prompt_manager.invalidate_caches()
+        tool_loader.invalidate_cache()
+        phrase_hints.invalidate_cache()
+
+        # Two nested gathers: eight awaitables exceed asyncio.gather's typed overloads
+        db_loads, redis_loads = await asyncio.gather(
+            asyncio.gather(
+                self._load_tenants(),
+                PromptManager(self._engine).get_template_variants(),
+                get_tools_with_overrides(self._engine, redis=self._redis),
+                get_few_shot_examples(self._engine, self._redis),
+                get_safety_rules_for_prompt(self._engine, self._redis),
+            ),
+            asyncio.gather(
+                get_pronunciation_rules(self._redis),
+                phrase_hints.get_all_phrases_flat(self._redis),
+                self._load_test_phones(),
+            ),
+        )
+        tenants, templates, tools, few_shot_examples, safety_rules = db_loads
+        pronunciation, hints, test_phones = redis_loads
+        promotions = await asyncio.gather(
+            *(
+                fetch_tenant_promotions(self._engine, str(t["id"]), redis=self._redis)
+                for t in tenants
+            )
+        )
+
+        def _context(tenant: dict[str, Any] | None, promos: list[dict[str, str]]) -> TenantContext:
+            ctx = build_tenant_context(
+                tenant,
+                templates=templates,
+                tools=tools,
+                few_shot_examples=few_shot_examples,
+                safety_rules=safety_rules,
+                promotions=promos,
+                pronunciation=pronunciation,
+                scenario_tools=self._scenario_tools,
+                scenario_emphasis=self._scenario_emphasis,
+            )
+            for scenario in self._scenarios:
+                ctx.scenario(scenario)
+            return ctx
+
+        self._version += 1
+        return TenantContextSnapshot(
+            version=self._version,
+            built_at=time.monotonic(),
+            tenants=tenants,
+            contexts={
+                str(t["id"]): _context(t, promos)
+                for t, promos in zip(tenants, promotions, strict=True)
+            },
+            default=_context(None, []),
+            phrase_hints=hints,
+            test_phones=test_phones,
+        )
+
+    async def _load_tenants(self) -> list[dict[str, Any]]:
+        async with self._engine.begin() as conn:
+            result = await conn.execute(
+                text(f"""
+                    SELECT {TENANT_COLUMNS}
+                    FROM tenants
+                    WHERE is_active = true
+                    ORDER BY created_at
+                """)
+            )
+            return [dict(row._mapping) for row in result]
+
+    async def _load_test_phones(self) -> dict[str, Any]:
+        try:
+            raw = await self._redis.get(TEST_PHONES_REDIS_KEY)
+            if raw:
+                phones = json.loads(raw.decode() if isinstance(raw, bytes) else raw)
+                if isinstance(phones, dict):
+                    return phones
+        except Exception:
+            logger.debug("tenant_context: failed to load test phones", exc_info=True)
+        return {}
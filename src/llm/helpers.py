@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Any
 import anthropic
 
 from src.config import get_settings
+from src.llm.models import Usage
 
 if TYPE_CHECKING:
     from src.llm.models import LLMTask
@@ -97,6 +98,30 @@ async def llm_complete(
     Returns:
         Stripped text response, or empty string if all paths fail.
     """
+    text, _usage = await llm_complete_with_usage(
+        task,
+        messages,
+        system=system,
+        max_tokens=max_tokens,
+        router=router,
+        provider_override=provider_override,
+    )
+    return text
+
+
+async def llm_complete_with_usage(
+    task: LLMTask,
+    messages: list[dict[str, Any]],
+    *,
+    system: str | None = None,
+    max_tokens: int = 1024,
+    router: object = _SENTINEL,
+    provider_override: str | None = None,
+) -> tuple[str, Usage]:
+    """Same as ``llm_complete`` but also returns the token usage.
+
+    Usage is zero when every path failed (empty text).
+    """
     # Resolve router: global → lazy-init for Celery workers
     if router is _SENTINEL:
         from src.llm import get_router
@@ -117,7 +142,7 @@ async def llm_complete(
             resp = await router.complete(task, messages, **kwargs)  # type: ignore[union-attr]
             text = (resp.text or "").strip()
             if text:
-                return text
+                return text, resp.usage
         except Exception:
             logger.debug("LLM router failed for task=%s, falling back to Anthropic SDK", task)
 
@@ -153,7 +178,11 @@ async def llm_complete(
             pass
 
         block = response.content[0] if response.content else None
-        return (block.text if block and hasattr(block, "text") else "").strip()
+        usage = Usage(
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+        )
+        return (block.text if block and hasattr(block, "text") else "").strip(), usage
     except Exception:
         logger.exception("Anthropic SDK fallback failed for task=%s", task)
-        return ""
+        return "", Usage(0, 0)
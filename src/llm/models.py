@@ -26,6 +26,33 @@ class ProviderType(enum.StrEnum):
     GEMINI = "gemini"
 
 
+class SystemPrompt(str):
+    """System prompt text that remembers where its stable prefix ends.
+
+    Behaves exactly like the joined string everywhere (OpenAI-compatible
+    providers send it as-is and rely on automatic prefix caching), but
+    ``AnthropicProvider`` uses ``stable_prefix`` / ``volatile_suffix`` to
+    place a ``cache_control`` breakpoint between the two — Anthropic only
+    caches up to explicitly declared breakpoints.
+    """
+
+    stable_len: int
+
+    def __new__(cls, stable: str, volatile: str = "") -> SystemPrompt:
+        text = f"{stable}\n{volatile}" if volatile else stable
+        obj = super().__new__(cls, text)
+        obj.stable_len = len(stable)
+        return obj
+
+    @property
+    def stable_prefix(self) -> str:
+        return self[: self.stable_len]
+
+    @property
+    def volatile_suffix(self) -> str:
+        return self[self.stable_len :].removeprefix("\n")
+
+
 @dataclass(frozen=True)
 class ToolCall:
     """A single tool call from the LLM response."""
@@ -43,8 +70,10 @@ class Usage:
     from the provider's automatic prompt cache — for OpenAI this comes from
     ``usage.prompt_tokens_details.cached_tokens`` (enabled by default since
     Oct 2024 for prefixes ≥1024 tokens, ~50% cheaper). Anthropic reports it
-    as ``usage.cache_read_input_tokens``. Field is 0 when the provider does
-    not report cache stats.
+    as ``usage.cache_read_input_tokens`` and excludes cached tokens from its
+    own ``input_tokens``, so ``AnthropicProvider`` adds cache reads and cache
+    writes back in to keep ``input_tokens`` the total prompt size. Field is
+    0 when the provider does not report cache stats.
     """
 
     input_tokens: int
@@ -14,6 +14,7 @@ from src.llm.models import (
     LLMResponse,
     StreamDone,
     StreamEvent,
+    SystemPrompt,
     TextDelta,
     ToolCall,
     ToolCallDelta,
@@ -25,6 +26,59 @@ from src.llm.providers.base import AbstractProvider
 
 logger = logging.getLogger(__name__)
 
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _system_param(system: str) -> str | list[dict[str, Any]]:
+    """Render ``system`` for the Messages API.
+
+    A ``SystemPrompt`` becomes two text blocks with a cache breakpoint
+    after the stable prefix, so every turn of a call re-reads the prefix
+    from Anthropic's prompt cache and only the per-turn suffix is billed
+    at the full input rate. Plain strings are sent unchanged.
+    """
+    if not isinstance(system, SystemPrompt) or not system.stable_len:
+        return system
+    blocks: list[dict[str, Any]] = [
+        {"type": "text", "text": system.stable_prefix, "cache_control": _EPHEMERAL},
+    ]
+    volatile = system.volatile_suffix
+    if volatile:
+        blocks.append({"type": "text", "text": volatile})
+    return blocks
+
+
+def _tools_param(tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mark the last tool schema as a cache breakpoint (caches all tools).
+
+    Tools precede the system prompt in Anthropic's cache order, so this
+    keeps the tool schema cached even when the system prompt changes
+    (e.g. after a compact→full module upgrade). The caller's dicts are
+    not mutated.
+    """
+    if not tools:
+        return tools
+    return [*tools[:-1], {**tools[-1], "cache_control": _EPHEMERAL}]
+
+
+def _usage(usage: Any) -> Usage:
+    """Normalize Anthropic usage so ``input_tokens`` includes cached tokens.
+
+    Anthropic's ``input_tokens`` counts only the tokens after the last
+    cache breakpoint; cache reads and cache writes are reported
+    separately. Other providers (and ``CostBreakdown``) treat
+    ``input_tokens`` as the full prompt with ``cached_input_tokens`` as
+    a subset, so both are added back here. Cache writes are billed at the
+    regular input rate (Anthropic's 25% write premium is not modelled).
+    """
+    cache_read = int(getattr(usage, "cache_read_input_tokens", 0) or 0)
+    cache_write = int(getattr(usage, "cache_creation_input_tokens", 0) or 0)
+    return Usage(
+        input_tokens=usage.input_tokens + cache_read + cache_write,
+        output_tokens=usage.output_tokens,
+        cached_input_tokens=cache_read,
+    )
+
 
 class AnthropicProvider(AbstractProvider):
     """LLM provider using the Anthropic Python SDK (AsyncAnthropic)."""
@@ -46,7 +100,7 @@ class AnthropicProvider(AbstractProvider):
             "messages": messages,
         }
         if system:
-            kwargs["system"] = system
+            kwargs["system"] = _system_param(system)
 
         response = await self._client.messages.create(**kwargs)
         return self._parse_response(response)
@@ -62,10 +116,10 @@ class AnthropicProvider(AbstractProvider):
             "model": self._model,
             "max_tokens": max_tokens,
             "messages": messages,
-            "tools": tools,
+            "tools": _tools_param(tools),
         }
         if system:
-            kwargs["system"] = system
+            kwargs["system"] = _system_param(system)
 
         response = await self._client.messages.create(**kwargs)
         return self._parse_response(response)
@@ -92,10 +146,10 @@ class AnthropicProvider(AbstractProvider):
             "model": self._model,
             "max_tokens": max_tokens,
             "messages": messages,
-            "tools": tools,
+            "tools": _tools_param(tools),
         }
         if system:
-            kwargs["system"] = system
+            kwargs["system"] = _system_param(system)
 
         async with self._client.messages.stream(**kwargs) as stream:
             current_tool_id = ""
@@ -123,17 +177,9 @@ class AnthropicProvider(AbstractProvider):
 
             # After stream completes, emit StreamDone
             final = await stream.get_final_message()
-            # Anthropic prompt caching: cache_read_input_tokens is populated
-            # only when the request declared cache_control breakpoints. When
-            # absent (or when SDK version predates the field) it's 0.
-            cached = int(getattr(final.usage, "cache_read_input_tokens", 0) or 0)
             yield StreamDone(
                 stop_reason=final.stop_reason or "end_turn",
-                usage=Usage(
-                    input_tokens=final.usage.input_tokens,
-                    output_tokens=final.usage.output_tokens,
-                    cached_input_tokens=cached,
-                ),
+                usage=_usage(final.usage),
             )
 
     def _parse_response(self, response: Any) -> LLMResponse:
@@ -155,16 +201,11 @@ class AnthropicProvider(AbstractProvider):
 
         stop_reason = response.stop_reason or "end_turn"
 
-        cached = int(getattr(response.usage, "cache_read_input_tokens", 0) or 0)
         return LLMResponse(
             text="".join(text_parts),
             tool_calls=tool_calls,
             stop_reason=stop_reason,
-            usage=Usage(
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-                cached_input_tokens=cached,
-            ),
+            usage=_usage(response.usage),
             provider=self._provider_key,
             model=self._model,
         )
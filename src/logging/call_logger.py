@@ -3,12 +3,20 @@
 Logs calls, turns, and tool calls asynchronously to avoid blocking
 the main call processing loop. Supports graceful degradation when
 PostgreSQL is unavailable.
+
+Turn and tool-call rows go through a write-behind queue shared by all
+calls: they are coalesced and written in batches (one transaction, one
+``COPY`` per table) when the batch fills up or ``batch_max_delay`` passes,
+instead of one session and transaction per row.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import logging
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
@@ -16,6 +24,15 @@ from typing import TYPE_CHECKING, Any
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from src.monitoring.metrics import (
+    call_logger_batch_rows,
+    call_logger_flush_ms,
+    call_logger_queue_rows,
+    call_logger_redis_buffer_entries,
+    call_logger_replay_entries_total,
+    call_logger_rows_total,
+)
+
 if TYPE_CHECKING:
     from redis.asyncio import Redis
 
@@ -24,6 +41,134 @@ logger = logging.getLogger(__name__)
 _REDIS_LOG_BUFFER_KEY = "call_log_buffer"
 _REDIS_LOG_BUFFER_TTL = 3600  # 1 hour buffer
 
+# Redis log-buffer replay (flush_redis_buffer)
+_REPLAY_CHUNK_SIZE = 1000
+_REPLAY_INFLIGHT_KEY = f"{_REDIS_LOG_BUFFER_KEY}:inflight"
+_REPLAY_INFLIGHT_ID_KEY = f"{_REDIS_LOG_BUFFER_KEY}:inflight_id"
+_REPLAY_LOCK_KEY = f"{_REDIS_LOG_BUFFER_KEY}:replay_lock"
+_REPLAY_LOCK_TTL = 60  # seconds, refreshed per chunk
+
+# Atomically move the next chunk from the buffer head to the in-flight list
+# and tag it with a chunk id (KEYS: buffer, inflight, inflight_id;
+# ARGV: chunk size, chunk id).
+_CLAIM_CHUNK_LUA = """
+local items = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+if #items == 0 then
+    return items
+end
+redis.call('LTRIM', KEYS[1], #items, -1)
+redis.call('DEL', KEYS[2])
+redis.call('RPUSH', KEYS[2], unpack(items))
+redis.call('SET', KEYS[3], ARGV[2])
+return items
+"""
+
+# Write-behind queue defaults
+_BATCH_MAX_ROWS = 200
+_BATCH_MAX_DELAY_SEC = 0.5
+_QUEUE_MAX_BYTES = 8 * 1024 * 1024
+_ROW_OVERHEAD_BYTES = 256  # rough per-row cost beyond its string values
+
+_INSERT_TURN = """
+    INSERT INTO call_turns (id, call_id, turn_number, speaker, content,
+                             stt_confidence, stt_latency_ms, llm_latency_ms,
+                             tts_latency_ms, language, created_at)
+    VALUES (:id, :call_id, :turn_number, :speaker, :content,
+            :stt_confidence, :stt_latency_ms, :llm_latency_ms,
+            :tts_latency_ms, :language, :created_at)
+"""
+
+_INSERT_TOOL_CALL = """
+    INSERT INTO call_tool_calls (id, call_id, turn_number, tool_name,
+                                  tool_args, tool_result, duration_ms,
+                                  success, created_at)
+    VALUES (:id, :call_id, :turn_number, :tool_name,
+            :tool_args, :tool_result, :duration_ms,
+            :success, :created_at)
+"""
+
+# table → (columns, per-row INSERT used for the Redis fallback / non-asyncpg drivers)
+_QUEUED_TABLES: dict[str, tuple[tuple[str, ...], str]] = {
+    "call_turns": (
+        (
+            "id",
+            "call_id",
+            "turn_number",
+            "speaker",
+            "content",
+            "stt_confidence",
+            "stt_latency_ms",
+            "llm_latency_ms",
+            "tts_latency_ms",
+            "language",
+            "created_at",
+        ),
+        _INSERT_TURN,
+    ),
+    "call_tool_calls": (
+        (
+            "id",
+            "call_id",
+            "turn_number",
+            "tool_name",
+            "tool_args",
+            "tool_result",
+            "duration_ms",
+            "success",
+            "created_at",
+        ),
+        _INSERT_TOOL_CALL,
+    ),
+}
+_UUID_COLUMNS = frozenset({"id", "call_id"})
+
+
+def _row_bytes(row: dict[str, Any]) -> int:
+    """Approximate memory held by a queued row."""
+    return _ROW_OVERHEAD_BYTES + sum(len(v) for v in row.values() if isinstance(v, str))
+
+
+def _copy_record(columns: tuple[str, ...], row: dict[str, Any]) -> tuple[Any, ...]:
+    """Row as a ``COPY`` record (asyncpg's binary codec wants ``UUID`` objects)."""
+    return tuple(uuid.UUID(row[c]) if c in _UUID_COLUMNS else row[c] for c in columns)
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _buffered_params(entry: dict[str, Any]) -> dict[str, Any]:
+    """Params of a buffered entry with its datetimes restored (JSON keeps them as text)."""
+    params = dict(entry["params"])
+    for key in entry.get("datetime_params", ()):
+        if isinstance(params.get(key), str):
+            params[key] = datetime.fromisoformat(params[key])
+    return params
+
+
+def _replay_batches(entries: list[dict[str, Any]]) -> list[tuple[str, list[dict[str, Any]]]]:
+    """Group buffered entries into executemany batches.
+
+    INSERTs (new rows with their own ids) are independent of each other and
+    are grouped by query text, in order of first appearance. They run
+    before every other statement, which keeps its original order
+    (consecutive identical queries still share a batch). That way an UPDATE
+    never runs before the INSERT it depends on, and later UPDATEs of the
+    same row still win.
+    """
+    inserts: dict[str, list[dict[str, Any]]] = {}
+    ordered: list[tuple[str, list[dict[str, Any]]]] = []
+    for entry in entries:
+        query = entry["query"]
+        params = _buffered_params(entry)
+        if query.lstrip()[:6].upper() == "INSERT":
+            inserts.setdefault(query, []).append(params)
+        elif ordered and ordered[-1][0] == query:
+            ordered[-1][1].append(params)
+        else:
+            ordered.append((query, [params]))
+    return [*inserts.items(), *ordered]
+
 
 def _merge_vehicles(
     existing: list[dict[str, Any]],
@@ -58,18 +203,50 @@ class CallLogger:
     """Asynchronous call logger writing to PostgreSQL.
 
     Falls back to Redis buffer when PostgreSQL is unavailable.
+
+    Args:
+        database_url: PostgreSQL URL (asyncpg driver for ``COPY`` batches).
+        redis: Fallback buffer for writes while PostgreSQL is down.
+        batch_max_rows: Queued rows that trigger an immediate flush.
+        batch_max_delay: Longest a queued row waits for its flush (seconds).
+        queue_max_bytes: Queue memory budget; beyond it callers flush inline.
     """
 
-    def __init__(self, database_url: str, redis: Redis | None = None) -> None:
+    def __init__(
+        self,
+        database_url: str,
+        redis: Redis | None = None,
+        *,
+        batch_max_rows: int = _BATCH_MAX_ROWS,
+        batch_max_delay: float = _BATCH_MAX_DELAY_SEC,
+        queue_max_bytes: int = _QUEUE_MAX_BYTES,
+    ) -> None:
         self._engine = create_async_engine(
             database_url, pool_size=5, max_overflow=5, pool_pre_ping=True
         )
         self._session_factory = async_sessionmaker(self._engine, expire_on_commit=False)
         self._redis = redis
         self._db_available = True
+        self._batch_max_rows = batch_max_rows
+        self._batch_max_delay = batch_max_delay
+        self._queue_max_bytes = queue_max_bytes
+        self._pending: list[tuple[str, dict[str, Any]]] = []
+        self._pending_bytes = 0
+        self._has_rows = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._writer_task: asyncio.Task[None] | None = None
+        self._replay_task: asyncio.Task[int] | None = None
 
     async def close(self) -> None:
-        """Close the database engine."""
+        """Flush queued rows, stop the writer and close the database engine."""
+        for task in (self._writer_task, self._replay_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._writer_task = self._replay_task = None
+        await self.flush()
         await self._engine.dispose()
 
     # --- Call lifecycle ---
@@ -111,7 +288,13 @@ class CallLogger:
         cost_breakdown: dict[str, Any] | None = None,
         total_cost_usd: float | None = None,
     ) -> None:
-        """Log the end of a call."""
+        """Log the end of a call.
+
+        Flushes the write-behind queue first, so the call's turns and tool
+        calls are in PostgreSQL before post-call tasks (quality evaluation)
+        read them.
+        """
+        await self.flush()
         await self._execute(
             """
             UPDATE calls
@@ -148,16 +331,9 @@ class CallLogger:
         tts_latency_ms: int | None = None,
         language: str | None = None,
     ) -> None:
-        """Log a single dialog turn."""
-        await self._execute(
-            """
-            INSERT INTO call_turns (id, call_id, turn_number, speaker, content,
-                                     stt_confidence, stt_latency_ms, llm_latency_ms,
-                                     tts_latency_ms, language, created_at)
-            VALUES (:id, :call_id, :turn_number, :speaker, :content,
-                    :stt_confidence, :stt_latency_ms, :llm_latency_ms,
-                    :tts_latency_ms, :language, :created_at)
-            """,
+        """Queue a single dialog turn for the next batch write."""
+        await self._enqueue(
+            "call_turns",
             {
                 "id": str(uuid.uuid4()),
                 "call_id": str(call_id),
@@ -183,16 +359,9 @@ class CallLogger:
         duration_ms: int,
         success: bool,
     ) -> None:
-        """Log a tool call."""
-        await self._execute(
-            """
-            INSERT INTO call_tool_calls (id, call_id, turn_number, tool_name,
-                                          tool_args, tool_result, duration_ms,
-                                          success, created_at)
-            VALUES (:id, :call_id, :turn_number, :tool_name,
-                    :tool_args, :tool_result, :duration_ms,
-                    :success, :created_at)
-            """,
+        """Queue a tool call for the next batch write."""
+        await self._enqueue(
+            "call_tool_calls",
             {
                 "id": str(uuid.uuid4()),
                 "call_id": str(call_id),
@@ -411,6 +580,93 @@ class CallLogger:
         await self._execute(sql, params)
         return {"status": "updated", "fields": fields_updated}
 
+    # --- Write-behind queue ---
+
+    async def _enqueue(self, table: str, row: dict[str, Any]) -> None:
+        """Queue a row for the next batch flush.
+
+        Backpressure: once the queue holds ``queue_max_bytes``, the caller
+        flushes inline (to PostgreSQL, or to the Redis buffer when it is
+        down), so memory stays bounded however far the writer falls behind.
+        """
+        self._pending.append((table, row))
+        self._pending_bytes += _row_bytes(row)
+        call_logger_queue_rows.set(len(self._pending))
+        if self._pending_bytes >= self._queue_max_bytes:
+            await self.flush()
+            return
+        self._has_rows.set()
+        if len(self._pending) >= self._batch_max_rows:
+            self._batch_full.set()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._run_writer())
+
+    async def _run_writer(self) -> None:
+        """Background flusher: batch full, or ``batch_max_delay`` after the first row."""
+        while True:
+            await self._has_rows.wait()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._batch_full.wait(), self._batch_max_delay)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("CallLogger batch flush failed")
+
+    async def flush(self) -> int:
+        """Write all queued rows now. Returns the number written to PostgreSQL.
+
+        On a database error the batch goes to the Redis buffer instead
+        (replayed later by ``flush_redis_buffer``).
+        """
+        async with self._flush_lock:
+            rows, self._pending = self._pending, []
+            self._pending_bytes = 0
+            self._has_rows.clear()
+            self._batch_full.clear()
+            call_logger_queue_rows.set(0)
+            if not rows:
+                return 0
+
+            start = time.monotonic()
+            try:
+                await self._write_batch(rows)
+            except Exception:
+                self._db_available = False
+                logger.warning("PostgreSQL unavailable, buffering %d log rows to Redis", len(rows))
+                buffered = await self._buffer_entries_to_redis(
+                    [(_QUEUED_TABLES[table][1], row) for table, row in rows]
+                )
+                outcome = "redis_buffered" if buffered else "lost"
+                call_logger_rows_total.labels(outcome=outcome).inc(len(rows))
+                return 0
+
+            self._mark_db_available()
+            call_logger_batch_rows.observe(len(rows))
+            call_logger_flush_ms.observe((time.monotonic() - start) * 1000)
+            call_logger_rows_total.labels(outcome="written").inc(len(rows))
+            return len(rows)
+
+    async def _write_batch(self, rows: list[tuple[str, dict[str, Any]]]) -> None:
+        """Write queued rows in one transaction: ``COPY`` per table on asyncpg,
+        executemany of the per-row INSERT on other drivers."""
+        by_table: dict[str, list[dict[str, Any]]] = {}
+        for table, row in rows:
+            by_table.setdefault(table, []).append(row)
+
+        async with self._session_factory() as session, session.begin():
+            conn = await session.connection()
+            driver_conn = (await conn.get_raw_connection()).driver_connection
+            for table, table_rows in by_table.items():
+                columns, insert_sql = _QUEUED_TABLES[table]
+                if driver_conn is not None and hasattr(driver_conn, "copy_records_to_table"):
+                    await driver_conn.copy_records_to_table(
+                        table,
+                        records=[_copy_record(columns, r) for r in table_rows],
+                        columns=list(columns),
+                    )
+                else:
+                    await session.execute(text(insert_sql), table_rows)
+
     # --- Internals ---
 
     async def _execute(self, query: str, params: dict[str, Any]) -> None:
@@ -418,12 +674,19 @@ class CallLogger:
         try:
             async with self._session_factory() as session, session.begin():
                 await session.execute(text(query), params)
-            self._db_available = True
+            self._mark_db_available()
         except Exception:
             self._db_available = False
             logger.warning("PostgreSQL unavailable, buffering log to Redis")
             await self._buffer_to_redis(query, params)
 
+    def _mark_db_available(self) -> None:
+        """Record a successful write; after an outage, start replaying the Redis buffer."""
+        replay_idle = self._replay_task is None or self._replay_task.done()
+        if not self._db_available and self._redis is not None and replay_idle:
+            self._replay_task = asyncio.create_task(self.flush_redis_buffer())
+        self._db_available = True
+
     async def _fetch_one(self, query: str, params: dict[str, Any]) -> dict[str, Any] | None:
         """Execute a read query and return one row."""
         try:
@@ -447,40 +710,141 @@ class CallLogger:
 
     async def _buffer_to_redis(self, query: str, params: dict[str, Any]) -> None:
         """Buffer a log entry in Redis when PostgreSQL is unavailable."""
+        await self._buffer_entries_to_redis([(query, params)])
+
+    async def _buffer_entries_to_redis(self, entries: list[tuple[str, dict[str, Any]]]) -> bool:
+        """Buffer log entries in Redis (one RPUSH). Returns False if they were lost."""
         if self._redis is None:
-            return
+            return False
 
-        entry = json.dumps({"query": query, "params": params}, default=str)
+        payloads = [
+            json.dumps(
+                {
+                    "query": query,
+                    "params": params,
+                    "datetime_params": [k for k, v in params.items() if isinstance(v, datetime)],
+                },
+                default=str,
+            )
+            for query, params in entries
+        ]
         try:
-            await self._redis.rpush(_REDIS_LOG_BUFFER_KEY, entry)  # type: ignore[misc]
+            await self._redis.rpush(_REDIS_LOG_BUFFER_KEY, *payloads)  # type: ignore[misc]
             await self._redis.expire(_REDIS_LOG_BUFFER_KEY, _REDIS_LOG_BUFFER_TTL)
         except Exception:
-            logger.error("Redis buffer also unavailable — log entry lost")
+            logger.error("Redis buffer also unavailable — %d log entries lost", len(entries))
+            return False
+        return True
 
-    async def flush_redis_buffer(self) -> int:
+    async def flush_redis_buffer(self, *, chunk_size: int = _REPLAY_CHUNK_SIZE) -> int:
         """Flush buffered log entries from Redis to PostgreSQL.
 
+        Replays in chunks of ``chunk_size``: a Lua script moves the chunk
+        from the buffer head to an in-flight list under a fresh chunk id,
+        then the chunk is written in one transaction (``_replay_batches``
+        executemany groups) together with its id in
+        ``call_log_replay_chunks``. If the process dies after that commit
+        but before the in-flight list is cleared, the next run finds the id
+        and drops the chunk instead of inserting its turns twice. A Redis
+        lock keeps concurrent workers from replaying at the same time.
+
         Returns the number of entries flushed.
         """
         if self._redis is None:
             return 0
+        redis = self._redis
+        if not await redis.set(_REPLAY_LOCK_KEY, "1", nx=True, ex=_REPLAY_LOCK_TTL):
+            return 0
 
         count = 0
-        while True:
-            entry_raw = await self._redis.lpop(_REDIS_LOG_BUFFER_KEY)  # type: ignore[misc]
-            if entry_raw is None:
-                break
-
-            entry = json.loads(entry_raw)
-            try:
-                async with self._session_factory() as session, session.begin():
-                    await session.execute(text(entry["query"]), entry["params"])
-                count += 1
-            except Exception:
-                # Put it back
-                await self._redis.lpush(_REDIS_LOG_BUFFER_KEY, entry_raw)  # type: ignore[misc]
-                break
+        try:
+            while True:
+                await redis.expire(_REPLAY_LOCK_KEY, _REPLAY_LOCK_TTL)
+                chunk_id, raw_entries = await self._claim_replay_chunk(chunk_size)
+                if not raw_entries:
+                    break
+                count += await self._replay_chunk(chunk_id, raw_entries)
+                await redis.delete(_REPLAY_INFLIGHT_KEY, _REPLAY_INFLIGHT_ID_KEY)
+                call_logger_redis_buffer_entries.set(
+                    await redis.llen(_REDIS_LOG_BUFFER_KEY)  # type: ignore[misc]
+                )
+        except Exception:
+            # The in-flight chunk stays in Redis and is retried on the next run
+            logger.warning("Redis log buffer replay stopped after %d entries", count, exc_info=True)
+        finally:
+            with contextlib.suppress(Exception):
+                await redis.delete(_REPLAY_LOCK_KEY)
 
         if count > 0:
+            await self._execute(
+                "DELETE FROM call_log_replay_chunks WHERE replayed_at < :before",
+                {"before": datetime.now(UTC) - timedelta(days=1)},
+            )
             logger.info("Flushed %d buffered log entries to PostgreSQL", count)
         return count
+
+    async def _claim_replay_chunk(self, chunk_size: int) -> tuple[str, list[Any]]:
+        """Return the in-flight chunk left by an interrupted run, or claim the next one."""
+        assert self._redis is not None
+        chunk_id = await self._redis.get(_REPLAY_INFLIGHT_ID_KEY)
+        if chunk_id is not None:
+            return _decode(chunk_id), await self._redis.lrange(_REPLAY_INFLIGHT_KEY, 0, -1)  # type: ignore[misc]
+        new_id = uuid.uuid4().hex
+        entries = await self._redis.eval(  # type: ignore[misc]
+            _CLAIM_CHUNK_LUA,
+            3,
+            _REDIS_LOG_BUFFER_KEY,
+            _REPLAY_INFLIGHT_KEY,
+            _REPLAY_INFLIGHT_ID_KEY,
+            str(chunk_size),
+            new_id,
+        )
+        return new_id, list(entries or [])
+
+    async def _replay_chunk(self, chunk_id: str, raw_entries: list[Any]) -> int:
+        """Write one claimed chunk in a single transaction. Returns entries written.
+
+        If a batch fails (e.g. one malformed entry), the chunk is retried
+        entry by entry under savepoints and the failing entries are dropped,
+        so one bad entry cannot block the buffer forever.
+        """
+        entries = [json.loads(raw) for raw in raw_entries]
+        try:
+            return await self._write_replay_chunk(chunk_id, entries, salvage=False)
+        except Exception:
+            logger.warning("Replay chunk %s failed as a batch, retrying per entry", chunk_id)
+        return await self._write_replay_chunk(chunk_id, entries, salvage=True)
+
+    async def _write_replay_chunk(
+        self, chunk_id: str, entries: list[dict[str, Any]], *, salvage: bool
+    ) -> int:
+        async with self._session_factory() as session, session.begin():
+            claimed = await session.execute(
+                text(
+                    "INSERT INTO call_log_replay_chunks (chunk_id, entries) "
+                    "VALUES (:chunk_id, :entries) "
+                    "ON CONFLICT (chunk_id) DO NOTHING RETURNING chunk_id"
+                ),
+                {"chunk_id": chunk_id, "entries": len(entries)},
+            )
+            if claimed.first() is None:
+                call_logger_replay_entries_total.labels(outcome="duplicate_chunk").inc(len(entries))
+                return 0
+            if not salvage:
+                for query, params_list in _replay_batches(entries):
+                    await session.execute(text(query), params_list)
+                written = len(entries)
+            else:
+                written = 0
+                for query, params_list in _replay_batches(entries):
+                    for params in params_list:
+                        try:
+                            async with session.begin_nested():
+                                await session.execute(text(query), params)
+                            written += 1
+                        except Exception:
+                            logger.error("Dropping unreplayable log entry: %s", query.strip()[:80])
+        call_logger_replay_entries_total.labels(outcome="replayed").inc(written)
+        if written < len(entries):
+            call_logger_replay_entries_total.labels(outcome="dropped").inc(len(entries) - written)
+        return written
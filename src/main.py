@@ -28,17 +28,12 @@ from src.agent.agent import LLMAgent, ToolRouter
 from src.agent.prompt_manager import (
     PromptManager,
     fetch_tenant_promotions,
-    format_few_shot_section,
-    format_promotions_context,
-    format_safety_rules_section,
     get_few_shot_examples,
     get_pronunciation_rules,
     get_safety_rules_for_prompt,
-    inject_pronunciation_rules,
 )
 from src.agent.prompts import (
     GREETING_TEXT_KNOWN,
-    assemble_prompt,
     format_caller_history,
     format_customer_profile,
     format_storage_context,
@@ -81,6 +76,13 @@ from src.config import Settings, get_settings
 from src.core.audio_socket import AudioSocketConnection, AudioSocketServer
 from src.core.call_session import CallSession, CallState, SessionStore
 from src.core.pipeline import CallPipeline
+from src.core.tenant_context import (
+    TENANT_COLUMNS,
+    TEST_PHONES_REDIS_KEY,
+    TenantContextStore,
+    build_tenant_context,
+    is_history_disabled,
+)
 from src.events.publisher import publish_event
 from src.logging.pii_vault import PIIVault
 from src.logging.structured_logger import setup_logging
@@ -97,7 +99,10 @@ from src.monitoring.metrics import (
     tenant_resolution_fallback_total,
 )
 from src.onec_client.client import OneCClient
+from src.onec_client.schedule_cache import StationScheduleCache, next_business_days
+from src.store_client.catalog_index import CatalogIndexStore
 from src.store_client.client import StoreClient
+from src.store_client.vehicle_index import VehicleIndexStore
 from src.stt.base import STTConfig
 from src.stt.google_stt import GoogleSTTEngine
 from src.tts.base import TTSConfig
@@ -197,6 +202,16 @@ _tts_engine: GoogleTTSEngine | None = None
 _onec_client: OneCClient | None = None
 _embedding_task: asyncio.Task | None = None  # type: ignore[type-arg]
 _pricing_task: asyncio.Task | None = None  # type: ignore[type-arg]
+_stt_corrections_task: asyncio.Task | None = None  # type: ignore[type-arg]
+_tenant_context_task: asyncio.Task | None = None  # type: ignore[type-arg]
+_catalog_index_task: asyncio.Task | None = None  # type: ignore[type-arg]
+_vehicle_index_task: asyncio.Task | None = None  # type: ignore[type-arg]
+_schedule_prefetch_task: asyncio.Task | None = None  # type: ignore[type-arg]
+_ab_counts_task: asyncio.Task | None = None  # type: ignore[type-arg]
+_tenant_contexts: TenantContextStore | None = None  # per-tenant call-setup snapshot
+_catalog_index: CatalogIndexStore | None = None  # in-memory tire catalog index
+_vehicle_index: VehicleIndexStore | None = None  # in-memory vehicle tire-size index
+_schedule_cache: StationScheduleCache | None = None  # 1C fitting schedules (Redis)
 _db_engine: Any = None
 _call_logger: Any = None  # CallLogger for persisting calls to PostgreSQL
 _llm_router: Any = None  # LLMRouter when FF_LLM_ROUTING_ENABLED=true
@@ -513,25 +528,15 @@ async def _resolve_caller_id(
             except Exception:
                 logger.debug("Redis CallerID lookup failed", exc_info=True)
 
-    # Fallback: ARI channel variable
-    settings = get_settings()
-    if settings.ari.url:
+    # Fallback: ARI channel variable (shared client, pooled keep-alive session)
+    if _ari_client is not None:
         try:
-            from src.core.asterisk_ari import AsteriskARIClient
-
-            ari = AsteriskARIClient(
-                url=settings.ari.url,
-                user=settings.ari.user,
-                password=settings.ari.password,
+            raw_ari: str | None = await _ari_client.get_channel_variable(
+                channel_uuid, "CALLER_NUMBER"
             )
-            await ari.open()
-            try:
-                raw_ari = await ari.get_channel_variable(channel_uuid, "CALLER_NUMBER")
-                if raw_ari and raw_ari.strip():
-                    logger.info("CallerID from ARI: %s for call %s", raw_ari.strip(), channel_uuid)
-                    return raw_ari.strip()
-            finally:
-                await ari.close()
+            if raw_ari and raw_ari.strip():
+                logger.info("CallerID from ARI: %s for call %s", raw_ari.strip(), channel_uuid)
+                return raw_ari.strip()
         except Exception:
             logger.debug("ARI CALLER_NUMBER lookup failed", exc_info=True)
 
@@ -543,24 +548,11 @@ async def _resolve_ivr_intent(channel_uuid: str) -> str | None:
 
     Returns one of _VALID_IVR_INTENTS or None if not set / invalid.
     """
-    settings = get_settings()
-    if not settings.ari.url:
+    if _ari_client is None:
         return None
 
     try:
-        from src.core.asterisk_ari import AsteriskARIClient
-
-        ari = AsteriskARIClient(
-            url=settings.ari.url,
-            user=settings.ari.user,
-            password=settings.ari.password,
-        )
-        await ari.open()
-        try:
-            raw = await ari.get_channel_variable(channel_uuid, "IVR_INTENT")
-        finally:
-            await ari.close()
-
+        raw: str | None = await _ari_client.get_channel_variable(channel_uuid, "IVR_INTENT")
         if raw and raw.strip().lower() in _VALID_IVR_INTENTS:
             return raw.strip().lower()
     except Exception:
@@ -586,11 +578,6 @@ async def _resolve_tenant(
     slug: str | None = None
     called_exten: str | None = None
 
-    tenant_columns = (
-        "id, slug, name, network_id, agent_name, greeting, "
-        "enabled_tools, prompt_suffix, config, is_active, extensions, working_hours"
-    )
-
     # 1. Primary: use pre-fetched exten from Redis pipeline, or read directly
     if prefetched_exten is not _SENTINEL:
         called_exten = prefetched_exten
@@ -612,36 +599,34 @@ async def _resolve_tenant(
             logger.debug("Redis CALLED_EXTEN lookup failed", exc_info=True)
 
     # 2. Fallback: try ARI channel variables (best-effort)
-    if not called_exten:
-        settings = get_settings()
-        if settings.ari.url:
-            try:
-                from src.core.asterisk_ari import AsteriskARIClient
-
-                ari = AsteriskARIClient(
-                    url=settings.ari.url,
-                    user=settings.ari.user,
-                    password=settings.ari.password,
-                )
-                await ari.open()
-                try:
-                    slug = await ari.get_channel_variable(channel_uuid, "TENANT_SLUG")
-                    if not slug:
-                        called_exten = await ari.get_channel_variable(channel_uuid, "CALLED_EXTEN")
-                finally:
-                    await ari.close()
-            except Exception:
-                logger.debug("ARI tenant lookup failed", exc_info=True)
+    if not called_exten and _ari_client is not None:
+        try:
+            slug = await _ari_client.get_channel_variable(channel_uuid, "TENANT_SLUG")
+            if not slug:
+                called_exten = await _ari_client.get_channel_variable(channel_uuid, "CALLED_EXTEN")
+        except Exception:
+            logger.debug("ARI tenant lookup failed", exc_info=True)
 
-    if db_engine is None:
+    snapshot = _tenant_contexts.snapshot if _tenant_contexts is not None else None
+    if db_engine is None and snapshot is None:
         return None
 
+    if not slug and not called_exten:
+        tenant_resolution_fallback_total.inc()
+        logger.warning(
+            "Tenant resolution fallback — no exten/slug for call %s, "
+            "serving as first active tenant",
+            channel_uuid,
+        )
+    if snapshot is not None:
+        return snapshot.resolve_tenant(slug=slug, exten=called_exten)
+
     try:
         async with db_engine.begin() as conn:
             if slug:
                 result = await conn.execute(
                     text(f"""
-                        SELECT {tenant_columns}
+                        SELECT {TENANT_COLUMNS}
                         FROM tenants
                         WHERE slug = :slug AND is_active = true
                     """),
@@ -651,7 +636,7 @@ async def _resolve_tenant(
                 # Extension-based lookup
                 result = await conn.execute(
                     text(f"""
-                        SELECT {tenant_columns}
+                        SELECT {TENANT_COLUMNS}
                         FROM tenants
                         WHERE :exten = ANY(extensions) AND is_active = true
                         LIMIT 1
@@ -660,15 +645,9 @@ async def _resolve_tenant(
                 )
             else:
                 # Fallback: first active tenant
-                tenant_resolution_fallback_total.inc()
-                logger.warning(
-                    "Tenant resolution fallback — no exten/slug for call %s, "
-                    "serving as first active tenant",
-                    channel_uuid,
-                )
                 result = await conn.execute(
                     text(f"""
-                        SELECT {tenant_columns}
+                        SELECT {TENANT_COLUMNS}
                         FROM tenants
                         WHERE is_active = true
                         ORDER BY created_at
@@ -806,10 +785,18 @@ async def handle_call(conn: AudioSocketConnection) -> None:
 
     _embedding_gen = None
     try:
+        # Prebuilt per-tenant context (prompt, tools, templates, phrase hints).
+        # None until the first snapshot is built — then everything below is
+        # loaded live and rendered through the same TenantContext.
+        snapshot = _tenant_contexts.snapshot if _tenant_contexts is not None else None
+        tenant_ctx = snapshot.context(tenant) if snapshot is not None else None
+
         # Per-call STT engine (each call gets its own streaming session)
         stt = GoogleSTTEngine(project_id=settings.google_stt.project_id)
         phrase_hints: tuple[str, ...] = ()
-        if _redis is not None:
+        if snapshot is not None:
+            phrase_hints = snapshot.phrase_hints
+        elif _redis is not None:
             try:
                 from src.stt.phrase_hints import get_all_phrases_flat
 
@@ -832,6 +819,8 @@ async def handle_call(conn: AudioSocketConnection) -> None:
             endpointing_sensitivity=settings.google_stt.endpointing_sensitivity,
             speech_end_timeout_ms=settings.google_stt.speech_end_timeout_ms,
             transcript_buffer_sec=settings.google_stt.transcript_buffer_sec,
+            speculative_turn_enabled=settings.google_stt.speculative_turn_enabled,
+            speculative_stable_ms=settings.google_stt.speculative_stable_ms,
         )
 
         # Load DB templates and tool overrides in parallel
@@ -842,54 +831,48 @@ async def handle_call(conn: AudioSocketConnection) -> None:
         system_prompt = None
         prompt_version_name = None
         if _db_engine is not None:
-            pm = PromptManager(_db_engine)
-            tid = str(session.tenant_id) if session.tenant_id else None
-            templates, tools = await asyncio.gather(
-                pm.get_active_templates(tenant_id=tid),
-                get_tools_with_overrides(_db_engine, redis=_redis),
-            )
+            if tenant_ctx is None:
+                pm = PromptManager(_db_engine)
+                tid = str(session.tenant_id) if session.tenant_id else None
+                templates, tools = await asyncio.gather(
+                    pm.get_active_templates(tenant_id=tid),
+                    get_tools_with_overrides(_db_engine, redis=_redis),
+                )
 
             # A/B test: may override code prompt with assigned variant
             try:
                 from src.agent.ab_testing import ABTestManager
 
                 ab_manager = ABTestManager(_db_engine)
-                assignment = await ab_manager.assign_variant(str(conn.channel_uuid))
-                if assignment is not None:
-                    variant = await pm.get_version(assignment["prompt_version_id"])
-                    if variant:
-                        system_prompt = variant["system_prompt"]
-                        prompt_version_name = assignment["variant_name"]
-                        logger.info(
-                            "A/B test override: call=%s, variant=%s (%s)",
-                            conn.channel_uuid,
-                            assignment["variant_label"],
-                            assignment["variant_name"],
-                        )
+                assignment = await ab_manager.assign_variant(str(conn.channel_uuid), _redis)
+                if assignment is not None and assignment["system_prompt"]:
+                    system_prompt = assignment["system_prompt"]
+                    prompt_version_name = assignment["variant_name"]
+                    logger.info(
+                        "A/B test override: call=%s, variant=%s (%s)",
+                        conn.channel_uuid,
+                        assignment["variant_label"],
+                        assignment["variant_name"],
+                    )
             except Exception:
                 logger.warning("A/B test assignment failed, using default prompt", exc_info=True)
 
         # Load few-shot, safety rules, pronunciation, and promotions in parallel
-        few_shot_context = None
-        safety_context = None
-        promotions_context = None
-
-        async def _load_few_shot() -> dict:
+        # (snapshot miss only) alongside the per-caller loads
+        async def _load_few_shot() -> dict[str, list[dict[str, Any]]]:
             if _db_engine is None:
                 return {}
             try:
-                tid = str(session.tenant_id) if session.tenant_id else None
-                return await get_few_shot_examples(_db_engine, _redis, tenant_id=tid)
+                return await get_few_shot_examples(_db_engine, _redis)
             except Exception:
                 logger.debug("Few-shot examples loading failed", exc_info=True)
                 return {}
 
-        async def _load_safety() -> list:
+        async def _load_safety() -> list[dict[str, Any]]:
             if _db_engine is None:
                 return []
             try:
-                tid = str(session.tenant_id) if session.tenant_id else None
-                return await get_safety_rules_for_prompt(_db_engine, _redis, tenant_id=tid)
+                return await get_safety_rules_for_prompt(_db_engine, _redis)
             except Exception:
                 logger.debug("Safety rules loading failed", exc_info=True)
                 return []
@@ -903,7 +886,7 @@ async def handle_call(conn: AudioSocketConnection) -> None:
                 logger.debug("Pronunciation rules loading failed", exc_info=True)
                 return ""
 
-        async def _load_promotions() -> list:
+        async def _load_promotions() -> list[dict[str, str]]:
             if _db_engine is None or not session.tenant_id:
                 return []
             try:
@@ -919,32 +902,15 @@ async def handle_call(conn: AudioSocketConnection) -> None:
                 return []
             try:
                 # Test phone override — skip history if configured
-                if _redis is not None:
-                    raw = await _redis.get("test:phones")
+                phones: dict[str, Any] = {}
+                if snapshot is not None:
+                    phones = snapshot.test_phones
+                elif _redis is not None:
+                    raw = await _redis.get(TEST_PHONES_REDIS_KEY)
                     if raw:
-                        from src.utils.phone import normalize_phone_ua
-
                         phones = json.loads(raw.decode() if isinstance(raw, bytes) else raw)
-                        normalized = normalize_phone_ua(session.caller_id)
-                        raw_entry = phones.get(normalized)
-                        if raw_entry is not None:
-                            # Normalize to list (backward compat)
-                            if isinstance(raw_entry, str):
-                                entries = [{"mode": raw_entry}]
-                            elif isinstance(raw_entry, dict):
-                                entries = [raw_entry]
-                            else:
-                                entries = raw_entry
-                            for entry in entries:
-                                if entry.get("mode") == "no_history":
-                                    cfg_tenant = entry.get("tenant_id")
-                                    if not cfg_tenant or cfg_tenant == session.tenant_id:
-                                        logger.info(
-                                            "Test phone %s: skipping history (tenant=%s)",
-                                            session.caller_id,
-                                            cfg_tenant,
-                                        )
-                                        return []
+                if is_history_disabled(phones, session.caller_id, session.tenant_id):
+                    return []
                 return await _call_logger.get_caller_history(
                     session.caller_id, tenant_id=session.tenant_id
                 )
@@ -972,28 +938,40 @@ async def handle_call(conn: AudioSocketConnection) -> None:
                 logger.debug("Customer profile loading failed", exc_info=True)
                 return None
 
-        (
-            few_shot_examples,
-            safety_rules_extra,
-            pron_rules,
-            promos,
-            caller_history_raw,
-            storage_raw,
-            customer_profile_raw,
-        ) = await asyncio.gather(
-            _load_few_shot(),
-            _load_safety(),
-            _load_pronunciation(),
-            _load_promotions(),
-            _load_caller_history(),
-            _load_storage_contracts(),
-            _load_customer_profile(),
-        )
-        few_shot_context = format_few_shot_section(
-            few_shot_examples, scenario_type=session.scenario
-        )
-        safety_context = format_safety_rules_section(safety_rules_extra)
-        promotions_context = format_promotions_context(promos)
+        if tenant_ctx is None:
+            # Grouped: asyncio.gather has typed overloads for at most six awaitables
+            shared, per_caller = await asyncio.gather(
+                asyncio.gather(
+                    _load_few_shot(),
+                    _load_safety(),
+                    _load_pronunciation(),
+                    _load_promotions(),
+                ),
+                asyncio.gather(
+                    _load_caller_history(),
+                    _load_storage_contracts(),
+                    _load_customer_profile(),
+                ),
+            )
+            few_shot_examples, safety_rules_extra, pron_rules, promos = shared
+            caller_history_raw, storage_raw, customer_profile_raw = per_caller
+            tenant_ctx = build_tenant_context(
+                tenant,
+                templates={k: (v,) for k, v in templates.items()} if templates else None,
+                tools=tools,
+                few_shot_examples=few_shot_examples,
+                safety_rules=safety_rules_extra,
+                promotions=promos,
+                pronunciation=pron_rules,
+                scenario_tools=_SCENARIO_TOOLS,
+                scenario_emphasis=_SCENARIO_EMPHASIS,
+            )
+        else:
+            caller_history_raw, storage_raw, customer_profile_raw = await asyncio.gather(
+                _load_caller_history(),
+                _load_storage_contracts(),
+                _load_customer_profile(),
+            )
         caller_history_text = format_caller_history(caller_history_raw)
         storage_context_text = format_storage_context(storage_raw)
         customer_profile_text = format_customer_profile(customer_profile_raw)
@@ -1005,49 +983,33 @@ async def handle_call(conn: AudioSocketConnection) -> None:
             session.fitting_customer_name = profile_name
             session.name_from_profile = True
 
-        # Modular prompt assembly: if no DB/A-B prompt, assemble from modules
-        is_modular = False
+        # Prompt, tools and templates rendered for this tenant × scenario:
+        # modules assembled per scenario (unless an A/B variant overrides the
+        # prompt), pronunciation rules, tenant overrides (tools filter,
+        # greeting, prompt suffix), IVR scenario tool filter and emphasis.
+        scenario_ctx = tenant_ctx.scenario(session.scenario)
+        templates = tenant_ctx.pick_templates()
+        tools = scenario_ctx.tools
+        few_shot_context = scenario_ctx.pick_few_shot()
+        safety_context = tenant_ctx.safety_context
+        promotions_context = tenant_ctx.promotions_context
+        is_modular = system_prompt is None
         if system_prompt is None:
-            tenant_tools_set: set[str] | None = None
-            if tenant and tenant.get("enabled_tools"):
-                tenant_tools_set = set(tenant["enabled_tools"])
-            system_prompt = assemble_prompt(
-                scenario=session.scenario,
-                include_pronunciation=False,  # added separately via inject_pronunciation_rules
-                # Compact router path is unused now that we default scenario
-                # to "fitting" on new calls (see main.py connection handler).
-                # Kept as backward-compat for the rare `session.scenario is None`
-                # path that survives session-restore edge cases.
-                compact=(session.scenario is None),
-                enabled_tools=tenant_tools_set,
+            system_prompt = scenario_ctx.system_prompt
+        else:
+            system_prompt = tenant_ctx.decorate_prompt(system_prompt, session.scenario)
+        if session.scenario and session.scenario in _SCENARIO_TOOLS:
+            logger.info(
+                "Scenario tool filter: %s → %d tools for call %s",
+                session.scenario,
+                len(tools) if tools else 0,
+                conn.channel_uuid,
             )
-            is_modular = True
-
-        # Inject pronunciation rules into system prompt
-        if pron_rules:
-            system_prompt = inject_pronunciation_rules(system_prompt, pron_rules)
 
         # Resolve tenant-specific names early (used in greeting personalization below)
         tenant_agent_name = tenant.get("agent_name") if tenant else None
         tenant_network_name = tenant.get("name") if tenant else None
 
-        # Apply tenant overrides (tools filter, greeting, prompt suffix)
-        if tenant:
-            if tenant.get("enabled_tools"):
-                allowed = set(tenant["enabled_tools"])
-                # Callback is the natural companion to transfer_to_operator (after-hours
-                # / operator-unavailable flow) — auto-include so tenants don't need to
-                # remember to list it when they enable transfers.
-                if "transfer_to_operator" in allowed:
-                    allowed.add("create_callback_request")
-                if tools:
-                    tools = [t for t in tools if t["name"] in allowed]
-            if tenant.get("greeting") and templates:
-                templates = dict(templates)  # copy to avoid mutating shared dict
-                templates["greeting"] = tenant["greeting"]
-            if tenant.get("prompt_suffix") and system_prompt:
-                system_prompt = system_prompt + "\n\n" + tenant["prompt_suffix"]
-
         # Personalized greeting for known customers (after tenant override)
         if profile_name and templates:
             templates = dict(templates)  # copy to avoid mutating shared dict
@@ -1074,24 +1036,6 @@ async def handle_call(conn: AudioSocketConnection) -> None:
                 conn.channel_uuid,
             )
 
-        # Apply IVR scenario-based tool filtering
-        if session.scenario and session.scenario in _SCENARIO_TOOLS:
-            allowed_scenario = _SCENARIO_TOOLS[session.scenario]
-            if tools:
-                tools = [t for t in tools if t["name"] in allowed_scenario]
-            logger.info(
-                "Scenario tool filter: %s → %d tools for call %s",
-                session.scenario,
-                len(tools) if tools else 0,
-                conn.channel_uuid,
-            )
-
-        # Apply IVR scenario emphasis to system prompt
-        if session.scenario and system_prompt:
-            emphasis = _SCENARIO_EMPHASIS.get(session.scenario)
-            if emphasis:
-                system_prompt = system_prompt + emphasis
-
         # Per-tenant config extracted once — used for StoreClient AND LLM
         # provider override.
         tenant_config: dict[str, Any] = {}
@@ -1113,6 +1057,8 @@ async def handle_call(conn: AudioSocketConnection) -> None:
                 timeout=settings.store_api.timeout,
                 db_engine=_db_engine,
                 redis=_redis,
+                catalog_index=_catalog_index,
+                vehicle_index=_vehicle_index,
             )
             await tenant_store_client.open()
             logger.info("Per-tenant StoreClient: %s", tenant_config["store_api_url"])
@@ -1345,13 +1291,15 @@ async def handle_call(conn: AudioSocketConnection) -> None:
         except Exception:
             logger.warning("log_call_end failed", exc_info=True)
 
-    # Dispatch async quality evaluation (non-blocking, Celery task)
-    try:
-        from src.tasks.quality_evaluator import evaluate_call_quality
+    # Dispatch async quality evaluation (non-blocking, Celery task);
+    # in batch mode calls are scored off-peak by evaluate_quality_batch
+    if not get_settings().quality.batch_mode:
+        try:
+            from src.tasks.quality_evaluator import evaluate_call_quality
 
-        evaluate_call_quality.delay(str(conn.channel_uuid))
-    except Exception:
-        logger.warning("Quality evaluation dispatch failed", exc_info=True)
+            evaluate_call_quality.delay(str(conn.channel_uuid))
+        except Exception:
+            logger.warning("Quality evaluation dispatch failed", exc_info=True)
 
     logger.info(
         "Call ended: %s, duration=%ds, turns=%d",
@@ -1427,6 +1375,30 @@ def _extract_time(raw: str) -> str:
     return m.group(1) if m else ""
 
 
+# Business days after an empty day searched in the schedule cache for a
+# "next available" offer
+_NEXT_FREE_LOOKAHEAD_DAYS = 5
+
+
+def _free_slot_times(raw_slots: list[dict[str, Any]], count_posts: int) -> list[str]:
+    """Times (HH:MM) of 1C schedule slots that still have a free post.
+
+    Build compact list of AVAILABLE times only. LLM never uses unavailable
+    slots — dropping them (and the per-slot metadata: station_id/date/
+    period/available) shaves ~900 chars per response for a typical 13-slot
+    day (call 98ee0296: raw payload was 1182 chars → now ~250).
+    """
+    times: list[str] = []
+    for s in raw_slots:
+        qty = int(s.get("Quantity", 0))
+        if count_posts - qty <= 0:
+            continue
+        t = _extract_time(s.get("Time", ""))
+        if t:
+            times.append(t)
+    return times
+
+
 _LETTER_FOLD = str.maketrans({
     # Fold uk↔ru near-equivalents so STT / caller input matches hints
     # written in either language: "Епіцентр"↔"Эпицентр", "Опытное"↔"Опитне",
@@ -1584,6 +1556,13 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
             orders_created_total.inc()
         return result
 
+    async def _invalidate_schedule(station_id: str, day: str, guid: str) -> None:
+        """Drop the cached schedule day a booking/reservation just changed."""
+        if _schedule_cache is None:
+            return
+        await _schedule_cache.invalidate(station_id, day)
+        await _schedule_cache.remember_booking(guid, station_id, day)
+
     async def _book_fitting_with_metric(**kwargs: Any) -> Any:
         """Book fitting: try SOAP, fallback to Store API."""
         # Server-side validation: reject booking without required customer data
@@ -1844,6 +1823,9 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
                     guid = data_list[0].get("GUID", "") if data_list else ""
                     if guid:
                         fittings_booked_total.inc()
+                        await _invalidate_schedule(
+                            kwargs.get("station_id", ""), booking_date_str, guid
+                        )
                         # Auto-update customer profile with vehicle data.
                         # 2026-08-18: Krok 5 now collects COLOR (not plate) in
                         # auto_number. Only save auto_number to profile.plate
@@ -2403,6 +2385,29 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
             pass
         return 1
 
+    async def _next_free_day(
+        station_id: str, after: str, count_posts: int
+    ) -> tuple[str, list[str]] | None:
+        """First cached business day after *after* with free slots (no 1C call)."""
+        if _schedule_cache is None:
+            return None
+        try:
+            after_date = date_type.fromisoformat(after)
+        except ValueError:
+            return None
+        max_date = datetime.now(tz=UTC).date() + timedelta(days=21)
+        days = [
+            d.isoformat()
+            for d in next_business_days(after_date, _NEXT_FREE_LOOKAHEAD_DAYS)
+            if d <= max_date
+        ]
+        cached = await _schedule_cache.cached_days(station_id, days)
+        for day in days:
+            times = _free_slot_times(cached.get(day, []), count_posts)
+            if times:
+                return day, times
+        return None
+
     async def _get_fitting_slots(**kwargs: Any) -> Any:
         """Get fitting slots: try SOAP, fallback to Store API."""
         station_id = kwargs.get("station_id", "")
@@ -2544,26 +2549,18 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
 
         if _onec_client is not None:
             try:
-                result = await _onec_client.get_station_schedule(
-                    station_id=station_id,
-                    date_from=date_from,
-                    date_to=date_to,
-                )
-                raw_slots = result.get("data", [])
+                # Single day (the usual call) → short-TTL cache, prefetched
+                if _schedule_cache is not None and date_to == date_from:
+                    raw_slots = await _schedule_cache.get(station_id, date_from)
+                else:
+                    result = await _onec_client.get_station_schedule(
+                        station_id=station_id,
+                        date_from=date_from,
+                        date_to=date_to,
+                    )
+                    raw_slots = result.get("data", [])
                 count_posts = await _get_station_count_posts(station_id)
-                # Build compact list of AVAILABLE times only. LLM never uses
-                # unavailable slots — dropping them (and the per-slot metadata:
-                # station_id/date/period/available) shaves ~900 chars per
-                # response for a typical 13-slot day (call 98ee0296: raw
-                # payload was 1182 chars → now ~250).
-                avail_times: list[str] = []
-                for s in raw_slots:
-                    qty = int(s.get("Quantity", 0))
-                    if count_posts - qty <= 0:
-                        continue
-                    t = _extract_time(s.get("Time", ""))
-                    if t:
-                        avail_times.append(t)
+                avail_times = _free_slot_times(raw_slots, count_posts)
                 logger.info(
                     "get_fitting_slots for call %s: station=%s, date=%s..%s, "
                     "total=%d, available=%d, posts=%d, times=%s",
@@ -2607,19 +2604,26 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
                 # a real next-business-day suggestion so bot can offer it.
                 if not avail:
                     weekday = d_from.weekday()  # 0=Mon..6=Sun
-
-                    def _next_business_day(from_date: date_type) -> date_type:
-                        """Return the earliest business day strictly after from_date."""
-                        candidate = from_date + timedelta(days=1)
-                        while candidate.weekday() in (5, 6):  # Sat/Sun
-                            candidate += timedelta(days=1)
-                        return candidate
-
                     same_weekday_next_week = d_from + timedelta(days=7)
 
+                    # The next cached day with free slots is offered right away
+                    # (its times included), saving a 1C call and an LLM tool
+                    # round; otherwise the next business day is suggested.
+                    next_free = await _next_free_day(station_id, date_from, count_posts)
+                    if next_free is not None:
+                        free_day, free_times = next_free
+                        next_open = date_type.fromisoformat(free_day)
+                        response["next_available"] = {"date": free_day, "slots": free_times}
+                        # The offered slots are on free_day, not the empty one asked for
+                        session.selected_fitting_date = free_day
+                        session.fitting_slots_offered = [
+                            {"date": free_day, "time": t} for t in free_times
+                        ]
+                    else:
+                        next_open = next_business_days(d_from, 1)[0]
+
                     if d_from == today_date:
                         # Today has no slots — day is over. Suggest tomorrow (business).
-                        next_open = _next_business_day(d_from)
                         response["reason"] = "today_too_late"
                         response["message"] = (
                             f"На сьогодні онлайн-запис уже закритий. "
@@ -2631,7 +2635,6 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
                         )
                     elif weekday in (5, 6):
                         # Weekend request → suggest next Monday (business).
-                        next_open = _next_business_day(d_from)
                         response["reason"] = "weekend"
                         response["message"] = (
                             f"Станція у вихідні (сб/нд) не працює. "
@@ -2643,7 +2646,6 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
                         )
                     else:
                         # Weekday with no slots → next business day + same weekday next week
-                        next_open = _next_business_day(d_from)
                         response["reason"] = "no_slots"
                         response["message"] = (
                             f"На {date_from} вільних слотів немає. "
@@ -2655,6 +2657,8 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
                         response["suggested_same_weekday_next_week"] = (
                             same_weekday_next_week.isoformat()
                         )
+                    if next_free is not None:
+                        response["message"] += " Вільні години на цей день — у next_available."
                 return response
             except Exception:
                 logger.warning(
@@ -2688,6 +2692,8 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
                 if result.get("success"):
                     data_list = result.get("data", [])
                     canceled = data_list[0].get("Canceled", False) if data_list else False
+                    if canceled and _schedule_cache is not None:
+                        await _schedule_cache.invalidate_booking(booking_id)
                     return {
                         "booking_id": booking_id,
                         "status": "cancelled" if canceled else "error",
@@ -2891,6 +2897,11 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
                     if sid in stations_map:
                         entry.update(stations_map[sid])
                     bookings.append(entry)
+                    # So cancel_fitting can invalidate the cached schedule day
+                    if _schedule_cache is not None:
+                        await _schedule_cache.remember_booking(
+                            entry["booking_id"], sid, entry["date"]
+                        )
 
                 return {"total": len(bookings), "bookings": bookings}
             except Exception:
@@ -3023,6 +3034,9 @@ def _build_tool_router(session: CallSession, store_client: StoreClient | None =
                     data_list = result.get("data", [])
                     guid = data_list[0].get("GUID", "") if data_list else ""
                     if guid:
+                        await _invalidate_schedule(
+                            station_id, _resolve_date(kwargs.get("date", "")), guid
+                        )
                         return {
                             "reservation_id": guid,
                             "status": "reserved",
@@ -3431,10 +3445,26 @@ async def _periodic_pricing_refresh(interval_minutes: int = 5) -> None:
         await asyncio.sleep(interval_minutes * 60)
 
 
+async def _periodic_ab_counts_flush(interval_seconds: int = 10) -> None:
+    """Periodically persist in-memory A/B assignment counters."""
+    from src.agent.ab_testing import ABTestManager
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            if _db_engine is not None:
+                await ABTestManager(_db_engine).flush_counts()
+        except Exception:
+            logger.warning("Periodic A/B counter flush failed", exc_info=True)
+
+
 async def main() -> None:
     """Main application entry point."""
     global _audio_server, _redis, _store_client, _tts_engine
-    global _onec_client, _embedding_task, _pricing_task
+    global _onec_client, _embedding_task, _pricing_task, _stt_corrections_task
+    global _tenant_context_task, _tenant_contexts, _ab_counts_task
+    global _catalog_index, _catalog_index_task, _vehicle_index, _vehicle_index_task
+    global _schedule_cache, _schedule_prefetch_task
     global _db_engine, _llm_router, _asyncpg_pool
     global _knowledge_search, _search_embedding_gen
 
@@ -3604,6 +3634,11 @@ async def main() -> None:
         logger.warning("CallLogger init failed — calls will not be persisted", exc_info=True)
         _call_logger = None
 
+    # LLM usage rows are buffered and batch-written; batches spill to Redis while PG is down
+    from src.monitoring.llm_usage_logger import configure_usage_writer
+
+    usage_writer = configure_usage_writer(_redis)
+
     # Initialize LLM pricing cache from DB
     if _db_engine is not None:
         from src.monitoring.pricing_cache import refresh_from_db as _refresh_pricing
@@ -3656,6 +3691,22 @@ async def main() -> None:
                     await _search_embedding_gen.close()
                 _search_embedding_gen = None
 
+    # In-memory tire catalog index, rebuilt after each 1C sync (Redis pub/sub)
+    if _redis is not None and _db_engine is not None:
+        _catalog_index = CatalogIndexStore(_db_engine, _redis)
+        # Vehicle tire-size index, rebuilt after each vehicle DB import
+        _vehicle_index = VehicleIndexStore(_db_engine, _redis)
+
+    # Fitting station schedules: short-TTL cache, next business days prefetched
+    if _redis is not None and _onec_client is not None:
+        _schedule_cache = StationScheduleCache(
+            _onec_client,
+            _redis,
+            ttl=settings.onec.schedule_cache_ttl,
+            prefetch_days=settings.onec.schedule_prefetch_days,
+            prefetch_interval=settings.onec.schedule_prefetch_interval,
+        )
+
     # Initialize shared components (TTS is shared across calls, StoreClient too)
     _store_client = StoreClient(
         base_url=settings.store_api.url,
@@ -3664,6 +3715,8 @@ async def main() -> None:
         db_engine=_db_engine,
         redis=_redis,
         stock_cache_ttl=settings.onec.stock_cache_ttl,
+        catalog_index=_catalog_index,
+        vehicle_index=_vehicle_index,
     )
     await _store_client.open()
     logger.info("StoreClient initialized: %s", settings.store_api.url)
@@ -3699,8 +3752,10 @@ async def main() -> None:
             user=settings.ami.user,
             secret=settings.ami.secret,
         )
+        # Persistent session: logs in now, reconnects in the background
+        await _ami_client.start()
         logger.info(
-            "AMI client configured: %s:%d user=%s",
+            "AMI client started: %s:%d user=%s",
             settings.ami.host,
             settings.ami.port,
             settings.ami.user,
@@ -3714,20 +3769,24 @@ async def main() -> None:
     try:
         # Read effective config: Redis (admin UI overrides) merged over env defaults
         from src.api.tts_config import _get_effective_config
+        from src.tts.audio_cache import create_shared_cache
 
         tts_cfg, tts_cfg_source = await _get_effective_config(_redis)
+        tts_config = TTSConfig(
+            voice_name=tts_cfg.get("voice_name", settings.google_tts.voice),
+            speaking_rate=tts_cfg.get("speaking_rate", settings.google_tts.speaking_rate),
+            pitch=tts_cfg.get("pitch", settings.google_tts.pitch),
+            break_comma_ms=tts_cfg.get("break_comma_ms", 100),
+            break_period_ms=tts_cfg.get("break_period_ms", 200),
+            break_exclamation_ms=tts_cfg.get("break_exclamation_ms", 250),
+            break_colon_ms=tts_cfg.get("break_colon_ms", 200),
+            break_semicolon_ms=tts_cfg.get("break_semicolon_ms", 150),
+            break_em_dash_ms=tts_cfg.get("break_em_dash_ms", 150),
+        )
         _tts_engine = GoogleTTSEngine(
-            config=TTSConfig(
-                voice_name=tts_cfg.get("voice_name", settings.google_tts.voice),
-                speaking_rate=tts_cfg.get("speaking_rate", settings.google_tts.speaking_rate),
-                pitch=tts_cfg.get("pitch", settings.google_tts.pitch),
-                break_comma_ms=tts_cfg.get("break_comma_ms", 100),
-                break_period_ms=tts_cfg.get("break_period_ms", 200),
-                break_exclamation_ms=tts_cfg.get("break_exclamation_ms", 250),
-                break_colon_ms=tts_cfg.get("break_colon_ms", 200),
-                break_semicolon_ms=tts_cfg.get("break_semicolon_ms", 150),
-                break_em_dash_ms=tts_cfg.get("break_em_dash_ms", 150),
-            )
+            config=tts_config,
+            shared_cache=await create_shared_cache(tts_config),
+            memory_cache_max_bytes=settings.tts_cache.memory_max_mb * 1024 * 1024,
         )
         await _tts_engine.initialize()
         from src.tts import set_engine as set_tts_engine
@@ -3751,6 +3810,36 @@ async def main() -> None:
     _pricing_task = asyncio.create_task(_periodic_pricing_refresh(interval_minutes=5))
     logger.info("Periodic pricing cache refresh started (every 5 min)")
 
+    # Keep compiled STT correction rules current (Redis pub/sub invalidation)
+    if _redis is not None:
+        from src.stt.corrections import listen_for_invalidations
+
+        _stt_corrections_task = asyncio.create_task(listen_for_invalidations(_redis))
+
+    # Per-tenant call-setup snapshot, rebuilt on admin writes (Redis pub/sub)
+    if _redis is not None and _db_engine is not None:
+        _tenant_contexts = TenantContextStore(
+            _db_engine,
+            _redis,
+            scenarios=_VALID_IVR_INTENTS,
+            scenario_tools=_SCENARIO_TOOLS,
+            scenario_emphasis=_SCENARIO_EMPHASIS,
+        )
+        _tenant_context_task = asyncio.create_task(_tenant_contexts.run())
+
+    if _catalog_index is not None:
+        _catalog_index_task = asyncio.create_task(_catalog_index.run())
+
+    if _vehicle_index is not None:
+        _vehicle_index_task = asyncio.create_task(_vehicle_index.run())
+
+    if _schedule_cache is not None:
+        _schedule_prefetch_task = asyncio.create_task(_schedule_cache.run())
+
+    # A/B assignment counters are kept in memory and flushed in batches
+    if _db_engine is not None:
+        _ab_counts_task = asyncio.create_task(_periodic_ab_counts_flush(interval_seconds=10))
+
     logger.info(
         "Call Center AI started — AudioSocket:%d, API:%d",
         settings.audio_socket.port,
@@ -3777,15 +3866,53 @@ async def main() -> None:
             await _pricing_task
         logger.info("Periodic pricing refresh stopped")
 
+    if _stt_corrections_task is not None:
+        _stt_corrections_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _stt_corrections_task
+
+    if _tenant_context_task is not None:
+        _tenant_context_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _tenant_context_task
+
+    if _catalog_index_task is not None:
+        _catalog_index_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _catalog_index_task
+
+    if _vehicle_index_task is not None:
+        _vehicle_index_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _vehicle_index_task
+
+    if _schedule_prefetch_task is not None:
+        _schedule_prefetch_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _schedule_prefetch_task
+
+    if _ab_counts_task is not None:
+        _ab_counts_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _ab_counts_task
+        try:
+            from src.agent.ab_testing import ABTestManager
+
+            await ABTestManager(_db_engine).flush_counts()
+        except Exception:
+            logger.warning("Final A/B counter flush failed", exc_info=True)
+
     # Close resources with per-step error suppression to ensure all get cleaned up
     _shutdown_resources: list[tuple[str, Any, str]] = [
         ("LLM router", _llm_router, "close"),
         ("ARI client", _ari_client, "close"),
+        ("AMI client", _ami_client, "close"),
         ("StoreClient", _store_client, "close"),
         ("OneCClient", _onec_client, "close"),
         ("Search embedding generator", _search_embedding_gen, "close"),
         ("asyncpg pool", _asyncpg_pool, "close"),
         ("CallLogger", _call_logger, "close"),
+        ("LLM usage writer", usage_writer, "close"),
         ("Database engine", _db_engine, "dispose"),
         ("Redis", _redis, "aclose"),
     ]
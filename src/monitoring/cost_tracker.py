@@ -10,7 +10,7 @@ import logging
 from dataclasses import dataclass
 from typing import Any
 
-from src.monitoring.metrics import call_cost_usd
+from src.monitoring.metrics import call_cost_usd, llm_cached_input_ratio
 from src.monitoring.pricing_cache import get_pricing
 
 logger = logging.getLogger(__name__)
@@ -26,6 +26,19 @@ PRICING = {
     "google_tts_per_1k_chars": 0.004,
 }
 
+# Cached-input price as a fraction of the standard input rate. Anthropic
+# cache reads (explicit cache_control breakpoints) cost 10%; OpenAI/Gemini
+# automatic prefix caching is ~50%.
+_CACHED_INPUT_RATE_DEFAULT = 0.5
+_CACHED_INPUT_RATE_BY_PREFIX = {"anthropic": 0.1}
+
+
+def _cached_input_rate(provider_key: str) -> float:
+    for prefix, rate in _CACHED_INPUT_RATE_BY_PREFIX.items():
+        if provider_key.startswith(prefix):
+            return rate
+    return _CACHED_INPUT_RATE_DEFAULT
+
 
 @dataclass
 class CostBreakdown:
@@ -34,11 +47,14 @@ class CostBreakdown:
     stt_cost: float = 0.0
     llm_cost: float = 0.0
     tts_cost: float = 0.0
+    llm_speculation_cost: float = 0.0
     stt_provider: str = "google"
     llm_model: str = ""
     _llm_input_tokens: int = 0
     _llm_output_tokens: int = 0
     _llm_cached_input_tokens: int = 0
+    _llm_discarded_input_tokens: int = 0
+    _llm_discarded_output_tokens: int = 0
     _stt_seconds: float = 0.0
     _tts_characters: int = 0
     _tts_cached: int = 0
@@ -47,7 +63,14 @@ class CostBreakdown:
 
     @property
     def total_cost(self) -> float:
-        return self.stt_cost + self.llm_cost + self.tts_cost
+        return self.stt_cost + self.llm_cost + self.llm_speculation_cost + self.tts_cost
+
+    @property
+    def cached_input_ratio(self) -> float:
+        """Share of LLM input tokens served from the prompt cache (0..1)."""
+        if not self._llm_input_tokens:
+            return 0.0
+        return self._llm_cached_input_tokens / self._llm_input_tokens
 
     def add_stt_usage(self, duration_seconds: float, provider: str = "google") -> None:
         """Record STT usage."""
@@ -76,8 +99,9 @@ class CostBreakdown:
             provider_key: LLM router provider key (e.g. "gemini-2.5-flash").
                 If empty, falls back to default pricing.
             cached_input_tokens: Subset of ``input_tokens`` served from the
-                provider's automatic prompt cache. Billed at ~50% of standard
-                input rate (OpenAI/Anthropic default). Uncached portion =
+                provider's prompt cache. Billed at ~50% of standard input
+                rate (OpenAI/Gemini automatic caching) or 10% for Anthropic
+                cache reads. Uncached portion =
                 ``input_tokens - cached_input_tokens`` billed at full rate.
         """
         if provider_key:
@@ -89,12 +113,35 @@ class CostBreakdown:
         inp_per_1m, out_per_1m = get_pricing(provider_key)
         self._llm_input_price_per_1m = inp_per_1m
         self._llm_output_price_per_1m = out_per_1m
-        # Cached input billed at 50% of standard rate (OpenAI/Anthropic default
-        # for automatic caching). Uncached portion at full rate.
+        # Cached input billed at a provider-specific discount; uncached
+        # portion at full rate.
         uncached_input = max(0, input_tokens - cached_input_tokens)
         self.llm_cost += (
             uncached_input / 1_000_000 * inp_per_1m
-            + cached_input_tokens / 1_000_000 * inp_per_1m * 0.5
+            + cached_input_tokens / 1_000_000 * inp_per_1m * _cached_input_rate(provider_key)
+            + output_tokens / 1_000_000 * out_per_1m
+        )
+
+    def add_discarded_llm_usage(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        provider_key: str = "",
+        cached_input_tokens: int = 0,
+    ) -> None:
+        """Record tokens spent on a discarded speculative LLM turn.
+
+        Priced like ``add_llm_usage`` but accumulated in
+        ``llm_speculation_cost`` so the price of speculation stays visible
+        next to the useful LLM spend.
+        """
+        self._llm_discarded_input_tokens += input_tokens
+        self._llm_discarded_output_tokens += output_tokens
+        inp_per_1m, out_per_1m = get_pricing(provider_key or self.llm_model)
+        uncached_input = max(0, input_tokens - cached_input_tokens)
+        self.llm_speculation_cost += (
+            uncached_input / 1_000_000 * inp_per_1m
+            + cached_input_tokens / 1_000_000 * inp_per_1m * _cached_input_rate(provider_key)
             + output_tokens / 1_000_000 * out_per_1m
         )
 
@@ -112,12 +159,16 @@ class CostBreakdown:
             "stt_cost": round(self.stt_cost, 6),
             "llm_cost": round(self.llm_cost, 6),
             "tts_cost": round(self.tts_cost, 6),
+            "llm_speculation_cost": round(self.llm_speculation_cost, 6),
             "total_cost": round(self.total_cost, 6),
             "stt_provider": self.stt_provider,
             "llm_model": self.llm_model,
             "llm_input_tokens": self._llm_input_tokens,
             "llm_output_tokens": self._llm_output_tokens,
             "llm_cached_input_tokens": self._llm_cached_input_tokens,
+            "llm_cached_input_ratio": round(self.cached_input_ratio, 4),
+            "llm_discarded_input_tokens": self._llm_discarded_input_tokens,
+            "llm_discarded_output_tokens": self._llm_discarded_output_tokens,
             "llm_input_price_per_1m": self._llm_input_price_per_1m,
             "llm_output_price_per_1m": self._llm_output_price_per_1m,
             "stt_seconds": round(self._stt_seconds, 1),
@@ -126,5 +177,9 @@ class CostBreakdown:
         }
 
     def record_metrics(self) -> None:
-        """Record cost to Prometheus histogram."""
+        """Record cost (and prompt-cache hit share) to Prometheus histograms."""
         call_cost_usd.observe(self.total_cost)
+        if self._llm_input_tokens:
+            llm_cached_input_ratio.labels(provider=self.llm_model or "unknown").observe(
+                self.cached_input_ratio
+            )
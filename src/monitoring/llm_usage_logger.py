@@ -1,83 +1,371 @@
-"""Fire-and-forget LLM usage logger.
+"""Buffered LLM usage logger.
 
 Writes every LLM call (all task types) to ``llm_usage_log`` for cost analysis.
-Uses lazy engine creation (same pattern as analytics.py) and
-``asyncio.create_task`` so callers never block on the INSERT.
+``log_llm_usage`` only appends a row to a bounded in-process buffer, so
+callers never block on the database. A background writer flushes the buffer
+as one multi-row INSERT when ``batch_max_rows`` rows are queued or
+``batch_max_delay`` seconds after the first one, and the buffer is drained
+on shutdown (``close_usage_writer``). When PostgreSQL is unavailable a
+batch spills to a Redis list, replayed after the next successful flush;
+replayed rows queue their days for ``src.tasks.llm_usage_rollup``. A batch
+PostgreSQL rejects (a value that does not cast, a violated constraint) is
+bisected so only the offending rows are dropped.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import logging
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from src.config import get_settings
+from src.monitoring.metrics import (
+    llm_usage_batch_rows,
+    llm_usage_buffer_rows,
+    llm_usage_rows_total,
+)
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
 
 logger = logging.getLogger(__name__)
 
-_engine: AsyncEngine | None = None
+_BATCH_MAX_ROWS = 200
+_BATCH_MAX_DELAY_SEC = 2.0
+_BUFFER_MAX_ROWS = 10_000
 
+_REDIS_BUFFER_KEY = "llm_usage_buffer"
+_REDIS_BUFFER_TTL = 24 * 3600
+_REDIS_BUFFER_MAX_ROWS = 200_000
+_REPLAY_CHUNK_SIZE = 1000
 
-def _get_engine() -> AsyncEngine:
-    """Lazily create and cache the async database engine."""
-    global _engine
-    if _engine is None:
-        settings = get_settings()
-        _engine = create_async_engine(settings.database.url, pool_pre_ping=True)
-    return _engine
+# One statement per batch: each column is bound as an array and unnested
+_INSERT_BATCH = """
+    INSERT INTO llm_usage_log
+        (task_type, provider_key, model_name,
+         input_tokens, output_tokens, cached_input_tokens,
+         latency_ms, call_id, tenant_id, created_at)
+    SELECT * FROM unnest(
+        CAST(:task_type AS varchar[]), CAST(:provider_key AS varchar[]),
+        CAST(:model_name AS varchar[]), CAST(:input_tokens AS integer[]),
+        CAST(:output_tokens AS integer[]), CAST(:cached_input_tokens AS integer[]),
+        CAST(:latency_ms AS integer[]), CAST(:call_id AS uuid[]),
+        CAST(:tenant_id AS uuid[]), CAST(:created_at AS timestamptz[])
+    )
+"""
 
+# Replayed rows may belong to days the daily rollup has already aggregated
+_INSERT_REPLAYED = f"""
+    WITH inserted AS (
+        {_INSERT_BATCH}
+        RETURNING created_at
+    )
+    INSERT INTO llm_usage_dirty_days (day)
+    SELECT DISTINCT created_at::date FROM inserted
+    ON CONFLICT DO NOTHING
+"""
+_COLUMNS = (
+    "task_type",
+    "provider_key",
+    "model_name",
+    "input_tokens",
+    "output_tokens",
+    "cached_input_tokens",
+    "latency_ms",
+    "call_id",
+    "tenant_id",
+    "created_at",
+)
 
-async def _insert_usage(
-    task_type: str,
-    provider_key: str,
-    model_name: str,
-    input_tokens: int,
-    output_tokens: int,
-    cached_input_tokens: int,
-    latency_ms: int | None,
-    call_id: str | None,
-    tenant_id: str | None,
-) -> None:
-    """Perform the actual INSERT into llm_usage_log."""
-    try:
-        engine = _get_engine()
-        async with engine.begin() as conn:
+
+def _batch_params(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    return {col: [row[col] for row in rows] for col in _COLUMNS}
+
+
+class LlmUsageWriter:
+    """Bounded in-process buffer for ``llm_usage_log`` rows with batched writes.
+
+    The buffer, writer task and engine belong to the event loop of the first
+    ``add``; a row added on another loop (e.g. a Celery task run outside the
+    worker runtime) rebinds them to that loop.
+
+    Args:
+        redis: Spill target for batches while PostgreSQL is down.
+        batch_max_rows: Buffered rows that trigger an immediate flush.
+        batch_max_delay: Longest a buffered row waits for its flush (seconds).
+        buffer_max_rows: Buffer capacity; rows beyond it are dropped.
+    """
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        *,
+        batch_max_rows: int = _BATCH_MAX_ROWS,
+        batch_max_delay: float = _BATCH_MAX_DELAY_SEC,
+        buffer_max_rows: int = _BUFFER_MAX_ROWS,
+    ) -> None:
+        self._redis = redis
+        self._batch_max_rows = batch_max_rows
+        self._batch_max_delay = batch_max_delay
+        self._buffer_max_rows = buffer_max_rows
+        self._pending: list[dict[str, Any]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._engine: AsyncEngine | None = None
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._writer_task: asyncio.Task[None] | None = None
+        # Replay whatever an earlier process left in Redis after the first good flush
+        self._needs_replay = redis is not None
+
+    def add(self, row: dict[str, Any]) -> None:
+        """Buffer a row for the next batch write.
+
+        Raises:
+            RuntimeError: If there is no running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._bind(loop)
+        if len(self._pending) >= self._buffer_max_rows:
+            llm_usage_rows_total.labels(outcome="dropped").inc()
+            return
+        self._pending.append(row)
+        llm_usage_buffer_rows.set(len(self._pending))
+        if len(self._pending) >= self._batch_max_rows:
+            self._batch_full.set()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = loop.create_task(self._run_writer())
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start over on a new event loop; buffered rows are kept.
+
+        The previous loop's engine cannot be disposed from here; its
+        connections went away with that loop.
+        """
+        self._loop = loop
+        self._engine = None
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._writer_task = None
+
+    def _get_engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(
+                get_settings().database.url, pool_size=2, max_overflow=0, pool_pre_ping=True
+            )
+        return self._engine
+
+    async def _run_writer(self) -> None:
+        """Flush on a full batch or ``batch_max_delay``; exit once the buffer is empty.
+
+        When cancelled (the loop shutting down) it drains the buffer and
+        disposes the engine first.
+        """
+        try:
+            while self._pending:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._batch_full.wait(), self._batch_max_delay)
+                await self.flush()
+        except asyncio.CancelledError:
+            await self.flush()
+            await self._dispose_engine()
+            raise
+
+    async def flush(self) -> int:
+        """Write all buffered rows now. Returns the number written to PostgreSQL.
+
+        Rows PostgreSQL rejects are dropped (counted as lost); while the
+        database is unavailable the unwritten rows go to the Redis buffer.
+        """
+        async with self._flush_lock:
+            rows, self._pending = self._pending, []
+            self._batch_full.clear()
+            llm_usage_buffer_rows.set(0)
+            if not rows:
+                return 0
+            parts = [rows]
+            try:
+                rejected = await self._insert_parts(parts)
+            except asyncio.CancelledError:
+                self._pending[:0] = [row for part in parts for row in part]
+                raise
+            unwritten = [row for part in parts for row in part]
+            written = len(rows) - rejected - len(unwritten)
+            llm_usage_rows_total.labels(outcome="written").inc(written)
+            llm_usage_rows_total.labels(outcome="lost").inc(rejected)
+            if unwritten:
+                logger.warning("Buffering %d LLM usage rows to Redis", len(unwritten))
+                outcome = "redis_buffered" if await self._spill_to_redis(unwritten) else "lost"
+                llm_usage_rows_total.labels(outcome=outcome).inc(len(unwritten))
+                self._needs_replay = self._redis is not None
+                return written
+
+        if self._needs_replay:
+            self._needs_replay = False
+            await self.replay_redis_buffer()
+        return written
+
+    async def _insert_parts(
+        self, parts: list[list[dict[str, Any]]], *, replayed: bool = False
+    ) -> int:
+        """Insert *parts* (batches of rows), bisecting any PostgreSQL rejects.
+
+        A failed insert is told apart from an outage by a ``SELECT 1``: if
+        the database answers, the batch is split in halves and retried, and
+        a single row that still fails is dropped. Written parts are removed
+        from *parts*; what is left there (on an outage or a cancellation)
+        was not written. Returns the number of rows dropped.
+        """
+        rejected = 0
+        while parts:
+            part = parts[-1]
+            try:
+                await self._insert(part, replayed=replayed)
+            except Exception:
+                if not await self._database_reachable():
+                    logger.warning(
+                        "PostgreSQL unavailable for %d LLM usage rows", len(part), exc_info=True
+                    )
+                    break
+                parts.pop()
+                if len(part) > 1:
+                    mid = len(part) // 2
+                    parts += [part[mid:], part[:mid]]
+                else:
+                    rejected += 1
+                    logger.warning(
+                        "PostgreSQL rejected an LLM usage row, dropping it: %r",
+                        part[0],
+                        exc_info=True,
+                    )
+                continue
+            parts.pop()
+        return rejected
+
+    async def _database_reachable(self) -> bool:
+        try:
+            async with self._get_engine().connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except Exception:
+            return False
+        return True
+
+    async def _insert(self, rows: list[dict[str, Any]], *, replayed: bool = False) -> None:
+        start = time.monotonic()
+        async with self._get_engine().begin() as conn:
             await conn.execute(
-                text("""
-                    INSERT INTO llm_usage_log
-                        (task_type, provider_key, model_name,
-                         input_tokens, output_tokens, cached_input_tokens,
-                         latency_ms, call_id, tenant_id)
-                    VALUES
-                        (:task_type, :provider_key, :model_name,
-                         :input_tokens, :output_tokens, :cached_input_tokens,
-                         :latency_ms, :call_id, :tenant_id)
-                """),
-                {
-                    "task_type": task_type,
-                    "provider_key": provider_key,
-                    "model_name": model_name,
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "cached_input_tokens": cached_input_tokens,
-                    "latency_ms": latency_ms,
-                    "call_id": call_id,
-                    "tenant_id": tenant_id,
-                },
+                text(_INSERT_REPLAYED if replayed else _INSERT_BATCH), _batch_params(rows)
             )
-    except Exception:
-        logger.warning(
-            "Failed to log LLM usage: task=%s provider=%s tokens=%d/%d cached=%d",
-            task_type,
-            provider_key,
-            input_tokens,
-            output_tokens,
-            cached_input_tokens,
-            exc_info=True,
+        llm_usage_batch_rows.observe(len(rows))
+        logger.debug(
+            "Wrote %d LLM usage rows in %.1f ms", len(rows), (time.monotonic() - start) * 1000
         )
 
+    async def _spill_to_redis(self, rows: list[dict[str, Any]]) -> bool:
+        """Append rows to the Redis buffer (capped). Returns False if they were lost."""
+        if self._redis is None:
+            return False
+        payloads = [json.dumps(row, default=str) for row in rows]
+        try:
+            await self._redis.rpush(_REDIS_BUFFER_KEY, *payloads)  # type: ignore[misc]
+            await self._redis.ltrim(_REDIS_BUFFER_KEY, -_REDIS_BUFFER_MAX_ROWS, -1)  # type: ignore[misc]
+            await self._redis.expire(_REDIS_BUFFER_KEY, _REDIS_BUFFER_TTL)
+        except Exception:
+            logger.error("Redis buffer also unavailable — %d LLM usage rows lost", len(rows))
+            return False
+        return True
+
+    async def replay_redis_buffer(self, *, chunk_size: int = _REPLAY_CHUNK_SIZE) -> int:
+        """Move rows spilled to Redis into ``llm_usage_log``, one batch per chunk.
+
+        ``LPOP`` hands each chunk to exactly one process. Rows PostgreSQL
+        rejects are dropped; if the database becomes unavailable the
+        unwritten rows are pushed back and the replay stops until the next
+        successful flush. Returns the number of rows replayed.
+        """
+        if self._redis is None:
+            return 0
+        count = 0
+        try:
+            while True:
+                raw_rows = await self._redis.lpop(_REDIS_BUFFER_KEY, chunk_size)  # type: ignore[misc]
+                if not raw_rows:
+                    break
+                rows = [json.loads(raw) for raw in raw_rows]
+                for row in rows:
+                    row["created_at"] = datetime.fromisoformat(row["created_at"])
+                parts = [rows]
+                try:
+                    rejected = await self._insert_parts(parts, replayed=True)
+                finally:
+                    unwritten = [json.dumps(row, default=str) for part in parts for row in part]
+                    if unwritten:
+                        await self._redis.rpush(_REDIS_BUFFER_KEY, *unwritten)  # type: ignore[misc]
+                llm_usage_rows_total.labels(outcome="lost").inc(rejected)
+                count += len(rows) - rejected - len(unwritten)
+                if unwritten:
+                    self._needs_replay = True
+                    break
+        except Exception:
+            self._needs_replay = True
+            logger.warning(
+                "LLM usage Redis buffer replay stopped after %d rows", count, exc_info=True
+            )
+        if count:
+            llm_usage_rows_total.labels(outcome="replayed").inc(count)
+            logger.info("Replayed %d buffered LLM usage rows to PostgreSQL", count)
+        return count
+
+    async def _dispose_engine(self) -> None:
+        if self._engine is not None:
+            engine, self._engine = self._engine, None
+            await engine.dispose()
+
+    async def close(self) -> None:
+        """Drain the buffer, wait for the writer and close the database engine."""
+        task, self._writer_task = self._writer_task, None
+        if task is not None and not task.done():
+            self._batch_full.set()  # flush now instead of after batch_max_delay
+            await task
+        await self.flush()
+        await self._dispose_engine()
+
+
+_writer: LlmUsageWriter | None = None
+
+
+def get_usage_writer() -> LlmUsageWriter:
+    """Process-wide usage writer (created without a Redis spill target)."""
+    global _writer
+    if _writer is None:
+        _writer = LlmUsageWriter()
+    return _writer
+
+
+def configure_usage_writer(redis: Redis | None) -> LlmUsageWriter:
+    """Replace the process-wide writer, e.g. to give it a Redis spill target.
+
+    Call at startup, before the first ``log_llm_usage``.
+    """
+    global _writer
+    _writer = LlmUsageWriter(redis)
+    return _writer
+
+
+async def close_usage_writer() -> None:
+    """Drain and close the process-wide writer (shutdown hook)."""
+    global _writer
+    writer, _writer = _writer, None
+    if writer is not None:
+        await writer.close()
+
 
 def log_llm_usage(
     task_type: str,
@@ -90,23 +378,24 @@ def log_llm_usage(
     call_id: str | None = None,
     tenant_id: str | None = None,
 ) -> None:
-    """Schedule a fire-and-forget INSERT into llm_usage_log.
+    """Buffer a row for ``llm_usage_log``; it is written with the next batch.
 
     Safe to call from any async context — errors are logged, never raised.
     """
     try:
-        asyncio.get_running_loop().create_task(
-            _insert_usage(
-                task_type=task_type,
-                provider_key=provider_key,
-                model_name=model_name,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cached_input_tokens=cached_input_tokens,
-                latency_ms=latency_ms,
-                call_id=call_id,
-                tenant_id=tenant_id,
-            )
+        get_usage_writer().add(
+            {
+                "task_type": task_type,
+                "provider_key": provider_key,
+                "model_name": model_name,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cached_input_tokens": cached_input_tokens,
+                "latency_ms": latency_ms,
+                "call_id": call_id,
+                "tenant_id": tenant_id,
+                "created_at": datetime.now(UTC),
+            }
         )
     except RuntimeError:
         # No running event loop (e.g. sync context) — skip silently
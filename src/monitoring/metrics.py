@@ -65,14 +65,65 @@ tts_delivery_ms = Histogram(
     buckets=[5, 10, 20, 30, 50, 75, 100, 200],
 )
 
+call_setup_latency_ms = Histogram(
+    "callcenter_call_setup_latency_ms",
+    "Latency from AudioSocket UUID packet to the first greeting audio frame in milliseconds",
+    buckets=[100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000],
+)
+
 # --- Streaming pipeline metrics ---
 
 time_to_first_audio_ms = Histogram(
     "callcenter_time_to_first_audio_ms",
-    "Time from turn start to first audio chunk sent (streaming pipeline)",
+    "Time from turn start to first audio sent (streaming pipeline); "
+    "stage=first_chunk: first audio chunk, stage=full_sentence: first complete sentence",
+    ["stage"],
     buckets=[100, 200, 300, 500, 700, 1000, 1500, 2000, 3000, 5000],
 )
 
+speculative_turns_total = Counter(
+    "callcenter_speculative_turns_total",
+    "Speculative LLM turns started on a stable interim transcript, by outcome "
+    "(hit = adopted by the final transcript)",
+    ["outcome"],
+)
+
+speculative_saved_ms = Histogram(
+    "callcenter_speculative_saved_ms",
+    "LLM time already spent by an adopted speculative turn when the final transcript arrived",
+    buckets=[50, 100, 200, 300, 500, 700, 1000, 1500, 2000, 3000],
+)
+
+speculative_discarded_tokens_total = Counter(
+    "callcenter_speculative_discarded_tokens_total",
+    "LLM tokens spent on discarded speculative turns",
+    ["type"],
+)
+
+# --- Audio clock (shared 20 ms playback scheduler) metrics ---
+
+audio_clock_tick_jitter_ms = Histogram(
+    "callcenter_audio_clock_tick_jitter_ms",
+    "How late the shared audio clock woke up relative to its 20 ms schedule",
+    buckets=[0.5, 1, 2, 5, 10, 20, 40, 100],
+)
+
+audio_clock_tick_duration_ms = Histogram(
+    "callcenter_audio_clock_tick_duration_ms",
+    "Time spent emitting frames for all connections in one audio clock tick",
+    buckets=[0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20],
+)
+
+audio_clock_late_frames_total = Counter(
+    "callcenter_audio_clock_late_frames_total",
+    "Audio frames emitted after their 20 ms slot had already passed",
+)
+
+audio_clock_streams = Gauge(
+    "callcenter_audio_clock_streams",
+    "Connections currently served by the shared audio clock",
+)
+
 # --- Tool call metrics ---
 
 tool_call_duration_ms = Histogram(
@@ -132,6 +183,13 @@ call_cost_usd = Histogram(
     buckets=[0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0],
 )
 
+llm_cached_input_ratio = Histogram(
+    "callcenter_llm_cached_input_ratio",
+    "Share of a call's LLM input tokens served from the provider prompt cache",
+    ["provider"],
+    buckets=[0.1, 0.25, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0],
+)
+
 # --- Scenario metrics ---
 
 call_scenario_total = Counter(
@@ -159,6 +217,30 @@ tts_cache_misses_total = Counter(
     "TTS cache miss count",
 )
 
+tts_cache_tier_hits_total = Counter(
+    "callcenter_tts_cache_tier_hits_total",
+    "TTS cache hits per tier (memory = in-process LRU, shared = Redis)",
+    ["tier"],
+)
+
+tts_cache_tier_misses_total = Counter(
+    "callcenter_tts_cache_tier_misses_total",
+    "TTS cache misses per tier (memory = in-process LRU, shared = Redis)",
+    ["tier"],
+)
+
+tts_cache_tier_bytes = Gauge(
+    "callcenter_tts_cache_tier_bytes",
+    "Audio bytes held per TTS cache tier",
+    ["tier"],
+)
+
+tts_cache_tier_evictions_total = Counter(
+    "callcenter_tts_cache_tier_evictions_total",
+    "TTS cache clips evicted per tier (reason: size, voice_change)",
+    ["tier", "reason"],
+)
+
 # --- Celery workers metrics ---
 
 celery_workers_online = Gauge(
@@ -219,6 +301,34 @@ partition_errors_total = Counter(
     "Total partition management failures",
 )
 
+data_retention_partitions_dropped_total = Counter(
+    "callcenter_data_retention_partitions_dropped_total",
+    "Expired partitions detached and dropped by data retention",
+    ["table"],
+)
+
+data_retention_rows_deleted_total = Counter(
+    "callcenter_data_retention_rows_deleted_total",
+    "Rows deleted by batched data retention deletes (straddling partitions)",
+    ["table"],
+)
+
+data_retention_calls_anonymized_total = Counter(
+    "callcenter_data_retention_calls_anonymized_total",
+    "Calls whose caller_id was anonymized by data retention",
+)
+
+data_retention_duration_seconds = Histogram(
+    "callcenter_data_retention_duration_seconds",
+    "Data retention run duration in seconds",
+    buckets=[1, 5, 30, 60, 300, 600, 1200, 1800],
+)
+
+data_retention_last_success_timestamp = Gauge(
+    "callcenter_data_retention_last_success_timestamp",
+    "Unix timestamp of last successful data retention run",
+)
+
 
 # --- Admin WebSocket metrics ---
 
@@ -315,6 +425,17 @@ tenant_resolution_fallback_total = Counter(
     "Times tenant resolution fell back to first active tenant",
 )
 
+tenant_context_version = Gauge(
+    "callcenter_tenant_context_version",
+    "Version of this process's tenant call-setup context snapshot",
+)
+
+tenant_context_rebuild_ms = Histogram(
+    "callcenter_tenant_context_rebuild_ms",
+    "Time to rebuild the tenant call-setup context snapshot in milliseconds",
+    buckets=[10, 25, 50, 100, 250, 500, 1000, 2500],
+)
+
 # --- Barge-in metrics ---
 
 barge_in_total = Counter(
@@ -410,6 +531,170 @@ bot_filler_stripped_total = Counter(
     ["pattern"],  # e.g. "opener:зараз перевірю", "double_confirm"
 )
 
+# --- Call logger (write-behind) metrics ---
+
+call_logger_queue_rows = Gauge(
+    "callcenter_call_logger_queue_rows",
+    "Turn / tool-call rows waiting in the CallLogger write-behind queue",
+)
+
+call_logger_batch_rows = Histogram(
+    "callcenter_call_logger_batch_rows",
+    "Rows written per CallLogger batch flush",
+    buckets=[1, 5, 10, 25, 50, 100, 250, 500, 1000],
+)
+
+call_logger_flush_ms = Histogram(
+    "callcenter_call_logger_flush_ms",
+    "CallLogger batch flush latency in milliseconds",
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500],
+)
+
+call_logger_rows_total = Counter(
+    "callcenter_call_logger_rows_total",
+    "Rows flushed by the CallLogger write-behind queue",
+    ["outcome"],  # written, redis_buffered, lost
+)
+
+call_logger_replay_entries_total = Counter(
+    "callcenter_call_logger_replay_entries_total",
+    "Redis log-buffer entries processed by flush_redis_buffer",
+    ["outcome"],  # replayed, duplicate_chunk, dropped
+)
+
+call_logger_redis_buffer_entries = Gauge(
+    "callcenter_call_logger_redis_buffer_entries",
+    "Entries left in the Redis log buffer (updated during replay)",
+)
+
+
+# --- LLM usage log (buffered writer) metrics ---
+
+llm_usage_buffer_rows = Gauge(
+    "callcenter_llm_usage_buffer_rows",
+    "llm_usage_log rows waiting in the in-process usage buffer",
+)
+
+llm_usage_batch_rows = Histogram(
+    "callcenter_llm_usage_batch_rows",
+    "Rows written per llm_usage_log batch insert",
+    buckets=[1, 5, 10, 25, 50, 100, 250, 500, 1000],
+)
+
+llm_usage_rows_total = Counter(
+    "callcenter_llm_usage_rows_total",
+    "llm_usage_log rows handled by the buffered usage writer",
+    ["outcome"],  # written, redis_buffered, replayed, dropped, lost
+)
+
+
+# --- Asterisk ARI / AMI client metrics ---
+
+asterisk_connections_total = Counter(
+    "callcenter_asterisk_connections_total",
+    "Connections used by the ARI/AMI clients",
+    ["client", "outcome"],  # ari: new, reused; ami: connected, failed, lost
+)
+
+asterisk_action_latency_ms = Histogram(
+    "callcenter_asterisk_action_latency_ms",
+    "ARI request / AMI action round-trip latency in milliseconds",
+    ["client", "action"],
+    buckets=[2, 5, 10, 25, 50, 100, 250, 500, 1000, 3000],
+)
+
+ami_connected = Gauge(
+    "callcenter_ami_connected",
+    "1 while the persistent AMI session is logged in",
+)
+
+
+# --- 1C catalog sync metrics ---
+
+catalog_stock_sync_rows_total = Counter(
+    "callcenter_catalog_stock_sync_rows_total",
+    "Stock rows per 1C stock sync by outcome",
+    ["network", "outcome"],  # fetched, changed, removed
+)
+
+catalog_stock_sync_duration_seconds = Histogram(
+    "callcenter_catalog_stock_sync_duration_seconds",
+    "1C stock sync duration per network in seconds (fetch + writes)",
+    ["network"],
+    buckets=[1, 2, 5, 10, 20, 30, 60, 120],
+)
+
+# --- Tire catalog index metrics ---
+
+catalog_index_skus = Gauge(
+    "callcenter_catalog_index_skus",
+    "SKUs in this process's in-memory tire catalog index",
+)
+
+catalog_index_rebuild_ms = Histogram(
+    "callcenter_catalog_index_rebuild_ms",
+    "Time to load and build the in-memory tire catalog index in milliseconds",
+    buckets=[100, 250, 500, 1000, 2500, 5000, 10000],
+)
+
+catalog_index_lookups_total = Counter(
+    "callcenter_catalog_index_lookups_total",
+    "Tire search / availability lookups by where they were answered",
+    ["operation", "source"],  # operation: search, availability; source: index, redis, db
+)
+
+# --- Vehicle tire-size index metrics ---
+
+vehicle_index_models = Gauge(
+    "callcenter_vehicle_index_models",
+    "Vehicle models in this process's in-memory tire-size index",
+)
+
+vehicle_index_rebuild_ms = Histogram(
+    "callcenter_vehicle_index_rebuild_ms",
+    "Time to load and build the in-memory vehicle tire-size index in milliseconds",
+    buckets=[100, 250, 500, 1000, 2500, 5000, 10000, 30000],
+)
+
+vehicle_index_lookups_total = Counter(
+    "callcenter_vehicle_index_lookups_total",
+    "get_vehicle_tire_sizes lookups by outcome",
+    ["outcome"],  # found, brand_miss, model_miss, no_sizes, db (no index yet)
+)
+
+vehicle_index_matches_total = Counter(
+    "callcenter_vehicle_index_matches_total",
+    "Vehicle brand / model name matches by how the name was matched",
+    ["level", "kind"],  # level: brand, model; kind: exact, phonetic, fuzzy
+)
+
+vehicle_index_match_similarity = Histogram(
+    "callcenter_vehicle_index_match_similarity",
+    "Trigram similarity of fuzzy vehicle brand / model matches",
+    ["level"],
+    buckets=[0.35, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
+)
+
+# --- Fitting schedule cache metrics ---
+
+fitting_schedule_cache_requests_total = Counter(
+    "callcenter_fitting_schedule_cache_requests_total",
+    "get_fitting_slots schedule reads by cache result",
+    ["result"],  # hit, miss
+)
+
+fitting_schedule_cache_age_seconds = Histogram(
+    "callcenter_fitting_schedule_cache_age_seconds",
+    "Age of the cached 1C station schedule served to a call",
+    buckets=[5, 15, 30, 60, 90, 120, 180, 300],
+)
+
+fitting_schedule_prefetch_total = Counter(
+    "callcenter_fitting_schedule_prefetch_total",
+    "Station-days fetched by the background schedule prefetch",
+    ["result"],  # ok, error
+)
+
 
 def get_metrics() -> bytes:
     """Generate Prometheus metrics output."""
@@ -9,11 +9,16 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 from aiobreaker import CircuitBreaker, CircuitBreakerError
 
+from src.onec_client.stream import iter_batches, iter_json_array
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 logger = logging.getLogger(__name__)
 
 # Retry config
@@ -21,6 +26,10 @@ _MAX_RETRIES = 2
 _RETRY_DELAYS = [1.0, 2.0]
 _RETRYABLE_STATUSES = {429, 503}
 
+# Streamed payloads (full catalog, stock) are read in chunks of this size
+_STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_BATCH_SIZE = 1000
+
 # Separate circuit breaker for 1C API
 _onec_breaker = CircuitBreaker(fail_max=5, timeout_duration=30)
 
@@ -98,6 +107,20 @@ class OneCClient:
             params["limit"] = limit
         return await self._get("/Trade/hs/site/get_wares/", params=params)
 
+    async def iter_wares_full(
+        self, batch_size: int = _STREAM_BATCH_SIZE
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream the full catalog in batches of at most ``batch_size`` wares.
+
+        Same endpoint as ``get_wares_full``, but the body is parsed while it
+        downloads, so the caller can write each batch before the next one
+        arrives.
+        """
+        async for batch in self._stream(
+            "/Trade/hs/site/get_wares/", {"UploadingAll": ""}, batch_size
+        ):
+            yield batch
+
     async def get_wares_by_sku(self, sku: str) -> dict[str, Any]:
         """Get a specific ware by SKU.
 
@@ -117,6 +140,15 @@ class OneCClient:
             params={"TradingNetwork": network},
         )
 
+    async def iter_stock(
+        self, network: str, batch_size: int = _STREAM_BATCH_SIZE
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream stock and prices for a trading network in batches (see ``get_stock``)."""
+        async for batch in self._stream(
+            "/Trade/hs/site/get_stock/", {"TradingNetwork": network}, batch_size
+        ):
+            yield batch
+
     # --- Pickup points ---
 
     async def get_pickup_points(self, network: str) -> dict[str, Any]:
@@ -463,6 +495,50 @@ class OneCClient:
             logger.error("Circuit breaker OPEN for 1C API")
             raise OneCAPIError(503, "1С сервіс тимчасово недоступний") from err
 
+    async def _stream(
+        self, path: str, params: dict[str, Any], batch_size: int
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """GET a large ``{"data": [...]}`` payload and yield its records in batches.
+
+        Opening the response goes through the circuit breaker; 429/503 are
+        not retried here (the sync task retries the whole run).
+        """
+        if self._session is None:
+            raise RuntimeError("OneCClient not opened — call open() first")
+
+        url = f"{self._base_url}{path}"
+        try:
+            resp: aiohttp.ClientResponse = await _onec_breaker.call_async(
+                self._open_stream, url, params
+            )
+        except CircuitBreakerError as err:
+            logger.error("Circuit breaker OPEN for 1C API")
+            raise OneCAPIError(503, "1С сервіс тимчасово недоступний") from err
+
+        try:
+            if resp.status == 204:
+                return
+            records = iter_json_array(resp.content.iter_chunked(_STREAM_CHUNK_SIZE))
+            async for batch in iter_batches(records, batch_size):
+                yield batch
+        finally:
+            resp.release()
+
+    async def _open_stream(self, url: str, params: dict[str, Any]) -> aiohttp.ClientResponse:
+        """Send the request and return the response with its body unread."""
+        assert self._session is not None
+
+        resp = await self._session.get(url, params=params)
+        if resp.status == 401:
+            logger.critical("1C API authentication failed — check credentials")
+        if resp.status >= 400:
+            try:
+                body_text = _decode_body(await resp.read())
+            finally:
+                resp.release()
+            raise OneCAPIError(resp.status, body_text[:200])
+        return resp
+
     async def _request_with_retry(
         self,
         method: str,
@@ -514,12 +590,7 @@ class OneCClient:
             if resp.status == 401:
                 logger.critical("1C API authentication failed — check credentials")
 
-            # 1C may return body in Windows-1251 instead of UTF-8
-            raw = await resp.read()
-            try:
-                body_text = raw.decode("utf-8")
-            except UnicodeDecodeError:
-                body_text = raw.decode("windows-1251")
+            body_text = _decode_body(await resp.read())
 
             if resp.status >= 400:
                 raise OneCAPIError(resp.status, body_text[:200])
@@ -531,6 +602,14 @@ class OneCClient:
             return data
 
 
+def _decode_body(raw: bytes) -> str:
+    """Decode a 1C response body: 1C may send Windows-1251 instead of UTF-8."""
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw.decode("windows-1251")
+
+
 # --- Helpers for TireService REST API ---
 
 
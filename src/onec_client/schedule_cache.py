@@ -0,0 +1,285 @@
+"""Short-TTL cache of fitting-station schedules from 1C.
+
+``get_fitting_slots`` used to call ``StationSchedule`` on every tool call,
+and a day without free slots cost another 1C round-trip (and LLM tool
+round) for the suggested next day. Raw 1C slots are now cached per
+(station, date) in Redis — ``onec:schedule:{station_id}:{date}`` with the
+fetch time — so every call processor shares them:
+
+* ``get`` serves a cached day or fetches it live (read-through);
+* ``cached_days`` reads several days in one round-trip, used to offer the
+  next day with free slots in the same response;
+* ``invalidate`` drops a day after a booking, reservation or cancellation
+  (cancellations find the day via ``remember_booking``);
+* ``run`` keeps the next ``prefetch_days`` business days of every station
+  warm. One process per interval does the work (``SET NX`` lock). Rounds
+  start ``prefetch_interval`` apart; a round that runs longer keeps the lock
+  until it ends and the next one starts right after, so with a cache TTL of
+  at least twice the interval prefetched days stay cached between rounds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import re
+import time
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from src.monitoring.metrics import (
+    fitting_schedule_cache_age_seconds,
+    fitting_schedule_cache_requests_total,
+    fitting_schedule_prefetch_total,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from redis.asyncio import Redis
+
+    from src.onec_client.client import OneCClient
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_KEY = "onec:schedule:{station_id}:{date}"
+BOOKING_KEY = "onec:schedule:booking:{guid}"
+_PREFETCH_LOCK_KEY = "onec:schedule:prefetch_lock"
+_STATIONS_KEY = "onec:fitting_stations"
+
+_BOOKING_TTL = 22 * 86400  # booking window is 21 days
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+def next_business_days(after: date, count: int) -> list[date]:
+    """The first *count* Mon-Fri days strictly after *after*."""
+    days: list[date] = []
+    day = after
+    while len(days) < count:
+        day += timedelta(days=1)
+        if day.weekday() < 5:
+            days.append(day)
+    return days
+
+
+class StationScheduleCache:
+    """Redis-backed (station, date) → raw 1C schedule slots.
+
+    Args:
+        onec: 1C client used for live fetches.
+        redis: Redis client shared by the call processors.
+        ttl: Seconds a fetched day is served from cache; at least twice
+            ``prefetch_interval`` so prefetched days last until the next round.
+        prefetch_days: Business days ahead (from tomorrow) kept warm; 0 disables.
+        prefetch_interval: Seconds between the starts of prefetch rounds.
+        concurrency: Parallel 1C requests during a prefetch round.
+    """
+
+    def __init__(
+        self,
+        onec: OneCClient,
+        redis: Redis,
+        *,
+        ttl: int = 180,
+        prefetch_days: int = 3,
+        prefetch_interval: int = 90,
+        concurrency: int = 4,
+    ) -> None:
+        self._onec = onec
+        self._redis = redis
+        self._ttl = ttl
+        self._prefetch_days = prefetch_days
+        self._prefetch_interval = prefetch_interval
+        self._concurrency = concurrency
+
+    async def get(self, station_id: str, day: str) -> list[dict[str, Any]]:
+        """Slots of *station_id* on *day* (YYYY-MM-DD), from cache or 1C.
+
+        Raises whatever the 1C client raises on a live fetch.
+        """
+        cached = (await self._read(station_id, [day])).get(day)
+        if cached is not None:
+            slots, age = cached
+            fitting_schedule_cache_requests_total.labels(result="hit").inc()
+            fitting_schedule_cache_age_seconds.observe(age)
+            return slots
+        fitting_schedule_cache_requests_total.labels(result="miss").inc()
+        return await self.fetch(station_id, day)
+
+    async def cached_days(
+        self, station_id: str, days: Iterable[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Cached slots of the given days (days not in cache are left out)."""
+        return {day: slots for day, (slots, _) in (await self._read(station_id, days)).items()}
+
+    async def _read(
+        self, station_id: str, days: Iterable[str]
+    ) -> dict[str, tuple[list[dict[str, Any]], float]]:
+        """Cached days with their age in seconds, in one Redis round-trip."""
+        days = list(days)
+        if not days:
+            return {}
+        try:
+            raws = await self._redis.mget(
+                [SCHEDULE_KEY.format(station_id=station_id, date=day) for day in days]
+            )
+        except Exception:
+            logger.debug("schedule cache read failed for %s", station_id, exc_info=True)
+            return {}
+        found: dict[str, tuple[list[dict[str, Any]], float]] = {}
+        now = time.time()
+        for day, raw in zip(days, raws, strict=True):
+            if not raw:
+                continue
+            try:
+                entry = json.loads(raw)
+                found[day] = (entry["slots"], max(0.0, now - entry["fetched_at"]))
+            except (TypeError, ValueError, KeyError):
+                continue
+        return found
+
+    async def fetch(self, station_id: str, day: str) -> list[dict[str, Any]]:
+        """Fetch *day* from 1C and cache it."""
+        result = await self._onec.get_station_schedule(
+            station_id=station_id, date_from=day, date_to=day
+        )
+        slots = result.get("data", []) or []
+        try:
+            await self._redis.setex(
+                SCHEDULE_KEY.format(station_id=station_id, date=day),
+                self._ttl,
+                json.dumps({"fetched_at": time.time(), "slots": slots}, ensure_ascii=False),
+            )
+        except Exception:
+            logger.debug("schedule cache write failed for %s %s", station_id, day, exc_info=True)
+        return slots
+
+    async def invalidate(self, station_id: str, day: str) -> None:
+        """Drop a cached day (best-effort); the next read goes to 1C."""
+        day = str(day).split("T")[0]
+        if not station_id or not day:
+            return
+        try:
+            await self._redis.delete(SCHEDULE_KEY.format(station_id=station_id, date=day))
+        except Exception:
+            logger.debug(
+                "schedule cache invalidate failed for %s %s", station_id, day, exc_info=True
+            )
+
+    async def remember_booking(self, guid: str, station_id: str, day: str) -> None:
+        """Record where a booking is, so cancelling it can invalidate that day."""
+        day = str(day)
+        if not guid or not station_id or not _ISO_DATE_RE.match(day):
+            return
+        try:
+            await self._redis.setex(
+                BOOKING_KEY.format(guid=guid), _BOOKING_TTL, f"{station_id}|{day[:10]}"
+            )
+        except Exception:
+            logger.debug("schedule cache: failed to remember booking %s", guid, exc_info=True)
+
+    async def invalidate_booking(self, guid: str) -> None:
+        """Invalidate the day of a (cancelled) booking, if it is known."""
+        if not guid:
+            return
+        try:
+            raw = await self._redis.get(BOOKING_KEY.format(guid=guid))
+        except Exception:
+            logger.debug("schedule cache: failed to look up booking %s", guid, exc_info=True)
+            return
+        if not raw:
+            return
+        station_id, _, day = (raw if isinstance(raw, str) else raw.decode()).partition("|")
+        await self.invalidate(station_id, day)
+
+    async def prefetch(self) -> int:
+        """Fetch the next ``prefetch_days`` business days of every station.
+
+        Returns the number of days fetched.
+        """
+        station_ids = await self._station_ids()
+        today = datetime.now(tz=UTC).date()
+        days = [d.isoformat() for d in next_business_days(today, self._prefetch_days)]
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def fetch_one(station_id: str, day: str) -> bool:
+            async with semaphore:
+                try:
+                    await self.fetch(station_id, day)
+                except Exception:
+                    fitting_schedule_prefetch_total.labels(result="error").inc()
+                    logger.debug("schedule prefetch failed: %s %s", station_id, day, exc_info=True)
+                    return False
+                fitting_schedule_prefetch_total.labels(result="ok").inc()
+                return True
+
+        results = await asyncio.gather(
+            *(fetch_one(station_id, day) for station_id in station_ids for day in days)
+        )
+        return sum(results)
+
+    async def run(self) -> None:
+        """Prefetch every ``prefetch_interval`` seconds (runs until cancelled)."""
+        if self._prefetch_days <= 0:
+            return
+        while True:
+            delay: float = self._prefetch_interval
+            try:
+                # Only one call processor prefetches per interval
+                if await self._redis.set(
+                    _PREFETCH_LOCK_KEY, "1", nx=True, ex=self._prefetch_interval
+                ):
+                    t0 = time.monotonic()
+                    due = t0 + self._prefetch_interval  # start of the next round
+                    # A round still running near *due* keeps the lock in short leases
+                    hold_from = due - self._prefetch_interval / 4
+                    keeper = asyncio.create_task(self._hold_prefetch_lock(hold_from))
+                    try:
+                        fetched = await self.prefetch()
+                    finally:
+                        keeper.cancel()
+                        # gather, not suppress: a cancellation of run() itself must propagate
+                        await asyncio.gather(keeper, return_exceptions=True)
+                    if time.monotonic() >= hold_from:
+                        # Leased past its slot: release so the next round is not held back
+                        await self._redis.delete(_PREFETCH_LOCK_KEY)
+                    delay = max(0.0, due - time.monotonic())
+                    logger.info(
+                        "schedule prefetch: %d station-days in %.1fs",
+                        fetched,
+                        time.monotonic() - t0,
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("schedule prefetch round failed", exc_info=True)
+            await asyncio.sleep(delay)
+
+    async def _hold_prefetch_lock(self, hold_from: float) -> None:
+        """Extend the prefetch lock from *hold_from* (monotonic) until cancelled.
+
+        Before then the lock keeps the expiry it was acquired with. Leases of
+        half an interval, renewed every quarter, outlast each renewal gap.
+        """
+        lease = self._prefetch_interval / 2
+        await asyncio.sleep(max(0.0, hold_from - time.monotonic()))
+        while True:
+            try:
+                await self._redis.pexpire(_PREFETCH_LOCK_KEY, math.ceil(lease * 1000))
+            except Exception:
+                logger.debug("schedule prefetch lock refresh failed", exc_info=True)
+            await asyncio.sleep(lease / 2)
+
+    async def _station_ids(self) -> list[str]:
+        """IDs of the stations to keep warm: the cached station list, else 1C."""
+        stations: list[dict[str, Any]] = []
+        raw = await self._redis.get(_STATIONS_KEY)
+        if raw:
+            stations = json.loads(raw)
+        else:
+            data = await self._onec.get_fitting_stations_rest()
+            stations = data if isinstance(data, list) else data.get("data", [])
+        ids = (s.get("station_id") or s.get("StationID") or s.get("id") for s in stations)
+        return list(dict.fromkeys(str(sid) for sid in ids if sid))
@@ -0,0 +1,156 @@
+"""Incremental parsing of large 1C JSON payloads.
+
+1C returns catalog and stock dumps as one JSON object whose ``data`` key
+holds an array of records (``{"success": true, "data": [...], ...}``).
+``iter_json_array`` walks the response body chunk by chunk and yields the
+records one at a time, so a dump is never held in memory as a whole —
+neither as bytes, nor as text, nor as parsed objects. Fields before the
+array are skipped, fields after it are not read. A bare top-level array is
+accepted as well.
+
+The body is UTF-8 unless 1C falls back to Windows-1251; the encoding is
+settled at the first non-ASCII bytes (ASCII reads the same in both).
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+_WHITESPACE = " \t\r\n"
+
+
+class _BodyDecoder:
+    """Incremental bytes → str with the 1C UTF-8 / Windows-1251 fallback."""
+
+    def __init__(self) -> None:
+        self._decoder: codecs.IncrementalDecoder | None = None
+        self._pending = b""  # undecided: start of a multi-byte sequence
+
+    def decode(self, chunk: bytes, final: bool = False) -> str:
+        if self._decoder is not None:
+            return self._decoder.decode(chunk, final)
+
+        data = self._pending + chunk
+        self._pending = b""
+        if data.isascii():
+            return data.decode("ascii")
+        utf8 = codecs.getincrementaldecoder("utf-8")()
+        try:
+            text = utf8.decode(data, final)
+        except UnicodeDecodeError:
+            self._decoder = codecs.getincrementaldecoder("windows-1251")()
+            return self._decoder.decode(data, final)
+        if text.isascii():
+            # The non-ASCII bytes are an incomplete sequence at the end; wait for more
+            self._pending = utf8.getstate()[0]
+        else:
+            self._decoder = utf8
+        return text
+
+
+class _Reader:
+    """Text buffer over the chunk stream that hands out whole JSON values."""
+
+    def __init__(self, chunks: AsyncIterable[bytes]) -> None:
+        self._chunks = aiter(chunks)
+        self._body = _BodyDecoder()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    async def _fill(self) -> None:
+        """Append the next chunk, dropping the text consumed so far."""
+        if self._eof:
+            raise ValueError("Unexpected end of 1C JSON payload")
+        try:
+            chunk = await anext(self._chunks)
+        except StopAsyncIteration:
+            self._eof = True
+            text = self._body.decode(b"", final=True)
+        else:
+            text = self._body.decode(chunk)
+        self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+
+    async def peek(self) -> str:
+        """Next non-whitespace character, not consumed."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            await self._fill()
+
+    async def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of ``chars``."""
+        char = await self.peek()
+        if char not in chars:
+            raise ValueError(f"Unexpected {char!r} in 1C JSON payload, expected one of {chars!r}")
+        self._pos += 1
+        return char
+
+    async def value(self) -> Any:
+        """Consume and return the next complete JSON value."""
+        await self.peek()
+        while True:
+            try:
+                obj, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A value that ends the buffer may be cut short (a number)
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return obj
+            await self._fill()
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes], key: str = "data") -> AsyncIterator[Any]:
+    """Yield the elements of the ``key`` array of a streamed JSON object.
+
+    Yields nothing if the object has no such array, like
+    ``resp.get("data", [])`` on a parsed body.
+
+    Raises:
+        ValueError: If the payload is not valid JSON (``json.JSONDecodeError``
+            for malformed values).
+    """
+    reader = _Reader(chunks)
+    if await reader.expect("{[") == "{":
+        if await reader.peek() == "}":
+            return
+        while True:
+            name = await reader.value()
+            await reader.expect(":")
+            if name == key and await reader.peek() == "[":
+                await reader.expect("[")
+                break
+            await reader.value()
+            if await reader.expect(",}") == "}":
+                return
+
+    if await reader.peek() == "]":
+        return
+    while True:
+        yield await reader.value()
+        if await reader.expect(",]") == "]":
+            return
+
+
+async def iter_batches(items: AsyncIterable[Any], size: int) -> AsyncIterator[list[Any]]:
+    """Group an async stream into lists of at most ``size`` items."""
+    batch: list[Any] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -2,16 +2,41 @@
 
 Syncs tire catalog from 1C ERP into PostgreSQL and Redis
 for fast search_tires and check_availability queries.
+
+Stock sync is delta-based: 1C always returns the whole stock list, so each
+row is fingerprinted and compared with the fingerprints of the previous
+sync (Redis hash ``onec:stock_fp:{network}``). Only changed SKUs are
+written to ``tire_stock`` and ``onec:stock:{network}``; SKUs that dropped
+out of the list are zeroed in the DB and removed from the cache. Without a
+previous snapshot (first run, Redis down or expired) the whole list is
+rewritten, into staging hashes that replace the live ones when complete.
+Redis is best-effort: if it fails, the run still writes PostgreSQL and
+leaves the cache to the next sync.
+
+Full catalog and stock dumps are streamed (``OneCClient.iter_wares_full`` /
+``iter_stock``): each batch is written as soon as it is parsed, so memory
+stays flat and writing overlaps the download.
+
+A sync that wrote anything asks the call processors to rebuild their
+in-memory catalog index (``src.store_client.catalog_index``).
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import text
 
+from src.monitoring.metrics import (
+    catalog_stock_sync_duration_seconds,
+    catalog_stock_sync_rows_total,
+)
+from src.store_client.catalog_index import publish_change
+
 if TYPE_CHECKING:
     from redis.asyncio import Redis
     from sqlalchemy.ext.asyncio import AsyncEngine
@@ -25,6 +50,15 @@ NETWORKS = ("ProKoleso", "Tshina")
 
 # Max rows per executemany batch (prevents huge memory/packet spikes)
 _BATCH_SIZE = 1000
+# Wares per streamed full-catalog batch (each carries its products)
+_WARES_BATCH_SIZE = 200
+
+# Fingerprints of the last synced stock rows: {sku: hash}
+_STOCK_FP_KEY = "onec:stock_fp:{network}"
+# Suffix of the hashes a full stock sync fills before swapping them in
+_STAGING_SUFFIX = ":staging"
+# tire_stock columns that make up a stock row's fingerprint
+_STOCK_FIELDS = ("price", "price_tshina", "stock_quantity", "country", "year_issue")
 
 # Seasonality normalization: 1C Russian/Ukrainian → internal code
 SEASON_MAP = {
@@ -61,6 +95,35 @@ def _safe_bool(value: str | bool | None) -> bool:
     return value.strip().lower() in ("1", "true", "да", "yes")
 
 
+def _stock_row(network: str, item: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a 1C stock item into a ``tire_stock`` row."""
+    return {
+        "sku": item["sku"],
+        "network": network,
+        "price": _safe_int(item.get("price")),
+        "price_tshina": _safe_int(item.get("price_tshina")),
+        "stock_quantity": _safe_int(item.get("stock")),
+        "country": item.get("country", ""),
+        "year_issue": item.get("year_issue", ""),
+    }
+
+
+def _stock_fingerprint(row: dict[str, Any]) -> str:
+    """Short hash of the row's synced fields (16 hex chars)."""
+    payload = "\x1f".join(str(row[field]) for field in _STOCK_FIELDS)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _decode(value: str | bytes) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _stock_keys(network: str, staging: bool = False) -> tuple[str, str]:
+    """Redis keys of the stock hash and its fingerprint snapshot."""
+    suffix = _STAGING_SUFFIX if staging else ""
+    return f"onec:stock:{network}{suffix}", _STOCK_FP_KEY.format(network=network) + suffix
+
+
 class CatalogSyncService:
     """Synchronizes 1C tire catalog into PostgreSQL and Redis."""
 
@@ -83,38 +146,47 @@ class CatalogSyncService:
         """
         logger.info("Starting full catalog sync from 1C")
 
-        # Sync wares (catalog)
+        # Sync wares (catalog), writing each batch while the rest downloads
         try:
-            resp = await self._onec.get_wares_full()
-            wares = resp.get("data", [])
-            if wares:
+            count = 0
+            async for wares in self._onec.iter_wares_full(batch_size=_WARES_BATCH_SIZE):
                 await self._upsert_wares(wares)
-                logger.info("Full wares sync: %d models", len(wares))
+                count += len(wares)
+            if count:
+                logger.info("Full wares sync: %d models", count)
             else:
                 logger.warning("Full wares sync: empty response from 1C")
         except Exception:
             logger.exception("Failed to sync wares from 1C")
             raise
 
-        # Sync stock for all networks
-        await self.sync_stock()
+        # Sync stock for all networks (full rewrite heals any drift)
+        await self.sync_stock(force_full=True)
+
+        await self._publish_catalog_change("full_sync")
 
         # Sync Nova Poshta reference data
         await self.sync_novapost()
 
         logger.info("Full catalog sync completed")
 
-    async def incremental_sync(self) -> None:
+    async def incremental_sync(self) -> dict[str, dict[str, Any]]:
         """Incremental catalog sync: changed wares + stock for both networks.
 
-        Runs periodically (every N minutes).
+        Runs periodically (every N minutes). Nova Poshta reference data has
+        its own, slower schedule (``sync_novapost``).
+
+        Returns:
+            Per-network stock sync stats (see ``sync_stock``).
         """
+        wares_updated = 0
         for network in NETWORKS:
             try:
                 resp = await self._onec.get_wares_incremental(network)
                 wares = resp.get("data", [])
                 if wares:
                     await self._upsert_wares(wares)
+                    wares_updated += len(wares)
                     logger.info(
                         "Incremental sync %s: %d models updated",
                         network,
@@ -128,25 +200,141 @@ class CatalogSyncService:
                 logger.exception("Failed incremental sync for %s", network)
 
         # Always refresh stock
-        await self.sync_stock()
+        stats = await self.sync_stock()
+        if wares_updated or any(s["changed"] or s["removed"] for s in stats.values()):
+            await self._publish_catalog_change("incremental_sync")
+        return stats
 
-        # Refresh Nova Poshta reference data
-        await self.sync_novapost()
+    async def sync_stock(self, *, force_full: bool = False) -> dict[str, dict[str, Any]]:
+        """Sync stock/prices from 1C for all networks into DB and Redis.
 
-    async def sync_stock(self) -> None:
-        """Sync stock/prices from 1C for all networks into DB and Redis."""
+        Args:
+            force_full: Rewrite every SKU even if the previous snapshot is
+                available.
+
+        Returns:
+            Per-network stats: ``fetched``, ``changed``, ``removed``,
+            ``full`` and ``duration_ms``.
+        """
+        stats: dict[str, dict[str, Any]] = {}
         for network in NETWORKS:
+            start = time.monotonic()
             try:
-                resp = await self._onec.get_stock(network)
-                stock_items = resp.get("data", [])
-                if stock_items:
-                    await self._upsert_stock(network, stock_items)
-                    await self._update_redis_stock(network, stock_items)
-                    logger.info("Stock sync %s: %d items", network, len(stock_items))
-                else:
-                    logger.debug("Stock sync %s: empty response", network)
+                result = await self._sync_network_stock(network, force_full)
             except Exception:
                 logger.exception("Failed stock sync for %s", network)
+                continue
+            if result is None:
+                logger.debug("Stock sync %s: empty response", network)
+                continue
+
+            duration = time.monotonic() - start
+            result["duration_ms"] = round(duration * 1000)
+            stats[network] = result
+            catalog_stock_sync_duration_seconds.labels(network=network).observe(duration)
+            for outcome in ("fetched", "changed", "removed"):
+                catalog_stock_sync_rows_total.labels(network=network, outcome=outcome).inc(
+                    result[outcome]
+                )
+            logger.info(
+                "Stock sync %s: %d fetched, %d changed, %d removed (%s) in %d ms",
+                network,
+                result["fetched"],
+                result["changed"],
+                result["removed"],
+                "full" if result["full"] else "delta",
+                result["duration_ms"],
+            )
+        return stats
+
+    async def _sync_network_stock(self, network: str, force_full: bool) -> dict[str, Any] | None:
+        """Stream one network's stock and write the SKUs changed since the previous sync.
+
+        Returns:
+            Sync stats, or None if 1C returned no stock (nothing is touched).
+        """
+        previous = None if force_full else await self._load_stock_fingerprints(network)
+        full = previous is None
+        # Redis is best-effort: once a step fails, the run continues with
+        # PostgreSQL only and leaves the live cache and snapshot alone
+        use_redis = self._redis is not None
+        if full and self._redis is not None:
+            try:
+                await self._redis.delete(*_stock_keys(network, staging=True))
+            except Exception:
+                use_redis = self._redis_unavailable(network)
+
+        seen: set[str] = set()
+        fetched = changed_count = 0
+        async for items in self._onec.iter_stock(network, batch_size=_BATCH_SIZE):
+            fetched += len(items)
+            rows = {item["sku"]: _stock_row(network, item) for item in items if item.get("sku")}
+            seen.update(rows)
+            fingerprints = {sku: _stock_fingerprint(row) for sku, row in rows.items()}
+            if previous is not None:
+                fingerprints = {
+                    sku: fp for sku, fp in fingerprints.items() if previous.get(sku) != fp
+                }
+            changed = [rows[sku] for sku in fingerprints]
+
+            # PostgreSQL first: the snapshot only advances once the rows are stored
+            await self._upsert_stock(changed)
+            if use_redis:
+                try:
+                    await self._update_redis_stock(network, changed, fingerprints, staging=full)
+                except Exception:
+                    use_redis = self._redis_unavailable(network)
+            changed_count += len(changed)
+
+        if not seen:
+            return None
+
+        removed = [] if previous is None else [sku for sku in previous if sku not in seen]
+        await self._zero_removed_stock(network, removed, list(seen) if full else None)
+        if use_redis:
+            try:
+                await self._finish_redis_stock(network, removed, full=full)
+            except Exception:
+                self._redis_unavailable(network)
+        return {
+            "fetched": fetched,
+            "changed": changed_count,
+            "removed": len(removed),
+            "full": full,
+        }
+
+    @staticmethod
+    def _redis_unavailable(network: str) -> bool:
+        """Log a failed Redis stock step; returns False to turn Redis off for the run."""
+        logger.warning(
+            "Redis unavailable, stock sync %s continues with PostgreSQL only",
+            network,
+            exc_info=True,
+        )
+        return False
+
+    async def _publish_catalog_change(self, reason: str) -> None:
+        """Ask the call processors to rebuild their catalog index."""
+        if self._redis is not None:
+            await publish_change(self._redis, reason)
+
+    async def _load_stock_fingerprints(self, network: str) -> dict[str, str] | None:
+        """Fingerprints of the previous sync, or None if the snapshot is gone.
+
+        The snapshot is only trusted while the stock cache it describes
+        still exists (both keys share a TTL).
+        """
+        if self._redis is None:
+            return None
+        stock_key, fp_key = _stock_keys(network)
+        try:
+            if await self._redis.exists(stock_key, fp_key) != 2:
+                return None
+            raw = await self._redis.hgetall(fp_key)  # type: ignore[misc]
+        except Exception:
+            logger.warning("Stock fingerprints unavailable for %s", network, exc_info=True)
+            return None
+        return {_decode(sku): _decode(fp) for sku, fp in raw.items()}
 
     async def sync_novapost(self) -> None:
         """Sync Nova Poshta cities and branches from 1C into PostgreSQL."""
@@ -366,25 +554,8 @@ class CatalogSyncService:
             for i in range(0, len(product_rows), _BATCH_SIZE):
                 await conn.execute(product_sql, product_rows[i : i + _BATCH_SIZE])
 
-    async def _upsert_stock(self, network: str, stock_items: list[dict[str, Any]]) -> None:
-        """UPSERT stock data into tire_stock (batch)."""
-        rows = []
-        for item in stock_items:
-            sku = item.get("sku", "")
-            if not sku:
-                continue
-            rows.append(
-                {
-                    "sku": sku,
-                    "network": network,
-                    "price": _safe_int(item.get("price")),
-                    "price_tshina": _safe_int(item.get("price_tshina")),
-                    "stock_quantity": _safe_int(item.get("stock")),
-                    "country": item.get("country", ""),
-                    "year_issue": item.get("year_issue", ""),
-                }
-            )
-
+    async def _upsert_stock(self, rows: list[dict[str, Any]]) -> None:
+        """UPSERT normalized stock rows into tire_stock (batch)."""
         if not rows:
             return
 
@@ -406,26 +577,83 @@ class CatalogSyncService:
             for i in range(0, len(rows), _BATCH_SIZE):
                 await conn.execute(sql, rows[i : i + _BATCH_SIZE])
 
-    async def _update_redis_stock(self, network: str, stock_items: list[dict[str, Any]]) -> None:
-        """Update Redis hash with stock data for fast check_availability."""
-        if self._redis is None:
+    async def _zero_removed_stock(
+        self, network: str, removed: list[str], present: list[str] | None
+    ) -> None:
+        """Mark SKUs that dropped out of the 1C stock list as out of stock.
+
+        Either ``removed`` lists them (delta sync), or ``present`` lists the
+        whole current list and every other SKU of the network is zeroed
+        (full sync).
+        """
+        if present is not None:
+            sql = text("""
+                UPDATE tire_stock SET stock_quantity = 0, synced_at = now()
+                WHERE trading_network = :network AND stock_quantity <> 0
+                  AND NOT (sku = ANY(:skus))
+            """)
+            skus = present
+        elif removed:
+            sql = text("""
+                UPDATE tire_stock SET stock_quantity = 0, synced_at = now()
+                WHERE trading_network = :network AND sku = ANY(:skus)
+            """)
+            skus = removed
+        else:
+            return
+
+        async with self._engine.begin() as conn:
+            await conn.execute(sql, {"network": network, "skus": skus})
+
+    async def _update_redis_stock(
+        self,
+        network: str,
+        rows: list[dict[str, Any]],
+        fingerprints: dict[str, str],
+        *,
+        staging: bool,
+    ) -> None:
+        """Write a batch of changed SKUs to the Redis stock hash and the snapshot.
+
+        A full sync writes to the staging hashes (see ``_finish_redis_stock``).
+        Both keys get the same TTL, so the snapshot never outlives the cache
+        it describes.
+        """
+        if self._redis is None or not rows:
             return
 
-        key = f"onec:stock:{network}"
+        key, fp_key = _stock_keys(network, staging)
         pipe = self._redis.pipeline()
-        for item in stock_items:
-            sku = item.get("sku", "")
-            if not sku:
-                continue
+        for row in rows:
             value = json.dumps(
                 {
-                    "price": _safe_int(item.get("price")),
-                    "stock": _safe_int(item.get("stock")),
-                    "country": item.get("country", ""),
-                    "year_issue": item.get("year_issue", ""),
+                    "price": row["price"],
+                    "stock": row["stock_quantity"],
+                    "country": row["country"],
+                    "year_issue": row["year_issue"],
                 },
                 ensure_ascii=False,
             )
-            pipe.hset(key, sku, value)
+            pipe.hset(key, row["sku"], value)
+        pipe.hset(fp_key, mapping=fingerprints)
         pipe.expire(key, self._stock_cache_ttl * 2)  # 2x TTL as safety margin
+        pipe.expire(fp_key, self._stock_cache_ttl * 2)
+        await pipe.execute()
+
+    async def _finish_redis_stock(self, network: str, removed: list[str], *, full: bool) -> None:
+        """Drop removed SKUs (delta) or swap the staging hashes in (full); refresh TTLs."""
+        if self._redis is None:
+            return
+
+        key, fp_key = _stock_keys(network)
+        pipe = self._redis.pipeline()
+        if full:
+            staging_key, staging_fp_key = _stock_keys(network, staging=True)
+            pipe.rename(staging_key, key)
+            pipe.rename(staging_fp_key, fp_key)
+        elif removed:
+            pipe.hdel(key, *removed)
+            pipe.hdel(fp_key, *removed)
+        pipe.expire(key, self._stock_cache_ttl * 2)
+        pipe.expire(fp_key, self._stock_cache_ttl * 2)
         await pipe.execute()
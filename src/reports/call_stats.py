@@ -0,0 +1,222 @@
+"""Hourly per-tenant call statistics rollup.
+
+``call_stats_hourly`` holds one row per (hour, tenant) with sums and counts
+— so averages re-aggregate exactly over any range — and scenario /
+transfer-reason histograms. ``src.tasks.call_stats_rollup`` keeps it filled
+up to the watermark in ``call_stats_rollup_state``; calls past the
+watermark (the current hour, or a lagging job) are aggregated live with the
+same SQL, so readers always see complete numbers.
+
+Every query filters ``calls`` by ``started_at`` ranges (never
+``started_at::date``) so monthly partitions are pruned.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TC003 - used in runtime signatures
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection  # noqa: TC002
+
+ROLLUP_NAME = "call_stats_hourly"
+
+_COLUMNS = (
+    "bucket, tenant_id, total_calls, resolved_by_bot, transferred, "
+    "duration_count, duration_sum, quality_count, quality_sum, total_cost_usd, "
+    "scenario_counts, transfer_reasons"
+)
+
+_WATERMARK_SQL = f"""
+    COALESCE(
+        (SELECT watermark FROM call_stats_rollup_state WHERE name = '{ROLLUP_NAME}'),
+        '-infinity'::timestamptz
+    )
+"""
+
+
+def _hourly_from_calls(where: str) -> str:
+    """SELECT producing ``call_stats_hourly`` rows from the calls matching ``where``."""
+    return f"""
+        WITH base AS (
+            SELECT date_trunc('hour', started_at) AS bucket, tenant_id, scenario,
+                   transferred_to_operator, transfer_reason,
+                   duration_seconds, quality_score, total_cost_usd
+              FROM calls
+             WHERE {where}
+        ),
+        totals AS (
+            SELECT bucket, tenant_id,
+                   COUNT(*) AS total_calls,
+                   COUNT(*) FILTER (WHERE NOT transferred_to_operator) AS resolved_by_bot,
+                   COUNT(*) FILTER (WHERE transferred_to_operator) AS transferred,
+                   COUNT(duration_seconds) AS duration_count,
+                   COALESCE(SUM(duration_seconds), 0) AS duration_sum,
+                   COUNT(quality_score) AS quality_count,
+                   COALESCE(SUM(quality_score), 0) AS quality_sum,
+                   COALESCE(SUM(total_cost_usd), 0) AS total_cost_usd
+              FROM base
+          GROUP BY bucket, tenant_id
+        ),
+        scenarios AS (
+            SELECT bucket, tenant_id, jsonb_object_agg(scenario, n) AS scenario_counts
+              FROM (SELECT bucket, tenant_id, scenario, COUNT(*) AS n
+                      FROM base
+                     WHERE scenario IS NOT NULL
+                  GROUP BY bucket, tenant_id, scenario) s
+          GROUP BY bucket, tenant_id
+        ),
+        reasons AS (
+            SELECT bucket, tenant_id, jsonb_object_agg(transfer_reason, n) AS transfer_reasons
+              FROM (SELECT bucket, tenant_id, transfer_reason, COUNT(*) AS n
+                      FROM base
+                     WHERE transferred_to_operator AND transfer_reason IS NOT NULL
+                  GROUP BY bucket, tenant_id, transfer_reason) r
+          GROUP BY bucket, tenant_id
+        )
+        SELECT t.bucket, t.tenant_id, t.total_calls, t.resolved_by_bot, t.transferred,
+               t.duration_count, t.duration_sum, t.quality_count, t.quality_sum,
+               t.total_cost_usd,
+               COALESCE(s.scenario_counts, '{{}}'::jsonb) AS scenario_counts,
+               COALESCE(r.transfer_reasons, '{{}}'::jsonb) AS transfer_reasons
+          FROM totals t
+          LEFT JOIN scenarios s
+                 ON s.bucket = t.bucket AND s.tenant_id IS NOT DISTINCT FROM t.tenant_id
+          LEFT JOIN reasons r
+                 ON r.bucket = t.bucket AND r.tenant_id IS NOT DISTINCT FROM t.tenant_id
+    """
+
+
+async def lock_rollup(conn: AsyncConnection) -> None:
+    """Serialize rollup writers for the rest of the transaction."""
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:name))"), {"name": ROLLUP_NAME})
+
+
+async def refresh_hours(conn: AsyncConnection, start: datetime, end: datetime) -> int:
+    """Recompute the rollup rows of every hour in ``[start, end)`` from ``calls``.
+
+    Call inside a transaction holding ``lock_rollup``.
+
+    Returns:
+        Number of (hour, tenant) rows written.
+    """
+    await conn.execute(
+        text("DELETE FROM call_stats_hourly WHERE bucket >= :start AND bucket < :end"),
+        {"start": start, "end": end},
+    )
+    result = await conn.execute(
+        text(
+            f"INSERT INTO call_stats_hourly ({_COLUMNS}) "
+            + _hourly_from_calls("started_at >= :start AND started_at < :end")
+        ),
+        {"start": start, "end": end},
+    )
+    return int(result.rowcount or 0)
+
+
+async def fetch_daily_stats(
+    conn: AsyncConnection,
+    *,
+    date_from: Any = None,
+    date_to_end: Any = None,
+    tenant_id: str | None = None,
+    limit: int | None = None,
+    newest_first: bool = True,
+) -> list[dict[str, Any]]:
+    """Per-day statistics from the rollup plus the live tail past its watermark.
+
+    Args:
+        date_from: Inclusive lower bound (date or datetime), optional.
+        date_to_end: Exclusive upper bound, optional.
+        tenant_id: Restrict to one tenant (UUID string).
+        limit: Max days to return.
+        newest_first: Order by date descending (else ascending).
+
+    Returns:
+        Rows with ``stat_date``, ``total_calls``, ``resolved_by_bot``,
+        ``transferred``, ``avg_duration_seconds``, ``avg_quality_score``,
+        ``total_cost_usd``, ``scenario_breakdown``, ``transfer_reasons``
+        and ``hourly_distribution``.
+    """
+    rolled = [f"bucket < {_WATERMARK_SQL}"]
+    live = [f"started_at >= {_WATERMARK_SQL}"]
+    params: dict[str, Any] = {}
+
+    if date_from is not None:
+        rolled.append("bucket >= :date_from")
+        live.append("started_at >= :date_from")
+        params["date_from"] = date_from
+    if date_to_end is not None:
+        rolled.append("bucket < :date_to_end")
+        live.append("started_at < :date_to_end")
+        params["date_to_end"] = date_to_end
+    if tenant_id:
+        rolled.append("tenant_id = CAST(:tenant_id AS uuid)")
+        live.append("tenant_id = CAST(:tenant_id AS uuid)")
+        params["tenant_id"] = tenant_id
+
+    limit_clause = ""
+    if limit is not None:
+        limit_clause = "LIMIT :limit"
+        params["limit"] = limit
+
+    result = await conn.execute(
+        text(f"""
+            WITH hours AS (
+                SELECT {_COLUMNS}
+                  FROM call_stats_hourly
+                 WHERE {" AND ".join(rolled)}
+                UNION ALL
+                SELECT {_COLUMNS}
+                  FROM ({_hourly_from_calls(" AND ".join(live))}) live
+            ),
+            days AS (
+                SELECT DATE(bucket) AS stat_date,
+                       SUM(total_calls)::bigint AS total_calls,
+                       SUM(resolved_by_bot)::bigint AS resolved_by_bot,
+                       SUM(transferred)::bigint AS transferred,
+                       SUM(duration_sum)::float / NULLIF(SUM(duration_count), 0)
+                           AS avg_duration_seconds,
+                       SUM(quality_sum) / NULLIF(SUM(quality_count), 0) AS avg_quality_score,
+                       SUM(total_cost_usd) AS total_cost_usd
+                  FROM hours
+              GROUP BY DATE(bucket)
+            ),
+            scenarios AS (
+                SELECT stat_date, jsonb_object_agg(key, n) AS scenario_breakdown
+                  FROM (SELECT DATE(h.bucket) AS stat_date, e.key, SUM(e.value::int)::bigint AS n
+                          FROM hours h, jsonb_each_text(h.scenario_counts) e
+                      GROUP BY 1, 2) s
+              GROUP BY stat_date
+            ),
+            reasons AS (
+                SELECT stat_date, jsonb_object_agg(key, n) AS transfer_reasons
+                  FROM (SELECT DATE(h.bucket) AS stat_date, e.key, SUM(e.value::int)::bigint AS n
+                          FROM hours h, jsonb_each_text(h.transfer_reasons) e
+                      GROUP BY 1, 2) r
+              GROUP BY stat_date
+            ),
+            by_hour AS (
+                SELECT stat_date, jsonb_object_agg(hour, n) AS hourly_distribution
+                  FROM (SELECT DATE(bucket) AS stat_date,
+                               EXTRACT(HOUR FROM bucket)::int::text AS hour,
+                               SUM(total_calls)::bigint AS n
+                          FROM hours
+                      GROUP BY 1, 2) b
+              GROUP BY stat_date
+            )
+            SELECT d.stat_date, d.total_calls, d.resolved_by_bot, d.transferred,
+                   d.avg_duration_seconds, d.avg_quality_score, d.total_cost_usd,
+                   COALESCE(s.scenario_breakdown, '{{}}'::jsonb) AS scenario_breakdown,
+                   COALESCE(r.transfer_reasons, '{{}}'::jsonb) AS transfer_reasons,
+                   COALESCE(b.hourly_distribution, '{{}}'::jsonb) AS hourly_distribution
+              FROM days d
+              LEFT JOIN scenarios s USING (stat_date)
+              LEFT JOIN reasons r USING (stat_date)
+              LEFT JOIN by_hour b USING (stat_date)
+          ORDER BY d.stat_date {"DESC" if newest_first else "ASC"}
+            {limit_clause}
+        """),
+        params,
+    )
+    return [dict(row._mapping) for row in result]
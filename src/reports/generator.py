@@ -15,10 +15,10 @@ from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from src.config import get_settings
+from src.reports.call_stats import fetch_daily_stats
 
 logger = logging.getLogger(__name__)
 
@@ -32,28 +32,12 @@ async def _fetch_report_data(
 ) -> dict[str, Any]:
     """Fetch aggregated data for the report period."""
     async with engine.begin() as conn:
-        result = await conn.execute(
-            text("""
-                SELECT
-                    DATE(started_at) AS stat_date,
-                    COUNT(*) AS total_calls,
-                    COUNT(*) FILTER (WHERE NOT transferred_to_operator) AS resolved_by_bot,
-                    COUNT(*) FILTER (WHERE transferred_to_operator) AS transferred,
-                    AVG(duration_seconds) AS avg_duration_seconds,
-                    AVG(quality_score) AS avg_quality_score,
-                    SUM(total_cost_usd) AS total_cost_usd,
-                    NULL AS transfer_reasons
-                FROM calls
-                WHERE started_at >= :date_from AND started_at < :date_to_end
-                GROUP BY DATE(started_at)
-                ORDER BY stat_date
-            """),
-            {
-                "date_from": date_type.fromisoformat(date_from),
-                "date_to_end": date_type.fromisoformat(date_to) + timedelta(days=1),
-            },
+        rows = await fetch_daily_stats(
+            conn,
+            date_from=date_type.fromisoformat(date_from),
+            date_to_end=date_type.fromisoformat(date_to) + timedelta(days=1),
+            newest_first=False,
         )
-        rows = [dict(row._mapping) for row in result]
 
     # Aggregate totals
     total_calls = sum(r["total_calls"] or 0 for r in rows)
@@ -0,0 +1,181 @@
+"""Daily per-tenant LLM usage rollup.
+
+``llm_usage_daily`` holds one row per (day, task_type, provider_key, tenant)
+with call and token counts and latency sums. ``src.tasks.llm_usage_rollup``
+keeps it filled up to the watermark (whole hours) in
+``call_stats_rollup_state``; usage past the watermark — the current hour, or
+a lagging job — is aggregated live from ``llm_usage_log`` with the same SQL,
+so the numbers are always complete. Only token counts are stored: prices
+are joined from ``llm_model_pricing`` at query time, so price edits apply to
+past usage as well.
+
+Every query filters ``llm_usage_log`` by ``created_at`` ranges so monthly
+partitions are pruned.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime  # noqa: TC003 - used in runtime signatures
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection  # noqa: TC002
+
+ROLLUP_NAME = "llm_usage_daily"
+
+_COLUMNS = (
+    "day, task_type, provider_key, tenant_id, call_count, input_tokens, "
+    "output_tokens, cached_input_tokens, latency_count, latency_sum"
+)
+
+_WATERMARK_SQL = f"""
+    COALESCE(
+        (SELECT watermark FROM call_stats_rollup_state WHERE name = '{ROLLUP_NAME}'),
+        '-infinity'::timestamptz
+    )
+"""
+
+
+def _daily_from_log(where: str) -> str:
+    """SELECT producing ``llm_usage_daily`` rows from the log rows matching ``where``."""
+    return f"""
+        SELECT created_at::date AS day, task_type, provider_key, tenant_id,
+               COUNT(*) AS call_count,
+               COALESCE(SUM(input_tokens), 0) AS input_tokens,
+               COALESCE(SUM(output_tokens), 0) AS output_tokens,
+               COALESCE(SUM(cached_input_tokens), 0) AS cached_input_tokens,
+               COUNT(latency_ms) AS latency_count,
+               COALESCE(SUM(latency_ms), 0) AS latency_sum
+          FROM llm_usage_log
+         WHERE {where}
+      GROUP BY created_at::date, task_type, provider_key, tenant_id
+    """
+
+
+async def lock_rollup(conn: AsyncConnection) -> None:
+    """Serialize rollup writers for the rest of the transaction."""
+    await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:name))"), {"name": ROLLUP_NAME})
+
+
+async def refresh_days(conn: AsyncConnection, start: datetime, end: datetime) -> int:
+    """Recompute the rollup rows of the days in ``[start, end)`` from ``llm_usage_log``.
+
+    ``start`` must be a day boundary; ``end`` may fall inside a day, which
+    then holds that day's usage up to ``end`` only. Call inside a
+    transaction holding ``lock_rollup``.
+
+    Returns:
+        Number of rows written.
+    """
+    await conn.execute(
+        text(
+            "DELETE FROM llm_usage_daily "
+            "WHERE day >= CAST(:start AS date) AND CAST(day AS timestamptz) < :end"
+        ),
+        {"start": start, "end": end},
+    )
+    result = await conn.execute(
+        text(
+            f"INSERT INTO llm_usage_daily ({_COLUMNS}) "
+            + _daily_from_log("created_at >= :start AND created_at < :end")
+        ),
+        {"start": start, "end": end},
+    )
+    return int(result.rowcount or 0)
+
+
+async def fetch_usage_totals(
+    conn: AsyncConnection,
+    *,
+    date_from: Any = None,
+    date_to_end: Any = None,
+    task_type: str | None = None,
+    tenant_id: str | None = None,
+    by_task_type: bool = True,
+) -> list[Any]:
+    """Usage per provider (and task type) from the rollup plus the live tail.
+
+    Args:
+        date_from: Inclusive lower bound (date), optional.
+        date_to_end: Exclusive upper bound (date), optional.
+        task_type: Restrict to one task type.
+        tenant_id: Restrict to one tenant (UUID string).
+        by_task_type: Group by ``(task_type, provider_key)``, else by
+            ``provider_key`` only.
+
+    Returns:
+        Rows with ``task_type`` (when grouped by it), ``provider_key``,
+        ``call_count``, ``total_input_tokens``, ``total_output_tokens``,
+        ``avg_latency_ms`` and ``total_cost`` (current prices), most
+        expensive first.
+    """
+    # The watermark's own day holds the usage up to the watermark only
+    rolled = [f"day <= CAST({_WATERMARK_SQL} AS date)"]
+    live = [f"created_at >= {_WATERMARK_SQL}"]
+    params: dict[str, Any] = {}
+
+    if date_from is not None:
+        rolled.append("day >= :date_from")
+        live.append("created_at >= :date_from")
+        params["date_from"] = date_from
+    if date_to_end is not None:
+        rolled.append("day < :date_to_end")
+        live.append("created_at < :date_to_end")
+        params["date_to_end"] = date_to_end
+    if task_type:
+        rolled.append("task_type = :task_type")
+        live.append("task_type = :task_type")
+        params["task_type"] = task_type
+    if tenant_id:
+        rolled.append("tenant_id = CAST(:tenant_id AS uuid)")
+        live.append("tenant_id = CAST(:tenant_id AS uuid)")
+        params["tenant_id"] = tenant_id
+
+    keys = "u.task_type, u.provider_key" if by_task_type else "u.provider_key"
+    result = await conn.execute(
+        text(f"""
+            WITH days AS (
+                SELECT {_COLUMNS}
+                  FROM llm_usage_daily
+                 WHERE {" AND ".join(rolled)}
+                UNION ALL
+                SELECT {_COLUMNS}
+                  FROM ({_daily_from_log(" AND ".join(live))}) live
+            ),
+            usage AS (
+                SELECT {keys},
+                       SUM(u.call_count)::bigint AS call_count,
+                       SUM(u.input_tokens)::bigint AS total_input_tokens,
+                       SUM(u.output_tokens)::bigint AS total_output_tokens,
+                       SUM(u.latency_sum)::float / NULLIF(SUM(u.latency_count), 0)
+                           AS avg_latency_ms
+                  FROM days u
+              GROUP BY {keys}
+            )
+            SELECT u.*,
+                   COALESCE(
+                       u.total_input_tokens / 1000000.0 * p.input_price_per_1m +
+                       u.total_output_tokens / 1000000.0 * p.output_price_per_1m,
+                       0
+                   ) AS total_cost
+              FROM usage u
+              LEFT JOIN llm_model_pricing p ON p.provider_key = u.provider_key
+          ORDER BY total_cost DESC, u.call_count DESC
+        """),
+        params,
+    )
+    return list(result.fetchall())
+
+
+async def fetch_freshness(conn: AsyncConnection) -> dict[str, Any]:
+    """How far the rollup reaches; usage after ``aggregated_until`` is read live."""
+    row = (
+        await conn.execute(
+            text("SELECT watermark, updated_at FROM call_stats_rollup_state WHERE name = :name"),
+            {"name": ROLLUP_NAME},
+        )
+    ).first()
+    return {
+        "aggregated_until": row.watermark.isoformat() if row else None,
+        "rollup_updated_at": row.updated_at.isoformat() if row else None,
+    }
@@ -0,0 +1,403 @@
+"""In-process tire catalog index for ``search_tires`` and ``check_availability``.
+
+The 1C catalog (``tire_products`` × ``tire_models``) and the per-network
+stock (``tire_stock``) are loaded into an immutable, versioned
+``CatalogIndex``: one column per product field (SKU, brand, model, size,
+season, width / profile / diameter) and, per trading network, price /
+stock / country / year columns aligned with them. Per network, row ids
+are kept in price order in posting lists per field value, per size and per
+size × brand, and the diversified answer of a size search without a brand
+(``pick_diverse_tires`` over the 50 cheapest) is precomputed for every
+size × season. A search is then a dict lookup, or a walk along one short
+posting list that stops at the result limit, instead of a 3-table join.
+
+``CatalogSyncService`` calls ``publish_change`` after every sync that wrote
+something; ``CatalogIndexStore.run`` rebuilds the index on each message and
+on a slow backstop timer, and swaps it in atomically. Until the first index
+is built — or for a network the index does not know — ``StoreClient``
+queries PostgreSQL as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import text
+
+from src.monitoring.metrics import catalog_index_rebuild_ms, catalog_index_skus
+from src.store_client.index_store import IndexStore, publish
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+INVALIDATE_CHANNEL = "catalog_index:invalidate"
+
+_REFRESH_INTERVAL = 1800.0  # seconds — backstop rebuild
+_FETCH_PARTITION = 5000  # rows per fetch, so a rebuild yields to live calls
+
+# Result sizes of the SQL search: a brand search returns the 5 cheapest,
+# otherwise the 50 cheapest are narrowed down to 5 across price segments.
+BRAND_LIMIT = 5
+DIVERSE_POOL = 50
+DIVERSE_TARGET = 5
+
+# LLM sends the English enum; rows synced before normalization hold Ukrainian
+SEASON_TO_DB = {
+    "summer": "літня",
+    "winter": "зимова",
+    "all_season": "всесезонна",
+}
+_SEASON_KEY = {db: code for code, db in SEASON_TO_DB.items()}
+
+_NO_PRICE = -1  # tire_stock.price is NULL, or no tire_stock row
+_NO_STOCK_ROW = -1  # no tire_stock row for the network
+
+_PRODUCTS_SQL = """
+    SELECT p.sku, p.width, p.profile, p.diameter, p.size,
+           m.manufacturer, m.name, m.seasonality
+    FROM tire_products p
+    JOIN tire_models m ON p.model_id = m.id
+"""
+_STOCK_SQL = """
+    SELECT sku, trading_network, price, stock_quantity, country, year_issue
+    FROM tire_stock
+"""
+
+SizeKey = tuple[int | None, int | None, int | None]
+
+
+async def publish_change(redis: Redis, reason: str) -> None:
+    """Tell every process to rebuild its catalog index (best-effort)."""
+    await publish(INVALIDATE_CHANNEL, reason, redis)
+
+
+def season_key(season: str | None) -> str | None:
+    """Internal code of a season, whether spelled as the enum or as 1C's Ukrainian."""
+    if not season:
+        return None
+    return _SEASON_KEY.get(season, season)
+
+
+def pick_diverse_tires(rows: list[Any], target: int = DIVERSE_TARGET) -> list[Any]:
+    """Pick tires from different price segments for a balanced overview.
+
+    Selects 1 budget + 1-2 mid-range + 1-2 premium, one per manufacturer,
+    so the customer sees the full price range.
+    """
+    if not rows:
+        return rows
+
+    # Deduplicate by manufacturer (keep cheapest per brand)
+    seen_brands: dict[str, Any] = {}
+    for r in rows:
+        brand = r["brand"]
+        if brand not in seen_brands:
+            seen_brands[brand] = r
+    unique = list(seen_brands.values())
+
+    if len(unique) <= target:
+        return unique
+
+    # Split into 3 price segments
+    prices = sorted(r["price"] for r in unique if r["price"] > 0)
+    if len(prices) < 3:
+        return unique[:target]
+
+    p33 = prices[len(prices) // 3]
+    p66 = prices[2 * len(prices) // 3]
+
+    budget = [r for r in unique if 0 < r["price"] <= p33]
+    mid = [r for r in unique if p33 < r["price"] <= p66]
+    premium = [r for r in unique if r["price"] > p66]
+
+    # Pick from each segment
+    result: list[Any] = []
+    for segment, count in [(budget, 1), (mid, 2), (premium, 2)]:
+        result.extend(segment[:count])
+
+    # Fill remaining slots if a segment was too small
+    remaining = [r for r in unique if r not in result]
+    while len(result) < target and remaining:
+        result.append(remaining.pop(0))
+
+    return sorted(result, key=lambda r: r["price"])
+
+
+@dataclass(frozen=True)
+class _NetworkColumns:
+    """Stock columns of one trading network, aligned with the product rows."""
+
+    price: array[int]  # _NO_PRICE where unknown
+    stock: array[int]  # _NO_STOCK_ROW where the network has no row
+    country: list[str | None]
+    year: list[str | None]
+    by_price: list[int]  # every row id, cheapest first, unknown prices last
+    # (field, value) → row ids in ``by_price`` order
+    postings: dict[tuple[str, Any], list[int]]
+    # Precomputed answers of size searches without a brand (season None = any)
+    diverse: dict[tuple[SizeKey, str | None], tuple[int, ...]]
+
+
+class CatalogIndex:
+    """Immutable columnar view of the tire catalog and its stock per network.
+
+    Answers the same as the SQL in ``StoreClient`` (prices in ascending
+    order, unknown prices last, ties by SKU), except that English and
+    Ukrainian spellings of a season match each other.
+
+    Args:
+        products: ``(sku, width, profile, diameter, size, manufacturer,
+            model, seasonality)`` rows.
+        stock: ``(sku, trading_network, price, stock_quantity, country,
+            year_issue)`` rows; SKUs missing from *products* are skipped.
+        version: Build counter of the owning store.
+    """
+
+    def __init__(
+        self,
+        products: Iterable[Sequence[Any]],
+        stock: Iterable[Sequence[Any]],
+        *,
+        version: int = 0,
+    ) -> None:
+        self.version = version
+        self.built_at = time.monotonic()
+        self._sku: list[str] = []
+        self._brand: list[str] = []
+        self._model: list[str] = []
+        self._size: list[str | None] = []
+        self._season: list[str | None] = []
+        self._width: list[int | None] = []
+        self._profile: list[int | None] = []
+        self._diameter: list[int | None] = []
+        self._season_key: list[str | None] = []
+        self._brand_key: list[str] = []
+        self._row_by_sku: dict[str, int] = {}
+
+        for sku, width, profile, diameter, size, brand, model, season in products:
+            self._row_by_sku[sku] = len(self._sku)
+            self._sku.append(sku)
+            self._brand.append(brand)
+            self._model.append(model)
+            self._size.append(size)
+            self._season.append(season)
+            self._width.append(width)
+            self._profile.append(profile)
+            self._diameter.append(diameter)
+            self._season_key.append(season_key(season))
+            self._brand_key.append(brand.lower())
+
+        self._networks = self._build_networks(stock)
+
+    def __len__(self) -> int:
+        return len(self._sku)
+
+    @property
+    def networks(self) -> frozenset[str]:
+        return frozenset(self._networks)
+
+    def _build_networks(self, stock: Iterable[Sequence[Any]]) -> dict[str, _NetworkColumns]:
+        n = len(self._sku)
+        raw: dict[str, tuple[array[int], array[int], list[Any], list[Any]]] = {}
+        for sku, network, price, quantity, country, year in stock:
+            row = self._row_by_sku.get(sku)
+            if row is None:
+                continue
+            if network not in raw:
+                raw[network] = (
+                    array("i", [_NO_PRICE]) * n,
+                    array("i", [_NO_STOCK_ROW]) * n,
+                    [None] * n,
+                    [None] * n,
+                )
+            prices, stocks, countries, years = raw[network]
+            prices[row] = _NO_PRICE if price is None else price
+            stocks[row] = quantity or 0
+            countries[row] = country
+            years[row] = year
+
+        networks: dict[str, _NetworkColumns] = {}
+        for network, (prices, stocks, countries, years) in raw.items():
+            by_price = sorted(
+                range(n), key=lambda i: (prices[i] == _NO_PRICE, prices[i], self._sku[i])
+            )
+            columns = _NetworkColumns(
+                price=prices,
+                stock=stocks,
+                country=countries,
+                year=years,
+                by_price=by_price,
+                postings=self._build_postings(by_price),
+                diverse={},
+            )
+            self._precompute_diverse(columns)
+            networks[network] = columns
+        return networks
+
+    def _build_postings(self, by_price: list[int]) -> dict[tuple[str, Any], list[int]]:
+        postings: dict[tuple[str, Any], list[int]] = {}
+        for row in by_price:
+            size = (self._width[row], self._profile[row], self._diameter[row])
+            for key in (
+                ("size", size),
+                ("size_brand", (size, self._brand_key[row])),
+                ("width", size[0]),
+                ("profile", size[1]),
+                ("diameter", size[2]),
+                ("season", self._season_key[row]),
+                ("brand", self._brand_key[row]),
+            ):
+                postings.setdefault(key, []).append(row)
+        return postings
+
+    def _precompute_diverse(self, columns: _NetworkColumns) -> None:
+        """Fill ``columns.diverse`` for every size, with and without each season."""
+        pools: dict[tuple[SizeKey, str | None], list[int]] = {}
+        for row in columns.by_price:
+            size = (self._width[row], self._profile[row], self._diameter[row])
+            for key in ((size, None), (size, self._season_key[row])):
+                pool = pools.setdefault(key, [])
+                if len(pool) < DIVERSE_POOL:
+                    pool.append(row)
+        for key, pool in pools.items():
+            columns.diverse[key] = self._diversify(columns, pool)
+
+    def _diversify(self, columns: _NetworkColumns, rows: list[int]) -> tuple[int, ...]:
+        if len(rows) <= DIVERSE_TARGET:
+            return tuple(rows)
+        picked = pick_diverse_tires(
+            [
+                {"row": row, "brand": self._brand[row], "price": self._price(columns, row)}
+                for row in rows
+            ]
+        )
+        return tuple(r["row"] for r in picked)
+
+    @staticmethod
+    def _price(columns: _NetworkColumns, row: int) -> int:
+        price = columns.price[row]
+        return 0 if price == _NO_PRICE else price
+
+    def _item(self, columns: _NetworkColumns, row: int) -> dict[str, Any]:
+        """A row shaped like the SQL search result."""
+        return {
+            "id": self._sku[row],
+            "brand": self._brand[row],
+            "model": self._model[row],
+            "size": self._size[row],
+            "season": self._season[row],
+            "price": self._price(columns, row),
+            "stock_quantity": max(columns.stock[row], 0),
+        }
+
+    def search(
+        self,
+        network: str,
+        *,
+        width: int | None = None,
+        profile: int | None = None,
+        diameter: int | None = None,
+        season: str | None = None,
+        brand: str | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Rows a ``search_tires`` would show, or None if *network* is not indexed.
+
+        With a brand: the 5 cheapest matches. Without: the 50 cheapest,
+        narrowed to 5 across price segments (``pick_diverse_tires``).
+        """
+        columns = self._networks.get(network)
+        if columns is None:
+            return None
+        skey = season_key(season)
+        bkey = brand.lower() if brand else None
+        size = (width, profile, diameter) if width and profile and diameter else None
+
+        if size is not None and bkey is None:
+            rows = columns.diverse.get((size, skey), ())
+            return [self._item(columns, row) for row in rows]
+
+        filters: list[tuple[list[Any], Any]] = []
+        postings: list[list[int]] = [columns.by_price]
+        for field, value, column in (
+            ("width", width, self._width),
+            ("profile", profile, self._profile),
+            ("diameter", diameter, self._diameter),
+            ("season", skey, self._season_key),
+            ("brand", bkey, self._brand_key),
+        ):
+            if value:
+                filters.append((column, value))
+                postings.append(columns.postings.get((field, value), []))
+        if size is not None:
+            postings.append(columns.postings.get(("size_brand", (size, bkey)), []))
+
+        # Walk the shortest posting list in price order until the limit is reached
+        limit = BRAND_LIMIT if bkey else DIVERSE_POOL
+        matches: list[int] = []
+        for row in min(postings, key=len):
+            if all(column[row] == value for column, value in filters):
+                matches.append(row)
+                if len(matches) == limit:
+                    break
+        if bkey is None:
+            return [self._item(columns, row) for row in self._diversify(columns, matches)]
+        return [self._item(columns, row) for row in matches]
+
+    def availability(self, sku: str, network: str) -> dict[str, Any] | None:
+        """Stock of *sku* in *network*, or None if the index has no stock row for it."""
+        row = self._row_by_sku.get(sku)
+        columns = self._networks.get(network)
+        if row is None or columns is None or columns.stock[row] == _NO_STOCK_ROW:
+            return None
+        price = columns.price[row]
+        return {
+            "available": columns.stock[row] > 0,
+            "quantity": columns.stock[row],
+            "price": None if price == _NO_PRICE else price,
+            "country": columns.country[row],
+            "year": columns.year[row],
+        }
+
+
+class CatalogIndexStore(IndexStore):
+    """Builds and holds this process's current ``CatalogIndex``."""
+
+    channel = INVALIDATE_CHANNEL
+    refresh_interval = _REFRESH_INTERVAL
+    index: CatalogIndex | None
+
+    async def _build(self, version: int) -> CatalogIndex:
+        products, stock = await self._load()
+        # Building is pure CPU; keep it off the event loop thread
+        return await asyncio.to_thread(CatalogIndex, products, stock, version=version)
+
+    def _on_built(self, index: CatalogIndex, elapsed_ms: float) -> None:
+        catalog_index_skus.set(len(index))
+        catalog_index_rebuild_ms.observe(elapsed_ms)
+        logger.info(
+            "catalog_index: v%d built (%d SKUs, networks: %s)",
+            index.version,
+            len(index),
+            ", ".join(sorted(index.networks)) or "-",
+        )
+
+    async def _load(self) -> tuple[list[Any], list[Any]]:
+        """Fetch product and stock rows in partitions, yielding to the loop between them."""
+        products: list[Any] = []
+        stock: list[Any] = []
+        async with self._engine.connect() as conn:
+            for sql, rows in ((_PRODUCTS_SQL, products), (_STOCK_SQL, stock)):
+                result = await conn.stream(text(sql))
+                async for partition in result.partitions(_FETCH_PARTITION):
+                    rows.extend(tuple(row) for row in partition)
+                    await asyncio.sleep(0)
+        return products, stock
@@ -4,7 +4,8 @@ Integrates with the tire shop's REST API for product search,
 availability checks, and order management.
 
 MVP: search_tires and check_availability can use PostgreSQL + Redis
-(synced from 1C) when db_engine/onec_client are provided.
+(synced from 1C) when db_engine/onec_client are provided, answered from the
+in-memory catalog index (``catalog_index``) once it is built.
 Falls back to HTTP calls if not (backward compat).
 """
 
@@ -14,26 +15,26 @@ import asyncio
 import json
 import logging
 import uuid
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 from aiobreaker import CircuitBreaker, CircuitBreakerError
 
-logger = logging.getLogger(__name__)
+from src.monitoring.metrics import catalog_index_lookups_total, vehicle_index_lookups_total
+from src.store_client.catalog_index import (
+    BRAND_LIMIT,
+    DIVERSE_POOL,
+    SEASON_TO_DB,
+    pick_diverse_tires,
+)
+from src.store_client.vehicle_index import format_tire_size as _format_tire_size
+from src.store_client.vehicle_index import select_year
 
+if TYPE_CHECKING:
+    from src.store_client.catalog_index import CatalogIndex, CatalogIndexStore
+    from src.store_client.vehicle_index import VehicleIndexStore
 
-def _format_tire_size(row: Any) -> str:
-    """Format a tire size row as '235/65 R17' with optional axle suffix."""
-    diameter = row["diameter"]
-    # Show integer diameter when possible (17 not 17.0)
-    d_str = str(int(diameter)) if diameter == int(diameter) else str(diameter)
-    size = f"{row['width']}/{row['height']} R{d_str}"
-    axle = row.get("axle", 0)
-    if axle == 1:
-        size += " (перед)"
-    elif axle == 2:
-        size += " (зад)"
-    return size
+logger = logging.getLogger(__name__)
 
 
 # Retry config
@@ -68,6 +69,8 @@ class StoreClient:
         db_engine: Any = None,
         redis: Any = None,
         stock_cache_ttl: int = 300,
+        catalog_index: CatalogIndexStore | None = None,
+        vehicle_index: VehicleIndexStore | None = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
@@ -80,6 +83,10 @@ class StoreClient:
         self._db_engine = db_engine
         self._redis = redis
         self._stock_cache_ttl = stock_cache_ttl
+        # Shared in-memory catalog index (rebuilt after each 1C sync)
+        self._catalog_index = catalog_index
+        # Shared in-memory vehicle tire-size index (rebuilt after each import)
+        self._vehicle_index = vehicle_index
 
     async def open(self) -> None:
         """Open the HTTP session with connection pooling."""
@@ -550,14 +557,20 @@ class StoreClient:
     ) -> dict[str, Any]:
         """Look up factory tire sizes for a vehicle.
 
-        Uses the vehicle tire size database (migration 014).
+        Uses the vehicle tire size database (migration 014), answered from
+        the in-memory vehicle index once it is built.
         Falls back gracefully if DB is unavailable.
         """
+        index = self._vehicle_index.index if self._vehicle_index is not None else None
+        if index is not None:
+            return index.lookup(brand, model, year)
+
         if self._db_engine is None:
             return {"found": False, "message": "База авто тимчасово недоступна"}
 
         from sqlalchemy import text
 
+        vehicle_index_lookups_total.labels(outcome="db").inc()
         engine = self._db_engine
 
         async with engine.connect() as conn:
@@ -586,14 +599,7 @@ class StoreClient:
             years = [r[0] for r in years_result]
 
             # 4. Query tire sizes
-            if year and year in years:
-                selected_year = year
-            elif year:
-                # Year not in DB — use closest available
-                selected_year = min(years, key=lambda y: abs(y - year)) if years else 0
-            else:
-                # No year specified — use most recent
-                selected_year = years[0] if years else 0
+            selected_year = select_year(years, year)
 
             size_params: dict[str, Any] = {"mid": model_row["id"]}
             year_filter = ""
@@ -701,50 +707,13 @@ class StoreClient:
 
     # --- 1C / PostgreSQL / Redis helpers (MVP) ---
 
-    @staticmethod
-    def _pick_diverse_tires(rows: list[Any], target: int = 5) -> list[Any]:
-        """Pick tires from different price segments for a balanced overview.
-
-        Selects 1 budget + 1-2 mid-range + 1-2 premium, one per manufacturer,
-        so the customer sees the full price range.
-        """
-        if not rows:
-            return rows
-
-        # Deduplicate by manufacturer (keep cheapest per brand)
-        seen_brands: dict[str, Any] = {}
-        for r in rows:
-            brand = r["brand"]
-            if brand not in seen_brands:
-                seen_brands[brand] = r
-        unique = list(seen_brands.values())
-
-        if len(unique) <= target:
-            return unique
-
-        # Split into 3 price segments
-        prices = sorted(r["price"] for r in unique if r["price"] > 0)
-        if len(prices) < 3:
-            return unique[:target]
+    _pick_diverse_tires = staticmethod(pick_diverse_tires)
 
-        p33 = prices[len(prices) // 3]
-        p66 = prices[2 * len(prices) // 3]
-
-        budget = [r for r in unique if 0 < r["price"] <= p33]
-        mid = [r for r in unique if p33 < r["price"] <= p66]
-        premium = [r for r in unique if r["price"] > p66]
-
-        # Pick from each segment
-        result: list[Any] = []
-        for segment, count in [(budget, 1), (mid, 2), (premium, 2)]:
-            result.extend(segment[:count])
-
-        # Fill remaining slots if a segment was too small
-        remaining = [r for r in unique if r not in result]
-        while len(result) < target and remaining:
-            result.append(remaining.pop(0))
-
-        return sorted(result, key=lambda r: r["price"])
+    def _current_catalog_index(self) -> CatalogIndex | None:
+        """The latest in-memory catalog index, or None until one is built."""
+        if self._catalog_index is None:
+            return None
+        return self._catalog_index.index
 
     async def _search_tires_db(self, network: str = "", **params: Any) -> dict[str, Any]:
         """Search tires in PostgreSQL catalog (synced from 1C)."""
@@ -761,30 +730,45 @@ class StoreClient:
         if not network:
             network = "ProKoleso"
 
+        width = int(params["width"]) if params.get("width") else None
+        profile = int(params["profile"]) if params.get("profile") else None
+        diameter = int(params["diameter"]) if params.get("diameter") else None
+
+        # In-memory catalog index: same answer without touching PostgreSQL
+        index = self._current_catalog_index()
+        if index is not None:
+            index_rows = index.search(
+                network,
+                width=width,
+                profile=profile,
+                diameter=diameter,
+                season=params.get("season"),
+                brand=params.get("brand"),
+            )
+            if index_rows is not None:
+                catalog_index_lookups_total.labels(operation="search", source="index").inc()
+                return self._format_catalog_rows(index_rows)
+        catalog_index_lookups_total.labels(operation="search", source="db").inc()
+
         engine = self._db_engine
 
         # Build WHERE clauses dynamically
         conditions = []
         bind_params: dict[str, Any] = {"network": network}
 
-        if params.get("width"):
+        if width:
             conditions.append("p.width = :width")
-            bind_params["width"] = int(params["width"])
-        if params.get("profile"):
+            bind_params["width"] = width
+        if profile:
             conditions.append("p.profile = :profile")
-            bind_params["profile"] = int(params["profile"])
-        if params.get("diameter"):
+            bind_params["profile"] = profile
+        if diameter:
             conditions.append("p.diameter = :diameter")
-            bind_params["diameter"] = int(params["diameter"])
+            bind_params["diameter"] = diameter
         if params.get("season"):
             # LLM sends English enum (summer/winter/all_season),
             # but DB may have Ukrainian values from 1C sync
-            _season_to_db = {
-                "summer": "літня",
-                "winter": "зимова",
-                "all_season": "всесезонна",
-            }
-            db_season = _season_to_db.get(params["season"], params["season"])
+            db_season = SEASON_TO_DB.get(params["season"], params["season"])
             conditions.append("m.seasonality IN (:season, :season_alt)")
             bind_params["season"] = params["season"]
             bind_params["season_alt"] = db_season
@@ -798,11 +782,11 @@ class StoreClient:
         # Otherwise, pick diverse results across price segments (budget/mid/premium)
         # so the customer sees the full range, not just the cheapest Chinese brands.
         if params.get("brand"):
-            limit = 5
+            limit = BRAND_LIMIT
             order = "s.price ASC NULLS LAST"
         else:
             # Fetch more rows to sample from different price segments
-            limit = 50
+            limit = DIVERSE_POOL
             order = "s.price ASC NULLS LAST"
 
         query = text(f"""
@@ -828,6 +812,11 @@ class StoreClient:
         if not params.get("brand") and len(rows) > 5:
             rows = self._pick_diverse_tires(rows)
 
+        return self._format_catalog_rows(rows)
+
+    @staticmethod
+    def _format_catalog_rows(rows: list[Any]) -> dict[str, Any]:
+        """Shape catalog search rows (SQL or index) as the ``search_tires`` result."""
         items = [
             {
                 "id": row["id"],
@@ -849,7 +838,7 @@ class StoreClient:
     async def _check_availability_1c(
         self, product_id: str, query: str, network: str = ""
     ) -> dict[str, Any]:
-        """Check availability via Redis cache → PostgreSQL fallback."""
+        """Check availability via catalog index → Redis cache → PostgreSQL fallback."""
         from sqlalchemy import text
 
         if not network:
@@ -875,12 +864,22 @@ class StoreClient:
         if sku.isdigit() and len(sku) < 11:
             sku = sku.zfill(11)
 
-        # 1) Try Redis cache first (fastest)
+        # 1) In-memory catalog index (no I/O)
+        index = self._current_catalog_index()
+        if index is not None:
+            indexed = index.availability(sku, network)
+            if indexed is not None:
+                catalog_index_lookups_total.labels(operation="availability", source="index").inc()
+                return indexed
+
+        # 2) Redis cache
         stock_data = await self._get_stock_from_redis(sku, network=network)
         if stock_data is not None:
+            catalog_index_lookups_total.labels(operation="availability", source="redis").inc()
             return stock_data
 
-        # 2) Fallback to PostgreSQL (last synced data)
+        # 3) Fallback to PostgreSQL (last synced data)
+        catalog_index_lookups_total.labels(operation="availability", source="db").inc()
         engine = self._db_engine
         async with engine.connect() as conn:
             result = await conn.execute(
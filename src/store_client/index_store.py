@@ -0,0 +1,119 @@
+"""In-memory lookup indexes kept current over Redis pub/sub.
+
+Base for the process-local catalog and vehicle indexes: ``rebuild`` loads
+the data afresh and swaps the new index in atomically (the previous one
+stays on failure); ``run`` rebuilds on every message on the store's
+channel and on a slow backstop timer. Until the first build ``index`` is
+None and callers query PostgreSQL.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import contextlib
+import logging
+import time
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_RESUBSCRIBE_DELAY = 5.0  # seconds
+
+
+async def publish(channel: str, reason: str, redis: Redis | None = None) -> None:
+    """Tell every process to rebuild the index behind *channel* (best-effort).
+
+    Uses the shared Redis client when *redis* is not given.
+    """
+    try:
+        if redis is None:
+            from src.core.redis_client import get_redis
+
+            redis = await get_redis()
+        await redis.publish(channel, reason)
+    except Exception:
+        logger.debug("%s: failed to publish change (%s)", channel, reason, exc_info=True)
+
+
+class IndexStore(abc.ABC):
+    """Builds and holds this process's current index.
+
+    Subclasses set ``channel`` / ``refresh_interval`` and implement ``_build``
+    (and narrow the type of ``index``).
+
+    Args:
+        engine: SQLAlchemy async engine.
+        redis: Redis client (pub/sub subscriber).
+    """
+
+    channel: ClassVar[str]
+    refresh_interval: ClassVar[float]  # seconds — backstop rebuild
+
+    def __init__(self, engine: AsyncEngine, redis: Redis) -> None:
+        self._engine = engine
+        self._redis = redis
+        self._version = 0
+        self._built_at = 0.0
+        self._lock = asyncio.Lock()
+        self.index: Any = None
+
+    @abc.abstractmethod
+    async def _build(self, version: int) -> Any:
+        """Load the data and build index number *version*."""
+
+    def _on_built(self, index: Any, elapsed_ms: float) -> None:  # noqa: B027
+        """Record metrics / log a freshly swapped-in index."""
+
+    async def rebuild(self) -> Any:
+        """Load everything afresh and swap the index in atomically.
+
+        On failure the previous index (if any) stays in place.
+        """
+        async with self._lock:
+            t0 = time.monotonic()
+            try:
+                index = await self._build(self._version + 1)
+            except Exception:
+                logger.warning("%s: rebuild failed", self.channel, exc_info=True)
+                return self.index
+            self._version += 1
+            self._built_at = time.monotonic()
+            self.index = index
+            self._on_built(index, (self._built_at - t0) * 1000)
+            return index
+
+    async def run(self) -> None:
+        """Keep the index current via Redis pub/sub (runs until cancelled).
+
+        Rebuilds after each (re)subscribe — so changes made while
+        disconnected are not missed — on every message on ``channel``, and
+        every ``refresh_interval`` seconds.
+        """
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                await self.rebuild()
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=self.refresh_interval
+                    )
+                    if message is None:
+                        if time.monotonic() - self._built_at < self.refresh_interval:
+                            continue
+                    else:
+                        logger.info("%s: change published (%r)", self.channel, message.get("data"))
+                    await self.rebuild()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("%s: invalidation subscription lost", self.channel, exc_info=True)
+            finally:
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()  # type: ignore[no-untyped-call]
+            await asyncio.sleep(_RESUBSCRIBE_DELAY)
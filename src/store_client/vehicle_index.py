@@ -0,0 +1,400 @@
+"""In-process vehicle tire-size index for ``get_vehicle_tire_sizes``.
+
+The vehicle database (migration 014: brands → models → kits → tire sizes)
+is loaded into an immutable ``VehicleIndex``. Per model it holds the
+distinct kit years (newest first) and, per year and over all years, the
+formatted factory (``stock_sizes``) and acceptable (``acceptable_sizes``)
+sizes — so a lookup is two name matches and a dict access instead of four
+queries.
+
+Names are matched the way callers actually say them: exact
+(case-insensitive, whitespace-normalised) first, then by a phonetic key
+that transliterates Cyrillic and folds common spelling variants ("Тойота"
+→ Toyota, "Фольксваген" → Volkswagen, "Камрі" → Camry), then by trigram
+similarity computed like pg_trgm's ``similarity()`` over both the raw name
+and the phonetic key, above the same 0.3 threshold the SQL used. A
+phonetic key shared by different names (GLC / GLK) answers nothing by
+itself; such queries go on to the trigram ranking.
+
+``scripts.import_vehicle_db.import_data`` calls ``publish_change`` after
+every import; ``VehicleIndexStore.run`` rebuilds the index on each message
+and on a slow backstop timer. Until the first index is built
+``StoreClient`` queries PostgreSQL as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from sqlalchemy import text
+
+from src.monitoring.metrics import (
+    vehicle_index_lookups_total,
+    vehicle_index_match_similarity,
+    vehicle_index_matches_total,
+    vehicle_index_models,
+    vehicle_index_rebuild_ms,
+)
+from src.store_client.index_store import IndexStore, publish
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+INVALIDATE_CHANNEL = "vehicle_index:invalidate"
+
+_REFRESH_INTERVAL = 6 * 3600.0  # seconds — backstop; the data only changes on import
+_FETCH_PARTITION = 10_000  # rows per fetch, so a rebuild yields to live calls
+_SIMILARITY_THRESHOLD = 0.3  # as in the pg_trgm queries this replaces
+_YEARS_SHOWN = 10
+
+_BRANDS_SQL = "SELECT id, name FROM vehicle_brands"
+_MODELS_SQL = "SELECT id, brand_id, name FROM vehicle_models"
+_SIZES_SQL = """
+    SELECT k.model_id, k.year, ts.width, ts.height, ts.diameter, ts.type, ts.axle
+    FROM vehicle_kits k
+    LEFT JOIN vehicle_tire_sizes ts ON ts.kit_id = k.id
+"""
+
+_CYRILLIC_TO_LATIN = str.maketrans(
+    {
+        "а": "a", "б": "b", "в": "v", "г": "h", "ґ": "g", "д": "d", "е": "e",
+        "є": "ye", "ё": "yo", "ж": "zh", "з": "z", "и": "y", "і": "i", "ї": "yi",
+        "й": "y", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o", "п": "p",
+        "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f", "х": "h", "ц": "ts",
+        "ч": "ch", "ш": "sh", "щ": "shch", "ъ": "", "ы": "y", "ь": "", "э": "e",
+        "ю": "yu", "я": "ya", "'": "", "’": "", "ʼ": "",
+    }
+)  # fmt: skip
+
+# Applied in order to the transliterated name: letters that sound alike in
+# brand names as spoken in Ukrainian collapse to one
+_PHONETIC_RULES: tuple[tuple[re.Pattern[str], str], ...] = tuple(
+    (re.compile(pattern), repl)
+    for pattern, repl in (
+        ("sch|sh", "s"),
+        ("chr", "kr"),
+        ("ch", "s"),
+        ("ph", "f"),
+        ("ck", "k"),
+        ("c(?=[eiy])", "s"),
+        ("c", "k"),
+        ("x", "ks"),
+        ("q", "k"),
+        ("[wf]", "v"),
+        ("[yj]", "i"),
+        ("g", "h"),
+        # Letters only: digits tell models apart (208 / 2008, 308 / 3008)
+        (r"([a-z])\1+", r"\1"),
+    )
+)
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+_AMBIGUOUS = -1  # phonetic key shared by different names
+
+
+async def publish_change(reason: str, redis: Redis | None = None) -> None:
+    """Tell every process to rebuild its vehicle index (best-effort).
+
+    Uses the shared Redis client when *redis* is not given.
+    """
+    await publish(INVALIDATE_CHANNEL, reason, redis)
+
+
+def format_tire_size(row: Any) -> str:
+    """Format a tire size row as '235/65 R17' with optional axle suffix."""
+    diameter = row["diameter"]
+    # Show integer diameter when possible (17 not 17.0)
+    d_str = str(int(diameter)) if diameter == int(diameter) else str(diameter)
+    size = f"{row['width']}/{row['height']} R{d_str}"
+    axle = row.get("axle", 0)
+    if axle == 1:
+        size += " (перед)"
+    elif axle == 2:
+        size += " (зад)"
+    return size
+
+
+def select_year(years: Sequence[int], year: int) -> int:
+    """The kit year to show sizes for: *year* itself, else the closest, else the newest."""
+    if year and year in years:
+        return year
+    if year:
+        # Year not in DB — use closest available
+        return min(years, key=lambda y: abs(y - year)) if years else 0
+    # No year specified — use most recent
+    return years[0] if years else 0
+
+
+def trigrams(value: str) -> frozenset[str]:
+    """Trigram set of *value* as pg_trgm builds it (words padded "  w ")."""
+    grams: set[str] = set()
+    for word in _WORD_RE.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def similarity(a: str, b: str) -> float:
+    """pg_trgm ``similarity(a, b)``: shared trigrams over all trigrams."""
+    ga, gb = trigrams(a), trigrams(b)
+    if not ga or not gb:
+        return 0.0
+    shared = len(ga & gb)
+    return shared / (len(ga) + len(gb) - shared)
+
+
+def normalize_name(name: str) -> str:
+    """Lowercased *name* with whitespace stripped and collapsed."""
+    return " ".join(name.lower().split())
+
+
+def phonetic_key(name: str) -> str:
+    """Spelling- and script-independent key of a vehicle name.
+
+    Lowercased, accents stripped, Cyrillic transliterated, separators
+    dropped ("RAV-4" = "Rav 4") and look-alike sounds folded.
+    """
+    value = unicodedata.normalize("NFKD", name.lower()).translate(_CYRILLIC_TO_LATIN)
+    value = "".join(ch for ch in value if ch.isascii() and ch.isalnum())
+    for pattern, repl in _PHONETIC_RULES:
+        value = pattern.sub(repl, value)
+    return value
+
+
+class NameMatch(NamedTuple):
+    id: int
+    name: str
+    kind: str  # exact, phonetic, fuzzy
+    similarity: float
+
+
+class _NameMatcher:
+    """Finds the best brand / model name for what the caller said.
+
+    Ties go to the lowest id, so a lookup is deterministic.
+    """
+
+    def __init__(self, entries: Iterable[tuple[int, str]]) -> None:
+        self._ids: list[int] = []
+        self._names: list[str] = []
+        self._exact: dict[str, int] = {}
+        self._phonetic: dict[str, int] = {}
+        # Per entry: trigrams of the lowercased name, of its phonetic key
+        self._grams: list[tuple[frozenset[str], frozenset[str]]] = []
+        self._postings: tuple[dict[str, list[int]], dict[str, list[int]]] = ({}, {})
+
+        for entry_id, name in sorted(entries):
+            i = len(self._ids)
+            self._ids.append(entry_id)
+            self._names.append(name)
+            key = phonetic_key(name)
+            normalized = normalize_name(name)
+            self._exact.setdefault(normalized, i)
+            if key:
+                first = self._phonetic.setdefault(key, i)
+                if first != _AMBIGUOUS and normalize_name(self._names[first]) != normalized:
+                    self._phonetic[key] = _AMBIGUOUS
+            grams = (trigrams(name), trigrams(key))
+            self._grams.append(grams)
+            for which, postings in enumerate(self._postings):
+                for gram in grams[which]:
+                    postings.setdefault(gram, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def match(self, query: str) -> NameMatch | None:
+        i = self._exact.get(normalize_name(query))
+        if i is not None:
+            return NameMatch(self._ids[i], self._names[i], "exact", 1.0)
+        key = phonetic_key(query)
+        i = self._phonetic.get(key) if key else None
+        if i is not None and i != _AMBIGUOUS:
+            return NameMatch(self._ids[i], self._names[i], "phonetic", 1.0)
+
+        best, best_score = -1, 0.0
+        for which, query_grams in enumerate((trigrams(query), trigrams(key))):
+            if not query_grams:
+                continue
+            postings = self._postings[which]
+            shared: Counter[int] = Counter()
+            for gram in query_grams:
+                shared.update(postings.get(gram, ()))
+            for i, count in shared.items():
+                score = count / (len(query_grams) + len(self._grams[i][which]) - count)
+                if score > best_score or (score == best_score and i < best):
+                    best, best_score = i, score
+        if best_score <= _SIMILARITY_THRESHOLD:
+            return None
+        return NameMatch(self._ids[best], self._names[best], "fuzzy", best_score)
+
+
+Sizes = tuple[tuple[str, ...], tuple[str, ...]]  # stock_sizes, acceptable_sizes
+
+
+@dataclass(frozen=True)
+class _Model:
+    years: tuple[int, ...]  # newest first
+    sizes: dict[int | None, Sizes]  # by kit year; None = all years
+
+
+class VehicleIndex:
+    """Immutable view of the vehicle database for tire-size lookups.
+
+    Args:
+        brands: ``(id, name)`` rows of ``vehicle_brands``.
+        models: ``(id, brand_id, name)`` rows of ``vehicle_models``.
+        sizes: ``(model_id, year, width, height, diameter, type, axle)``
+            rows — one per kit with the size columns NULL for a kit
+            without sizes.
+        version: Build counter of the owning store.
+    """
+
+    def __init__(
+        self,
+        brands: Iterable[Sequence[Any]],
+        models: Iterable[Sequence[Any]],
+        sizes: Iterable[Sequence[Any]],
+        *,
+        version: int = 0,
+    ) -> None:
+        self.version = version
+        self._brand_names: dict[int, str] = {row[0]: row[1] for row in brands}
+        self._brands = _NameMatcher(self._brand_names.items())
+
+        model_names: dict[int, list[tuple[int, str]]] = defaultdict(list)
+        for model_id, brand_id, name in models:
+            model_names[brand_id].append((model_id, name))
+        self._models_by_brand = {
+            brand_id: _NameMatcher(entries) for brand_id, entries in model_names.items()
+        }
+
+        years: dict[int, set[int]] = defaultdict(set)
+        rows: dict[tuple[int, int], set[tuple[Any, ...]]] = defaultdict(set)
+        for model_id, year, width, height, diameter, size_type, axle in sizes:
+            years[model_id].add(year)
+            if width is not None:
+                # Sort key of the SQL (type, width), made total
+                rows[model_id, year].add((size_type, width, height, diameter, axle))
+
+        self._models: dict[int, _Model] = {}
+        for model_id, model_years in years.items():
+            by_year: dict[int | None, Sizes] = {}
+            every: set[tuple[Any, ...]] = set()
+            for year in model_years:
+                year_rows = rows.get((model_id, year), set())
+                by_year[year] = self._format(year_rows)
+                every |= year_rows
+            by_year[None] = self._format(every)
+            self._models[model_id] = _Model(tuple(sorted(model_years, reverse=True)), by_year)
+
+    def __len__(self) -> int:
+        return sum(len(matcher) for matcher in self._models_by_brand.values())
+
+    @staticmethod
+    def _format(rows: set[tuple[Any, ...]]) -> Sizes:
+        stock: list[str] = []
+        acceptable: list[str] = []
+        for size_type, width, height, diameter, axle in sorted(rows):
+            size = format_tire_size(
+                {"width": width, "height": height, "diameter": diameter, "axle": axle}
+            )
+            (stock if size_type == 1 else acceptable).append(size)
+        return tuple(stock), tuple(acceptable)
+
+    def match_brand(self, brand: str) -> NameMatch | None:
+        return self._record("brand", self._brands.match(brand))
+
+    def match_model(self, brand_id: int, model: str) -> NameMatch | None:
+        matcher = self._models_by_brand.get(brand_id)
+        return self._record("model", matcher.match(model) if matcher else None)
+
+    @staticmethod
+    def _record(level: str, match: NameMatch | None) -> NameMatch | None:
+        if match is not None:
+            vehicle_index_matches_total.labels(level=level, kind=match.kind).inc()
+            if match.kind == "fuzzy":
+                vehicle_index_match_similarity.labels(level=level).observe(match.similarity)
+        return match
+
+    def lookup(self, brand: str, model: str, year: int = 0) -> dict[str, Any]:
+        """Same answer as ``StoreClient.get_vehicle_tire_sizes`` from PostgreSQL."""
+        brand_match = self.match_brand(brand)
+        if brand_match is None:
+            vehicle_index_lookups_total.labels(outcome="brand_miss").inc()
+            return {"found": False, "message": f"Марку '{brand}' не знайдено в базі"}
+
+        model_match = self.match_model(brand_match.id, model)
+        if model_match is None:
+            vehicle_index_lookups_total.labels(outcome="model_miss").inc()
+            return {
+                "found": False,
+                "brand": brand_match.name,
+                "message": f"Модель '{model}' не знайдено для {brand_match.name}",
+            }
+
+        entry = self._models.get(model_match.id, _Model((), {None: ((), ())}))
+        selected_year = select_year(entry.years, year)
+        stock_sizes, acceptable_sizes = entry.sizes.get(selected_year or None, ((), ()))
+        if not stock_sizes and not acceptable_sizes:
+            vehicle_index_lookups_total.labels(outcome="no_sizes").inc()
+            return {
+                "found": False,
+                "brand": brand_match.name,
+                "model": model_match.name,
+                "message": "Розміри шин не знайдено",
+            }
+
+        vehicle_index_lookups_total.labels(outcome="found").inc()
+        result: dict[str, Any] = {
+            "found": True,
+            "brand": brand_match.name,
+            "model": model_match.name,
+            "years": list(entry.years[:_YEARS_SHOWN]),
+            "stock_sizes": list(stock_sizes),
+        }
+        if acceptable_sizes:
+            result["acceptable_sizes"] = list(acceptable_sizes)
+        if selected_year:
+            result["selected_year"] = selected_year
+        return result
+
+
+class VehicleIndexStore(IndexStore):
+    """Builds and holds this process's current ``VehicleIndex``."""
+
+    channel = INVALIDATE_CHANNEL
+    refresh_interval = _REFRESH_INTERVAL
+    index: VehicleIndex | None
+
+    async def _build(self, version: int) -> VehicleIndex:
+        brands, models, sizes = await self._load()
+        # Building is pure CPU; keep it off the event loop thread
+        return await asyncio.to_thread(VehicleIndex, brands, models, sizes, version=version)
+
+    def _on_built(self, index: VehicleIndex, elapsed_ms: float) -> None:
+        vehicle_index_models.set(len(index))
+        vehicle_index_rebuild_ms.observe(elapsed_ms)
+        logger.info("vehicle_index: v%d built (%d models)", index.version, len(index))
+
+    async def _load(self) -> tuple[list[Any], list[Any], list[Any]]:
+        """Fetch the vehicle tables in partitions, yielding to the loop between them."""
+        tables: tuple[list[Any], list[Any], list[Any]] = ([], [], [])
+        async with self._engine.connect() as conn:
+            for sql, rows in zip((_BRANDS_SQL, _MODELS_SQL, _SIZES_SQL), tables, strict=True):
+                result = await conn.stream(text(sql))
+                async for partition in result.partitions(_FETCH_PARTITION):
+                    rows.extend(tuple(row) for row in partition)
+                    await asyncio.sleep(0)
+        return tables
@@ -50,6 +50,9 @@ class STTConfig:
     speech_end_timeout_ms: int = 0
     # Pipeline-side buffer for merging fragmented finals. Read by pipeline, not by STT engine.
     transcript_buffer_sec: float = 1.2
+    # Speculative LLM turn on stable interims. Read by pipeline, not by STT engine.
+    speculative_turn_enabled: bool = False
+    speculative_stable_ms: int = 300
 
 
 @runtime_checkable
@@ -14,15 +14,25 @@ utterance was asking for a date). Rules live in Redis so a content
 manager can add/remove them without a deploy.
 
 Storage: Redis key ``stt:corrections`` → JSON list of rule objects.
+
+Runtime: rules are compiled once into a ``CompiledCorrections`` bundle —
+bucketed per ``context_hint`` and fronted by a literal prefilter, so a
+transcript only runs the regexes whose required text actually occurs in
+it. Writers publish on ``stt:corrections:invalidate`` and every process
+running ``listen_for_invalidations`` reloads the bundle immediately.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import logging
 import re
 import time
 import uuid
+from collections import deque
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -31,7 +41,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 REDIS_KEY = "stt:corrections"
-_CACHE_TTL = 60.0  # seconds
+INVALIDATE_CHANNEL = "stt:corrections:invalidate"
+_CACHE_TTL = 60.0  # seconds (fallback poll when not subscribed)
+_RESUBSCRIBE_DELAY = 5.0  # seconds
 
 # Valid context_hint values. ``None`` / empty = applies to any turn.
 VALID_CONTEXTS: tuple[str, ...] = (
@@ -45,10 +57,22 @@ VALID_CONTEXTS: tuple[str, ...] = (
 )
 
 # ─── In-process cache ─────────────────────────────────────
-# (rules, compiled patterns aligned by index) — invalidated on write.
+# Raw rules plus the compiled bundle built from them. Refreshed on every
+# write in this process and, when ``listen_for_invalidations`` is running,
+# on every write in any other process (pub/sub). The ``_CACHE_TTL`` poll is
+# only the fallback for processes without a live subscription.
 _cache_rules: list[dict[str, Any]] = []
-_cache_patterns: list[re.Pattern[str] | None] = []
+_cache_bundle: CompiledCorrections | None = None
 _cache_ts: float = 0.0
+_subscribed: bool = False
+
+# (pattern, flags) → (compiled regex or None, required literals or None).
+# Survives reloads so that adding one rule does not recompile the others.
+_pattern_cache: dict[tuple[str, int], tuple[re.Pattern[str] | None, tuple[str, ...] | None]] = {}
+
+
+def _rule_flags(rule: dict[str, Any]) -> int:
+    return re.IGNORECASE if "i" in str(rule.get("flags") or "").lower() else 0
 
 
 def _compile_rule(rule: dict[str, Any]) -> re.Pattern[str] | None:
@@ -56,12 +80,8 @@ def _compile_rule(rule: dict[str, Any]) -> re.Pattern[str] | None:
     pattern = rule.get("pattern") or ""
     if not pattern:
         return None
-    flags = 0
-    flag_str = str(rule.get("flags") or "")
-    if "i" in flag_str.lower():
-        flags |= re.IGNORECASE
     try:
-        return re.compile(pattern, flags)
+        return re.compile(pattern, _rule_flags(rule))
     except re.error as exc:
         logger.warning(
             "stt_corrections: invalid regex in rule id=%s: %s (%s)",
@@ -100,6 +120,245 @@ def validate_rule(rule: dict[str, Any]) -> None:
         )
 
 
+# ─── Compiled bundle ──────────────────────────────────────
+
+# Private CPython modules (3.11+) with no public equivalent: the case-fold
+# equivalences and the regex parser used to extract required literals.
+try:
+    from re import _casefix as _re_casefix  # type: ignore[attr-defined]
+    from re import _parser as _re_parser  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover — falls back to the unfiltered path
+    _re_casefix = None
+    _re_parser = None
+
+
+def _build_fold_table() -> dict[int, str]:
+    """Map every char ``re.IGNORECASE`` treats as equal to one representative.
+
+    ``re`` compares lowercased chars plus a few extra equivalences
+    (``ı``/``i``, ``ſ``/``s``, old Cyrillic ``ᲀ``/``в`` …); folding both the
+    text and the literals through this table keeps the prefilter from ever
+    rejecting a rule the regex would match.
+    """
+    table: dict[int, str] = {}
+    if _re_casefix is None:
+        return table
+    groups: dict[int, set[int]] = {}
+    for key, extras in _re_casefix._EXTRA_CASES.items():
+        members = {key, *extras}
+        for m in list(members):
+            members |= groups.get(m, set())
+        for m in members:
+            groups[m] = members
+    for member, members in groups.items():
+        canonical = min(members)
+        if member != canonical:
+            table[member] = chr(canonical)
+    return table
+
+
+_PRE_LOWER = {0x130: "i"}  # "İ".lower() is two chars; re lowercases it to "i"
+_FOLD_TABLE = _build_fold_table()
+
+
+def _fold(text: str) -> str:
+    """Case-fold *text* the way ``re.IGNORECASE`` compares characters."""
+    return text.translate(_PRE_LOWER).lower().translate(_FOLD_TABLE)
+
+
+def _required_literals(items: Any) -> tuple[str, ...] | None:
+    """Literals one of which every match of the parsed regex must contain.
+
+    Walks the top-level sequence of ``re._parser`` output: runs of plain
+    characters, groups, repeats with ``min >= 1`` and alternations whose
+    every branch has a literal. Returns the alternative set with the longest
+    shortest member, or ``None`` when nothing is required (rule always runs).
+    """
+    consts = _re_parser
+    best: tuple[str, ...] | None = None
+    run: list[str] = []
+
+    def consider(options: tuple[str, ...] | None) -> None:
+        nonlocal best
+        if options and (best is None or min(map(len, options)) > min(map(len, best))):
+            best = options
+
+    for op, av in items:
+        if op is consts.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            consider(("".join(run),))
+            run = []
+        if op is consts.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av
+            if not add_flags and not del_flags:
+                consider(_required_literals(sub))
+        elif op is consts.BRANCH:
+            branches = [_required_literals(b) for b in av[1]]
+            if all(branches):
+                consider(tuple(lit for b in branches for lit in b))  # type: ignore[union-attr]
+        elif op in (consts.MAX_REPEAT, consts.MIN_REPEAT, consts.POSSESSIVE_REPEAT):
+            lo, _hi, sub = av
+            if lo >= 1:
+                consider(_required_literals(sub))
+    if run:
+        consider(("".join(run),))
+    return best
+
+
+def _prefilter_literals(pattern: str, flags: int) -> tuple[str, ...] | None:
+    if _re_parser is None:
+        return None
+    try:
+        literals = _required_literals(_re_parser.parse(pattern, flags))
+    except Exception:
+        return None
+    if not literals:
+        return None
+    return tuple(dict.fromkeys(_fold(lit) for lit in literals))
+
+
+def _compile_cached(rule: dict[str, Any]) -> tuple[re.Pattern[str] | None, tuple[str, ...] | None]:
+    key = (rule.get("pattern") or "", _rule_flags(rule))
+    entry = _pattern_cache.get(key)
+    if entry is None:
+        compiled = _compile_rule(rule)
+        literals = _prefilter_literals(*key) if compiled is not None else None
+        entry = _pattern_cache[key] = (compiled, literals)
+    return entry
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledRule:
+    rule_id: str
+    pattern: re.Pattern[str]
+    replacement: str
+    literals: tuple[str, ...] | None
+
+
+class _Bucket:
+    """Rules applicable to one ``context_hint``, in list order, plus their prefilter.
+
+    The prefilter is an Aho-Corasick automaton over the folded required
+    literals: one pass over the transcript yields every rule that can match.
+    """
+
+    def __init__(self, rules: list[_CompiledRule]) -> None:
+        self.rules = rules
+        self._unfiltered = frozenset(i for i, r in enumerate(rules) if r.literals is None)
+        goto: list[dict[str, int]] = [{}]
+        out: list[set[int]] = [set()]
+        for pos, rule in enumerate(rules):
+            for lit in rule.literals or ():
+                node = 0
+                for ch in lit:
+                    nxt = goto[node].get(ch)
+                    if nxt is None:
+                        nxt = goto[node][ch] = len(goto)
+                        goto.append({})
+                        out.append(set())
+                    node = nxt
+                out[node].add(pos)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[child] = target if target != child else 0
+                out[child] |= out[fail[child]]
+        self._goto = goto
+        self._fail = fail
+        self._out = [frozenset(o) for o in out]
+
+    def candidates(self, text: str) -> set[int]:
+        """Positions of rules that can match *text* (all literal-free rules included)."""
+        found = set(self._unfiltered)
+        if len(self._goto) == 1:
+            return found
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for ch in _fold(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found |= out[node]
+        return found
+
+
+class CompiledCorrections:
+    """Correction rules compiled for repeated application.
+
+    Rules are bucketed per ``context_hint`` on first use (a rule with an
+    empty or ``"any"`` hint lands in every bucket), and each bucket only
+    runs the regexes whose required literal occurs in the text. Semantics
+    are identical to applying the enabled rules one by one in list order.
+    """
+
+    def __init__(self, rules: list[dict[str, Any]]) -> None:
+        self._rules: list[tuple[str, _CompiledRule]] = []
+        for rule in rules:
+            if not rule.get("enabled", True):
+                continue
+            pattern, literals = _compile_cached(rule)
+            if pattern is None:
+                continue
+            self._rules.append(
+                (
+                    str(rule.get("context_hint") or "").strip().lower(),
+                    _CompiledRule(
+                        rule_id=str(rule.get("id") or "?"),
+                        pattern=pattern,
+                        replacement=rule.get("replacement", ""),
+                        literals=literals,
+                    ),
+                )
+            )
+        self._buckets: dict[str, _Bucket] = {}
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def _bucket(self, ctx: str) -> _Bucket:
+        bucket = self._buckets.get(ctx)
+        if bucket is None:
+            bucket = self._buckets[ctx] = _Bucket(
+                [r for rule_ctx, r in self._rules if rule_ctx in ("", "any", ctx)]
+            )
+        return bucket
+
+    def apply(self, text: str, context_hint: str | None = None) -> tuple[str, list[str]]:
+        """Apply the rules to *text*. Returns (new_text, applied_rule_ids)."""
+        if not text or not self._rules:
+            return text, []
+        bucket = self._bucket((context_hint or "").strip().lower())
+        pending = sorted(bucket.candidates(text))
+        result = text
+        applied: list[str] = []
+        i = 0
+        while i < len(pending):
+            pos = pending[i]
+            i += 1
+            rule = bucket.rules[pos]
+            try:
+                new_result, count = rule.pattern.subn(rule.replacement, result)
+            except re.error:
+                continue
+            if count > 0 and new_result != result:
+                result = new_result
+                applied.append(rule.rule_id)
+                # A replacement can introduce text that later rules match
+                pending = sorted(p for p in bucket.candidates(result) if p > pos)
+                i = 0
+        return result, applied
+
+
 # ─── Redis persistence ────────────────────────────────────
 
 
@@ -108,10 +367,10 @@ async def load_corrections(redis: Redis, *, force: bool = False) -> list[dict[st
 
     Returns a fresh list copy — callers may mutate it safely.
     """
-    global _cache_rules, _cache_patterns, _cache_ts
+    global _cache_rules, _cache_bundle, _cache_ts
 
     now = time.monotonic()
-    if not force and _cache_rules and (now - _cache_ts) < _CACHE_TTL:
+    if not force and _cache_bundle is not None and (_subscribed or now - _cache_ts < _CACHE_TTL):
         return list(_cache_rules)
 
     rules: list[dict[str, Any]] = []
@@ -124,12 +383,24 @@ async def load_corrections(redis: Redis, *, force: bool = False) -> list[dict[st
     except Exception:
         logger.debug("stt_corrections: failed to read from Redis", exc_info=True)
 
+    bundle = CompiledCorrections(rules)
+    live = {(r.get("pattern") or "", _rule_flags(r)) for r in rules}
+    for key in [k for k in _pattern_cache if k not in live]:
+        del _pattern_cache[key]
+
     _cache_rules = rules
-    _cache_patterns = [_compile_rule(r) for r in rules]
+    _cache_bundle = bundle
     _cache_ts = now
     return list(rules)
 
 
+async def load_compiled(redis: Redis) -> CompiledCorrections:
+    """Return the compiled bundle for the current rules (cached like ``load_corrections``)."""
+    await load_corrections(redis)
+    assert _cache_bundle is not None
+    return _cache_bundle
+
+
 async def save_corrections(redis: Redis, rules: list[dict[str, Any]]) -> None:
     """Replace the full rules list; invalidates the in-process cache."""
     for r in rules:
@@ -137,6 +408,10 @@ async def save_corrections(redis: Redis, rules: list[dict[str, Any]]) -> None:
     payload = json.dumps(rules, ensure_ascii=False)
     await redis.set(REDIS_KEY, payload)
     invalidate_cache()
+    try:
+        await redis.publish(INVALIDATE_CHANNEL, "1")
+    except Exception:
+        logger.debug("stt_corrections: failed to publish invalidation", exc_info=True)
 
 
 async def add_correction(redis: Redis, rule: dict[str, Any]) -> dict[str, Any]:
@@ -197,49 +472,56 @@ def apply_rules(
     Rules are applied when:
       - enabled = True
       - context_hint matches, OR rule.context_hint is empty/"any"
+
+    Compiles *rules* on every call — the runtime path goes through the
+    cached bundle of ``apply_corrections`` instead.
     """
     if not text or not rules:
         return text, []
-
-    ctx = (context_hint or "").strip().lower()
-    result = text
-    applied: list[str] = []
-
-    for rule in rules:
-        if not rule.get("enabled", True):
-            continue
-        rule_ctx = str(rule.get("context_hint") or "").strip().lower()
-        if rule_ctx and rule_ctx != "any" and rule_ctx != ctx:
-            continue
-
-        pattern_str = rule.get("pattern") or ""
-        if not pattern_str:
-            continue
-        flags = 0
-        if "i" in str(rule.get("flags") or "").lower():
-            flags |= re.IGNORECASE
-        try:
-            new_result, count = re.subn(pattern_str, rule.get("replacement", ""), result, flags=flags)
-        except re.error:
-            continue
-        if count > 0 and new_result != result:
-            result = new_result
-            applied.append(str(rule.get("id") or "?"))
-
-    return result, applied
+    return CompiledCorrections(rules).apply(text, context_hint)
 
 
 async def apply_corrections(
     redis: Redis, text: str, context_hint: str | None = None
 ) -> tuple[str, list[str]]:
     """High-level entry: load rules (cached), apply, return (new_text, applied)."""
-    rules = await load_corrections(redis)
-    return apply_rules(text, rules, context_hint)
+    bundle = await load_compiled(redis)
+    return bundle.apply(text, context_hint)
 
 
 def invalidate_cache() -> None:
     """Force next load_corrections() to re-read from Redis."""
-    global _cache_rules, _cache_patterns, _cache_ts
+    global _cache_rules, _cache_bundle, _cache_ts
     _cache_rules = []
-    _cache_patterns = []
+    _cache_bundle = None
     _cache_ts = 0.0
+
+
+async def listen_for_invalidations(redis: Redis) -> None:
+    """Keep this process's bundle current via Redis pub/sub (runs until cancelled).
+
+    Reloads on every ``INVALIDATE_CHANNEL`` message and after each
+    (re)subscribe, so writes made while disconnected are not missed. While
+    subscribed, ``load_corrections`` skips the ``_CACHE_TTL`` poll.
+    """
+    global _subscribed
+
+    while True:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATE_CHANNEL)
+            await load_corrections(redis, force=True)
+            _subscribed = True
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    await load_corrections(redis, force=True)
+                    logger.info("stt_corrections: reloaded %d rules", len(_cache_rules))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("stt_corrections: invalidation subscription lost", exc_info=True)
+        finally:
+            _subscribed = False
+            with contextlib.suppress(Exception):
+                await pubsub.aclose()  # type: ignore[no-untyped-call]
+        await asyncio.sleep(_RESUBSCRIBE_DELAY)
@@ -713,6 +713,7 @@ async def refresh_phrase_hints(db_engine: Any, redis: Redis) -> dict[str, Any]:
     # Invalidate in-process cache
     _cache = ()
     _cache_ts = 0.0
+    await _publish_change(redis)
 
     stats = {
         "base_count": len(base),
@@ -732,6 +733,13 @@ async def refresh_phrase_hints(db_engine: Any, redis: Redis) -> dict[str, Any]:
     return stats
 
 
+async def _publish_change(redis: Redis) -> None:
+    """Let call-setup snapshots pick up the new phrase list."""
+    from src.core.tenant_context import publish_change
+
+    await publish_change("stt_phrase_hints", redis)
+
+
 async def get_phrase_hints(redis: Redis) -> dict[str, Any]:
     """Get phrase hints data from Redis (with stats)."""
     try:
@@ -818,6 +826,7 @@ async def update_custom_phrases(redis: Redis, phrases: list[str]) -> dict[str, A
     # Invalidate cache
     _cache = ()
     _cache_ts = 0.0
+    await _publish_change(redis)
 
     return {
         "custom_count": len(phrases),
@@ -846,6 +855,7 @@ async def update_base_phrases(redis: Redis, phrases: list[str]) -> dict[str, Any
 
     _cache = ()
     _cache_ts = 0.0
+    await _publish_change(redis)
 
     return {
         "base_count": len(phrases),
@@ -879,6 +889,7 @@ async def reset_base_to_defaults(redis: Redis) -> dict[str, Any]:
 
     _cache = ()
     _cache_ts = 0.0
+    await _publish_change(redis)
 
     return {
         "base_count": len(base),
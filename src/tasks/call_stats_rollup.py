@@ -0,0 +1,119 @@
+"""Incremental hourly call statistics rollup (``call_stats_hourly``).
+
+Runs every 5 minutes via Celery Beat. Each run recomputes whole hours from
+the watermark — minus a short lookback for calls that ended or changed
+after their hour was rolled up — to the start of the current hour, plus
+any older hours queued in ``call_stats_dirty_hours`` (late quality
+scores), then advances the watermark. The first run backfills from the
+oldest call, one chunk per transaction.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import text
+
+from src.reports.call_stats import ROLLUP_NAME, lock_rollup, refresh_hours
+from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+_LOOKBACK_HOURS = 3
+_CHUNK_HOURS = 24 * 7
+_MAX_CHUNKS_PER_RUN = 8
+
+
+@app.task(name="src.tasks.call_stats_rollup.rollup_call_stats")  # type: ignore[untyped-decorator]
+def rollup_call_stats() -> dict[str, Any]:
+    """Bring ``call_stats_hourly`` up to the start of the current hour."""
+    return run_async(_rollup_async())
+
+
+async def _rollup_async() -> dict[str, Any]:
+    engine = get_task_engine()
+
+    stats: dict[str, Any] = {"hours_refreshed": 0, "dirty_hours": 0, "rows_written": 0}
+
+    try:
+        for _ in range(_MAX_CHUNKS_PER_RUN):
+            async with engine.begin() as conn:
+                caught_up = await _rollup_chunk(conn, stats)
+            if caught_up:
+                break
+
+        logger.info(
+            "Call stats rollup: watermark=%s, hours=%d, dirty=%d, rows=%d",
+            stats.get("watermark"),
+            stats["hours_refreshed"],
+            stats["dirty_hours"],
+            stats["rows_written"],
+        )
+    except Exception:
+        logger.exception("Call stats rollup failed")
+        raise
+    finally:
+        await release_task_engine(engine)
+
+    return stats
+
+
+async def _rollup_chunk(conn: AsyncConnection, stats: dict[str, Any]) -> bool:
+    """Roll up one chunk of hours and advance the watermark.
+
+    Returns:
+        True when the watermark has reached the current hour.
+    """
+    await lock_rollup(conn)
+
+    row = (
+        await conn.execute(
+            text("""
+                SELECT date_trunc('hour', now()) AS upto,
+                       (SELECT watermark FROM call_stats_rollup_state
+                         WHERE name = :name) AS watermark
+            """),
+            {"name": ROLLUP_NAME},
+        )
+    ).one()
+    upto: datetime = row.upto
+
+    if row.watermark is not None:
+        start = row.watermark - timedelta(hours=_LOOKBACK_HOURS)
+    else:
+        oldest = (
+            await conn.execute(text("SELECT date_trunc('hour', MIN(started_at)) FROM calls"))
+        ).scalar()
+        start = oldest if oldest is not None else upto
+    end: datetime = min(upto, start + timedelta(hours=_CHUNK_HOURS))
+
+    if start < end:
+        stats["rows_written"] += await refresh_hours(conn, start, end)
+        stats["hours_refreshed"] += int((end - start) / timedelta(hours=1))
+
+    # Hours changed after they were rolled up; those inside [start, end) are fresh already
+    dirty = await conn.execute(
+        text("DELETE FROM call_stats_dirty_hours WHERE bucket < :end RETURNING bucket"),
+        {"end": end},
+    )
+    for bucket in sorted(r.bucket for r in dirty if r.bucket < start):
+        stats["rows_written"] += await refresh_hours(conn, bucket, bucket + timedelta(hours=1))
+        stats["dirty_hours"] += 1
+
+    await conn.execute(
+        text("""
+            INSERT INTO call_stats_rollup_state (name, watermark, updated_at)
+            VALUES (:name, :watermark, now())
+            ON CONFLICT (name) DO UPDATE
+                SET watermark = EXCLUDED.watermark, updated_at = now()
+        """),
+        {"name": ROLLUP_NAME, "watermark": end},
+    )
+    stats["watermark"] = end.isoformat()
+    return end >= upto
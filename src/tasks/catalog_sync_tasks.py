@@ -1,9 +1,10 @@
 """Celery tasks for 1C catalog synchronization.
 
 Replaces the in-process sync that previously ran at call-processor startup.
-Two tasks:
+Three tasks:
   - catalog_full_sync: daily full catalog upload (configurable via Admin UI, default 08:00 Kyiv)
-  - catalog_incremental_sync: incremental wares + stock + Nova Poshta (every 5 min)
+  - catalog_incremental_sync: incremental wares + delta stock (every 5 min)
+  - catalog_novapost_sync: Nova Poshta cities/branches (every 6 hours)
 """
 
 from __future__ import annotations
@@ -13,6 +14,7 @@ from typing import Any
 
 from src.config import get_settings
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -31,20 +33,19 @@ def catalog_full_sync(self: Any, triggered_by: str = "manual") -> dict[str, Any]
     is controlled by configurable schedule in Redis.
     When triggered_by="manual", runs immediately.
     """
-    import asyncio
-
-    return asyncio.run(_catalog_full_sync_async(self, triggered_by))
+    return run_async(_catalog_full_sync_async(self, triggered_by))
 
 
 _LOCK_KEY = "catalog_sync:lock"
 _LOCK_TTL_FULL = 1800  # 30 min for full sync
 _LOCK_TTL_INCR = 300  # 5 min for incremental sync
+_NOVAPOST_LOCK_KEY = "catalog_sync:novapost:lock"  # separate tables, separate lock
+_LOCK_TTL_NOVAPOST = 900
 
 
 async def _catalog_full_sync_async(task: Any, triggered_by: str) -> dict[str, Any]:
     """Async implementation of full catalog sync."""
     from redis.asyncio import Redis
-    from sqlalchemy.ext.asyncio import create_async_engine
 
     from src.onec_client.client import OneCClient
     from src.onec_client.sync import CatalogSyncService
@@ -72,9 +73,7 @@ async def _catalog_full_sync_async(task: Any, triggered_by: str) -> dict[str, An
         logger.info("1C not configured (ONEC_USERNAME empty), skipping full sync")
         return {"status": "skipped", "reason": "onec_not_configured"}
 
-    engine = create_async_engine(
-        settings.database.url, pool_size=5, max_overflow=5, pool_pre_ping=True
-    )
+    engine = get_task_engine()
     redis: Redis | None = None
     onec_client: OneCClient | None = None
 
@@ -124,7 +123,7 @@ async def _catalog_full_sync_async(task: Any, triggered_by: str) -> dict[str, An
             await onec_client.close()
         if redis is not None:
             await redis.aclose()
-        await engine.dispose()
+        await release_task_engine(engine)
 
 
 @app.task(
@@ -135,19 +134,16 @@ async def _catalog_full_sync_async(task: Any, triggered_by: str) -> dict[str, An
     soft_time_limit=240,
 )  # type: ignore[untyped-decorator]
 def catalog_incremental_sync(self: Any) -> dict[str, Any]:
-    """Incremental catalog sync: changed wares + stock + Nova Poshta.
+    """Incremental catalog sync: changed wares + stock (changed SKUs only).
 
     Scheduled every 5 minutes via Celery Beat.
     """
-    import asyncio
-
-    return asyncio.run(_catalog_incremental_sync_async(self))
+    return run_async(_catalog_incremental_sync_async(self))
 
 
 async def _catalog_incremental_sync_async(task: Any) -> dict[str, Any]:
     """Async implementation of incremental catalog sync."""
     from redis.asyncio import Redis
-    from sqlalchemy.ext.asyncio import create_async_engine
 
     from src.onec_client.client import OneCClient
     from src.onec_client.sync import CatalogSyncService
@@ -158,9 +154,7 @@ async def _catalog_incremental_sync_async(task: Any) -> dict[str, Any]:
         logger.info("1C not configured (ONEC_USERNAME empty), skipping incremental sync")
         return {"status": "skipped", "reason": "onec_not_configured"}
 
-    engine = create_async_engine(
-        settings.database.url, pool_size=5, max_overflow=5, pool_pre_ping=True
-    )
+    engine = get_task_engine()
     redis: Redis | None = None
     onec_client: OneCClient | None = None
 
@@ -195,9 +189,9 @@ async def _catalog_incremental_sync_async(task: Any) -> dict[str, Any]:
             stock_cache_ttl=settings.onec.stock_cache_ttl,
         )
 
-        await sync_service.incremental_sync()
+        stock = await sync_service.incremental_sync()
         logger.info("Incremental catalog sync completed successfully")
-        return {"status": "ok"}
+        return {"status": "ok", "stock": stock}
 
     except Exception as exc:
         logger.exception("Incremental catalog sync failed")
@@ -209,4 +203,79 @@ async def _catalog_incremental_sync_async(task: Any) -> dict[str, Any]:
             await onec_client.close()
         if redis is not None:
             await redis.aclose()
-        await engine.dispose()
+        await release_task_engine(engine)
+
+
+@app.task(
+    name="src.tasks.catalog_sync_tasks.catalog_novapost_sync",
+    bind=True,
+    max_retries=2,
+    time_limit=900,
+    soft_time_limit=840,
+)  # type: ignore[untyped-decorator]
+def catalog_novapost_sync(self: Any) -> dict[str, Any]:
+    """Nova Poshta reference data sync (cities + working branches).
+
+    Scheduled every 6 hours via Celery Beat; the data changes rarely, so it
+    is kept out of the 5-minute incremental sync.
+    """
+    return run_async(_catalog_novapost_sync_async(self))
+
+
+async def _catalog_novapost_sync_async(task: Any) -> dict[str, Any]:
+    """Async implementation of Nova Poshta sync."""
+    from redis.asyncio import Redis
+
+    from src.onec_client.client import OneCClient
+    from src.onec_client.sync import CatalogSyncService
+
+    settings = get_settings()
+
+    if not settings.onec.username:
+        logger.info("1C not configured (ONEC_USERNAME empty), skipping Nova Poshta sync")
+        return {"status": "skipped", "reason": "onec_not_configured"}
+
+    engine = get_task_engine()
+    redis: Redis | None = None
+    onec_client: OneCClient | None = None
+    locked = False
+
+    try:
+        redis = Redis.from_url(settings.redis.url, decode_responses=False)
+        try:
+            await redis.ping()
+        except Exception:
+            logger.warning("Redis unavailable for Nova Poshta sync")
+            await redis.aclose()
+            redis = None
+
+        if redis is not None:
+            locked = bool(await redis.set(_NOVAPOST_LOCK_KEY, "1", nx=True, ex=_LOCK_TTL_NOVAPOST))
+            if not locked:
+                logger.info("Nova Poshta sync already running, skipping")
+                return {"status": "skipped", "reason": "already_running"}
+
+        onec_client = OneCClient(
+            base_url=settings.onec.url,
+            username=settings.onec.username,
+            password=settings.onec.password,
+            timeout=settings.onec.timeout,
+        )
+        await onec_client.open()
+
+        sync_service = CatalogSyncService(onec_client=onec_client, db_engine=engine)
+        await sync_service.sync_novapost()
+        logger.info("Nova Poshta sync completed successfully")
+        return {"status": "ok"}
+
+    except Exception as exc:
+        logger.exception("Nova Poshta sync failed")
+        raise task.retry(countdown=300) from exc
+    finally:
+        if redis is not None:
+            if locked:
+                await redis.delete(_NOVAPOST_LOCK_KEY)
+            await redis.aclose()
+        if onec_client is not None:
+            await onec_client.close()
+        await release_task_engine(engine)
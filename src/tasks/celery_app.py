@@ -9,7 +9,11 @@ from typing import Any
 
 from celery import Celery  # type: ignore[import-untyped]
 from celery.schedules import crontab  # type: ignore[import-untyped]
-from celery.signals import task_failure  # type: ignore[import-untyped]
+from celery.signals import (  # type: ignore[import-untyped]
+    task_failure,
+    worker_process_init,
+    worker_process_shutdown,
+)
 
 from src.config import get_settings
 
@@ -22,6 +26,8 @@ app = Celery(
     include=[
         "src.tasks.quality_evaluator",
         "src.tasks.daily_stats",
+        "src.tasks.call_stats_rollup",
+        "src.tasks.llm_usage_rollup",
         "src.tasks.data_retention",
         "src.tasks.partition_manager",
         "src.tasks.backup",
@@ -52,6 +58,8 @@ app.conf.update(
     task_routes={
         "src.tasks.quality_evaluator.*": {"queue": "quality"},
         "src.tasks.daily_stats.*": {"queue": "stats"},
+        "src.tasks.call_stats_rollup.*": {"queue": "stats"},
+        "src.tasks.llm_usage_rollup.*": {"queue": "stats"},
         "src.tasks.data_retention.*": {"queue": "stats"},
         "src.tasks.partition_manager.*": {"queue": "stats"},
         "src.tasks.backup.*": {"queue": "stats"},
@@ -73,6 +81,14 @@ app.conf.beat_schedule = {
         "task": "src.tasks.daily_stats.calculate_daily_stats",
         "schedule": crontab(hour=1, minute=0),  # Every day at 01:00 Kyiv time
     },
+    "rollup-call-stats": {
+        "task": "src.tasks.call_stats_rollup.rollup_call_stats",
+        "schedule": crontab(minute="*/5"),  # Hourly stats up to the current hour
+    },
+    "rollup-llm-usage": {
+        "task": "src.tasks.llm_usage_rollup.rollup_llm_usage",
+        "schedule": crontab(minute="*/10"),  # Daily LLM usage up to the current hour
+    },
     "cleanup-expired-data": {
         "task": "src.tasks.data_retention.cleanup_expired_data",
         "schedule": crontab(hour=3, minute=0, day_of_week="sunday"),  # Weekly at 03:00 Sunday
@@ -135,6 +151,15 @@ app.conf.beat_schedule = {
         "task": "src.tasks.catalog_sync_tasks.catalog_incremental_sync",
         "schedule": crontab(minute="*/5"),  # Every 5 minutes
     },
+    "catalog-novapost-sync": {
+        "task": "src.tasks.catalog_sync_tasks.catalog_novapost_sync",
+        "schedule": crontab(minute=40, hour="*/6"),  # Every 6 hours at :40
+    },
+    "quality-batch-scoring": {
+        "task": "src.tasks.quality_evaluator.evaluate_quality_batch",
+        "schedule": crontab(minute=20),  # Every hour at :20; actual time via Redis schedule
+        "kwargs": {"triggered_by": "beat"},
+    },
     "analyze-failed-calls": {
         "task": "src.tasks.prompt_optimizer.analyze_failed_calls",
         "schedule": crontab(hour=6, minute=0, day_of_week="sunday"),  # Weekly Sunday 06:00
@@ -167,3 +192,22 @@ def _on_task_failure(sender: Any = None, **kwargs: Any) -> None:
     # Use short name (last segment) for cleaner metrics
     short_name = task_name.rsplit(".", 1)[-1] if task_name else "unknown"
     celery_task_failures_total.labels(task_name=short_name).inc()
+
+
+# --- Celery signals: one async runtime (event loop + DB pools) per worker process ---
+
+
+@worker_process_init.connect  # type: ignore[untyped-decorator]
+def _on_worker_process_init(**kwargs: Any) -> None:
+    """Create the event loop that async tasks share in this process."""
+    from src.tasks.worker_runtime import init_worker_runtime
+
+    init_worker_runtime()
+
+
+@worker_process_shutdown.connect  # type: ignore[untyped-decorator]
+def _on_worker_process_shutdown(**kwargs: Any) -> None:
+    """Dispose the shared engine and close the loop."""
+    from src.tasks.worker_runtime import shutdown_worker_runtime
+
+    shutdown_worker_runtime()
@@ -1,7 +1,8 @@
 """Daily statistics aggregation task.
 
 Runs daily via Celery Beat to calculate aggregated metrics
-and store them in the daily_stats table.
+and store them in the daily_stats table. The numbers come from the
+hourly rollup (``src.reports.call_stats``), not from a rescan of calls.
 """
 
 from __future__ import annotations
@@ -12,10 +13,10 @@ from datetime import date, timedelta
 from typing import Any
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
 
-from src.config import get_settings
+from src.reports.call_stats import fetch_daily_stats
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -28,80 +29,32 @@ def calculate_daily_stats(target_date: str | None = None) -> dict[str, Any]:
         target_date: Date to calculate stats for (YYYY-MM-DD).
                      Defaults to yesterday.
     """
-    import asyncio
-
-    return asyncio.run(_calculate_daily_stats_async(target_date))
+    return run_async(_calculate_daily_stats_async(target_date))
 
 
 async def _calculate_daily_stats_async(target_date: str | None = None) -> dict[str, Any]:
     """Async implementation of daily stats calculation."""
-    settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     stat_date = date.fromisoformat(target_date) if target_date else date.today() - timedelta(days=1)
 
     try:
         async with engine.begin() as conn:
-            # Main call statistics
-            result = await conn.execute(
-                text("""
-                    SELECT
-                        COUNT(*) AS total_calls,
-                        COUNT(*) FILTER (WHERE NOT transferred_to_operator) AS resolved_by_bot,
-                        COUNT(*) FILTER (WHERE transferred_to_operator) AS transferred,
-                        COALESCE(AVG(duration_seconds), 0) AS avg_duration_seconds,
-                        COALESCE(AVG(quality_score), 0) AS avg_quality_score,
-                        COALESCE(SUM(total_cost_usd), 0) AS total_cost_usd
-                    FROM calls
-                    WHERE started_at::date = :stat_date
-                """),
-                {"stat_date": stat_date.isoformat()},
-            )
-            stats_row = result.first()
-            if stats_row is None:
-                msg = "Expected row from aggregate query"
-                raise RuntimeError(msg)
-            stats = dict(stats_row._mapping)
-
-            # Scenario breakdown
-            scenario_result = await conn.execute(
-                text("""
-                    SELECT scenario, COUNT(*) AS count
-                    FROM calls
-                    WHERE started_at::date = :stat_date
-                      AND scenario IS NOT NULL
-                    GROUP BY scenario
-                """),
-                {"stat_date": stat_date.isoformat()},
-            )
-            scenario_breakdown = {row.scenario: row.count for row in scenario_result}
-
-            # Transfer reasons breakdown
-            transfer_result = await conn.execute(
-                text("""
-                    SELECT transfer_reason, COUNT(*) AS count
-                    FROM calls
-                    WHERE started_at::date = :stat_date
-                      AND transferred_to_operator = true
-                      AND transfer_reason IS NOT NULL
-                    GROUP BY transfer_reason
-                """),
-                {"stat_date": stat_date.isoformat()},
-            )
-            transfer_reasons = {row.transfer_reason: row.count for row in transfer_result}
-
-            # Hourly distribution
-            hourly_result = await conn.execute(
-                text("""
-                    SELECT EXTRACT(HOUR FROM started_at) AS hour, COUNT(*) AS count
-                    FROM calls
-                    WHERE started_at::date = :stat_date
-                    GROUP BY EXTRACT(HOUR FROM started_at)
-                    ORDER BY hour
-                """),
-                {"stat_date": stat_date.isoformat()},
+            days = await fetch_daily_stats(
+                conn, date_from=stat_date, date_to_end=stat_date + timedelta(days=1)
             )
-            hourly_distribution = {str(int(row.hour)): row.count for row in hourly_result}
+            day = days[0] if days else {}
+            stats = {
+                "total_calls": int(day.get("total_calls") or 0),
+                "resolved_by_bot": int(day.get("resolved_by_bot") or 0),
+                "transferred": int(day.get("transferred") or 0),
+                "avg_duration_seconds": float(day.get("avg_duration_seconds") or 0),
+                "avg_quality_score": float(day.get("avg_quality_score") or 0),
+                "total_cost_usd": float(day.get("total_cost_usd") or 0),
+            }
+            scenario_breakdown = day.get("scenario_breakdown") or {}
+            transfer_reasons = day.get("transfer_reasons") or {}
+            hourly_distribution = day.get("hourly_distribution") or {}
 
             # Upsert into daily_stats
             await conn.execute(
@@ -128,12 +81,7 @@ async def _calculate_daily_stats_async(target_date: str | None = None) -> dict[s
                 """),
                 {
                     "stat_date": stat_date.isoformat(),
-                    "total_calls": stats["total_calls"],
-                    "resolved_by_bot": stats["resolved_by_bot"],
-                    "transferred": stats["transferred"],
-                    "avg_duration_seconds": float(stats["avg_duration_seconds"]),
-                    "avg_quality_score": float(stats["avg_quality_score"]),
-                    "total_cost_usd": float(stats["total_cost_usd"]),
+                    **stats,
                     "scenario_breakdown": json.dumps(scenario_breakdown),
                     "transfer_reasons": json.dumps(transfer_reasons),
                     "hourly_distribution": json.dumps(hourly_distribution),
@@ -156,4 +104,4 @@ async def _calculate_daily_stats_async(target_date: str | None = None) -> dict[s
         }
 
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
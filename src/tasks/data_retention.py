@@ -1,30 +1,58 @@
 """Data retention task — automatic cleanup per data-policy.md.
 
 Runs weekly via Celery Beat:
-- Deletes call_turns older than 90 days
-- Deletes call_tool_calls older than 90 days
-- Anonymizes caller_id in calls older than 1 year
+- Drops call_turns / call_tool_calls partitions that are entirely older
+  than 90 days (DETACH + DROP: no row deletes, no bloat, minimal WAL)
+- Deletes expired rows from the partition straddling the 90-day cutoff in
+  small batches, with pauses between batches and a time budget
+- Anonymizes caller_id in calls older than 1 year in keyset-paginated batches
+
+Every batch is its own short transaction, so locks are held briefly and an
+interrupted run simply continues on the next one.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+import re
+import time
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
 
-from src.config import get_settings
+from src.monitoring.metrics import (
+    data_retention_calls_anonymized_total,
+    data_retention_duration_seconds,
+    data_retention_last_success_timestamp,
+    data_retention_partitions_dropped_total,
+    data_retention_rows_deleted_total,
+)
 from src.tasks.celery_app import app
+from src.tasks.partition_manager import PARTITION_KEY, RETENTION_TABLES
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
 
 logger = logging.getLogger(__name__)
 
 _RETENTION_TRANSCRIPTS_DAYS = 90
 _RETENTION_METADATA_DAYS = 365
 
+_BATCH_SIZE = 5000
+_BATCH_PAUSE_SECONDS = 0.2
+# Per phase (straddling deletes, anonymization); leftovers wait for the next run
+_PHASE_BUDGET_SECONDS = 600
+_LOCK_TIMEOUT = "5s"
+
 
-@app.task(name="src.tasks.data_retention.cleanup_expired_data")  # type: ignore[untyped-decorator]
+@app.task(  # type: ignore[untyped-decorator]
+    name="src.tasks.data_retention.cleanup_expired_data",
+    soft_time_limit=1800,
+    time_limit=1860,
+)
 def cleanup_expired_data() -> dict[str, Any]:
     """Delete expired transcriptions and anonymize old caller data.
 
@@ -32,55 +60,208 @@ def cleanup_expired_data() -> dict[str, Any]:
     - Transcriptions (call_turns, call_tool_calls): 90 days
     - Caller metadata (caller_id): 1 year → anonymize
     """
-    return asyncio.run(_cleanup_async())
+    t0 = time.monotonic()
+    try:
+        result = run_async(_cleanup_async())
+    finally:
+        data_retention_duration_seconds.observe(time.monotonic() - t0)
+    data_retention_last_success_timestamp.set(time.time())
+    return result
 
 
-async def _cleanup_async() -> dict[str, Any]:
-    settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+def _partition_month(table: str, name: str) -> date | None:
+    """First day of the month a ``{table}_{YYYY}_{MM}`` partition covers."""
+    m = re.fullmatch(rf"{re.escape(table)}_(\d{{4}})_(\d{{2}})", name)
+    if not m:
+        return None
+    return date(int(m.group(1)), int(m.group(2)), 1)
+
+
+def _next_month(d: date) -> date:
+    return date(d.year + 1, 1, 1) if d.month == 12 else date(d.year, d.month + 1, 1)
 
-    results: dict[str, Any] = {}
 
+def _classify_partitions(
+    table: str, names: list[str], cutoff: datetime
+) -> tuple[list[str], list[str]]:
+    """Split partitions into (fully expired, straddling the cutoff).
+
+    A partition is fully expired when its upper bound lies a whole day
+    before the cutoff date — a margin for the bounds being in the database
+    time zone. Partitions not following the naming scheme are ignored.
+    """
+    expired: list[str] = []
+    straddling: list[str] = []
+    cutoff_day = cutoff.date()
+    for name in sorted(names):
+        start = _partition_month(table, name)
+        if start is None:
+            continue
+        if _next_month(start) < cutoff_day:
+            expired.append(name)
+        elif start <= cutoff_day:
+            straddling.append(name)
+    return expired, straddling
+
+
+async def _list_partitions(engine: AsyncEngine, table: str) -> list[str]:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text("""
+                SELECT c.relname
+                  FROM pg_inherits i
+                  JOIN pg_class c ON c.oid = i.inhrelid
+                  JOIN pg_class p ON p.oid = i.inhparent
+                 WHERE p.relname = :parent
+            """),
+            {"parent": table},
+        )
+        return [row.relname for row in result]
+
+
+async def _drop_partition(engine: AsyncEngine, table: str, partition: str) -> bool:
+    """Detach and drop one partition; False if its lock could not be taken in time."""
     try:
         async with engine.begin() as conn:
-            # Delete transcriptions older than 90 days
-            r1 = await conn.execute(
-                text(
-                    f"DELETE FROM call_turns "
-                    f"WHERE created_at < NOW() - INTERVAL '{_RETENTION_TRANSCRIPTS_DAYS} days'"
-                )
-            )
-            results["call_turns_deleted"] = r1.rowcount
+            await conn.execute(text(f"SET LOCAL lock_timeout = '{_LOCK_TIMEOUT}'"))
+            await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {partition}"))
+            await conn.execute(text(f"DROP TABLE {partition}"))
+    except Exception:
+        logger.warning(
+            "Could not drop expired partition %s, retrying next run", partition, exc_info=True
+        )
+        return False
+    return True
 
-            r2 = await conn.execute(
-                text(
-                    f"DELETE FROM call_tool_calls "
-                    f"WHERE created_at < NOW() - INTERVAL '{_RETENTION_TRANSCRIPTS_DAYS} days'"
-                )
+
+async def _delete_batched(
+    engine: AsyncEngine, partition: str, column: str, cutoff: datetime, deadline: float
+) -> tuple[int, bool]:
+    """Delete rows older than ``cutoff`` from one partition in ctid chunks.
+
+    Returns (rows deleted, finished) — ``finished`` is False when the time
+    budget ran out first.
+    """
+    sql = text(f"""
+        DELETE FROM {partition}
+         WHERE ctid = ANY(ARRAY(
+               SELECT ctid FROM {partition} WHERE {column} < :cutoff LIMIT :limit))
+    """)
+    deleted = 0
+    while True:
+        async with engine.begin() as conn:
+            result = await conn.execute(sql, {"cutoff": cutoff, "limit": _BATCH_SIZE})
+        deleted += result.rowcount
+        if result.rowcount < _BATCH_SIZE:
+            return deleted, True
+        if time.monotonic() >= deadline:
+            return deleted, False
+        await asyncio.sleep(_BATCH_PAUSE_SECONDS)
+
+
+async def _anonymize_batched(
+    engine: AsyncEngine, cutoff: datetime, deadline: float
+) -> tuple[int, bool]:
+    """Anonymize caller_id of calls older than ``cutoff``, walking (started_at, id)."""
+    first = text("""
+        WITH batch AS (
+            SELECT id, started_at FROM calls
+             WHERE started_at < :cutoff
+               AND caller_id IS NOT NULL AND caller_id != 'DELETED'
+          ORDER BY started_at, id
+             LIMIT :limit
+        )
+        UPDATE calls c SET caller_id = 'DELETED'
+          FROM batch b
+         WHERE c.id = b.id AND c.started_at = b.started_at
+     RETURNING c.started_at, c.id
+    """)
+    after = text("""
+        WITH batch AS (
+            SELECT id, started_at FROM calls
+             WHERE started_at < :cutoff
+               AND (started_at, id) > (:after_ts, :after_id)
+               AND caller_id IS NOT NULL AND caller_id != 'DELETED'
+          ORDER BY started_at, id
+             LIMIT :limit
+        )
+        UPDATE calls c SET caller_id = 'DELETED'
+          FROM batch b
+         WHERE c.id = b.id AND c.started_at = b.started_at
+     RETURNING c.started_at, c.id
+    """)
+    anonymized = 0
+    cursor: tuple[Any, Any] | None = None
+    while True:
+        params: dict[str, Any] = {"cutoff": cutoff, "limit": _BATCH_SIZE}
+        if cursor is not None:
+            params["after_ts"], params["after_id"] = cursor
+        async with engine.begin() as conn:
+            rows = (await conn.execute(first if cursor is None else after, params)).all()
+        anonymized += len(rows)
+        data_retention_calls_anonymized_total.inc(len(rows))
+        if len(rows) < _BATCH_SIZE:
+            return anonymized, True
+        cursor = max((r.started_at, r.id) for r in rows)
+        if time.monotonic() >= deadline:
+            return anonymized, False
+        await asyncio.sleep(_BATCH_PAUSE_SECONDS)
+
+
+async def _cleanup_async() -> dict[str, Any]:
+    engine = get_task_engine()
+
+    now = datetime.now(UTC)
+    transcripts_cutoff = now - timedelta(days=_RETENTION_TRANSCRIPTS_DAYS)
+    metadata_cutoff = now - timedelta(days=_RETENTION_METADATA_DAYS)
+    results: dict[str, Any] = {"partitions_dropped": [], "incomplete": []}
+
+    try:
+        # Transcriptions: drop whole partitions, batch-delete the straddling one(s)
+        deadline = time.monotonic() + _PHASE_BUDGET_SECONDS
+        for table in RETENTION_TABLES:
+            expired, straddling = _classify_partitions(
+                table, await _list_partitions(engine, table), transcripts_cutoff
             )
-            results["call_tool_calls_deleted"] = r2.rowcount
-
-            # Anonymize caller_id older than 1 year
-            r3 = await conn.execute(
-                text(
-                    f"UPDATE calls SET caller_id = 'DELETED' "
-                    f"WHERE started_at < NOW() - INTERVAL '{_RETENTION_METADATA_DAYS} days' "
-                    f"AND caller_id IS NOT NULL AND caller_id != 'DELETED'"
+            for partition in expired:
+                if await _drop_partition(engine, table, partition):
+                    results["partitions_dropped"].append(partition)
+                    data_retention_partitions_dropped_total.labels(table=table).inc()
+
+            deleted = 0
+            for partition in straddling:
+                n, finished = await _delete_batched(
+                    engine, partition, PARTITION_KEY[table], transcripts_cutoff, deadline
                 )
-            )
-            results["calls_anonymized"] = r3.rowcount
+                deleted += n
+                data_retention_rows_deleted_total.labels(table=table).inc(n)
+                if not finished:
+                    results["incomplete"].append(partition)
+                    break
+            results[f"{table}_deleted"] = deleted
+
+        # Caller metadata: anonymize older than 1 year
+        deadline = time.monotonic() + _PHASE_BUDGET_SECONDS
+        anonymized, finished = await _anonymize_batched(engine, metadata_cutoff, deadline)
+        results["calls_anonymized"] = anonymized
+        if not finished:
+            results["incomplete"].append("calls")
 
         logger.info(
-            "Data retention cleanup: turns=%d, tool_calls=%d, anonymized=%d",
+            "Data retention cleanup: dropped=%s, turns=%d, tool_calls=%d, anonymized=%d%s",
+            ", ".join(results["partitions_dropped"]) or "none",
             results["call_turns_deleted"],
             results["call_tool_calls_deleted"],
             results["calls_anonymized"],
+            f", time budget exhausted for {', '.join(results['incomplete'])}"
+            if results["incomplete"]
+            else "",
         )
 
     except Exception:
         logger.exception("Data retention cleanup failed")
         raise
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
 
     return results
@@ -6,7 +6,6 @@ to configured recipients via SMTP.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from datetime import date, timedelta
 from email.message import EmailMessage
@@ -17,6 +16,7 @@ import aiosmtplib
 from src.config import get_settings
 from src.reports.generator import generate_weekly_report
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -105,4 +105,4 @@ async def _generate_and_send_weekly_report() -> dict[str, Any]:
 @app.task(name="src.tasks.email_report.send_weekly_report")  # type: ignore[untyped-decorator]
 def send_weekly_report() -> dict[str, Any]:
     """Celery task: generate and send weekly report."""
-    return asyncio.run(_generate_and_send_weekly_report())
+    return run_async(_generate_and_send_weekly_report())
@@ -10,11 +10,17 @@ import logging
 from typing import Any
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from src.config import get_settings
 from src.knowledge.embeddings import EmbeddingGenerator, process_article
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import (
+    get_asyncpg_pool,
+    get_task_engine,
+    release_asyncpg_pool,
+    release_task_engine,
+    run_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,15 +41,13 @@ def generate_article_embeddings(self: Any, article_id: str) -> dict[str, Any]:
     Returns:
         Result dict with article_id, chunks count, and status.
     """
-    import asyncio
-
-    return asyncio.run(_generate_article_embeddings_async(self, article_id))
+    return run_async(_generate_article_embeddings_async(self, article_id))
 
 
 async def _generate_article_embeddings_async(task: Any, article_id: str) -> dict[str, Any]:
     """Async implementation of embedding generation."""
     settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     try:
         # Set status to processing
@@ -93,10 +97,7 @@ async def _generate_article_embeddings_async(task: Any, article_id: str) -> dict
 
         try:
             # Use asyncpg pool directly for process_article (it expects asyncpg, not SQLAlchemy)
-            import asyncpg  # type: ignore[import-untyped]
-
-            db_url = settings.database.url.replace("+asyncpg", "")
-            pool = await asyncpg.create_pool(db_url)
+            pool = await get_asyncpg_pool()
             try:
                 chunks_count = await process_article(
                     article_id=str(row.id),
@@ -106,7 +107,7 @@ async def _generate_article_embeddings_async(task: Any, article_id: str) -> dict
                     generator=generator,
                 )
             finally:
-                await pool.close()
+                await release_asyncpg_pool(pool)
         finally:
             await generator.close()
 
@@ -150,7 +151,7 @@ async def _generate_article_embeddings_async(task: Any, article_id: str) -> dict
         logger.exception("Embedding generation failed for article %s", article_id)
         raise task.retry(countdown=60) from exc
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
 
 
 @app.task(
@@ -165,15 +166,12 @@ def reindex_all_articles(self: Any) -> dict[str, Any]:
     Returns:
         Result dict with count of dispatched tasks.
     """
-    import asyncio
-
-    return asyncio.run(_reindex_all_articles_async())
+    return run_async(_reindex_all_articles_async())
 
 
 async def _reindex_all_articles_async() -> dict[str, Any]:
     """Async implementation of reindex-all."""
-    settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     try:
         async with engine.begin() as conn:
@@ -199,4 +197,4 @@ async def _reindex_all_articles_async() -> dict[str, Any]:
         logger.info("Reindex-all dispatched %d embedding tasks", len(article_ids))
         return {"dispatched": len(article_ids)}
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
@@ -21,6 +21,7 @@ from typing import Any
 
 from src.config import get_settings
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +41,7 @@ LOCK_TTL = 180  # 3 min max task runtime
 )  # type: ignore[untyped-decorator]
 def refresh_fitting_prices(self: Any, triggered_by: str = "beat") -> dict[str, Any]:
     """Fetch fitting service prices from 1C REST and cache in Redis."""
-    import asyncio
-
-    return asyncio.run(_refresh_async(self, triggered_by))
+    return run_async(_refresh_async(self, triggered_by))
 
 
 async def _refresh_async(task: Any, triggered_by: str) -> dict[str, Any]:
@@ -0,0 +1,128 @@
+"""Incremental daily LLM usage rollup (``llm_usage_daily``).
+
+Runs every 10 minutes via Celery Beat. Each run recomputes the days from
+the watermark — minus a short lookback for rows still in a writer's buffer
+— up to the start of the current hour, plus any older days queued in
+``llm_usage_dirty_days`` (usage replayed late from the Redis spill buffer),
+then advances the watermark. The first run backfills from the oldest log
+row, one chunk per transaction.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import text
+
+from src.reports.llm_usage import ROLLUP_NAME, lock_rollup, refresh_days
+from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+_LOOKBACK = timedelta(hours=1)
+_CHUNK = timedelta(days=7)
+_MAX_CHUNKS_PER_RUN = 8
+
+
+@app.task(name="src.tasks.llm_usage_rollup.rollup_llm_usage")  # type: ignore[untyped-decorator]
+def rollup_llm_usage() -> dict[str, Any]:
+    """Bring ``llm_usage_daily`` up to the start of the current hour."""
+    return run_async(_rollup_async())
+
+
+async def _rollup_async() -> dict[str, Any]:
+    engine = get_task_engine()
+
+    stats: dict[str, Any] = {"days_refreshed": 0, "dirty_days": 0, "rows_written": 0}
+
+    try:
+        for _ in range(_MAX_CHUNKS_PER_RUN):
+            async with engine.begin() as conn:
+                caught_up = await _rollup_chunk(conn, stats)
+            if caught_up:
+                break
+
+        logger.info(
+            "LLM usage rollup: watermark=%s, days=%d, dirty=%d, rows=%d",
+            stats.get("watermark"),
+            stats["days_refreshed"],
+            stats["dirty_days"],
+            stats["rows_written"],
+        )
+    except Exception:
+        logger.exception("LLM usage rollup failed")
+        raise
+    finally:
+        await release_task_engine(engine)
+
+    return stats
+
+
+async def _rollup_chunk(conn: AsyncConnection, stats: dict[str, Any]) -> bool:
+    """Roll up one chunk of days and advance the watermark.
+
+    Returns:
+        True when the watermark has reached the current hour.
+    """
+    await lock_rollup(conn)
+
+    row = (
+        await conn.execute(
+            text("""
+                SELECT date_trunc('hour', now()) AS upto,
+                       date_trunc(
+                           'day',
+                           (SELECT watermark FROM call_stats_rollup_state WHERE name = :name)
+                           - CAST(:lookback AS interval)
+                       ) AS start
+            """),
+            {"name": ROLLUP_NAME, "lookback": _LOOKBACK},
+        )
+    ).one()
+    upto: datetime = row.upto
+
+    if row.start is not None:
+        start = row.start
+    else:
+        oldest = (
+            await conn.execute(text("SELECT date_trunc('day', MIN(created_at)) FROM llm_usage_log"))
+        ).scalar()
+        start = oldest if oldest is not None else upto
+    end: datetime = min(upto, start + _CHUNK)
+
+    if start < end:
+        stats["rows_written"] += await refresh_days(conn, start, end)
+        stats["days_refreshed"] += math.ceil((end - start) / timedelta(days=1))
+
+    # Days that got rows after they were rolled up; those from ``start`` on are fresh already
+    dirty = await conn.execute(
+        text("""
+            DELETE FROM llm_usage_dirty_days
+             WHERE CAST(day AS timestamptz) < :end
+         RETURNING CAST(day AS timestamptz) AS day_start,
+                   CAST(day + 1 AS timestamptz) AS day_end
+        """),
+        {"end": end},
+    )
+    for day in sorted((r for r in dirty if r.day_start < start), key=lambda r: r.day_start):
+        stats["rows_written"] += await refresh_days(conn, day.day_start, day.day_end)
+        stats["dirty_days"] += 1
+
+    await conn.execute(
+        text("""
+            INSERT INTO call_stats_rollup_state (name, watermark, updated_at)
+            VALUES (:name, :watermark, now())
+            ON CONFLICT (name) DO UPDATE
+                SET watermark = EXCLUDED.watermark, updated_at = now()
+        """),
+        {"name": ROLLUP_NAME, "watermark": end},
+    )
+    stats["watermark"] = end.isoformat()
+    return end >= upto
@@ -9,16 +9,13 @@ Partition naming: {table}_{YYYY}_{MM}
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
 from datetime import date, timedelta
 from typing import Any
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
 
-from src.config import get_settings
 from src.monitoring.metrics import (
     partition_created_total,
     partition_dropped_total,
@@ -26,6 +23,7 @@ from src.monitoring.metrics import (
     partition_last_success_timestamp,
 )
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +60,7 @@ def ensure_partitions() -> dict[str, Any]:
     Idempotent: uses IF NOT EXISTS / IF EXISTS.
     """
     try:
-        result = asyncio.run(_ensure_partitions_async())
+        result = run_async(_ensure_partitions_async())
         partition_last_success_timestamp.set(time.time())
         partition_created_total.inc(len(result["created"]))
         partition_dropped_total.inc(len(result["dropped"]))
@@ -73,8 +71,7 @@ def ensure_partitions() -> dict[str, Any]:
 
 
 async def _ensure_partitions_async() -> dict[str, Any]:
-    settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     results: dict[str, Any] = {"created": [], "dropped": []}
 
@@ -123,6 +120,6 @@ async def _ensure_partitions_async() -> dict[str, Any]:
         logger.exception("Partition management failed")
         raise
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
 
     return results
@@ -107,9 +107,9 @@ async def _do_sync() -> dict[str, int]:
     """Core sync logic — fetch, parse, upsert."""
     import aiohttp
     from sqlalchemy import text
-    from sqlalchemy.ext.asyncio import create_async_engine
 
     from src.config import get_settings
+    from src.tasks.worker_runtime import get_task_engine, release_task_engine
 
     settings = get_settings()
 
@@ -127,7 +127,7 @@ async def _do_sync() -> dict[str, int]:
         logger.warning("pricing_sync: no models parsed from LiteLLM JSON")
         return {"inserted": 0, "updated": 0, "auto_updated": 0}
 
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
     sync_time = datetime.now(UTC)
 
     try:
@@ -209,7 +209,7 @@ async def _do_sync() -> dict[str, int]:
             logger.warning("pricing_sync: failed to update Redis timestamp", exc_info=True)
 
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
 
     stats = {"inserted": inserted, "updated": updated, "auto_updated": auto_updated}
     logger.info("pricing_sync completed: %s", stats)
@@ -226,10 +226,10 @@ async def _do_sync() -> dict[str, int]:
 )
 def sync_llm_pricing_catalog(self: Any, **kwargs: Any) -> dict[str, int]:
     """Celery task: sync LLM pricing catalog from LiteLLM."""
-    import asyncio
+    from src.tasks.worker_runtime import run_async
 
     try:
-        return asyncio.run(_do_sync())
+        return run_async(_do_sync())
     except Exception as exc:
         logger.error("pricing_sync failed: %s", exc, exc_info=True)
         raise self.retry(exc=exc) from exc
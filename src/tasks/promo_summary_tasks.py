@@ -13,12 +13,12 @@ import logging
 from typing import Any
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from src.config import get_settings
 from src.llm.helpers import llm_complete
 from src.llm.models import LLMTask
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -46,13 +46,13 @@ _SUMMARY_SYSTEM_PROMPT = """Ти — помічник для створення
 )  # type: ignore[untyped-decorator]
 def generate_promo_summary(self: Any, article_id: str) -> dict[str, Any]:
     """Generate a concise promo summary for a knowledge article."""
-    return asyncio.run(_generate_promo_summary_async(self, article_id))
+    return run_async(_generate_promo_summary_async(self, article_id))
 
 
 async def _generate_promo_summary_async(task: Any, article_id: str) -> dict[str, Any]:
     """Async implementation of promo summary generation."""
     settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     try:
         async with engine.begin() as conn:
@@ -106,9 +106,12 @@ async def _generate_promo_summary_async(task: Any, article_id: str) -> dict[str,
         try:
             from redis import Redis as SyncRedis
 
+            from src.core.tenant_context import INVALIDATE_CHANNEL as TENANT_CONTEXT_CHANNEL
+
             redis_url = settings.redis.url
             r = SyncRedis.from_url(redis_url)
             r.set("promotions:cache_ts", str(asyncio.get_event_loop().time()))
+            r.publish(TENANT_CONTEXT_CHANNEL, "promotions")
             r.close()
         except Exception:
             logger.debug("Could not invalidate promotions cache", exc_info=True)
@@ -120,7 +123,7 @@ async def _generate_promo_summary_async(task: Any, article_id: str) -> dict[str,
         logger.exception("Promo summary failed for %s", article_id)
         raise task.retry(countdown=30) from exc
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
 
 
 @app.task(
@@ -131,12 +134,11 @@ async def _generate_promo_summary_async(task: Any, article_id: str) -> dict[str,
 )  # type: ignore[untyped-decorator]
 def generate_all_promo_summaries(self: Any) -> dict[str, Any]:
     """Generate summaries for all active promotions missing a summary."""
-    return asyncio.run(_generate_all_promo_summaries_async())
+    return run_async(_generate_all_promo_summaries_async())
 
 
 async def _generate_all_promo_summaries_async() -> dict[str, Any]:
-    settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     try:
         async with engine.begin() as conn:
@@ -156,4 +158,4 @@ async def _generate_all_promo_summaries_async() -> dict[str, Any]:
         logger.info("Dispatched promo summary generation for %d articles", len(ids))
         return {"dispatched": len(ids)}
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
@@ -12,12 +12,12 @@ import logging
 from typing import Any
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from src.config import get_settings
 from src.llm.helpers import llm_complete
 from src.llm.models import LLMTask
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -65,13 +65,7 @@ def analyze_failed_calls(
         max_calls: Maximum number of calls to analyze.
         triggered_by: Who triggered the analysis ('manual', 'beat').
     """
-    import asyncio
-
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(_analyze_failed_calls_async(days, max_calls, triggered_by))
-    finally:
-        loop.close()
+    return run_async(_analyze_failed_calls_async(days, max_calls, triggered_by))
 
 
 async def _analyze_failed_calls_async(
@@ -79,7 +73,7 @@ async def _analyze_failed_calls_async(
 ) -> dict[str, Any]:
     """Async implementation of failed calls analysis."""
     settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     try:
         async with engine.begin() as conn:
@@ -173,7 +167,7 @@ async def _analyze_failed_calls_async(
             pass
         return error_result
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
 
 
 async def _persist_result(
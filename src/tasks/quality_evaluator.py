@@ -2,21 +2,33 @@
 
 Evaluates each call against 8 quality criteria after completion.
 Flags problematic calls (score < threshold) for manual review.
+
+Two entry points share the prompt and scoring:
+
+* ``evaluate_call_quality`` — one task per finished call (dispatched by
+  ``main.py`` unless ``QUALITY_BATCH_MODE`` is on).
+* ``evaluate_quality_batch`` — picks up finished, unscored calls in batches
+  of ``QUALITY_BATCH_SIZE`` with set-based reads, scores them with bounded
+  LLM concurrency and writes all scores back in one UPDATE. Scheduled via
+  ``schedule_utils`` (``quality-batch-scoring``) for off-peak runs; also
+  backfills calls whose per-call task failed.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 from typing import Any
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from src.config import get_settings
-from src.llm.helpers import llm_complete
+from src.llm.helpers import llm_complete, llm_complete_with_usage
 from src.llm.models import LLMTask
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +99,50 @@ def _build_transcription_text(turns: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
+def _call_transcription(
+    turns: list[dict[str, Any]],
+    tool_calls: list[dict[str, Any]],
+    call_row: Any,
+) -> str:
+    """Transcription text with tool calls and call metadata context."""
+    turn_data = [{"speaker": t["speaker"], "content": t["content"]} for t in turns]
+    if tool_calls:
+        turn_data.append({"tool_calls": tool_calls})
+
+    transcription = _build_transcription_text(turn_data)
+
+    # Add call metadata context
+    if call_row:
+        context_parts = []
+        if call_row.transferred_to_operator:
+            context_parts.append(
+                f"Call was transferred to operator. Reason: {call_row.transfer_reason}"
+            )
+        if call_row.scenario:
+            context_parts.append(f"Scenario: {call_row.scenario}")
+        if context_parts:
+            transcription = "\n".join(context_parts) + "\n\n" + transcription
+    return transcription
+
+
+def _parse_quality_response(response_text: str) -> tuple[dict[str, Any], float]:
+    """Parse the evaluator's JSON answer into (details, overall score).
+
+    Raises:
+        json.JSONDecodeError: The response is not valid JSON.
+        TypeError: A criterion score is not a number.
+    """
+    # Handle markdown code blocks if present
+    if response_text.startswith("```"):
+        response_text = response_text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+
+    quality_details = json.loads(response_text)
+
+    scores = [quality_details.get(criterion, 0.0) for criterion in QUALITY_CRITERIA]
+    overall_score = sum(scores) / len(scores) if scores else 0.0
+    return quality_details, overall_score
+
+
 @app.task(
     name="src.tasks.quality_evaluator.evaluate_call_quality",
     bind=True,
@@ -103,15 +159,13 @@ def evaluate_call_quality(self: Any, call_id: str) -> dict[str, Any]:
     Returns:
         Quality evaluation result with per-criterion scores.
     """
-    import asyncio
-
-    return asyncio.run(_evaluate_call_quality_async(self, call_id))
+    return run_async(_evaluate_call_quality_async(self, call_id))
 
 
 async def _evaluate_call_quality_async(task: Any, call_id: str) -> dict[str, Any]:
     """Async implementation of quality evaluation."""
     settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     try:
         # Fetch call turns from database
@@ -154,52 +208,32 @@ async def _evaluate_call_quality_async(task: Any, call_id: str) -> dict[str, Any
             logger.warning("No turns found for call %s, skipping quality evaluation", call_id)
             return {"call_id": call_id, "error": "no_turns"}
 
-        # Enrich turns with tool call info
-        turn_data = [{"speaker": t["speaker"], "content": t["content"]} for t in turns]
-        if tool_calls:
-            turn_data.append({"tool_calls": tool_calls})
-
-        transcription = _build_transcription_text(turn_data)
-
-        # Add call metadata context
-        if call_row:
-            context_parts = []
-            if call_row.transferred_to_operator:
-                context_parts.append(
-                    f"Call was transferred to operator. Reason: {call_row.transfer_reason}"
-                )
-            if call_row.scenario:
-                context_parts.append(f"Scenario: {call_row.scenario}")
-            if context_parts:
-                transcription = "\n".join(context_parts) + "\n\n" + transcription
+        transcription = _call_transcription(turns, tool_calls, call_row)
 
         # Call LLM for evaluation (router → Anthropic fallback)
         messages = [{"role": "user", "content": EVALUATION_PROMPT + transcription}]
 
         response_text = await llm_complete(LLMTask.QUALITY_SCORING, messages, max_tokens=512)
 
-        # Parse JSON response
-        # Handle markdown code blocks if present
-        if response_text.startswith("```"):
-            response_text = response_text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
-
-        quality_details = json.loads(response_text)
-
-        # Calculate overall score
-        scores = [quality_details.get(criterion, 0.0) for criterion in QUALITY_CRITERIA]
-        overall_score = sum(scores) / len(scores) if scores else 0.0
+        quality_details, overall_score = _parse_quality_response(response_text)
 
         # Check if call needs manual review
         needs_review = overall_score < settings.quality.score_threshold
 
-        # Save to database
+        # Save to database; the call's hour is queued for the stats rollup
         async with engine.begin() as conn:
             await conn.execute(
                 text("""
-                    UPDATE calls
-                    SET quality_score = :score,
-                        quality_details = :details
-                    WHERE id = :call_id
+                    WITH scored AS (
+                        UPDATE calls
+                        SET quality_score = :score,
+                            quality_details = :details
+                        WHERE id = :call_id
+                        RETURNING started_at
+                    )
+                    INSERT INTO call_stats_dirty_hours (bucket)
+                    SELECT DISTINCT date_trunc('hour', started_at) FROM scored
+                    ON CONFLICT DO NOTHING
                 """),
                 {
                     "call_id": call_id,
@@ -237,4 +271,266 @@ async def _evaluate_call_quality_async(task: Any, call_id: str) -> dict[str, Any
         logger.exception("LLM error during quality evaluation for call %s", call_id)
         raise task.retry(countdown=30) from err
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
+
+
+# --- Batch evaluation ---
+
+_BATCH_SCHEDULE_KEY = "quality-batch-scoring"
+_BATCH_LOCK_KEY = "quality_batch:lock"
+_BATCH_LOCK_TTL = 3600
+_BATCH_MIN_AGE_MINUTES = 10  # leave fresh calls to their per-call task
+_BATCH_LOOKBACK_DAYS = 7  # bounds the partitions scanned for unscored calls
+
+
+@app.task(
+    name="src.tasks.quality_evaluator.evaluate_quality_batch",
+    bind=True,
+    soft_time_limit=3300,
+    time_limit=3420,
+)  # type: ignore[untyped-decorator]
+def evaluate_quality_batch(
+    self: Any,
+    triggered_by: str = "manual",
+    max_calls: int | None = None,
+) -> dict[str, Any]:
+    """Score finished, unscored calls in batches.
+
+    When triggered_by="beat", checks the ``quality-batch-scoring`` schedule
+    first. Runs until no unscored calls are left or ``max_calls``
+    (default ``QUALITY_BATCH_MAX_CALLS``) have been attempted.
+
+    Returns:
+        Throughput stats: scored/failed counts, calls per minute, tokens per call.
+    """
+    return run_async(_evaluate_quality_batch_async(triggered_by, max_calls))
+
+
+async def _evaluate_quality_batch_async(
+    triggered_by: str, max_calls: int | None = None
+) -> dict[str, Any]:
+    """Async implementation of batch quality evaluation."""
+    from redis.asyncio import Redis
+
+    settings = get_settings()
+    redis = Redis.from_url(settings.redis.url, decode_responses=True)
+    engine = get_task_engine()
+    locked = False
+
+    try:
+        if triggered_by == "beat":
+            try:
+                from src.tasks.schedule_utils import load_schedules, should_run_now
+
+                schedules = await load_schedules(redis)
+                if not should_run_now(schedules.get(_BATCH_SCHEDULE_KEY, {})):
+                    logger.debug("%s: not scheduled to run now, skipping", _BATCH_SCHEDULE_KEY)
+                    return {"status": "skipped", "reason": "not_scheduled"}
+            except Exception:
+                logger.warning("Failed to check schedule, running anyway", exc_info=True)
+
+        try:
+            locked = bool(
+                await redis.set(_BATCH_LOCK_KEY, triggered_by, nx=True, ex=_BATCH_LOCK_TTL)
+            )
+            if not locked:
+                logger.warning("Quality batch scoring already running, skipping")
+                return {"status": "skipped", "reason": "already_running"}
+        except Exception:
+            logger.warning("Redis unavailable for quality batch lock, running anyway")
+
+        limit = max_calls if max_calls is not None else settings.quality.batch_max_calls
+        semaphore = asyncio.Semaphore(settings.quality.batch_concurrency)
+        attempted: list[Any] = []  # never re-select a call within one run
+        scored = failed = flagged = 0
+        input_tokens = output_tokens = 0
+        started = time.monotonic()
+
+        while len(attempted) < limit:
+            size = min(settings.quality.batch_size, limit - len(attempted))
+            batch = await _fetch_unscored_calls(engine, size, attempted)
+            if not batch:
+                break
+            attempted.extend(batch)
+
+            results = await asyncio.gather(
+                *(_score_call(semaphore, transcription) for transcription in batch.values())
+            )
+            rows: list[dict[str, Any]] = []
+            for (call_id, started_at), (outcome, usage) in zip(batch, results, strict=True):
+                input_tokens += usage.input_tokens
+                output_tokens += usage.output_tokens
+                if outcome is None:
+                    failed += 1
+                    continue
+                details, score = outcome
+                flagged += score < settings.quality.score_threshold
+                rows.append(
+                    {"id": call_id, "started_at": started_at, "score": score, "details": details}
+                )
+            await _write_scores(engine, rows)
+            scored += len(rows)
+
+        elapsed = time.monotonic() - started
+        evaluated = scored + failed
+        stats = {
+            "status": "ok",
+            "triggered_by": triggered_by,
+            "scored": scored,
+            "failed": failed,
+            "flagged_for_review": flagged,
+            "elapsed_seconds": round(elapsed, 1),
+            "calls_per_minute": round(scored / elapsed * 60, 1) if elapsed and scored else 0.0,
+            "input_tokens_per_call": round(input_tokens / evaluated) if evaluated else 0,
+            "output_tokens_per_call": round(output_tokens / evaluated) if evaluated else 0,
+        }
+        logger.info("Quality batch scoring complete: %s", stats)
+        return stats
+    finally:
+        if locked:
+            try:
+                await redis.delete(_BATCH_LOCK_KEY)
+            except Exception:
+                logger.debug("Failed to release quality batch lock", exc_info=True)
+        await redis.aclose()
+        await release_task_engine(engine)
+
+
+async def _fetch_unscored_calls(engine: Any, limit: int, exclude: list[Any]) -> dict[Any, str]:
+    """Next batch of finished, unscored calls with their transcriptions.
+
+    One query each for calls (+ metadata), turns and tool calls.
+
+    Returns:
+        ``{(call_id, started_at): transcription}`` in ``started_at`` order.
+    """
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            text("""
+                SELECT c.id, c.started_at, c.transferred_to_operator,
+                       c.transfer_reason, c.scenario
+                FROM calls c
+                WHERE c.quality_score IS NULL
+                  AND c.started_at >= now() - make_interval(days => :lookback_days)
+                  AND c.ended_at IS NOT NULL
+                  AND c.ended_at < now() - make_interval(mins => :min_age)
+                  AND NOT (c.id = ANY(:exclude))
+                  AND EXISTS (SELECT 1 FROM call_turns t WHERE t.call_id = c.id)
+                ORDER BY c.started_at
+                LIMIT :limit
+            """),
+            {
+                "lookback_days": _BATCH_LOOKBACK_DAYS,
+                "min_age": _BATCH_MIN_AGE_MINUTES,
+                "exclude": [call_id for call_id, _ in exclude],
+                "limit": limit,
+            },
+        )
+        calls = result.all()
+        if not calls:
+            return {}
+
+        ids = [c.id for c in calls]
+        since = min(c.started_at for c in calls)
+        turns_result = await conn.execute(
+            text("""
+                SELECT call_id, speaker, content
+                FROM call_turns
+                WHERE call_id = ANY(:ids) AND created_at >= :since
+                ORDER BY call_id, turn_number
+            """),
+            {"ids": ids, "since": since},
+        )
+        turns: dict[Any, list[dict[str, Any]]] = {}
+        for row in turns_result:
+            turns.setdefault(row.call_id, []).append(
+                {"speaker": row.speaker, "content": row.content}
+            )
+
+        tc_result = await conn.execute(
+            text("""
+                SELECT call_id, tool_name, success
+                FROM call_tool_calls
+                WHERE call_id = ANY(:ids) AND created_at >= :since
+                ORDER BY call_id, created_at
+            """),
+            {"ids": ids, "since": since},
+        )
+        tool_calls: dict[Any, list[dict[str, Any]]] = {}
+        for row in tc_result:
+            tool_calls.setdefault(row.call_id, []).append(
+                {"tool_name": row.tool_name, "success": row.success}
+            )
+
+    return {
+        (c.id, c.started_at): _call_transcription(
+            turns.get(c.id, []), tool_calls.get(c.id, []), c
+        )
+        for c in calls
+    }
+
+
+async def _score_call(
+    semaphore: asyncio.Semaphore, transcription: str
+) -> tuple[tuple[dict[str, Any], float] | None, Any]:
+    """LLM-score one transcription under the concurrency limit.
+
+    Returns:
+        ``((details, score) | None, usage)`` — None when the LLM call or
+        parsing failed; the call stays unscored for the next run.
+    """
+    from src.llm.models import Usage
+
+    messages = [{"role": "user", "content": EVALUATION_PROMPT + transcription}]
+    async with semaphore:
+        try:
+            response_text, usage = await llm_complete_with_usage(
+                LLMTask.QUALITY_SCORING, messages, max_tokens=512
+            )
+        except Exception:
+            logger.warning("LLM error during batch quality evaluation", exc_info=True)
+            return None, Usage(0, 0)
+    try:
+        return _parse_quality_response(response_text), usage
+    except (ValueError, TypeError, AttributeError, IndexError):
+        # Invalid JSON (JSONDecodeError is a ValueError) or non-numeric scores
+        logger.warning("Failed to parse batch quality evaluation response", exc_info=True)
+        return None, usage
+
+
+async def _write_scores(engine: Any, rows: list[dict[str, Any]]) -> None:
+    """Write a batch of scores back with one ``UPDATE ... FROM (VALUES ...)``.
+
+    The scored calls' hours are queued for the hourly stats rollup.
+    """
+    if not rows:
+        return
+    values: list[str] = []
+    params: dict[str, Any] = {}
+    for i, row in enumerate(rows):
+        values.append(
+            f"(CAST(:id_{i} AS uuid), CAST(:started_at_{i} AS timestamptz), "
+            f"CAST(:score_{i} AS double precision), CAST(:details_{i} AS jsonb))"
+        )
+        params[f"id_{i}"] = row["id"]
+        params[f"started_at_{i}"] = row["started_at"]
+        params[f"score_{i}"] = row["score"]
+        params[f"details_{i}"] = json.dumps(row["details"])
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(f"""
+                WITH scored AS (
+                    UPDATE calls AS c
+                    SET quality_score = v.score,
+                        quality_details = v.details
+                    FROM (VALUES {", ".join(values)}) AS v(id, started_at, score, details)
+                    WHERE c.id = v.id AND c.started_at = v.started_at
+                    RETURNING c.started_at
+                )
+                INSERT INTO call_stats_dirty_hours (bucket)
+                SELECT DISTINCT date_trunc('hour', started_at) FROM scored
+                ON CONFLICT DO NOTHING
+            """),
+            params,
+        )
@@ -36,6 +36,13 @@ TASK_DEFAULTS: dict[str, dict[str, Any]] = {
         "day_of_week": 6,
         "label": "Обновление STT подсказок из каталога",
     },
+    "quality-batch-scoring": {
+        "enabled": True,
+        "frequency": "daily",
+        "hour": 2,
+        "day_of_week": 0,
+        "label": "Пакетная оценка качества звонков",
+    },
 }
 
 
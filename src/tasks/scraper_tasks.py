@@ -13,11 +13,11 @@ from typing import Any
 
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from src.config import get_settings
 from src.llm import get_router
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -39,9 +39,7 @@ def run_scraper(self: Any, triggered_by: str = "manual") -> dict[str, Any]:
     Returns:
         Stats dict with processed, skipped, errors counts.
     """
-    import asyncio
-
-    return asyncio.run(_run_scraper_async(self, triggered_by=triggered_by))
+    return run_async(_run_scraper_async(self, triggered_by=triggered_by))
 
 
 async def _run_scraper_async(task: Any, *, triggered_by: str = "manual") -> dict[str, Any]:
@@ -54,7 +52,7 @@ async def _run_scraper_async(task: Any, *, triggered_by: str = "manual") -> dict
     from src.knowledge.scraper import ProKolesoScraper
 
     settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     # Read config from Redis (with env fallback)
     redis = Redis.from_url(settings.redis.url, decode_responses=True)
@@ -127,7 +125,7 @@ async def _run_scraper_async(task: Any, *, triggered_by: str = "manual") -> dict
         logger.info("Discovered %d article URLs", len(discovered))
 
         if not discovered:
-            await engine.dispose()
+            await release_task_engine(engine)
             return {"status": "ok", **stats, "discovered": 0}
 
         # 2. Filter against known URLs
@@ -291,7 +289,7 @@ async def _run_scraper_async(task: Any, *, triggered_by: str = "manual") -> dict
         raise task.retry(countdown=300) from exc
     finally:
         await scraper.close()
-        await engine.dispose()
+        await release_task_engine(engine)
 
     logger.info("Scraper finished: %s", json.dumps(stats))
     return {"status": "ok", **stats, "discovered": len(discovered)}
@@ -308,9 +306,7 @@ def scrape_single_url(
     self: Any, url: str, *, is_promotion: bool = False, is_shop_info: bool = False
 ) -> dict[str, Any]:
     """Scrape a single URL (for manual trigger from admin)."""
-    import asyncio
-
-    return asyncio.run(
+    return run_async(
         _scrape_single_url_async(self, url, is_promotion=is_promotion, is_shop_info=is_shop_info)
     )
 
@@ -325,7 +321,7 @@ async def _scrape_single_url_async(
     from src.knowledge.scraper import ProKolesoScraper
 
     settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     redis = Redis.from_url(settings.redis.url, decode_responses=True)
     try:
@@ -392,7 +388,7 @@ async def _scrape_single_url_async(
         raise task.retry(countdown=60) from exc
     finally:
         await scraper.close()
-        await engine.dispose()
+        await release_task_engine(engine)
 
 
 async def _get_scraper_config(redis: Any, settings: Any) -> dict[str, Any]:
@@ -460,9 +456,7 @@ def _dispatch_embedding(article_id: str) -> None:
 )  # type: ignore[untyped-decorator]
 def rescrape_watched_pages(self: Any) -> dict[str, Any]:
     """Check and rescrape watched pages that are due for update."""
-    import asyncio
-
-    return asyncio.run(_rescrape_watched_pages_async(self))
+    return run_async(_rescrape_watched_pages_async(self))
 
 
 async def _rescrape_watched_pages_async(task: Any) -> dict[str, Any]:
@@ -473,7 +467,7 @@ async def _rescrape_watched_pages_async(task: Any) -> dict[str, Any]:
     from src.knowledge.scraper import ProKolesoScraper, content_hash
 
     settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     redis = Redis.from_url(settings.redis.url, decode_responses=True)
     try:
@@ -500,7 +494,7 @@ async def _rescrape_watched_pages_async(task: Any) -> dict[str, Any]:
 
     if not pages:
         logger.info("No watched pages due for rescraping")
-        await engine.dispose()
+        await release_task_engine(engine)
         return {"status": "ok", **stats}
 
     logger.info("Found %d watched pages due for rescraping", len(pages))
@@ -673,7 +667,7 @@ async def _rescrape_watched_pages_async(task: Any) -> dict[str, Any]:
         raise task.retry(countdown=300) from exc
     finally:
         await scraper.close()
-        await engine.dispose()
+        await release_task_engine(engine)
 
     logger.info("Watched pages rescrape finished: %s", stats)
     return {"status": "ok", **stats}
@@ -959,15 +953,12 @@ def run_all_sources(self: Any, triggered_by: str = "manual") -> dict[str, Any]:
     Returns:
         Dict with dispatched source count.
     """
-    import asyncio
-
-    return asyncio.run(_run_all_sources_async(self, triggered_by=triggered_by))
+    return run_async(_run_all_sources_async(self, triggered_by=triggered_by))
 
 
 async def _run_all_sources_async(task: Any, *, triggered_by: str = "manual") -> dict[str, Any]:
     """Async implementation of run_all_sources."""
-    settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     try:
         async with engine.begin() as conn:
@@ -980,7 +971,7 @@ async def _run_all_sources_async(task: Any, *, triggered_by: str = "manual") ->
             )
             configs = [dict(row._mapping) for row in result]
     finally:
-        await engine.dispose()
+        await release_task_engine(engine)
 
     if not configs:
         logger.info("No enabled content sources found")
@@ -1032,9 +1023,7 @@ def run_source(self: Any, source_config_id: str, triggered_by: str = "manual") -
     Returns:
         Stats dict with processed, skipped, errors counts.
     """
-    import asyncio
-
-    return asyncio.run(_run_source_async(self, source_config_id, triggered_by=triggered_by))
+    return run_async(_run_source_async(self, source_config_id, triggered_by=triggered_by))
 
 
 async def _run_source_async(
@@ -1049,8 +1038,7 @@ async def _run_source_async(
     from src.knowledge.article_processor import process_article
     from src.knowledge.fetchers import create_fetcher
 
-    settings = get_settings()
-    engine = create_async_engine(settings.database.url, pool_pre_ping=True)
+    engine = get_task_engine()
 
     # Load source config from DB
     async with engine.begin() as conn:
@@ -1068,7 +1056,7 @@ async def _run_source_async(
 
     if not row:
         logger.error("Source config %s not found", source_config_id)
-        await engine.dispose()
+        await release_task_engine(engine)
         return {"status": "error", "reason": "config_not_found"}
 
     config = dict(row._mapping)
@@ -1078,7 +1066,7 @@ async def _run_source_async(
 
     if not config["enabled"]:
         logger.info("Source %s is disabled, skipping", config["name"])
-        await engine.dispose()
+        await release_task_engine(engine)
         return {"status": "disabled"}
 
     stats: dict[str, int] = {"processed": 0, "skipped": 0, "errors": 0, "discovered": 0}
@@ -1099,7 +1087,7 @@ async def _run_source_async(
 
         if not discovered:
             await _update_source_config_run(engine, source_config_id, "ok", stats)
-            await engine.dispose()
+            await release_task_engine(engine)
             return {"status": "ok", **stats}
 
         # Filter against known URLs
@@ -1267,7 +1255,7 @@ async def _run_source_async(
         raise task.retry(countdown=300) from exc
     finally:
         await fetcher.close()
-        await engine.dispose()
+        await release_task_engine(engine)
 
     logger.info("Source %s finished: %s", config["name"], json.dumps(stats))
     return {"status": "ok", **stats}
@@ -6,12 +6,12 @@ Can be triggered manually via Admin UI or by Celery Beat (weekly schedule).
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 from src.config import get_settings
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +29,12 @@ def refresh_stt_hints(self: Any, triggered_by: str = "manual") -> dict[str, Any]
     When triggered_by="beat", checks the configurable schedule first.
     When triggered_by="manual", runs immediately.
     """
-    return asyncio.run(_refresh_async(self, triggered_by))
+    return run_async(_refresh_async(self, triggered_by))
 
 
 async def _refresh_async(task: Any, triggered_by: str) -> dict[str, Any]:
     """Async implementation of STT hints refresh."""
     from redis.asyncio import Redis
-    from sqlalchemy.ext.asyncio import create_async_engine
 
     settings = get_settings()
 
@@ -56,9 +55,7 @@ async def _refresh_async(task: Any, triggered_by: str) -> dict[str, Any]:
         except Exception:
             logger.warning("Failed to check schedule, running anyway", exc_info=True)
 
-    engine = create_async_engine(
-        settings.database.url, pool_size=5, max_overflow=5, pool_pre_ping=True
-    )
+    engine = get_task_engine()
     redis: Redis | None = None
 
     try:
@@ -87,4 +84,4 @@ async def _refresh_async(task: Any, triggered_by: str) -> dict[str, Any]:
     finally:
         if redis is not None:
             await redis.aclose()
-        await engine.dispose()
+        await release_task_engine(engine)
@@ -7,12 +7,12 @@ trigger is also exposed via POST /admin/stt-corrections/suggestions/rescan.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
 from src.config import get_settings
 from src.tasks.celery_app import app
+from src.tasks.worker_runtime import get_task_engine, release_task_engine, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -31,19 +31,16 @@ def rescan_stt_suggestions(
     triggered_by: str = "manual",
 ) -> dict[str, Any]:
     """Weekly scan of recent call_turns → stt_correction_suggestions."""
-    return asyncio.run(_scan_async(self, days, min_occurrences, triggered_by))
+    return run_async(_scan_async(self, days, min_occurrences, triggered_by))
 
 
 async def _scan_async(
     task: Any, days: int, min_occurrences: int, triggered_by: str
 ) -> dict[str, Any]:
     from redis.asyncio import Redis
-    from sqlalchemy.ext.asyncio import create_async_engine
 
     settings = get_settings()
-    engine = create_async_engine(
-        settings.database.url, pool_size=3, max_overflow=2, pool_pre_ping=True
-    )
+    engine = get_task_engine()
     redis: Redis | None = None
 
     try:
@@ -76,4 +73,4 @@ async def _scan_async(
     finally:
         if redis is not None:
             await redis.aclose()
-        await engine.dispose()
+        await release_task_engine(engine)
@@ -0,0 +1,162 @@
+"""Per-process async runtime for Celery workers.
+
+Celery task bodies are synchronous, so async tasks used to wrap their
+coroutine in ``asyncio.run()`` and build (and dispose) a fresh
+``AsyncEngine`` on every invocation — a new PostgreSQL handshake per task.
+
+In a worker process ``init_worker_runtime`` (hooked to
+``worker_process_init`` in ``celery_app``) creates one long-lived event loop;
+tasks run on it via ``run_async`` and share one pooled engine and one
+asyncpg pool, created lazily on that loop. The process's buffered LLM usage
+writer gets a Redis spill target and is drained at shutdown. Outside a
+worker (tests, CLI, eager mode) nothing is initialised and tasks fall back
+to a throwaway loop and a per-invocation engine, as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from src.config import get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_loop: asyncio.AbstractEventLoop | None = None
+_engine: AsyncEngine | None = None
+_asyncpg_pool: Any = None
+_redis: Any = None  # spill target of the LLM usage writer
+
+
+def init_worker_runtime() -> None:
+    """Create the worker's event loop (idempotent)."""
+    global _loop, _redis
+    if _loop is not None and not _loop.is_closed():
+        return
+    from redis.asyncio import Redis
+
+    from src.monitoring.llm_usage_logger import configure_usage_writer
+
+    _loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_loop)
+    _redis = Redis.from_url(get_settings().redis.url, decode_responses=False)
+    configure_usage_writer(_redis)
+    logger.info("Celery worker async runtime initialised")
+
+
+def shutdown_worker_runtime() -> None:
+    """Drain the LLM usage writer; close the shared engine, asyncpg pool and event loop."""
+    global _loop, _engine, _asyncpg_pool, _redis
+    if _loop is None:
+        return
+    from src.monitoring.llm_usage_logger import close_usage_writer
+
+    try:
+        _loop.run_until_complete(close_usage_writer())
+    except Exception:
+        logger.warning("Failed to drain the LLM usage writer", exc_info=True)
+    try:
+        if _redis is not None:
+            _loop.run_until_complete(_redis.aclose())
+        if _asyncpg_pool is not None:
+            _loop.run_until_complete(_asyncpg_pool.close())
+        if _engine is not None:
+            _loop.run_until_complete(_engine.dispose())
+    except Exception:
+        logger.warning("Failed to close worker database pools", exc_info=True)
+    finally:
+        _loop.close()
+        asyncio.set_event_loop(None)
+        _loop = None
+        _engine = None
+        _asyncpg_pool = None
+        _redis = None
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a task coroutine to completion on the worker loop.
+
+    Falls back to ``asyncio.run`` when the runtime is not initialised. If the
+    task is interrupted (e.g. ``SoftTimeLimitExceeded`` raised from the signal
+    handler), the coroutine is cancelled and drained so it does not resume
+    during the next task and its pooled connections are returned.
+    """
+    if _loop is None or _loop.is_closed():
+        return asyncio.run(coro)
+
+    task = _loop.create_task(coro)
+    try:
+        return _loop.run_until_complete(task)
+    except BaseException:
+        if not task.done():
+            task.cancel()
+            try:
+                _loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+            except BaseException:
+                logger.warning("Interrupted task did not finish cancelling", exc_info=True)
+        raise
+
+
+def _on_worker_loop() -> bool:
+    if _loop is None:
+        return False
+    try:
+        return asyncio.get_running_loop() is _loop
+    except RuntimeError:
+        return False
+
+
+def get_task_engine() -> AsyncEngine:
+    """Engine for a task: the shared pooled engine on the worker loop, else a new one.
+
+    Pair with ``release_task_engine`` in a ``finally`` block.
+    """
+    global _engine
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    settings = get_settings()
+    if not _on_worker_loop():
+        return create_async_engine(settings.database.url, pool_pre_ping=True)
+    if _engine is None:
+        _engine = create_async_engine(
+            settings.database.url,
+            pool_size=settings.celery.worker_db_pool_size,
+            max_overflow=settings.celery.worker_db_max_overflow,
+            pool_pre_ping=True,
+        )
+    return _engine
+
+
+async def release_task_engine(engine: AsyncEngine) -> None:
+    """Dispose a per-invocation engine; the shared engine stays open."""
+    if engine is not _engine:
+        await engine.dispose()
+
+
+async def get_asyncpg_pool() -> Any:
+    """Raw asyncpg pool for code that bypasses SQLAlchemy.
+
+    Shared on the worker loop; otherwise a new pool the caller must close
+    via ``release_asyncpg_pool``.
+    """
+    global _asyncpg_pool
+    import asyncpg  # type: ignore[import-untyped]
+
+    db_url = get_settings().database.url.replace("+asyncpg", "")
+    if not _on_worker_loop():
+        return await asyncpg.create_pool(db_url)
+    if _asyncpg_pool is None:
+        _asyncpg_pool = await asyncpg.create_pool(db_url, min_size=1, max_size=5)
+    return _asyncpg_pool
+
+
+async def release_asyncpg_pool(pool: Any) -> None:
+    """Close a per-invocation asyncpg pool; the shared pool stays open."""
+    if pool is not _asyncpg_pool:
+        await pool.close()
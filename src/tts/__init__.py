@@ -36,10 +36,18 @@ async def reinitialize_engine(config: TTSConfig) -> GoogleTTSEngine:
 
     Both active and new calls pick up the new engine via the _tts property
     (get_engine() is called on each synthesize, not cached at call start).
+    Clips for a voice config seen before come from the shared TTS cache
+    instead of being synthesized again.
     """
+    from src.config import get_settings
+    from src.tts.audio_cache import create_shared_cache
     from src.tts.google_tts import GoogleTTSEngine
 
-    new_engine = GoogleTTSEngine(config=config)
+    new_engine = GoogleTTSEngine(
+        config=config,
+        shared_cache=await create_shared_cache(config),
+        memory_cache_max_bytes=get_settings().tts_cache.memory_max_mb * 1024 * 1024,
+    )
     await new_engine.initialize()
     set_engine(new_engine)
     logger.info(
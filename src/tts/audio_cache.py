@@ -0,0 +1,267 @@
+"""Shared (second-tier) TTS audio cache in Redis.
+
+``GoogleTTSEngine`` keeps an in-process LRU of framed clips; this store
+sits behind it so every worker process — and every restart or TTS config
+hot-reload that comes back to a voice already used — reuses audio that
+was synthesized once instead of re-billing Google for the same greetings,
+fillers and confirmations.
+
+Layout (binary Redis client, all keys share one namespace per voice)::
+
+    tts:audio:active                 fingerprint of the current voice config
+    tts:audio:{fp}:{text_hash}       raw PCM clip (with TTL)
+    tts:audio:{fp}:_lru              ZSET text_hash → last access (epoch s)
+    tts:audio:{fp}:_size             HASH text_hash → clip bytes
+    tts:audio:{fp}:_bytes            total clip bytes in the namespace
+
+``fp`` is a digest of everything that changes the produced audio (voice,
+language, rate, pitch, sample rate and SSML break rules), so a voice
+change is a clean namespace switch; ``activate()`` then drops the old
+namespace. Eviction by size removes least-recently-used clips once the
+namespace exceeds ``max_bytes``.
+
+All Redis errors are swallowed — the shared tier is an optimization and
+must never fail a synthesis.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import time
+from typing import TYPE_CHECKING, Any
+
+from src.monitoring.metrics import (
+    tts_cache_tier_bytes,
+    tts_cache_tier_evictions_total,
+    tts_cache_tier_hits_total,
+    tts_cache_tier_misses_total,
+)
+
+if TYPE_CHECKING:
+    from src.tts.base import TTSConfig
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "tts:audio"
+ACTIVE_KEY = f"{KEY_PREFIX}:active"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_COMBINING_ACUTE = "\u0301"
+
+# Clips evicted per round-trip when the namespace is over budget
+_EVICT_BATCH = 32
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache lookups.
+
+    Strips stress marks (U+0301) and collapses whitespace, so variants
+    that synthesize to the same audio share one cache entry.
+    """
+    return _WHITESPACE_RE.sub(" ", text.replace(_COMBINING_ACUTE, "")).strip()
+
+
+def text_hash(text: str) -> str:
+    """Cache key for *text* (hash of its normalized form)."""
+    return hashlib.sha256(normalize_text(text).encode()).hexdigest()
+
+
+def voice_fingerprint(config: TTSConfig) -> str:
+    """Short digest of every TTS setting that affects the synthesized audio."""
+    parts = (
+        config.language_code,
+        config.voice_name,
+        f"{config.speaking_rate:g}",
+        f"{config.pitch:g}",
+        config.sample_rate_hertz,
+        config.break_comma_ms,
+        config.break_period_ms,
+        config.break_exclamation_ms,
+        config.break_colon_ms,
+        config.break_semicolon_ms,
+        config.break_em_dash_ms,
+    )
+    return hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()[:16]
+
+
+class SharedTTSAudioCache:
+    """Redis-backed TTS clip store shared by all worker processes.
+
+    Args:
+        redis: Binary Redis client (``get_redis_binary()``).
+        fingerprint: ``voice_fingerprint()`` of the engine's config.
+        max_bytes: Size budget for one voice namespace.
+        ttl_sec: Expiry of individual clips (refreshed on write only).
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        fingerprint: str,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_sec: int = 30 * 86400,
+    ) -> None:
+        self._redis = redis
+        self._fingerprint = fingerprint
+        self._max_bytes = max_bytes
+        self._ttl_sec = ttl_sec
+        self._ns = f"{KEY_PREFIX}:{fingerprint}"
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    def _clip_key(self, key: str) -> str:
+        return f"{self._ns}:{key}"
+
+    async def activate(self) -> None:
+        """Mark this voice config as current and drop the previous namespace.
+
+        Called once per engine initialize; a no-op when the voice config
+        did not change (e.g. plain restart).
+        """
+        try:
+            previous = await self._redis.getset(ACTIVE_KEY, self._fingerprint)
+        except Exception:
+            logger.warning("Shared TTS cache unavailable", exc_info=True)
+            return
+        if isinstance(previous, bytes):
+            previous = previous.decode()
+        if previous and previous != self._fingerprint:
+            removed = await self._purge_namespace(f"{KEY_PREFIX}:{previous}")
+            logger.info(
+                "TTS voice config changed (%s → %s): evicted %d shared clips",
+                previous,
+                self._fingerprint,
+                removed,
+            )
+        await self._refresh_bytes_gauge()
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the clip for *key* (``text_hash``), or ``None``."""
+        return (await self.get_many([key]))[0]
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Fetch several clips in one round-trip (order preserved)."""
+        if not keys:
+            return []
+        try:
+            values = await self._redis.mget([self._clip_key(k) for k in keys])
+            hit_keys = {k: time.time() for k, v in zip(keys, values, strict=True) if v}
+            if hit_keys:
+                await self._redis.zadd(f"{self._ns}:_lru", hit_keys)
+        except Exception:
+            logger.debug("Shared TTS cache read failed", exc_info=True)
+            values = [None] * len(keys)
+        hits = sum(1 for v in values if v)
+        if hits:
+            tts_cache_tier_hits_total.labels(tier="shared").inc(hits)
+        if hits < len(keys):
+            tts_cache_tier_misses_total.labels(tier="shared").inc(len(keys) - hits)
+        return list(values)
+
+    async def put(self, key: str, audio: bytes) -> None:
+        """Store a clip, then evict least-recently-used clips if over budget."""
+        if len(audio) > self._max_bytes:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.set(self._clip_key(key), bytes(audio), ex=self._ttl_sec)
+            pipe.zadd(f"{self._ns}:_lru", {key: time.time()})
+            pipe.hget(f"{self._ns}:_size", key)
+            pipe.hset(f"{self._ns}:_size", key, len(audio))
+            _, _, old_size, _ = await pipe.execute()
+            delta = len(audio) - int(old_size or 0)
+            total = await self._redis.incrby(f"{self._ns}:_bytes", delta)
+            if total > self._max_bytes:
+                total = await self._evict(total)
+            tts_cache_tier_bytes.labels(tier="shared").set(total)
+        except Exception:
+            logger.debug("Shared TTS cache write failed", exc_info=True)
+
+    async def _evict(self, total: int) -> int:
+        """Drop least-recently-used clips until the namespace fits ``max_bytes``."""
+        lru_key = f"{self._ns}:_lru"
+        size_key = f"{self._ns}:_size"
+        evicted = 0
+        while total > self._max_bytes:
+            oldest = await self._redis.zpopmin(lru_key, _EVICT_BATCH)
+            if not oldest:
+                break
+            sizes = await self._redis.hmget(size_key, [m for m, _ in oldest])
+            victims: list[Any] = []
+            freed = 0
+            for (member, _score), size in zip(oldest, sizes, strict=True):
+                if total - freed <= self._max_bytes:
+                    break
+                victims.append(member)
+                freed += int(size or 0)
+            pipe = self._redis.pipeline(transaction=False)
+            keep = dict(oldest[len(victims) :])
+            if keep:
+                # Popped but not needed — restore with their original scores
+                pipe.zadd(lru_key, keep)
+            pipe.delete(*(self._clip_key(_decode(m)) for m in victims))
+            pipe.hdel(size_key, *victims)
+            pipe.incrby(f"{self._ns}:_bytes", -freed)
+            total = (await pipe.execute())[-1]
+            evicted += len(victims)
+        if evicted:
+            tts_cache_tier_evictions_total.labels(tier="shared", reason="size").inc(evicted)
+            logger.info("Shared TTS cache over budget: evicted %d clips", evicted)
+        return int(total)
+
+    async def _purge_namespace(self, ns: str) -> int:
+        """Delete every key of a (stale) voice namespace; returns clips removed."""
+        removed = 0
+        batch: list[Any] = []
+        try:
+            async for key in self._redis.scan_iter(match=f"{ns}:*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await self._redis.unlink(*batch)
+                    removed += _count_clips(batch)
+                    batch = []
+            if batch:
+                await self._redis.unlink(*batch)
+                removed += _count_clips(batch)
+        except Exception:
+            logger.warning("Failed to purge stale TTS cache namespace %s", ns, exc_info=True)
+        if removed:
+            tts_cache_tier_evictions_total.labels(tier="shared", reason="voice_change").inc(removed)
+        return removed
+
+    async def _refresh_bytes_gauge(self) -> None:
+        try:
+            total = await self._redis.get(f"{self._ns}:_bytes")
+            tts_cache_tier_bytes.labels(tier="shared").set(int(total or 0))
+        except Exception:
+            logger.debug("Shared TTS cache size read failed", exc_info=True)
+
+
+def _decode(member: Any) -> str:
+    return member.decode() if isinstance(member, bytes) else str(member)
+
+
+def _count_clips(keys: list[Any]) -> int:
+    """Count clip keys, skipping the ``_lru``/``_size``/``_bytes`` bookkeeping keys."""
+    return sum(1 for k in keys if not _decode(k).rsplit(":", 1)[-1].startswith("_"))
+
+
+async def create_shared_cache(config: TTSConfig) -> SharedTTSAudioCache | None:
+    """Build the shared cache for *config* from settings (``None`` if disabled)."""
+    from src.config import get_settings
+    from src.core.redis_client import get_redis_binary
+
+    settings = get_settings().tts_cache
+    if not settings.shared_enabled:
+        return None
+    return SharedTTSAudioCache(
+        await get_redis_binary(),
+        voice_fingerprint(config),
+        max_bytes=settings.shared_max_mb * 1024 * 1024,
+        ttl_sec=settings.shared_ttl_days * 86400,
+    )
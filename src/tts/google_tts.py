@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import logging
 import re
 import xml.sax.saxutils
@@ -29,12 +29,23 @@ from src.agent.prompts import (
     WAIT_TEXT,
     WAIT_THINKING_POOL,
 )
-from src.monitoring.metrics import tts_cache_hits_total, tts_cache_misses_total
+from src.core.audio_socket import FramedAudio
+from src.monitoring.metrics import (
+    tts_cache_hits_total,
+    tts_cache_misses_total,
+    tts_cache_tier_bytes,
+    tts_cache_tier_evictions_total,
+    tts_cache_tier_hits_total,
+    tts_cache_tier_misses_total,
+)
+from src.tts.audio_cache import text_hash
 from src.tts.base import TTSConfig
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+    from src.tts.audio_cache import SharedTTSAudioCache
+
 logger = logging.getLogger(__name__)
 
 # Sentence-splitting pattern (split on ., !, ? followed by space or end)
@@ -107,21 +118,65 @@ CACHED_PHRASES = [
 ]
 
 
+# Default in-process cache budget (~10 s of 8 kHz audio per clip → ~200 clips)
+_MEMORY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Only short phrases are cached (likely to repeat — most agent responses are <200 chars)
+_MAX_CACHED_TEXT_LEN = 200
+
+
+class _ClipLRU(LRUCache[str, FramedAudio]):
+    """Byte-bounded LRU of framed clips that reports evictions and size.
+
+    A clip larger than the whole budget (any clip when it is 0) is not kept
+    in memory; it is still served from the shared cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__(maxsize=maxsize, getsizeof=len)
+
+    def __setitem__(self, key: str, value: FramedAudio) -> None:
+        if len(value) > self.maxsize:
+            return
+        super().__setitem__(key, value)
+        tts_cache_tier_bytes.labels(tier="memory").set(self.currsize)
+
+    def popitem(self) -> tuple[str, FramedAudio]:
+        item = super().popitem()
+        tts_cache_tier_evictions_total.labels(tier="memory", reason="size").inc()
+        return item
+
+
 class GoogleTTSEngine:
-    """Google Cloud TTS with in-memory phrase caching.
+    """Google Cloud TTS with two-tier phrase caching.
 
     Audio format: LINEAR16, 16kHz, mono — matches AudioSocket expectations.
+    Cached clips are stored as ``FramedAudio`` so their AudioSocket packets
+    are built once and shared by every call that replays them.
+
+    The in-process LRU is backed by an optional ``SharedTTSAudioCache``
+    (Redis), so other workers, restarts and hot-reloads back to a known
+    voice reuse clips instead of synthesizing them again.
     """
 
-    def __init__(self, config: TTSConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: TTSConfig | None = None,
+        shared_cache: SharedTTSAudioCache | None = None,
+        memory_cache_max_bytes: int = _MEMORY_CACHE_MAX_BYTES,
+    ) -> None:
         self._config = config or TTSConfig()
         self._client: texttospeech.TextToSpeechAsyncClient | None = None
         self._voice: texttospeech.VoiceSelectionParams | None = None
         self._audio_config: texttospeech.AudioConfig | None = None
-        self._cache: LRUCache[str, bytes] = LRUCache(maxsize=200)
+        self._cache: LRUCache[str, FramedAudio] = _ClipLRU(memory_cache_max_bytes)
+        self._shared_cache = shared_cache
+        self._shared_writes: set[asyncio.Task[None]] = set()
         self._cache_hits = 0
         self._cache_misses = 0
         self._ssml_supported: bool = True
+        # Bidirectional streaming synthesis is only offered for Chirp3-HD voices
+        self._streaming_supported: bool = "Chirp3-HD" in self._config.voice_name
         self._break_rules = self._build_break_rules()
 
     def _build_break_rules(self) -> list[tuple[re.Pattern[str], str]]:
@@ -150,11 +205,27 @@ class GoogleTTSEngine:
             pitch=self._config.pitch,
         )
 
-        # Pre-cache common phrases (with auto-detection of voice capabilities)
-        for phrase in CACHED_PHRASES:
+        # Pre-cache common phrases: shared cache first, then the API
+        # (with auto-detection of voice capabilities)
+        pending = list(dict.fromkeys(CACHED_PHRASES))
+        if self._shared_cache is not None:
+            await self._shared_cache.activate()
+            keys = [self._cache_key(phrase) for phrase in pending]
+            shared = await self._shared_cache.get_many(keys)
+            for key, audio in zip(keys, shared, strict=True):
+                if audio:
+                    self._cache[key] = FramedAudio(audio)
+            pending = [p for p, audio in zip(pending, shared, strict=True) if not audio]
+            logger.info(
+                "TTS pre-cache: %d phrases from shared cache, %d to synthesize",
+                len(keys) - len(pending),
+                len(pending),
+            )
+
+        for phrase in pending:
             try:
                 audio = await self._synthesize_uncached(phrase)
-                self._cache[self._cache_key(phrase)] = audio
+                self._store(self._cache_key(phrase), audio)
             except Exception as exc:
                 exc_msg = str(exc)
                 if "pitch" in exc_msg.lower():
@@ -170,7 +241,7 @@ class GoogleTTSEngine:
                     )
                     try:
                         audio = await self._synthesize_uncached(phrase)
-                        self._cache[self._cache_key(phrase)] = audio
+                        self._store(self._cache_key(phrase), audio)
                     except Exception:
                         logger.warning("Failed to pre-cache phrase: '%s'", phrase[:40])
                     continue
@@ -181,21 +252,93 @@ class GoogleTTSEngine:
     async def synthesize(self, text: str) -> bytes:
         """Synthesize text into raw PCM audio bytes."""
         key = self._cache_key(text)
+        cacheable = len(text) < _MAX_CACHED_TEXT_LEN
+
+        cached = await self._lookup(key, cacheable)
+        if cached is not None:
+            return cached
+
+        audio = await self._synthesize_uncached(text)
+
+        if cacheable:
+            audio = self._store(key, audio)
 
+        return audio
+
+    async def synthesize_chunks(self, text: str) -> AsyncIterator[bytes]:
+        """Synthesize one sentence, yielding PCM chunks as soon as they arrive.
+
+        Cached clips are yielded whole. Voices that support Google's
+        bidirectional streaming API (Chirp3-HD) stream uncached text chunk
+        by chunk, so playback can start before synthesis finishes; other
+        voices fall back to one ``synthesize()`` result. The joined chunks
+        are cached like a regular synthesis.
+        """
+        key = self._cache_key(text)
+        cacheable = len(text) < _MAX_CACHED_TEXT_LEN
+
+        cached = await self._lookup(key, cacheable)
+        if cached is not None:
+            yield cached
+            return
+
+        if not self._streaming_supported:
+            audio = await self._synthesize_uncached(text)
+            yield self._store(key, audio) if cacheable else audio
+            return
+
+        chunks: list[bytes] = []
+        try:
+            async for chunk in self._stream_uncached(text):
+                chunks.append(chunk)
+                yield chunk
+        except Exception:
+            if chunks:
+                raise
+            # Nothing played yet — use unary synthesis from now on
+            self._streaming_supported = False
+            logger.info(
+                "Voice %s does not support streaming synthesis, falling back to unary",
+                self._config.voice_name,
+            )
+            audio = await self._synthesize_uncached(text)
+            yield self._store(key, audio) if cacheable else audio
+            return
+
+        if cacheable and chunks:
+            self._store(key, b"".join(chunks))
+
+    async def _lookup(self, key: str, cacheable: bool) -> FramedAudio | None:
+        """Look a clip up in the memory tier, then the shared tier (counts misses)."""
         if key in self._cache:
             self._cache_hits += 1
             tts_cache_hits_total.inc()
+            tts_cache_tier_hits_total.labels(tier="memory").inc()
             return self._cache[key]
+        tts_cache_tier_misses_total.labels(tier="memory").inc()
+
+        if cacheable and self._shared_cache is not None:
+            shared = await self._shared_cache.get(key)
+            if shared:
+                self._cache_hits += 1
+                tts_cache_hits_total.inc()
+                clip = FramedAudio(shared)
+                self._cache[key] = clip
+                return clip
 
         self._cache_misses += 1
         tts_cache_misses_total.inc()
-        audio = await self._synthesize_uncached(text)
-
-        # Cache short phrases (likely to repeat — most agent responses are <200 chars)
-        if len(text) < 200:
-            self._cache[key] = audio
-
-        return audio
+        return None
+
+    def _store(self, key: str, audio: bytes) -> FramedAudio:
+        """Put a clip in the memory tier and (in the background) the shared tier."""
+        clip = FramedAudio(audio)
+        self._cache[key] = clip
+        if self._shared_cache is not None:
+            task = asyncio.create_task(self._shared_cache.put(key, audio))
+            self._shared_writes.add(task)
+            task.add_done_callback(self._shared_writes.discard)
+        return clip
 
     async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
         """Synthesize text sentence by sentence for streaming playback."""
@@ -218,11 +361,13 @@ class GoogleTTSEngine:
     def _cache_key(text: str) -> str:
         """Generate a cache key for a text string.
 
-        Strips combining acute accents (U+0301) before hashing so that
-        texts with/without stress marks map to the same cache entry.
+        Strips combining acute accents (U+0301) and collapses whitespace
+        before hashing so that texts with/without stress marks map to the
+        same cache entry. Voice settings are not part of the key: the
+        memory tier belongs to one engine (one config) and the shared tier
+        namespaces keys by voice fingerprint.
         """
-        normalized = text.replace(_COMBINING_ACUTE, "")
-        return hashlib.sha256(normalized.encode()).hexdigest()
+        return text_hash(text)
 
     def _to_ssml(self, text: str) -> str:
         """Convert plain text to SSML with natural pauses.
@@ -248,10 +393,7 @@ class GoogleTTSEngine:
         if self._client is None:
             raise RuntimeError("TTS not initialized — call initialize() first")
 
-        text = text.replace(_COMBINING_ACUTE, "")
-
-        for pattern, replacement in _TTS_SUBSTITUTIONS:
-            text = pattern.sub(replacement, text)
+        text = self._prepare_text(text)
 
         if self._ssml_supported:
             try:
@@ -267,6 +409,47 @@ class GoogleTTSEngine:
 
         return await self._call_tts_api(texttospeech.SynthesisInput(text=text), text)
 
+    async def _stream_uncached(self, text: str) -> AsyncIterator[bytes]:
+        """Call Google's streaming synthesis API, yielding raw PCM chunks.
+
+        Streaming input is plain text only (no SSML breaks) — the voices
+        that support it reject SSML anyway.
+        """
+        if self._client is None:
+            raise RuntimeError("TTS not initialized — call initialize() first")
+
+        prepared = self._prepare_text(text)
+        streaming_config = texttospeech.StreamingSynthesizeConfig(
+            voice=self._voice,
+            streaming_audio_config=texttospeech.StreamingAudioConfig(
+                audio_encoding=texttospeech.AudioEncoding.PCM,
+                sample_rate_hertz=self._config.sample_rate_hertz,
+                speaking_rate=self._config.speaking_rate,
+            ),
+        )
+
+        async def _requests() -> AsyncIterator[texttospeech.StreamingSynthesizeRequest]:
+            yield texttospeech.StreamingSynthesizeRequest(streaming_config=streaming_config)
+            yield texttospeech.StreamingSynthesizeRequest(
+                input=texttospeech.StreamingSynthesisInput(text=prepared)
+            )
+
+        responses = await self._client.streaming_synthesize(_requests())
+        total = 0
+        async for response in responses:
+            if response.audio_content:
+                total += len(response.audio_content)
+                yield response.audio_content
+        logger.debug("TTS streamed %d bytes for '%s'", total, text[:50])
+
+    @staticmethod
+    def _prepare_text(text: str) -> str:
+        """Strip stress marks and apply pronunciation substitutions."""
+        text = text.replace(_COMBINING_ACUTE, "")
+        for pattern, replacement in _TTS_SUBSTITUTIONS:
+            text = pattern.sub(replacement, text)
+        return text
+
     async def _call_tts_api(self, synthesis_input: texttospeech.SynthesisInput, text: str) -> bytes:
         """Send synthesis request to Google TTS and return raw PCM audio."""
         response = await self._client.synthesize_speech(  # type: ignore[union-attr]
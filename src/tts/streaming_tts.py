@@ -5,9 +5,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+from collections import deque
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from src.core.audio_socket import AUDIO_FRAME_BYTES, FramedAudio
 from src.core.sentence_buffer import SentenceReady
 from src.llm.models import StreamDone, ToolCallDelta, ToolCallEnd, ToolCallStart
 
@@ -131,7 +133,43 @@ class AudioReady:
     text: str  # original text (for logging/metrics)
 
 
-TTSEvent = AudioReady | ToolCallStart | ToolCallDelta | ToolCallEnd | StreamDone
+@dataclass(frozen=True)
+class AudioChunk:
+    """Part of one sentence's PCM audio, delivered while synthesis continues.
+
+    ``audio`` is a whole number of AudioSocket frames except on the last
+    chunk, which carries the remainder (possibly empty) and marks the
+    sentence as complete.
+    """
+
+    audio: bytes
+    text: str
+    first: bool
+    last: bool
+
+
+TTSEvent = AudioReady | AudioChunk | ToolCallStart | ToolCallDelta | ToolCallEnd | StreamDone
+
+# Sentinels on the per-sentence chunk queue
+_SENTENCE_DONE = object()
+_SENTENCE_FAILED = object()
+
+# Process-wide cap on concurrent syntheses (shared by all calls on the loop)
+_synthesis_slots: asyncio.Semaphore | None = None
+_synthesis_slots_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_synthesis_slots() -> asyncio.Semaphore:
+    """Return the process-wide synthesis semaphore for the running loop."""
+    global _synthesis_slots, _synthesis_slots_loop
+    loop = asyncio.get_running_loop()
+    if _synthesis_slots is None or _synthesis_slots_loop is not loop:
+        from src.config import get_settings
+
+        limit = get_settings().tts_stream.max_concurrent_per_process
+        _synthesis_slots = asyncio.Semaphore(max(1, limit))
+        _synthesis_slots_loop = loop
+    return _synthesis_slots
 
 
 class StreamingTTSSynthesizer:
@@ -139,69 +177,91 @@ class StreamingTTSSynthesizer:
 
     All other BufferEvents (tool calls, StreamDone) pass through unchanged.
 
-    When prefetch=True (default), uses 1-slot lookahead: starts synthesizing
-    the next sentence while the current one is being yielded/played.
+    When prefetch=True (default), up to ``lookahead`` following sentences
+    are synthesized while the current one is being yielded/played.
+
+    When chunked=True, each sentence is emitted as ``AudioChunk`` events as
+    soon as the engine's ``synthesize_chunks()`` produces audio (engines
+    without it yield one chunk per sentence). Playback of the first
+    sentence starts without waiting for the next one to arrive from the
+    LLM, and ``lookahead`` sentences are synthesized ahead of the one
+    playing. Every synthesis also holds a process-wide slot
+    (``TTS_STREAM_MAX_CONCURRENT_PER_PROCESS``).
     """
 
-    def __init__(self, tts: TTSEngine, *, prefetch: bool = True) -> None:
+    def __init__(
+        self,
+        tts: TTSEngine,
+        *,
+        prefetch: bool = True,
+        lookahead: int = 1,
+        chunked: bool = False,
+    ) -> None:
         self._tts = tts
         self._prefetch = prefetch
+        self._lookahead = max(1, lookahead)
+        self._chunked = chunked
 
     async def process(
         self,
         stream: AsyncIterator[BufferEvent],
     ) -> AsyncIterator[TTSEvent]:
         """Consume buffer events, synthesizing sentences into audio."""
-        if not self._prefetch:
-            async for event in self._process_sequential(stream):
+        if self._chunked:
+            async for event in self._process_chunked(stream):
                 yield event
             return
 
-        # Prefetch path: 1-slot lookahead
-        pending_task: asyncio.Task[bytes] | None = None
-        pending_text: str | None = None
-
-        async for event in stream:  # type: ignore[assignment]
-            if isinstance(event, SentenceReady):
-                # Last-mile normalisation (ISO dates, tire sizes, house
-                # numbers with letter suffix) so TTS speaks natural Ukrainian.
-                normalized = _normalize_for_tts(event.text)
-                # Launch new task FIRST so it runs while we await the old one
-                new_task = asyncio.create_task(self._tts.synthesize(normalized))
-                new_text = normalized
-
-                # Now await previous task (new synthesis runs in parallel)
-                if pending_task is not None:
-                    try:
-                        audio = await pending_task
-                        yield AudioReady(audio=audio, text=pending_text)  # type: ignore[arg-type]
-                    except Exception:
-                        logger.warning("Prefetch TTS failed for '%s', skipping", pending_text)
-
-                pending_task = new_task
-                pending_text = new_text
-
-            elif isinstance(event, (ToolCallStart, StreamDone)):
-                # Flush pending synthesis before control events
-                if pending_task is not None:
-                    try:
-                        audio = await pending_task
-                        yield AudioReady(audio=audio, text=pending_text)  # type: ignore[arg-type]
-                    except Exception:
-                        logger.warning("Prefetch TTS failed for '%s', skipping", pending_text)
-                    pending_task = None
-                    pending_text = None
-                yield event
-            else:
+        if not self._prefetch:
+            async for event in self._process_sequential(stream):
                 yield event
+            return
 
-        # Flush any remaining pending task
-        if pending_task is not None:
-            try:
-                audio = await pending_task
-                yield AudioReady(audio=audio, text=pending_text)  # type: ignore[arg-type]
-            except Exception:
-                logger.warning("Prefetch TTS failed for '%s', skipping", pending_text)
+        # Prefetch path: up to `lookahead` sentences synthesizing ahead
+        pending: deque[tuple[str, asyncio.Task[bytes]]] = deque()
+        try:
+            async for event in stream:  # type: ignore[assignment]
+                if isinstance(event, SentenceReady):
+                    # Last-mile normalisation (ISO dates, tire sizes, house
+                    # numbers with letter suffix) so TTS speaks natural Ukrainian.
+                    normalized = _normalize_for_tts(event.text)
+                    # Launch new task FIRST so it runs while we await the old ones
+                    pending.append((normalized, asyncio.create_task(self._synthesize(normalized))))
+                    while len(pending) > self._lookahead:
+                        ready = await self._await_prefetched(*pending.popleft())
+                        if ready is not None:
+                            yield ready
+
+                elif isinstance(event, (ToolCallStart, StreamDone)):
+                    # Flush pending synthesis before control events
+                    while pending:
+                        ready = await self._await_prefetched(*pending.popleft())
+                        if ready is not None:
+                            yield ready
+                    yield event
+                else:
+                    yield event
+
+            # Flush any remaining pending tasks
+            while pending:
+                ready = await self._await_prefetched(*pending.popleft())
+                if ready is not None:
+                    yield ready
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def _synthesize(self, text: str) -> bytes:
+        async with _get_synthesis_slots():
+            return await self._tts.synthesize(text)
+
+    @staticmethod
+    async def _await_prefetched(text: str, task: asyncio.Task[bytes]) -> AudioReady | None:
+        try:
+            return AudioReady(audio=await task, text=text)
+        except Exception:
+            logger.warning("Prefetch TTS failed for '%s', skipping", text)
+            return None
 
     async def _process_sequential(
         self,
@@ -216,12 +276,122 @@ class StreamingTTSSynthesizer:
             else:
                 yield event
 
+    async def _process_chunked(
+        self,
+        stream: AsyncIterator[BufferEvent],
+    ) -> AsyncIterator[TTSEvent]:
+        """Chunked path: sentences stream in order while later ones synthesize.
+
+        A feeder task reads the buffer stream and starts one synthesis task
+        per sentence (at most ``lookahead`` + the playing one at a time);
+        this generator replays the sentences' chunk queues and the control
+        events in their original order.
+        """
+        items: asyncio.Queue[Any] = asyncio.Queue()
+        in_flight = asyncio.Semaphore(self._lookahead + 1)
+        tasks: list[asyncio.Task[None]] = []
+        end = object()
+
+        async def _feed() -> None:
+            try:
+                async for event in stream:
+                    if isinstance(event, SentenceReady):
+                        normalized = _normalize_for_tts(event.text)
+                        await in_flight.acquire()
+                        chunks: asyncio.Queue[Any] = asyncio.Queue()
+                        tasks.append(asyncio.create_task(self._stream_sentence(normalized, chunks)))
+                        await items.put((normalized, chunks))
+                    else:
+                        await items.put(event)
+            except Exception as exc:
+                # Surface upstream (LLM) errors to the consumer, in order
+                await items.put(exc)
+            finally:
+                await items.put(end)
+
+        feeder = asyncio.create_task(_feed())
+        try:
+            while (item := await items.get()) is not end:
+                if isinstance(item, Exception):
+                    raise item
+                if not isinstance(item, tuple):
+                    yield item
+                    continue
+                text, chunks = item
+                try:
+                    async for chunk in self._drain_sentence(text, chunks):
+                        yield chunk
+                finally:
+                    in_flight.release()
+        finally:
+            feeder.cancel()
+            for task in tasks:
+                task.cancel()
+
+    async def _stream_sentence(self, text: str, chunks: asyncio.Queue[Any]) -> None:
+        """Synthesize *text* into *chunks*, ending with a done/failed sentinel."""
+        try:
+            async with _get_synthesis_slots():
+                synthesize_chunks = getattr(self._tts, "synthesize_chunks", None)
+                if synthesize_chunks is None:
+                    await chunks.put(await self._tts.synthesize(text))
+                else:
+                    async for chunk in synthesize_chunks(text):
+                        await chunks.put(chunk)
+        except Exception:
+            logger.warning("Streaming TTS failed for '%s'", text, exc_info=True)
+            await chunks.put(_SENTENCE_FAILED)
+        else:
+            await chunks.put(_SENTENCE_DONE)
+
+    @staticmethod
+    async def _drain_sentence(text: str, chunks: asyncio.Queue[Any]) -> AsyncIterator[AudioChunk]:
+        """Re-cut engine chunks on frame boundaries and emit them as they arrive."""
+        remainder = b""
+        first = True
+        while (chunk := await chunks.get()) not in (_SENTENCE_DONE, _SENTENCE_FAILED):
+            if not remainder and isinstance(chunk, FramedAudio):
+                # Cached clip — keep it whole so its pre-built packets are reused
+                data, remainder = chunk, b""
+            else:
+                joined = remainder + chunk
+                cut = len(joined) - len(joined) % AUDIO_FRAME_BYTES
+                data, remainder = joined[:cut], joined[cut:]
+            if data:
+                yield AudioChunk(audio=data, text=text, first=first, last=False)
+                first = False
+        if chunk is _SENTENCE_FAILED and first:
+            logger.warning("Streaming TTS produced no audio for '%s', skipping", text)
+            return
+        yield AudioChunk(audio=remainder, text=text, first=first, last=True)
+
 
 async def synthesize_stream(
     stream: AsyncIterator[BufferEvent],
     tts: TTSEngine,
 ) -> AsyncIterator[TTSEvent]:
-    """Convenience wrapper — create synthesizer and process stream."""
-    synth = StreamingTTSSynthesizer(tts)
+    """Convenience wrapper — create synthesizer (per TTS_STREAM_* settings) and process stream."""
+    from src.config import get_settings
+
+    settings = get_settings().tts_stream
+    synth = StreamingTTSSynthesizer(
+        tts,
+        lookahead=settings.lookahead_sentences,
+        chunked=settings.chunked,
+    )
     async for event in synth.process(stream):
         yield event
+
+
+async def prewarm_sentence(tts: TTSEngine, text: str) -> None:
+    """Synthesize *text* into the engine's clip cache without playing it.
+
+    Applies the same normalization as ``StreamingTTSSynthesizer``, so a
+    later ``synthesize_stream`` of the same sentence is a cache hit.
+    Failures are logged and ignored.
+    """
+    try:
+        async with _get_synthesis_slots():
+            await tts.synthesize(_normalize_for_tts(text))
+    except Exception:
+        logger.debug("TTS prewarm failed for '%s'", text[:40], exc_info=True)
@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
-from src.agent.ab_testing import calculate_significance
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agent import ab_testing
+from src.agent.ab_testing import ABTestManager, calculate_significance, is_variant_a
 from src.agent.prompts import PROMPT_VERSION, SYSTEM_PROMPT
 
 
@@ -65,3 +72,123 @@ class TestPromptVersionFallback:
         """System prompt should contain essential instructions."""
         assert "Олена" in SYSTEM_PROMPT or "олена" in SYSTEM_PROMPT.lower()
         assert "українськ" in SYSTEM_PROMPT.lower() or "uk" in SYSTEM_PROMPT.lower()
+
+
+def _test_row(traffic_split: float = 0.5) -> dict[str, Any]:
+    return {
+        "id": uuid.uuid4(),
+        "test_name": "greeting-v2",
+        "traffic_split": traffic_split,
+        "variant_a_id": uuid.uuid4(),
+        "variant_b_id": uuid.uuid4(),
+        "variant_a_name": "v1",
+        "variant_b_name": "v2",
+        "variant_a_prompt": "PROMPT A",
+        "variant_b_prompt": "PROMPT B",
+    }
+
+
+def _make_engine() -> tuple[MagicMock, AsyncMock]:
+    conn = AsyncMock()
+    cm = AsyncMock()
+    cm.__aenter__ = AsyncMock(return_value=conn)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    engine = MagicMock()
+    engine.begin = MagicMock(return_value=cm)
+    return engine, conn.execute
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():  # type: ignore[no-untyped-def]
+    ab_testing.invalidate_cache()
+    ab_testing._pending_counts.clear()
+    yield
+    ab_testing.invalidate_cache()
+    ab_testing._pending_counts.clear()
+
+
+class TestVariantAssignment:
+    """Hash-based assignment against the cached active test."""
+
+    def test_assignment_is_deterministic_and_follows_split(self) -> None:
+        test = _test_row(traffic_split=0.3)
+        calls = [str(uuid.uuid4()) for _ in range(5000)]
+
+        first = [is_variant_a(test, c) for c in calls]
+
+        assert first == [is_variant_a(test, c) for c in calls]
+        assert 0.27 < sum(first) / len(first) < 0.33
+        assert not any(is_variant_a(_test_row(traffic_split=0.0), c) for c in calls[:100])
+
+    @pytest.mark.asyncio
+    async def test_assign_variant_reads_cache_and_never_writes(self) -> None:
+        test = _test_row()
+        engine, execute = _make_engine()
+        manager = ABTestManager(engine)
+        manager.get_active_test = AsyncMock(return_value=test)  # type: ignore[method-assign]
+
+        results = [await manager.assign_variant(f"call-{i}") for i in range(20)]
+
+        manager.get_active_test.assert_awaited_once()
+        execute.assert_not_awaited()
+        assert results[0] == await manager.assign_variant("call-0")
+        expected_a = sum(is_variant_a(test, f"call-{i}") for i in range(20))
+        assert ab_testing.pending_counts(test["id"]) == (expected_a + 1, 20 - expected_a)
+        label = results[0]["variant_label"]
+        assert results[0]["system_prompt"] == f"PROMPT {label}"
+
+    @pytest.mark.asyncio
+    async def test_redis_timestamp_invalidates_cached_test(self) -> None:
+        engine, _ = _make_engine()
+        manager = ABTestManager(engine)
+        manager.get_active_test = AsyncMock(return_value=None)  # type: ignore[method-assign]
+        redis = AsyncMock()
+        redis.get.return_value = None
+
+        assert await manager.assign_variant("call-1", redis) is None
+        assert await manager.assign_variant("call-2", redis) is None
+        manager.get_active_test.assert_awaited_once()
+
+        redis.get.return_value = str(ab_testing._active_test_ts + 1).encode()
+        manager.get_active_test.return_value = _test_row()
+        assert await manager.assign_variant("call-3", redis) is not None
+
+
+class TestCounterFlush:
+    """Batched persistence of assignment counters."""
+
+    @pytest.mark.asyncio
+    async def test_flush_adds_counts_in_one_update_per_test(self) -> None:
+        test = _test_row()
+        engine, execute = _make_engine()
+        manager = ABTestManager(engine)
+        manager.get_active_test = AsyncMock(return_value=test)  # type: ignore[method-assign]
+        for i in range(10):
+            await manager.assign_variant(f"call-{i}")
+        calls_a, calls_b = ab_testing.pending_counts(test["id"])
+
+        assert await manager.flush_counts() == 10
+
+        execute.assert_awaited_once()
+        sql, params = execute.await_args.args
+        assert "calls_a = calls_a + :calls_a" in str(sql)
+        assert params == {"calls_a": calls_a, "calls_b": calls_b, "test_id": str(test["id"])}
+        assert ab_testing.pending_counts(test["id"]) == (0, 0)
+        assert await manager.flush_counts() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_counts_for_retry(self) -> None:
+        test = _test_row()
+        engine, execute = _make_engine()
+        execute.side_effect = ConnectionError("pg down")
+        manager = ABTestManager(engine)
+        manager.get_active_test = AsyncMock(return_value=test)  # type: ignore[method-assign]
+        await manager.assign_variant("call-1")
+        before = ab_testing.pending_counts(test["id"])
+
+        with pytest.raises(ConnectionError):
+            await manager.flush_counts()
+
+        await manager.assign_variant("call-1")
+        after = ab_testing.pending_counts(test["id"])
+        assert [a - b for a, b in zip(after, before, strict=True)] == list(before)
@@ -2,11 +2,13 @@
 
 Uses in-process TCP servers to feed scripted responses to the client;
 avoids running Asterisk. Verifies:
-- happy path: Login → Redirect → Success
+- happy path: Login → Redirect → Success, Logoff on close
 - rejected redirect (wrong channel)
 - rejected login (bad secret)
 - missing config (empty user/secret)
 - connect timeout
+- one session shared by concurrent redirects (responses matched by ActionID)
+- reconnect after the session drops
 """
 
 from __future__ import annotations
@@ -52,7 +54,7 @@ async def _read_message(reader: asyncio.StreamReader) -> dict[str, str]:
 
 @pytest.mark.asyncio
 async def test_redirect_success() -> None:
-    """Happy path: banner → Login OK → Redirect OK → Logoff swallowed."""
+    """Happy path: banner → Login OK → Redirect OK → Logoff on close."""
 
     async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         writer.write(b"Asterisk Call Manager/7.0.3\r\n")
@@ -80,16 +82,18 @@ async def test_redirect_success() -> None:
         )
         await writer.drain()
 
-        # Drain Logoff (best-effort), then close.
-        await reader.read(100)
+        logoff.set_result(await _read_message(reader))
         writer.close()
 
+    logoff: asyncio.Future[dict[str, str]] = asyncio.get_running_loop().create_future()
     async with fake_ami_server(handler) as port:
         client = AsteriskAMIClient("127.0.0.1", port, "callcenter", "s3cret")
         ok = await client.redirect(
             "SIP/trunk-00000042", "transfer-to-operator", "s", 1
         )
         assert ok is True
+        await client.close()
+        assert (await asyncio.wait_for(logoff, 1))["Action"] == "Logoff"
 
 
 @pytest.mark.asyncio
@@ -116,6 +120,7 @@ async def test_redirect_bad_channel_returns_false() -> None:
     async with fake_ami_server(handler) as port:
         client = AsteriskAMIClient("127.0.0.1", port, "u", "p")
         assert await client.redirect("SIP/ghost", "transfer-to-operator") is False
+        await client.close()
 
 
 @pytest.mark.asyncio
@@ -137,6 +142,8 @@ async def test_login_failure_returns_false() -> None:
     async with fake_ami_server(handler) as port:
         client = AsteriskAMIClient("127.0.0.1", port, "u", "wrong")
         assert await client.redirect("SIP/x", "transfer-to-operator") is False
+        assert client.connected is False
+        await client.close()
 
 
 @pytest.mark.asyncio
@@ -157,3 +164,80 @@ async def test_connect_timeout_returns_false() -> None:
         "240.0.0.1", 5038, "u", "p", connect_timeout=0.1, action_timeout=0.1
     )
     assert await client.redirect("SIP/x", "transfer-to-operator") is False
+    await client.close()
+
+
+async def _accept_login(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    writer.write(b"Asterisk Call Manager/7.0.3\r\n")
+    await writer.drain()
+    login = await _read_message(reader)
+    writer.write(f"Response: Success\r\nActionID: {login['ActionID']}\r\n\r\n".encode())
+    await writer.drain()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_redirects_share_one_session() -> None:
+    """Two transfers use the same login; out-of-order responses match by ActionID."""
+    connections = 0
+
+    async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal connections
+        connections += 1
+        await _accept_login(reader, writer)
+        first = await _read_message(reader)
+        second = await _read_message(reader)
+        for msg in (second, first):
+            response = "Success" if msg["Channel"] == "SIP/a" else "Error"
+            writer.write(
+                f"Response: {response}\r\nActionID: {msg['ActionID']}\r\n\r\n".encode()
+            )
+        await writer.drain()
+        await reader.read(100)
+        writer.close()
+
+    async with fake_ami_server(handler) as port:
+        client = AsteriskAMIClient("127.0.0.1", port, "u", "p")
+        await client.start()
+        results = await asyncio.gather(
+            client.redirect("SIP/a", "transfer-to-operator"),
+            client.redirect("SIP/b", "transfer-to-operator"),
+        )
+        await client.close()
+
+    assert results == [True, False]
+    assert connections == 1
+
+
+@pytest.mark.asyncio
+async def test_reconnects_after_session_drop() -> None:
+    """A dropped session is re-established for the next transfer."""
+    connections = 0
+    dropped = asyncio.Event()
+
+    async def handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal connections
+        connections += 1
+        await _accept_login(reader, writer)
+        if connections == 1:
+            writer.close()
+            dropped.set()
+            return
+        redirect = await _read_message(reader)
+        writer.write(f"Response: Success\r\nActionID: {redirect['ActionID']}\r\n\r\n".encode())
+        await writer.drain()
+        await reader.read(100)
+        writer.close()
+
+    async with fake_ami_server(handler) as port:
+        client = AsteriskAMIClient("127.0.0.1", port, "u", "p")
+        await client.start()
+        await asyncio.wait_for(dropped.wait(), 1)
+        for _ in range(100):
+            if not client.connected:
+                break
+            await asyncio.sleep(0.01)
+
+        assert await client.redirect("SIP/x", "transfer-to-operator") is True
+        await client.close()
+
+    assert connections == 2
@@ -0,0 +1,149 @@
+"""Unit tests for the shared 20 ms audio clock."""
+
+import asyncio
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.audio_clock import AudioClock
+from src.core.audio_socket import (
+    AUDIO_FRAME_BYTES,
+    AudioSocketConnection,
+    build_audio_packet,
+    frame_audio_packets,
+)
+
+
+def _make_conn() -> AudioSocketConnection:
+    writer = MagicMock()
+    writer.is_closing.return_value = False
+    return AudioSocketConnection(asyncio.StreamReader(), writer, uuid.uuid4())
+
+
+def _written(conn: AudioSocketConnection) -> list[bytes]:
+    return [bytes(c.args[0]) for c in conn.writer.write.call_args_list]  # type: ignore[attr-defined]
+
+
+class TestAudioClockPlayback:
+    @pytest.mark.asyncio
+    async def test_plays_all_frames_in_order(self) -> None:
+        clock = AudioClock()
+        conn = _make_conn()
+        audio = b"\x01" * AUDIO_FRAME_BYTES + b"\x02" * AUDIO_FRAME_BYTES + b"\x03" * 10
+
+        result = await clock.play(conn, frame_audio_packets(audio))
+
+        assert result is False
+        assert _written(conn) == [
+            build_audio_packet(b"\x01" * AUDIO_FRAME_BYTES),
+            build_audio_packet(b"\x02" * AUDIO_FRAME_BYTES),
+            build_audio_packet(b"\x03" * 10),
+        ]
+        assert clock.active_streams == 0
+
+    @pytest.mark.asyncio
+    async def test_serves_many_connections_concurrently(self) -> None:
+        clock = AudioClock()
+        conns = [_make_conn() for _ in range(20)]
+        packets = frame_audio_packets(b"\x00" * AUDIO_FRAME_BYTES * 5)
+
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        results = await asyncio.gather(*(clock.play(c, packets) for c in conns))
+        elapsed = loop.time() - t0
+
+        assert results == [False] * 20
+        assert all(len(_written(c)) == 5 for c in conns)
+        # 5 frames paced at 20 ms — all calls share the same ticks
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_cancel_event_interrupts_mid_clip(self) -> None:
+        clock = AudioClock()
+        conn = _make_conn()
+        cancel = asyncio.Event()
+        packets = frame_audio_packets(b"\x00" * AUDIO_FRAME_BYTES * 50)
+
+        async def _barge_in() -> None:
+            await asyncio.sleep(0.05)
+            cancel.set()
+
+        barge_task = asyncio.create_task(_barge_in())
+        result = await clock.play(conn, packets, cancel)
+        await barge_task
+
+        assert result is True
+        assert 0 < len(_written(conn)) < 50
+
+    @pytest.mark.asyncio
+    async def test_preset_cancel_event_writes_nothing(self) -> None:
+        clock = AudioClock()
+        conn = _make_conn()
+        cancel = asyncio.Event()
+        cancel.set()
+
+        result = await clock.play(conn, frame_audio_packets(b"\x00" * 640), cancel)
+
+        assert result is True
+        assert _written(conn) == []
+
+    @pytest.mark.asyncio
+    async def test_closed_transport_releases_waiter(self) -> None:
+        clock = AudioClock()
+        conn = _make_conn()
+        conn.writer.is_closing.return_value = True  # type: ignore[attr-defined]
+
+        result = await clock.play(conn, frame_audio_packets(b"\x00" * 640))
+
+        assert result is False
+        assert conn.is_closed
+
+
+class TestAudioClockKeepalive:
+    @pytest.mark.asyncio
+    async def test_silence_streamed_while_idle(self) -> None:
+        clock = AudioClock()
+        conn = _make_conn()
+        conn.last_send_time = 0.0  # long idle
+
+        clock.start_keepalive(conn, idle_ms=40)
+        await asyncio.sleep(0.1)
+        clock.stop_keepalive(conn)
+        sent = len(_written(conn))
+        await asyncio.sleep(0.06)
+
+        assert sent >= 2
+        assert all(
+            frame == build_audio_packet(b"\x00" * AUDIO_FRAME_BYTES) for frame in _written(conn)
+        )
+        assert len(_written(conn)) == sent
+        assert clock.active_streams == 0
+
+    @pytest.mark.asyncio
+    async def test_no_silence_during_playback(self) -> None:
+        clock = AudioClock()
+        conn = _make_conn()
+        clock.start_keepalive(conn, idle_ms=40)
+
+        await clock.play(conn, frame_audio_packets(b"\x07" * AUDIO_FRAME_BYTES * 4))
+        clock.stop_keepalive(conn)
+
+        assert _written(conn) == [build_audio_packet(b"\x07" * AUDIO_FRAME_BYTES)] * 4
+
+    @pytest.mark.asyncio
+    async def test_first_audio_frame_marks_call_setup_not_silence(self) -> None:
+        clock = AudioClock()
+        conn = _make_conn()
+        conn.last_send_time = 0.0  # long idle → silence right away
+        clock.start_keepalive(conn, idle_ms=40)
+        await asyncio.sleep(0.05)
+
+        assert _written(conn)
+        assert conn.first_audio_at is None
+
+        await clock.play(conn, frame_audio_packets(b"\x07" * AUDIO_FRAME_BYTES))
+        clock.stop_keepalive(conn)
+
+        assert conn.first_audio_at is not None
+        assert conn.first_audio_at >= conn.connected_at
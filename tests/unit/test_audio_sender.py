@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import time
 from typing import TYPE_CHECKING, Any
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -19,7 +19,7 @@ from src.core.audio_sender import (
     send_audio_stream,
 )
 from src.llm.models import StreamDone, ToolCallDelta, ToolCallEnd, ToolCallStart, Usage
-from src.tts.streaming_tts import AudioReady
+from src.tts.streaming_tts import AudioChunk, AudioReady
 from tests.unit.mocks.mock_audio_socket import MockAudioSocketConnection
 
 
@@ -407,9 +407,15 @@ class TestTimeToFirstAudio:
 
         with patch("src.core.audio_sender.time_to_first_audio_ms") as mock_metric:
             await sender.send(stream)
-            mock_metric.observe.assert_called_once()
+            # Whole-sentence audio: first chunk and first sentence coincide
+            assert mock_metric.labels.call_args_list == [
+                call(stage="first_chunk"),
+                call(stage="full_sentence"),
+            ]
+            observe = mock_metric.labels.return_value.observe
+            assert observe.call_count == 2
             # Value should be a positive number in ms
-            observed_ms = mock_metric.observe.call_args[0][0]
+            observed_ms = observe.call_args[0][0]
             assert observed_ms >= 0
 
     @pytest.mark.asyncio
@@ -424,7 +430,7 @@ class TestTimeToFirstAudio:
 
         with patch("src.core.audio_sender.time_to_first_audio_ms") as mock_metric:
             await sender.send(stream)
-            mock_metric.observe.assert_not_called()
+            mock_metric.labels.return_value.observe.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_ttfa_not_recorded_when_all_skipped(self) -> None:
@@ -441,7 +447,7 @@ class TestTimeToFirstAudio:
 
         with patch("src.core.audio_sender.time_to_first_audio_ms") as mock_metric:
             await sender.send(stream)
-            mock_metric.observe.assert_not_called()
+            mock_metric.labels.return_value.observe.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -548,3 +554,63 @@ class TestFillerAudio:
         await sender.send(_late_barge_stream())
         # Should have played 1-2 fillers before barge-in cancels the loop
         assert 1 <= len(conn.sent_chunks) <= 3
+
+
+# ---------------------------------------------------------------------------
+# Chunked sentences (AudioChunk)
+# ---------------------------------------------------------------------------
+
+
+class TestAudioChunks:
+    @pytest.mark.asyncio
+    async def test_chunks_sent_in_order_and_text_once(self) -> None:
+        conn = MockAudioSocketConnection()
+        sender = StreamingAudioSender(conn)
+        stream = _events(
+            AudioChunk(audio=b"\x01" * 320, text="Привіт.", first=True, last=False),
+            AudioChunk(audio=b"\x02" * 320, text="Привіт.", first=False, last=False),
+            AudioChunk(audio=b"\x03" * 10, text="Привіт.", first=False, last=True),
+            AudioChunk(audio=b"\x04" * 320, text="Як справи?", first=True, last=False),
+            AudioChunk(audio=b"", text="Як справи?", first=False, last=True),
+            StreamDone(stop_reason="end_turn", usage=Usage(0, 0)),
+        )
+
+        result = await sender.send(stream)
+
+        assert conn.sent_chunks == [b"\x01" * 320, b"\x02" * 320, b"\x03" * 10, b"\x04" * 320]
+        assert result.spoken_text == "Привіт. Як справи?"
+
+    @pytest.mark.asyncio
+    async def test_ttfa_first_chunk_then_full_sentence(self) -> None:
+        conn = MockAudioSocketConnection()
+        sender = StreamingAudioSender(conn, turn_start_time=time.monotonic())
+        stream = _events(
+            AudioChunk(audio=b"\x01" * 320, text="Раз.", first=True, last=False),
+            AudioChunk(audio=b"\x02" * 320, text="Раз.", first=False, last=True),
+            AudioChunk(audio=b"\x03" * 320, text="Два.", first=True, last=True),
+        )
+
+        with patch("src.core.audio_sender.time_to_first_audio_ms") as mock_metric:
+            await sender.send(stream)
+
+        assert mock_metric.labels.call_args_list == [
+            call(stage="first_chunk"),
+            call(stage="full_sentence"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_barge_in_mid_sentence_not_spoken(self) -> None:
+        conn = MockAudioSocketConnection()
+        barge_in = asyncio.Event()
+        sender = StreamingAudioSender(conn, barge_in_event=barge_in)
+
+        async def _stream() -> AsyncIterator[Any]:
+            yield AudioChunk(audio=b"\x01" * 320, text="Довге речення.", first=True, last=False)
+            barge_in.set()
+            yield AudioChunk(audio=b"\x02" * 320, text="Довге речення.", first=False, last=True)
+
+        result = await sender.send(_stream())
+
+        assert result.interrupted is True
+        assert result.spoken_text == ""
+        assert conn.sent_chunks == [b"\x01" * 320]
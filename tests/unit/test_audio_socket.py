@@ -8,10 +8,13 @@ import pytest
 
 from src.core.audio_socket import (
     AUDIO_FRAME_BYTES,
+    AUDIO_PACKET_BYTES,
     HEADER_SIZE,
     AudioSocketConnection,
+    FramedAudio,
     PacketType,
     build_audio_packet,
+    frame_audio_packets,
     parse_uuid,
     read_packet,
 )
@@ -129,6 +132,55 @@ class TestBuildAudioPacket:
         assert len(packet) == HEADER_SIZE
 
 
+class TestFramedAudio:
+    """Test pre-framed outbound audio buffers."""
+
+    def test_packets_match_per_frame_build(self) -> None:
+        audio = bytes(range(256)) * 3  # 768 bytes = 2 full frames + 128-byte tail
+        expected = b"".join(
+            build_audio_packet(audio[i : i + AUDIO_FRAME_BYTES])
+            for i in range(0, len(audio), AUDIO_FRAME_BYTES)
+        )
+        assert frame_audio_packets(audio) == expected
+
+    def test_exact_multiple_has_no_tail_packet(self) -> None:
+        packets = frame_audio_packets(b"\x01" * (AUDIO_FRAME_BYTES * 3))
+        assert len(packets) == AUDIO_PACKET_BYTES * 3
+
+    def test_empty_audio(self) -> None:
+        assert frame_audio_packets(b"") == b""
+
+    def test_framed_audio_is_plain_pcm(self) -> None:
+        audio = b"\x02" * 500
+        framed = FramedAudio(audio)
+        assert framed == audio
+        assert len(framed) == 500
+        assert framed[:10] == audio[:10]
+
+    def test_packets_built_once(self) -> None:
+        framed = FramedAudio(b"\x03" * 640)
+        assert framed.packets is framed.packets
+
+    @pytest.mark.asyncio
+    async def test_send_framed_audio_writes_cached_packets(self) -> None:
+        from unittest.mock import AsyncMock, MagicMock
+
+        mock_writer = MagicMock()
+        mock_writer.drain = AsyncMock()
+        mock_writer.is_closing.return_value = False
+        conn = AudioSocketConnection(asyncio.StreamReader(), mock_writer, uuid.uuid4())
+
+        framed = FramedAudio(b"\x04" * 400)  # 1 full frame + 80-byte tail
+        result = await conn.send_audio(framed)
+
+        assert result is False
+        written = [bytes(c.args[0]) for c in mock_writer.write.call_args_list]
+        assert written == [
+            build_audio_packet(b"\x04" * AUDIO_FRAME_BYTES),
+            build_audio_packet(b"\x04" * 80),
+        ]
+
+
 class TestParseUUID:
     """Test UUID parsing from packet payload."""
 
@@ -155,6 +207,7 @@ class TestSendAudioCancelEvent:
         mock_writer = MagicMock()
         mock_writer.write = MagicMock()
         mock_writer.drain = AsyncMock()
+        mock_writer.is_closing.return_value = False
 
         conn = AudioSocketConnection(asyncio.StreamReader(), mock_writer, uuid.uuid4())
 
@@ -176,6 +229,7 @@ class TestSendAudioCancelEvent:
         mock_writer = MagicMock()
         mock_writer.write = MagicMock()
         mock_writer.drain = AsyncMock()
+        mock_writer.is_closing.return_value = False
 
         conn = AudioSocketConnection(asyncio.StreamReader(), mock_writer, uuid.uuid4())
 
@@ -192,6 +246,7 @@ class TestSendAudioCancelEvent:
         mock_writer = MagicMock()
         mock_writer.write = MagicMock()
         mock_writer.drain = AsyncMock()
+        mock_writer.is_closing.return_value = False
 
         conn = AudioSocketConnection(asyncio.StreamReader(), mock_writer, uuid.uuid4())
 
@@ -0,0 +1,297 @@
+"""Unit tests for CallLogger batching: the write-behind queue and Redis buffer replay."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.logging.call_logger import CallLogger
+
+
+class _FakeDriverConnection:
+    def __init__(self) -> None:
+        self.copies: list[tuple[str, list[str], list[tuple[Any, ...]]]] = []
+
+    async def copy_records_to_table(
+        self, table: str, *, records: list[tuple[Any, ...]], columns: list[str]
+    ) -> None:
+        self.copies.append((table, columns, records))
+
+
+def _make_logger(**kwargs: Any) -> tuple[CallLogger, _FakeDriverConnection, AsyncMock]:
+    call_logger = CallLogger("postgresql+asyncpg://u:p@localhost/db", **kwargs)
+    driver = _FakeDriverConnection()
+
+    raw = MagicMock()
+    raw.driver_connection = driver
+    conn = MagicMock()
+    conn.get_raw_connection = AsyncMock(return_value=raw)
+
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=conn)
+    session.execute = AsyncMock()
+    begin_cm = AsyncMock()
+    begin_cm.__aexit__ = AsyncMock(return_value=False)
+    session.begin = MagicMock(return_value=begin_cm)
+
+    session_cm = AsyncMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    call_logger._session_factory = MagicMock(return_value=session_cm)  # type: ignore[method-assign]
+    return call_logger, driver, session.execute
+
+
+async def _log_turn(call_logger: CallLogger, call_id: uuid.UUID, n: int) -> None:
+    await call_logger.log_turn(call_id, n, "customer", f"репліка {n}")
+
+
+class TestWriteBehindQueue:
+    @pytest.mark.asyncio
+    async def test_rows_are_coalesced_into_one_copy_per_table(self) -> None:
+        call_logger, driver, _ = _make_logger(batch_max_delay=60)
+        calls = [uuid.uuid4(), uuid.uuid4()]
+        for n in range(3):
+            for call_id in calls:
+                await _log_turn(call_logger, call_id, n)
+        await call_logger.log_tool_call(calls[0], 1, "search_tires", {"w": 205}, {}, 12, True)
+
+        assert driver.copies == []
+        assert await call_logger.flush() == 7
+
+        assert [(table, len(records)) for table, _, records in driver.copies] == [
+            ("call_turns", 6),
+            ("call_tool_calls", 1),
+        ]
+        _table, columns, records = driver.copies[0]
+        row = dict(zip(columns, records[0], strict=True))
+        assert row["call_id"] == calls[0]
+        assert isinstance(row["id"], uuid.UUID)
+        assert row["content"] == "репліка 0"
+        await call_logger.close()
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_in_background(self) -> None:
+        call_logger, driver, _ = _make_logger(batch_max_rows=3, batch_max_delay=60)
+        call_id = uuid.uuid4()
+        for n in range(3):
+            await _log_turn(call_logger, call_id, n)
+
+        await asyncio.sleep(0.01)
+
+        assert len(driver.copies) == 1
+        assert len(driver.copies[0][2]) == 3
+        await call_logger.close()
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushes_after_delay(self) -> None:
+        call_logger, driver, _ = _make_logger(batch_max_delay=0.02)
+        await _log_turn(call_logger, uuid.uuid4(), 0)
+
+        await asyncio.sleep(0.001)
+        assert driver.copies == []
+        await asyncio.sleep(0.05)
+
+        assert len(driver.copies) == 1
+        await call_logger.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_budget_flushes_inline(self) -> None:
+        call_logger, driver, _ = _make_logger(queue_max_bytes=1, batch_max_delay=60)
+
+        await _log_turn(call_logger, uuid.uuid4(), 0)
+
+        assert len(driver.copies) == 1
+        assert call_logger._pending == []
+        await call_logger.close()
+
+    @pytest.mark.asyncio
+    async def test_database_down_buffers_batch_to_redis(self) -> None:
+        redis = AsyncMock()
+        call_logger, _, _ = _make_logger(redis=redis, batch_max_delay=60)
+        call_logger._session_factory = MagicMock(side_effect=ConnectionError("pg down"))  # type: ignore[method-assign]
+        await _log_turn(call_logger, uuid.uuid4(), 0)
+        await _log_turn(call_logger, uuid.uuid4(), 1)
+
+        assert await call_logger.flush() == 0
+
+        redis.rpush.assert_awaited_once()
+        key, *payloads = redis.rpush.await_args.args
+        assert key == "call_log_buffer"
+        entries = [json.loads(p) for p in payloads]
+        assert [e["params"]["turn_number"] for e in entries] == [0, 1]
+        assert "INSERT INTO call_turns" in entries[0]["query"]
+        assert call_logger._db_available is False
+        await call_logger.close()
+
+    @pytest.mark.asyncio
+    async def test_call_end_flushes_queued_rows_first(self) -> None:
+        call_logger, driver, execute = _make_logger(batch_max_delay=60)
+        call_id = uuid.uuid4()
+        await _log_turn(call_logger, call_id, 0)
+
+        await call_logger.log_call_end(call_id, datetime.now(UTC), 42)
+
+        assert len(driver.copies) == 1
+        assert "UPDATE calls" in str(execute.await_args.args[0])
+        await call_logger.close()
+
+
+class _FakeRedis:
+    """Lists, strings and the chunk-claim script of CallLogger's replay."""
+
+    def __init__(self) -> None:
+        self.lists: dict[str, list[bytes]] = {}
+        self.kv: dict[str, bytes] = {}
+
+    async def rpush(self, key: str, *values: str) -> int:
+        self.lists.setdefault(key, []).extend(v.encode() for v in values)
+        return len(self.lists[key])
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        return True
+
+    async def llen(self, key: str) -> int:
+        return len(self.lists.get(key, []))
+
+    async def lrange(self, key: str, start: int, end: int) -> list[bytes]:
+        items = self.lists.get(key, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    async def get(self, key: str) -> bytes | None:
+        return self.kv.get(key)
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.kv:
+            return False
+        self.kv[key] = value.encode()
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(
+            self.lists.pop(k, None) is not None or self.kv.pop(k, None) is not None for k in keys
+        )
+
+    async def eval(self, script: str, numkeys: int, *args: Any) -> list[bytes]:
+        buffer, inflight, inflight_id, size, chunk_id = args
+        # Redis passes ARGV as strings
+        items = self.lists.get(buffer, [])[: int(size)]
+        if items:
+            self.lists[buffer] = self.lists[buffer][len(items) :]
+            self.lists[inflight] = list(items)
+            self.kv[inflight_id] = chunk_id.encode()
+        return items
+
+
+def _make_replay_logger(
+    redis: _FakeRedis, committed: set[str]
+) -> tuple[CallLogger, list[tuple[str, Any]]]:
+    """CallLogger whose sessions record executed statements; chunk ids in *committed* conflict."""
+    call_logger = CallLogger("postgresql+asyncpg://u:p@localhost/db", redis=redis)  # type: ignore[arg-type]
+    executed: list[tuple[str, Any]] = []
+
+    async def _execute(stmt: Any, params: Any = None) -> MagicMock:
+        sql = str(stmt)
+        result = MagicMock()
+        if "call_log_replay_chunks" in sql and sql.startswith("INSERT"):
+            duplicate = params["chunk_id"] in committed
+            committed.add(params["chunk_id"])
+            result.first.return_value = None if duplicate else (params["chunk_id"],)
+        else:
+            executed.append((sql.strip(), params))
+        return result
+
+    def _session_cm() -> AsyncMock:
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=_execute)
+        begin_cm = AsyncMock()
+        begin_cm.__aexit__ = AsyncMock(return_value=False)
+        session.begin = MagicMock(return_value=begin_cm)
+        cm = AsyncMock()
+        cm.__aenter__ = AsyncMock(return_value=session)
+        cm.__aexit__ = AsyncMock(return_value=False)
+        return cm
+
+    call_logger._session_factory = MagicMock(side_effect=_session_cm)  # type: ignore[method-assign]
+    return call_logger, executed
+
+
+async def _buffer_turns(call_logger: CallLogger, n: int) -> None:
+    await call_logger._buffer_entries_to_redis(
+        [
+            (
+                "INSERT INTO call_turns (id) VALUES (:id)",
+                {"id": f"t{i}", "created_at": datetime(2026, 10, 16, tzinfo=UTC)},
+            )
+            for i in range(n)
+        ]
+    )
+
+
+class TestRedisBufferReplay:
+    @pytest.mark.asyncio
+    async def test_replays_in_chunks_as_executemany(self) -> None:
+        redis = _FakeRedis()
+        call_logger, executed = _make_replay_logger(redis, set())
+        await _buffer_turns(call_logger, 25)
+        await call_logger._buffer_entries_to_redis(
+            [("UPDATE calls SET ended_at = :ended_at WHERE id = :id", {"id": "c1", "ended_at": 1})]
+        )
+
+        assert await call_logger.flush_redis_buffer(chunk_size=10) == 26
+
+        inserts = [params for sql, params in executed if sql.startswith("INSERT")]
+        assert [len(batch) for batch in inserts] == [10, 10, 5]
+        assert inserts[0][0]["created_at"] == datetime(2026, 10, 16, tzinfo=UTC)
+        assert await redis.llen("call_log_buffer") == 0
+        assert "call_log_buffer:inflight" not in redis.lists
+        assert "call_log_buffer:replay_lock" not in redis.kv
+
+    @pytest.mark.asyncio
+    async def test_inserts_run_before_updates_in_a_chunk(self) -> None:
+        redis = _FakeRedis()
+        call_logger, executed = _make_replay_logger(redis, set())
+        await call_logger._buffer_entries_to_redis(
+            [
+                ("INSERT INTO calls (id) VALUES (:id)", {"id": "c1"}),
+                ("UPDATE calls SET scenario = :s WHERE id = :id", {"id": "c1", "s": "a"}),
+                ("INSERT INTO call_turns (id) VALUES (:id)", {"id": "t1"}),
+                ("UPDATE calls SET scenario = :s WHERE id = :id", {"id": "c1", "s": "b"}),
+            ]
+        )
+
+        await call_logger.flush_redis_buffer()
+
+        statements = [sql.split()[0] + " " + sql.split()[2] for sql, _ in executed[:3]]
+        assert statements == ["INSERT calls", "INSERT call_turns", "UPDATE SET"]
+        assert [p["s"] for p in executed[2][1]] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_committed_inflight_chunk_is_not_replayed_twice(self) -> None:
+        redis = _FakeRedis()
+        # A previous run committed chunk "c0" but died before clearing it in Redis
+        redis.lists["call_log_buffer:inflight"] = [b'{"query": "INSERT x", "params": {}}']
+        redis.kv["call_log_buffer:inflight_id"] = b"c0"
+        call_logger, executed = _make_replay_logger(redis, {"c0"})
+        await _buffer_turns(call_logger, 3)
+
+        assert await call_logger.flush_redis_buffer() == 3
+
+        assert [len(p) for sql, p in executed if sql.startswith("INSERT")] == [3]
+
+    @pytest.mark.asyncio
+    async def test_database_down_keeps_chunk_in_flight(self) -> None:
+        redis = _FakeRedis()
+        call_logger, _ = _make_replay_logger(redis, set())
+        await _buffer_turns(call_logger, 3)
+        call_logger._session_factory = MagicMock(side_effect=ConnectionError("pg down"))  # type: ignore[method-assign]
+
+        assert await call_logger.flush_redis_buffer() == 0
+
+        assert len(redis.lists["call_log_buffer:inflight"]) == 3
+        assert "call_log_buffer:replay_lock" not in redis.kv
@@ -0,0 +1,128 @@
+"""Unit tests for the hourly call statistics rollup."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.reports.call_stats import fetch_daily_stats, refresh_hours
+from src.tasks import call_stats_rollup
+from src.tasks.call_stats_rollup import _rollup_chunk
+
+_NOW = datetime(2026, 10, 16, 14, 0, tzinfo=UTC)
+
+
+def _state(watermark: datetime | None) -> MagicMock:
+    result = MagicMock()
+    result.one.return_value = SimpleNamespace(upto=_NOW, watermark=watermark)
+    return result
+
+
+def _rows(*buckets: datetime) -> MagicMock:
+    result = MagicMock()
+    result.__iter__.return_value = iter([SimpleNamespace(bucket=b) for b in buckets])
+    return result
+
+
+async def _chunk(conn: AsyncMock) -> tuple[bool, dict[str, Any], AsyncMock]:
+    refresh = AsyncMock(return_value=4)
+    stats: dict[str, Any] = {"hours_refreshed": 0, "dirty_hours": 0, "rows_written": 0}
+    with (
+        patch.object(call_stats_rollup, "lock_rollup", AsyncMock()),
+        patch.object(call_stats_rollup, "refresh_hours", refresh),
+    ):
+        done = await _rollup_chunk(conn, stats)
+    return done, stats, refresh
+
+
+class TestRollupChunk:
+    @pytest.mark.asyncio
+    async def test_recomputes_lookback_window_and_old_dirty_hours(self) -> None:
+        watermark = _NOW - timedelta(hours=1)
+        dirty_old = _NOW - timedelta(days=2)
+        dirty_recent = _NOW - timedelta(hours=2)  # inside the lookback window
+        conn = AsyncMock()
+        conn.execute = AsyncMock(
+            side_effect=[_state(watermark), _rows(dirty_recent, dirty_old), MagicMock()]
+        )
+
+        done, stats, refresh = await _chunk(conn)
+
+        assert done is True
+        start = watermark - timedelta(hours=call_stats_rollup._LOOKBACK_HOURS)
+        assert refresh.await_args_list[0].args[1:] == (start, _NOW)
+        assert refresh.await_args_list[1].args[1:] == (dirty_old, dirty_old + timedelta(hours=1))
+        assert refresh.await_count == 2
+        assert stats["hours_refreshed"] == 4
+        assert stats["dirty_hours"] == 1
+        upsert_params = conn.execute.await_args_list[-1].args[1]
+        assert upsert_params["watermark"] == _NOW
+
+    @pytest.mark.asyncio
+    async def test_first_run_backfills_in_chunks(self) -> None:
+        oldest = _NOW - timedelta(days=30)
+        conn = AsyncMock()
+        conn.execute = AsyncMock(
+            side_effect=[
+                _state(None),
+                MagicMock(scalar=MagicMock(return_value=oldest)),
+                _rows(),
+                MagicMock(),
+            ]
+        )
+
+        done, _, refresh = await _chunk(conn)
+
+        assert done is False
+        chunk_end = oldest + timedelta(hours=call_stats_rollup._CHUNK_HOURS)
+        refresh.assert_awaited_once()
+        assert refresh.await_args.args[1:] == (oldest, chunk_end)
+        assert conn.execute.await_args_list[-1].args[1]["watermark"] == chunk_end
+
+
+class TestCallStatsQueries:
+    @pytest.mark.asyncio
+    async def test_refresh_replaces_hours_with_range_predicates(self) -> None:
+        conn = AsyncMock()
+        conn.execute = AsyncMock(return_value=MagicMock(rowcount=3))
+        start = _NOW - timedelta(hours=2)
+
+        written = await refresh_hours(conn, start, _NOW)
+
+        assert written == 3
+        delete_sql = str(conn.execute.await_args_list[0].args[0])
+        insert_sql = str(conn.execute.await_args_list[1].args[0])
+        assert delete_sql.startswith("DELETE FROM call_stats_hourly")
+        assert "INSERT INTO call_stats_hourly" in insert_sql
+        assert "started_at >= :start AND started_at < :end" in insert_sql
+        assert "::date" not in insert_sql
+
+    @pytest.mark.asyncio
+    async def test_daily_stats_combine_rollup_and_live_tail(self) -> None:
+        conn = AsyncMock()
+        row = MagicMock()
+        row._mapping = {"stat_date": date(2026, 10, 16), "total_calls": 7}
+        result = MagicMock()
+        result.__iter__.return_value = iter([row])
+        conn.execute = AsyncMock(return_value=result)
+
+        stats = await fetch_daily_stats(
+            conn,
+            date_from=date(2026, 10, 1),
+            date_to_end=date(2026, 10, 17),
+            tenant_id="7b0e4c1e-0000-4000-8000-000000000001",
+            limit=30,
+        )
+
+        assert stats == [{"stat_date": date(2026, 10, 16), "total_calls": 7}]
+        sql, params = conn.execute.await_args.args
+        sql = str(sql)
+        assert "FROM call_stats_hourly" in sql
+        assert "started_at >=" in sql and "call_stats_rollup_state" in sql
+        assert sql.count("tenant_id = CAST(:tenant_id AS uuid)") == 2
+        assert "ORDER BY d.stat_date DESC" in sql
+        assert params["limit"] == 30
@@ -0,0 +1,216 @@
+"""Unit tests for the in-memory tire catalog index."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.store_client.catalog_index import (
+    SEASON_TO_DB,
+    CatalogIndex,
+    CatalogIndexStore,
+    pick_diverse_tires,
+)
+from src.store_client.client import StoreClient
+
+_BRANDS = ["Michelin", "Continental", "Nokian", "Hankook", "Kumho", "Tigar", "Sava", "Triangle"]
+_SIZES = [(205, 55, 16), (195, 65, 15), (225, 45, 17), (235, 65, 17)]
+_SEASONS = ["summer", "winter", "all_season", "літня", "зимова"]
+
+
+def _catalog(seed: int = 7, n: int = 600) -> tuple[list[tuple], list[tuple]]:
+    rng = random.Random(seed)
+    products = []
+    stock = []
+    for i in range(n):
+        sku = f"{i:011d}"
+        width, profile, diameter = rng.choice(_SIZES)
+        products.append(
+            (
+                sku,
+                width,
+                profile,
+                diameter,
+                f"{width}/{profile}R{diameter}",
+                rng.choice(_BRANDS),
+                f"Model {i % 40}",
+                rng.choice(_SEASONS),
+            )
+        )
+        for network in ("ProKoleso", "Tshina"):
+            roll = rng.random()
+            if roll < 0.1:
+                continue  # no tire_stock row
+            price = None if roll < 0.15 else rng.randrange(1500, 9000, 50)
+            stock.append((sku, network, price, rng.choice([0, 0, 2, 8, 24]), "UA", "2024"))
+    return products, stock
+
+
+def _sql_search(
+    products: list[tuple], stock: list[tuple], network: str, **params: Any
+) -> list[dict[str, Any]]:
+    """What ``StoreClient._search_tires_db`` gets from PostgreSQL."""
+    by_sku = {(row[0], row[1]): row for row in stock}
+    season = params.get("season")
+    seasons = {season, SEASON_TO_DB.get(season, season)} if season else None
+    rows = []
+    for sku, width, profile, diameter, size, brand, model, row_season in products:
+        if params.get("width") and width != params["width"]:
+            continue
+        if params.get("profile") and profile != params["profile"]:
+            continue
+        if params.get("diameter") and diameter != params["diameter"]:
+            continue
+        if seasons and row_season not in seasons:
+            continue
+        if params.get("brand") and brand.lower() != params["brand"].lower():
+            continue
+        st = by_sku.get((sku, network))
+        price = st[2] if st else None
+        rows.append(
+            {
+                "id": sku,
+                "brand": brand,
+                "model": model,
+                "size": size,
+                "season": row_season,
+                "price": price or 0,
+                "stock_quantity": st[3] if st else 0,
+                "_order": (price is None, price or 0, sku),
+            }
+        )
+    rows.sort(key=lambda r: r.pop("_order"))
+    if params.get("brand"):
+        return rows[:5]
+    rows = rows[:50]
+    return pick_diverse_tires(rows) if len(rows) > 5 else rows
+
+
+@pytest.fixture(scope="module")
+def catalog() -> tuple[list[tuple], list[tuple], CatalogIndex]:
+    products, stock = _catalog()
+    return products, stock, CatalogIndex(products, stock)
+
+
+class TestCatalogIndex:
+    @pytest.mark.parametrize("network", ["ProKoleso", "Tshina"])
+    def test_matches_sql_search(self, catalog: tuple, network: str) -> None:
+        products, stock, index = catalog
+        queries: list[dict[str, Any]] = [{}]
+        for width, profile, diameter in _SIZES:
+            for season in (None, "summer", "winter", "all_season"):
+                for brand in (None, "michelin", "Tigar"):
+                    queries.append(
+                        {
+                            "width": width,
+                            "profile": profile,
+                            "diameter": diameter,
+                            "season": season,
+                            "brand": brand,
+                        }
+                    )
+            queries.append({"width": width, "season": "winter"})
+            queries.append({"diameter": diameter, "brand": "Nokian"})
+        queries.append({"brand": "Sava"})
+        queries.append({"width": 205, "profile": 60, "diameter": 16})
+
+        for query in queries:
+            assert index.search(network, **query) == _sql_search(
+                products, stock, network, **query
+            ), query
+
+    def test_unknown_network_is_not_answered(self, catalog: tuple) -> None:
+        _, _, index = catalog
+        assert index.search("Unknown", width=205) is None
+        assert index.availability("00000000000", "Unknown") is None
+
+    def test_availability(self) -> None:
+        products, _ = _catalog(n=2)
+        stock = [(products[0][0], "ProKoleso", None, 3, "PL", "2023")]
+        index = CatalogIndex(products, stock)
+
+        assert index.availability(products[0][0], "ProKoleso") == {
+            "available": True,
+            "quantity": 3,
+            "price": None,
+            "country": "PL",
+            "year": "2023",
+        }
+        # No tire_stock row / unknown SKU: left to Redis and PostgreSQL
+        assert index.availability(products[1][0], "ProKoleso") is None
+        assert index.availability("99999999999", "ProKoleso") is None
+
+
+class TestStoreClientWithIndex:
+    @pytest.fixture
+    def client(self) -> StoreClient:
+        products, stock = _catalog(n=50)
+        store = MagicMock(index=CatalogIndex(products, stock))
+        return StoreClient(
+            base_url="http://localhost:3000/api/v1",
+            api_key="test-key",
+            db_engine=MagicMock(),
+            redis=AsyncMock(),
+            catalog_index=store,
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_answered_without_db(self, client: StoreClient) -> None:
+        result = await client.search_tires(width="205", profile="55", diameter="16")
+
+        assert 0 < result["total"] <= 5
+        assert all(item["size"] == "205/55R16" for item in result["items"])
+        client._db_engine.connect.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_availability_answered_without_redis(self, client: StoreClient) -> None:
+        sku = next(
+            s
+            for s in (f"{i:011d}" for i in range(50))
+            if client._catalog_index.index.availability(s, "ProKoleso")
+        )
+        result = await client.check_availability(product_id=sku.lstrip("0") or "0")
+
+        assert result == client._catalog_index.index.availability(sku, "ProKoleso")
+        client._redis.hget.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_counted_as_redis(self, client: StoreClient) -> None:
+        client._catalog_index.index = None
+        client._redis.hget.return_value = '{"stock": 4, "price": 2100}'
+
+        with patch("src.store_client.client.catalog_index_lookups_total") as lookups:
+            result = await client.check_availability(product_id="12345")
+
+        assert result["quantity"] == 4
+        lookups.labels.assert_called_once_with(operation="availability", source="redis")
+
+    @pytest.mark.asyncio
+    async def test_db_fallback_before_first_build(self, client: StoreClient) -> None:
+        client._catalog_index.index = None
+        conn = AsyncMock()
+        conn.execute = AsyncMock(return_value=MagicMock())
+        client._db_engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+
+        result = await client.search_tires(width=205)
+
+        assert result == {"total": 0, "items": []}
+        conn.execute.assert_awaited_once()
+
+
+class TestCatalogIndexStore:
+    @pytest.mark.asyncio
+    async def test_failed_rebuild_keeps_previous_index(self) -> None:
+        store = CatalogIndexStore(MagicMock(), MagicMock())
+        products, stock = _catalog(n=10)
+        with patch.object(store, "_load", AsyncMock(return_value=(products, stock))):
+            first = await store.rebuild()
+        with patch.object(store, "_load", AsyncMock(side_effect=RuntimeError("db down"))):
+            assert await store.rebuild() is first
+
+        assert first is not None
+        assert first.version == 1
+        assert len(first) == 10
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import AsyncIterator  # noqa: TC003
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -11,6 +12,8 @@ from src.onec_client.sync import (
     _normalize_season,
     _safe_bool,
     _safe_int,
+    _stock_fingerprint,
+    _stock_row,
 )
 
 
@@ -69,6 +72,16 @@ class TestNormalization:
         assert _safe_bool(False) is False
 
 
+def _stream(items: list[dict]) -> MagicMock:
+    """Mock for ``OneCClient.iter_*``: each call streams ``items`` as one batch."""
+
+    async def batches(*_args: object, **_kwargs: object) -> AsyncIterator[list[dict]]:
+        if items:
+            yield list(items)
+
+    return MagicMock(side_effect=batches)
+
+
 class TestCatalogSyncService:
     """Test sync service logic."""
 
@@ -132,9 +145,8 @@ class TestCatalogSyncService:
     @pytest.fixture
     def mock_onec(self) -> AsyncMock:
         client = AsyncMock()
-        client.get_wares_full.return_value = {
-            "success": True,
-            "data": [
+        client.iter_wares_full = _stream(
+            [
                 {
                     "type": "000000001",
                     "model_id": "000167134",
@@ -157,13 +169,10 @@ class TestCatalogSyncService:
                         },
                     ],
                 },
-            ],
-            "errors": [],
-        }
-        client.get_stock.return_value = {
-            "success": True,
-            "TradingNetwork": "ProKoleso",
-            "data": [
+            ]
+        )
+        client.iter_stock = _stream(
+            [
                 {
                     "sku": "00000019835",
                     "price": "1850",
@@ -173,8 +182,8 @@ class TestCatalogSyncService:
                     "year_issue": "25-24",
                     "country": "Сербія",
                 },
-            ],
-        }
+            ]
+        )
         client.get_wares_incremental.return_value = {"success": True, "data": [], "errors": []}
         client.confirm_wares_receipt.return_value = {"success": True}
         client.get_novapost_cities.return_value = {"success": True, "data": []}
@@ -211,6 +220,11 @@ class TestCatalogSyncService:
         pipe.execute = AsyncMock()
         redis.pipeline.return_value = pipe
         redis.hget = AsyncMock(return_value=None)
+        # No previous stock snapshot → full stock sync
+        redis.exists = AsyncMock(return_value=0)
+        redis.hgetall = AsyncMock(return_value={})
+        redis.delete = AsyncMock()
+        redis.publish = AsyncMock()
         return redis
 
     @pytest.mark.asyncio
@@ -220,9 +234,9 @@ class TestCatalogSyncService:
         service = CatalogSyncService(mock_onec, mock_engine, mock_redis)
         await service.full_sync()
 
-        mock_onec.get_wares_full.assert_called_once()
-        # get_stock called for both networks
-        assert mock_onec.get_stock.call_count == 2
+        mock_onec.iter_wares_full.assert_called_once()
+        # stock streamed for both networks
+        assert mock_onec.iter_stock.call_count == 2
 
     @pytest.mark.asyncio
     async def test_full_sync_upserts_to_db(
@@ -287,7 +301,7 @@ class TestCatalogSyncService:
     async def test_full_sync_empty_wares_warns(
         self, mock_onec: AsyncMock, mock_engine: MagicMock, mock_redis: AsyncMock
     ) -> None:
-        mock_onec.get_wares_full.return_value = {"success": True, "data": [], "errors": []}
+        mock_onec.iter_wares_full = _stream([])
         service = CatalogSyncService(mock_onec, mock_engine, mock_redis)
         # Should not raise, just log warning
         await service.full_sync()
@@ -337,3 +351,149 @@ class TestCatalogSyncService:
 
         mock_onec.get_novapost_cities.assert_called_once()
         mock_onec.get_novapost_branches.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_skips_novapost(
+        self, mock_onec: AsyncMock, mock_engine: MagicMock, mock_redis: AsyncMock
+    ) -> None:
+        service = CatalogSyncService(mock_onec, mock_engine, mock_redis)
+        await service.incremental_sync()
+
+        mock_onec.get_novapost_cities.assert_not_called()
+        mock_onec.get_novapost_branches.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_stock_writes_only_changed_and_removed(
+        self, mock_onec: AsyncMock, mock_engine: MagicMock, mock_redis: AsyncMock
+    ) -> None:
+        same = {"sku": "A", "price": "100", "stock": "4", "country": "UA", "year_issue": "24"}
+        changed = {"sku": "B", "price": "250", "stock": "1", "country": "UA", "year_issue": "24"}
+        mock_onec.iter_stock = _stream([same, changed])
+        mock_redis.exists.return_value = 2
+        mock_redis.hgetall.return_value = {
+            b"A": _stock_fingerprint(_stock_row("ProKoleso", same)).encode(),
+            b"B": b"0000000000000000",
+            b"C": b"0000000000000000",
+        }
+        mock_engine.begin.return_value.__aenter__.return_value.execute.reset_mock()
+        service = CatalogSyncService(mock_onec, mock_engine, mock_redis)
+        with patch("src.onec_client.sync.NETWORKS", ("ProKoleso",)):
+            stats = await service.sync_stock()
+
+        result = stats["ProKoleso"]
+        assert (result["fetched"], result["changed"], result["removed"]) == (2, 1, 1)
+        assert result["full"] is False
+
+        conn = mock_engine.begin.return_value.__aenter__.return_value
+        upsert_rows = conn.execute.await_args_list[0].args[1]
+        assert [row["sku"] for row in upsert_rows] == ["B"]
+        assert conn.execute.await_args_list[1].args[1] == {"network": "ProKoleso", "skus": ["C"]}
+
+        pipe = mock_redis.pipeline.return_value
+        pipe.rename.assert_not_called()
+        stock_hset = [c.args for c in pipe.hset.call_args_list if c.args[0] == "onec:stock:ProKoleso"]
+        assert [args[1] for args in stock_hset] == ["B"]
+        pipe.hset.assert_any_call("onec:stock_fp:ProKoleso", mapping={"B": ANY})
+        pipe.hdel.assert_any_call("onec:stock:ProKoleso", "C")
+        pipe.hdel.assert_any_call("onec:stock_fp:ProKoleso", "C")
+
+    @pytest.mark.asyncio
+    async def test_sync_stock_full_without_snapshot(
+        self, mock_onec: AsyncMock, mock_engine: MagicMock, mock_redis: AsyncMock
+    ) -> None:
+        service = CatalogSyncService(mock_onec, mock_engine, mock_redis)
+        with patch("src.onec_client.sync.NETWORKS", ("ProKoleso",)):
+            stats = await service.sync_stock()
+
+        assert stats["ProKoleso"]["full"] is True
+        assert stats["ProKoleso"]["changed"] == 1
+        # Written to staging hashes, then swapped in
+        mock_redis.delete.assert_awaited_once_with(
+            "onec:stock:ProKoleso:staging", "onec:stock_fp:ProKoleso:staging"
+        )
+        pipe = mock_redis.pipeline.return_value
+        assert pipe.hset.call_args_list[0].args[0] == "onec:stock:ProKoleso:staging"
+        pipe.rename.assert_any_call("onec:stock:ProKoleso:staging", "onec:stock:ProKoleso")
+        pipe.rename.assert_any_call("onec:stock_fp:ProKoleso:staging", "onec:stock_fp:ProKoleso")
+        # SKUs missing from the full list are zeroed
+        conn = mock_engine.begin.return_value.__aenter__.return_value
+        zero_sql = str(conn.execute.await_args_list[-1].args[0])
+        assert "NOT (sku = ANY(:skus))" in zero_sql
+
+    @pytest.mark.asyncio
+    async def test_full_sync_ignores_snapshot(
+        self, mock_onec: AsyncMock, mock_engine: MagicMock, mock_redis: AsyncMock
+    ) -> None:
+        mock_redis.exists.return_value = 2
+        service = CatalogSyncService(mock_onec, mock_engine, mock_redis)
+        await service.full_sync()
+
+        mock_redis.hgetall.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_full_sync_publishes_catalog_change(
+        self, mock_onec: AsyncMock, mock_engine: MagicMock, mock_redis: AsyncMock
+    ) -> None:
+        service = CatalogSyncService(mock_onec, mock_engine, mock_redis)
+        await service.full_sync()
+
+        mock_redis.publish.assert_awaited_once_with("catalog_index:invalidate", "full_sync")
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_publishes_only_on_change(
+        self, mock_onec: AsyncMock, mock_engine: MagicMock, mock_redis: AsyncMock
+    ) -> None:
+        item = {"sku": "A", "price": "100", "stock": "4", "country": "UA", "year_issue": "24"}
+        mock_onec.iter_stock = _stream([item])
+        mock_redis.exists.return_value = 2
+        mock_redis.hgetall.return_value = {
+            b"A": _stock_fingerprint(_stock_row("ProKoleso", item)).encode()
+        }
+        service = CatalogSyncService(mock_onec, mock_engine, mock_redis)
+        with patch("src.onec_client.sync.NETWORKS", ("ProKoleso",)):
+            await service.incremental_sync()
+            mock_redis.publish.assert_not_called()
+
+            mock_onec.iter_stock = _stream([{**item, "stock": "3"}])
+            await service.incremental_sync()
+
+        mock_redis.publish.assert_awaited_once_with(
+            "catalog_index:invalidate", "incremental_sync"
+        )
+
+    @pytest.mark.asyncio
+    async def test_sync_stock_writes_db_when_redis_down(
+        self, mock_onec: AsyncMock, mock_engine: MagicMock, mock_redis: AsyncMock
+    ) -> None:
+        mock_redis.exists.side_effect = ConnectionError("redis down")
+        mock_redis.delete.side_effect = ConnectionError("redis down")
+        mock_redis.pipeline.return_value.execute.side_effect = ConnectionError("redis down")
+        service = CatalogSyncService(mock_onec, mock_engine, mock_redis)
+        with patch("src.onec_client.sync.NETWORKS", ("ProKoleso",)):
+            stats = await service.sync_stock()
+
+        assert stats["ProKoleso"]["changed"] == 1
+        mock_onec.iter_stock.assert_called_once()
+        conn = mock_engine.begin.return_value.__aenter__.return_value
+        upsert_rows = conn.execute.await_args_list[0].args[1]
+        assert [row["sku"] for row in upsert_rows] == ["00000019835"]
+        # The first failed step turns Redis off: no later pipeline, no swap
+        pipe = mock_redis.pipeline.return_value
+        pipe.hset.assert_not_called()
+        pipe.rename.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sync_stock_skips_swap_when_redis_fails_mid_run(
+        self, mock_onec: AsyncMock, mock_engine: MagicMock, mock_redis: AsyncMock
+    ) -> None:
+        mock_redis.pipeline.return_value.execute.side_effect = ConnectionError("redis down")
+        service = CatalogSyncService(mock_onec, mock_engine, mock_redis)
+        with patch("src.onec_client.sync.NETWORKS", ("ProKoleso",)):
+            stats = await service.sync_stock()
+
+        assert stats["ProKoleso"]["full"] is True
+        # Staging hashes are incomplete, so they must not replace the live ones
+        mock_redis.pipeline.return_value.rename.assert_not_called()
+        conn = mock_engine.begin.return_value.__aenter__.return_value
+        zero_sql = str(conn.execute.await_args_list[-1].args[0])
+        assert "NOT (sku = ANY(:skus))" in zero_sql
@@ -248,6 +248,9 @@ class TestCeleryAppRegistration:
         incr = app.conf.beat_schedule["catalog-incremental-sync"]
         assert incr["task"] == "src.tasks.catalog_sync_tasks.catalog_incremental_sync"
 
+        novapost = app.conf.beat_schedule["catalog-novapost-sync"]
+        assert novapost["task"] == "src.tasks.catalog_sync_tasks.catalog_novapost_sync"
+
 
 class TestOneCSettingsFullSyncTimeout:
     """Verify full_sync_timeout setting."""
@@ -8,6 +8,7 @@ from src.config import (
     AdminSettings,
     AnthropicSettings,
     DatabaseSettings,
+    OneCSettings,
     RedisSettings,
     Settings,
     StoreAPISettings,
@@ -123,3 +124,18 @@ class TestValidateRequired:
         err = next(e for e in result.errors if e.field == "ANTHROPIC_API_KEY")
         assert err.hint
         assert "export" in err.hint
+
+    def test_schedule_cache_ttl_shorter_than_two_prefetch_intervals(self) -> None:
+        settings = _make_settings(
+            onec=OneCSettings(schedule_cache_ttl=120, schedule_prefetch_interval=90)
+        )
+        result = settings.validate_required()
+        err = next(e for e in result.errors if e.field == "ONEC_SCHEDULE_CACHE_TTL")
+        assert "=180" in err.hint
+
+        settings = _make_settings(
+            onec=OneCSettings(
+                schedule_cache_ttl=120, schedule_prefetch_interval=90, schedule_prefetch_days=0
+            )
+        )
+        assert settings.validate_required().ok
@@ -0,0 +1,50 @@
+"""Tests for per-call cost tracking."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from src.monitoring.cost_tracker import CostBreakdown
+
+
+@pytest.fixture(autouse=True)
+def _flat_pricing():  # type: ignore[no-untyped-def]
+    with patch("src.monitoring.cost_tracker.get_pricing", return_value=(1.0, 4.0)):
+        yield
+
+
+class TestLLMCachedInput:
+    def test_anthropic_cache_reads_billed_at_ten_percent(self) -> None:
+        cost = CostBreakdown()
+        cost.add_llm_usage(1_000_000, 0, "anthropic-sonnet", cached_input_tokens=1_000_000)
+        assert cost.llm_cost == pytest.approx(0.1)
+
+    def test_automatic_cache_billed_at_half(self) -> None:
+        cost = CostBreakdown()
+        cost.add_llm_usage(1_000_000, 0, "gemini-2.5-flash", cached_input_tokens=500_000)
+        assert cost.llm_cost == pytest.approx(0.75)
+
+    def test_cached_ratio_reported(self) -> None:
+        cost = CostBreakdown()
+        assert cost.cached_input_ratio == 0.0
+        cost.add_llm_usage(4000, 100, "anthropic-sonnet", cached_input_tokens=3000)
+        cost.add_llm_usage(4000, 100, "anthropic-sonnet", cached_input_tokens=3400)
+
+        assert cost.cached_input_ratio == pytest.approx(0.8)
+        assert cost.to_dict()["llm_cached_input_ratio"] == 0.8
+
+
+class TestDiscardedSpeculation:
+    def test_counted_separately_but_in_total(self) -> None:
+        cost = CostBreakdown()
+        cost.add_llm_usage(1_000_000, 0, "gemini-2.5-flash")
+        cost.add_discarded_llm_usage(500_000, 0, "gemini-2.5-flash")
+
+        assert cost.llm_cost == pytest.approx(1.0)
+        assert cost.llm_speculation_cost == pytest.approx(0.5)
+        assert cost.total_cost == pytest.approx(1.5)
+        data = cost.to_dict()
+        assert data["llm_discarded_input_tokens"] == 500_000
+        assert data["llm_input_tokens"] == 1_000_000
@@ -0,0 +1,171 @@
+"""Unit tests for partition-based data retention."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.tasks import data_retention
+from src.tasks.data_retention import _classify_partitions, _cleanup_async
+
+
+class TestClassifyPartitions:
+    def test_splits_expired_and_straddling(self) -> None:
+        names = [
+            "call_turns_2026_05",
+            "call_turns_2026_06",
+            "call_turns_2026_07",
+            "call_turns_2026_08",
+            "call_turns_default",
+        ]
+        cutoff = datetime(2026, 7, 18, 10, 0, tzinfo=UTC)
+
+        expired, straddling = _classify_partitions("call_turns", names, cutoff)
+
+        assert expired == ["call_turns_2026_05", "call_turns_2026_06"]
+        assert straddling == ["call_turns_2026_07"]
+
+    def test_partition_ending_on_cutoff_day_is_not_dropped(self) -> None:
+        cutoff = datetime(2026, 7, 1, 12, 0, tzinfo=UTC)
+
+        expired, straddling = _classify_partitions(
+            "call_turns", ["call_turns_2026_06", "call_turns_2026_07"], cutoff
+        )
+
+        assert expired == []
+        assert straddling == ["call_turns_2026_06", "call_turns_2026_07"]
+
+    def test_ignores_other_tables(self) -> None:
+        cutoff = datetime(2026, 7, 18, tzinfo=UTC)
+
+        expired, _ = _classify_partitions("call_turns", ["call_tool_calls_2026_01"], cutoff)
+
+        assert expired == []
+
+
+class _FakeConn:
+    def __init__(self, engine: _FakeEngine) -> None:
+        self._engine = engine
+
+    async def execute(self, stmt: Any, params: Any = None) -> Any:
+        sql = " ".join(str(stmt).split())
+        self._engine.statements.append((sql, params))
+        return self._engine.respond(sql, params)
+
+
+class _FakeEngine:
+    """Answers the retention queries from canned partitions / batch sizes."""
+
+    def __init__(self, partitions: dict[str, list[str]], deletes: list[int], updates: list[int]):
+        self.partitions = partitions
+        self.deletes = deletes
+        self.updates = updates
+        self.statements: list[tuple[str, Any]] = []
+
+    def respond(self, sql: str, params: Any) -> Any:
+        result = MagicMock()
+        if "FROM pg_inherits" in sql:
+            result.__iter__.return_value = iter(
+                [SimpleNamespace(relname=n) for n in self.partitions[params["parent"]]]
+            )
+        elif sql.startswith("DELETE"):
+            result.rowcount = self.deletes.pop(0)
+        elif "UPDATE calls" in sql:
+            n = self.updates.pop(0)
+            result.all.return_value = [
+                SimpleNamespace(started_at=datetime(2025, 1, 1, tzinfo=UTC), id=uuid.uuid4())
+                for _ in range(n)
+            ]
+        return result
+
+    def _ctx(self) -> Any:
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=_FakeConn(self))
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        return ctx
+
+    def begin(self) -> Any:
+        return self._ctx()
+
+    def connect(self) -> Any:
+        return self._ctx()
+
+    def executed(self, prefix: str) -> list[tuple[str, Any]]:
+        return [(s, p) for s, p in self.statements if s.startswith(prefix)]
+
+
+async def _run(engine: _FakeEngine) -> dict[str, Any]:
+    with (
+        patch.object(data_retention, "get_task_engine", return_value=engine),
+        patch.object(data_retention, "release_task_engine", AsyncMock()),
+        patch.object(data_retention, "_BATCH_SIZE", 2),
+        patch.object(data_retention, "_BATCH_PAUSE_SECONDS", 0),
+    ):
+        return await _cleanup_async()
+
+
+class TestCleanup:
+    @pytest.mark.asyncio
+    async def test_drops_expired_partitions_and_batches_the_rest(self) -> None:
+        engine = _FakeEngine(
+            partitions={
+                "call_turns": ["call_turns_2020_01", "call_turns_2099_01"],
+                "call_tool_calls": ["call_tool_calls_2099_01"],
+            },
+            deletes=[],
+            updates=[2, 2, 1],
+        )
+
+        result = await _run(engine)
+
+        assert result["partitions_dropped"] == ["call_turns_2020_01"]
+        assert [s for s, _ in engine.executed("ALTER TABLE")] == [
+            "ALTER TABLE call_turns DETACH PARTITION call_turns_2020_01"
+        ]
+        assert [s for s, _ in engine.executed("DROP TABLE")] == ["DROP TABLE call_turns_2020_01"]
+        assert engine.executed("DELETE") == []  # no partition straddles the cutoff
+        assert result["call_turns_deleted"] == 0
+        assert result["calls_anonymized"] == 5
+        assert result["incomplete"] == []
+
+        updates = [p for s, p in engine.statements if "UPDATE calls" in s]
+        assert "after_ts" not in updates[0]
+        assert updates[1]["after_ts"] == datetime(2025, 1, 1, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_straddling_partition_deleted_in_chunks(self) -> None:
+        cutoff = datetime.now(UTC) - timedelta(days=data_retention._RETENTION_TRANSCRIPTS_DAYS)
+        name = f"call_turns_{cutoff.year}_{cutoff.month:02d}"
+        engine = _FakeEngine(
+            partitions={"call_turns": [name], "call_tool_calls": []},
+            deletes=[2, 2, 1],
+            updates=[0],
+        )
+
+        result = await _run(engine)
+
+        deletes = engine.executed("DELETE")
+        assert len(deletes) == 3
+        assert all(f"DELETE FROM {name} WHERE ctid" in s for s, _ in deletes)
+        assert all(p["limit"] == 2 for _, p in deletes)
+        assert result["call_turns_deleted"] == 5
+        assert result["partitions_dropped"] == []
+
+    @pytest.mark.asyncio
+    async def test_time_budget_stops_between_batches(self) -> None:
+        engine = _FakeEngine(
+            partitions={"call_turns": [], "call_tool_calls": []},
+            deletes=[],
+            updates=[2, 2],
+        )
+
+        with patch.object(data_retention, "_PHASE_BUDGET_SECONDS", 0):
+            result = await _run(engine)
+
+        assert result["calls_anonymized"] == 2
+        assert result["incomplete"] == ["calls"]
@@ -3,22 +3,21 @@
 from __future__ import annotations
 
 import array
-import math
 import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.core.echo_canceller import (
+    _FRAME_BYTES,
+    _SILENCE_FRAME,
     EchoCanceller,
     EchoCancellerConfig,
     FarEndBuffer,
-    _FRAME_BYTES,
-    _SILENCE_FRAME,
     _compute_rms,
+    _compute_rms_batch,
 )
 
-
 # ---------------------------------------------------------------------------
 # FarEndBuffer
 # ---------------------------------------------------------------------------
@@ -92,6 +91,45 @@ class TestFarEndBuffer:
         assert len(buf) == 0
 
 
+class TestFarEndBufferRing:
+    """Ring-buffer edge cases: wrap-around and batch pops."""
+
+    def _frame(self, value: int) -> bytes:
+        return bytes([value]) * _FRAME_BYTES
+
+    def test_wraps_around_ring(self):
+        buf = FarEndBuffer(maxlen=3)
+        buf.push(self._frame(1) + self._frame(2))
+        assert buf.pop_frame() == self._frame(1)
+        buf.push(self._frame(3) + self._frame(4))
+        assert len(buf) == 3
+        assert [buf.pop_frame() for _ in range(3)] == [
+            self._frame(2),
+            self._frame(3),
+            self._frame(4),
+        ]
+
+    def test_oversized_push_keeps_newest(self):
+        buf = FarEndBuffer(maxlen=2)
+        buf.push(self._frame(1) + self._frame(2) + self._frame(3) + b"\x04" * 10)
+        assert len(buf) == 2
+        assert buf.pop_frame() == self._frame(3)
+        assert buf.pop_frame() == b"\x04" * 10 + b"\x00" * (_FRAME_BYTES - 10)
+
+    def test_pop_frames_pads_with_silence(self):
+        buf = FarEndBuffer(maxlen=4)
+        buf.push(self._frame(7))
+        assert buf.pop_frames(3) == self._frame(7) + _SILENCE_FRAME * 2
+        assert len(buf) == 0
+
+    def test_pop_frames_across_wrap(self):
+        buf = FarEndBuffer(maxlen=3)
+        buf.push(self._frame(1) + self._frame(2))
+        buf.pop_frame()
+        buf.push(self._frame(3) + self._frame(4))
+        assert buf.pop_frames(3) == self._frame(2) + self._frame(3) + self._frame(4)
+
+
 # ---------------------------------------------------------------------------
 # _compute_rms
 # ---------------------------------------------------------------------------
@@ -115,6 +153,18 @@ class TestComputeRms:
     def test_empty_frame(self):
         assert _compute_rms(b"") == 0.0
 
+    def test_batch_matches_single(self):
+        frames = [
+            array.array("h", [amp] * (_FRAME_BYTES // 2)).tobytes() for amp in (0, 10, 100, -3000)
+        ]
+        batch = _compute_rms_batch(b"".join(frames))
+        assert len(batch) == 4
+        for rms, frame in zip(batch, frames, strict=True):
+            assert abs(rms - _compute_rms(frame)) < 0.01
+
+    def test_batch_empty(self):
+        assert _compute_rms_batch(b"") == []
+
 
 # ---------------------------------------------------------------------------
 # EchoCanceller
@@ -164,9 +214,7 @@ class TestEchoCanceller:
         assert result == loud  # loud enough to pass
 
     def test_energy_gate_disabled(self):
-        config = self._make_config(
-            enabled=True, energy_gate_only=True, energy_gate_enabled=False
-        )
+        config = self._make_config(enabled=True, energy_gate_only=True, energy_gate_enabled=False)
         ec = EchoCanceller(config, FarEndBuffer())
         quiet = self._make_quiet_frame(amplitude=5)
         result = ec.process(quiet, speaking=True)
@@ -274,3 +322,34 @@ class TestEchoCanceller:
                 sys.modules["pyaec"] = saved
             else:
                 sys.modules.pop("pyaec", None)
+
+    def test_batch_gates_only_quiet_frames(self):
+        config = self._make_config(enabled=True, energy_gate_only=True, energy_threshold_rms=50.0)
+        ec = EchoCanceller(config, FarEndBuffer())
+        loud = self._make_loud_frame()
+        quiet = self._make_quiet_frame()
+        result = ec.process(loud + quiet + loud, speaking=True)
+        assert result == loud + _SILENCE_FRAME + loud
+
+    def test_batch_aec_uses_far_end_per_frame(self):
+        mock_aec_instance = MagicMock()
+        mock_aec_instance.cancel_echo.side_effect = lambda near, far: near
+        mock_pyaec = MagicMock()
+        mock_pyaec.Aec.return_value = mock_aec_instance
+
+        with patch.dict(sys.modules, {"pyaec": mock_pyaec}):
+            ec = EchoCanceller(self._make_config(enabled=True), FarEndBuffer())
+            ec.record_far_end(array.array("h", [7] * (_FRAME_BYTES // 2)).tobytes())
+            loud = self._make_loud_frame()
+            result = ec.process_batch(loud + loud)
+
+        assert result == loud + loud
+        far_args = [c.args[1] for c in mock_aec_instance.cancel_echo.call_args_list]
+        assert far_args == [[7] * (_FRAME_BYTES // 2), [0] * (_FRAME_BYTES // 2)]
+
+    @pytest.mark.parametrize("size", [0, 100, _FRAME_BYTES + 100])
+    def test_batch_passes_partial_frames_through(self, size):
+        config = self._make_config(enabled=True, energy_gate_only=True, energy_threshold_rms=50.0)
+        ec = EchoCanceller(config, FarEndBuffer())
+        data = b"\x01" * size
+        assert ec.process_batch(data) == data
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import csv
+import gzip
 import io
+import json
+import sys
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -272,3 +275,160 @@ class TestExportSummaryCSV:
         }
         assert set(rows[0].keys()) == expected_cols
         assert rows[0]["top_scenario"] == ""
+
+
+def _call_row(n: int) -> dict[str, Any]:
+    return {
+        "id": f"00000000-0000-4000-8000-{n:012d}",
+        "started_at": f"2026-02-14T10:00:{60 - n:02d}",
+        "duration_seconds": 30 + n,
+        "caller_id": "+380501234567",
+        "scenario": "tire_search",
+        "transferred_to_operator": False,
+        "transfer_reason": None,
+        "quality_score": None,
+        "total_cost_usd": 0.01,
+    }
+
+
+def _make_paged_engine(pages: list[list[dict[str, Any]]]) -> tuple[MagicMock, AsyncMock]:
+    """Mock engine whose successive queries return successive pages."""
+    results = []
+    for page in pages:
+        result = MagicMock()
+        result.__iter__.return_value = iter([_make_mock_row(r) for r in page])
+        results.append(result)
+    mock_conn = AsyncMock()
+    mock_conn.execute = AsyncMock(side_effect=results)
+
+    mock_engine = MagicMock()
+
+    @asynccontextmanager
+    async def _begin() -> AsyncIterator[AsyncMock]:
+        yield mock_conn
+
+    mock_engine.begin = _begin
+    return mock_engine, mock_conn
+
+
+class TestStreamingExport:
+    """Keyset-paginated streaming and alternative formats."""
+
+    @patch("src.api.export_stream.EXPORT_PAGE_SIZE", 2)
+    @patch("src.api.export._get_engine")
+    def test_calls_streamed_in_keyset_pages(
+        self, mock_engine_fn: MagicMock, client: TestClient
+    ) -> None:
+        mock_engine, mock_conn = _make_paged_engine([[_call_row(1), _call_row(2)], [_call_row(3)]])
+        mock_engine_fn.return_value = mock_engine
+
+        response = client.get("/analytics/calls/export?scenario=tire_search")
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [r["duration_sec"] for r in rows] == ["31", "32", "33"]
+        assert all("***" in r["caller_id"] for r in rows)
+        assert mock_conn.execute.await_count == 2
+        first_sql = str(mock_conn.execute.await_args_list[0].args[0])
+        second_sql, second_params = mock_conn.execute.await_args_list[1].args
+        assert "ORDER BY started_at DESC, id DESC" in first_sql
+        assert "OFFSET" not in first_sql
+        assert "(started_at, id) < (:after_started_at, :after_id)" in str(second_sql)
+        assert second_params["after_id"] == _call_row(2)["id"]
+        assert second_params["scenario"] == "tire_search"
+
+    @patch("src.api.export._get_engine")
+    def test_ndjson_gzip(self, mock_engine_fn: MagicMock, client: TestClient) -> None:
+        mock_engine, _ = _make_mock_engine([_call_row(1)])
+        mock_engine_fn.return_value = mock_engine
+
+        response = client.get("/analytics/calls/export?format=ndjson&gzip=true")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert "calls_all_all.ndjson.gz" in response.headers["content-disposition"]
+        lines = gzip.decompress(response.content).decode().splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["duration_sec"] == 31
+        assert record["quality_score"] is None
+        assert "***" in record["caller_id"]
+
+    @patch("src.api.export._get_engine")
+    def test_parquet_without_pyarrow(self, mock_engine_fn: MagicMock, client: TestClient) -> None:
+        mock_engine, _ = _make_mock_engine([])
+        mock_engine_fn.return_value = mock_engine
+
+        with patch.dict(sys.modules, {"pyarrow": None, "pyarrow.parquet": None}):
+            response = client.get("/analytics/summary/export?format=parquet")
+
+        assert response.status_code == 501
+
+    @patch("src.api.export._get_engine")
+    def test_unknown_format_rejected(self, mock_engine_fn: MagicMock, client: TestClient) -> None:
+        response = client.get("/analytics/calls/export?format=xlsx")
+
+        assert response.status_code == 422
+        mock_engine_fn.assert_not_called()
+
+
+class TestTranscriptDownload:
+    """GET /analytics/calls/{call_id}/transcript streams turns page by page."""
+
+    @patch("src.api.export_stream.EXPORT_PAGE_SIZE", 2)
+    @patch("src.api.analytics._get_engine")
+    def test_transcript_streamed(self, mock_engine_fn: MagicMock) -> None:
+        from src.api.analytics import router as analytics_router
+
+        call = MagicMock()
+        call._mapping = {
+            "caller_id": "+380501234567",
+            "started_at": "2026-02-14 10:00:00",
+            "duration_seconds": 42,
+            "scenario": "fitting",
+        }
+        meta = MagicMock()
+        meta.first.return_value = call
+        # A turn without turn_number is paged as turn 0
+        turns = MagicMock()
+        turns.__iter__.return_value = iter(
+            [
+                _make_mock_row({"id": 3, "turn_order": 0, "speaker": "bot", "content": "Алло"}),
+                _make_mock_row({"id": 1, "turn_order": 1, "speaker": "bot", "content": "Вітаю"}),
+            ]
+        )
+        more_turns = MagicMock()
+        more_turns.__iter__.return_value = iter(
+            [_make_mock_row({"id": 2, "turn_order": 2, "speaker": "customer", "content": "Шини"})]
+        )
+        mock_conn = AsyncMock()
+        mock_conn.execute = AsyncMock(side_effect=[meta, turns, more_turns])
+        mock_engine = MagicMock()
+
+        @asynccontextmanager
+        async def _begin() -> AsyncIterator[AsyncMock]:
+            yield mock_conn
+
+        mock_engine.begin = _begin
+        mock_engine_fn.return_value = mock_engine
+
+        with patch(
+            "src.api.auth.require_admin", new_callable=AsyncMock, return_value=_ADMIN_PAYLOAD
+        ):
+            app = FastAPI()
+            app.include_router(analytics_router)
+            response = TestClient(app).get(
+                "/analytics/calls/550e8400-e29b-41d4-a716-446655440000/transcript"
+            )
+
+        assert response.status_code == 200
+        assert response.text.endswith(
+            "=" * 50 + "\n\n[Бот]\nАлло\n\n[Бот]\nВітаю\n\n[Клієнт]\nШини\n"
+        )
+        first_sql = str(mock_conn.execute.await_args_list[1].args[0])
+        second_sql, second_params = mock_conn.execute.await_args_list[2].args
+        assert "ORDER BY COALESCE(turn_number, 0) ASC, id ASC" in first_sql
+        assert "(COALESCE(turn_number, 0), id) > (:after_turn_order, :after_id)" in str(second_sql)
+        assert (second_params["after_turn_order"], second_params["after_id"]) == (1, 1)
+        turns_sql, turns_params = mock_conn.execute.await_args_list[1].args
+        assert "created_at >= :started_at" in str(turns_sql)
+        assert turns_params["started_at"] == "2026-02-14 10:00:00"
@@ -3,7 +3,7 @@ greeting suffix, and prompt emphasis."""
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -15,18 +15,8 @@ class TestResolveIvrIntent:
     async def test_ari_returns_valid_intent(self) -> None:
         mock_ari = AsyncMock()
         mock_ari.get_channel_variable = AsyncMock(return_value="tire_search")
-        mock_ari.open = AsyncMock()
-        mock_ari.close = AsyncMock()
-
-        mock_settings = MagicMock()
-        mock_settings.ari.url = "http://localhost:8088/ari"
-        mock_settings.ari.user = "user"
-        mock_settings.ari.password = "pass"
-
-        with (
-            patch("src.main.get_settings", return_value=mock_settings),
-            patch("src.core.asterisk_ari.AsteriskARIClient", return_value=mock_ari),
-        ):
+
+        with patch("src.main._ari_client", mock_ari):
             from src.main import _resolve_ivr_intent
 
             result = await _resolve_ivr_intent("test-uuid")
@@ -37,18 +27,8 @@ class TestResolveIvrIntent:
     async def test_ari_returns_uppercase_normalized(self) -> None:
         mock_ari = AsyncMock()
         mock_ari.get_channel_variable = AsyncMock(return_value="ORDER_STATUS")
-        mock_ari.open = AsyncMock()
-        mock_ari.close = AsyncMock()
-
-        mock_settings = MagicMock()
-        mock_settings.ari.url = "http://localhost:8088/ari"
-        mock_settings.ari.user = "user"
-        mock_settings.ari.password = "pass"
-
-        with (
-            patch("src.main.get_settings", return_value=mock_settings),
-            patch("src.core.asterisk_ari.AsteriskARIClient", return_value=mock_ari),
-        ):
+
+        with patch("src.main._ari_client", mock_ari):
             from src.main import _resolve_ivr_intent
 
             result = await _resolve_ivr_intent("test-uuid")
@@ -59,18 +39,8 @@ class TestResolveIvrIntent:
     async def test_ari_returns_invalid_intent(self) -> None:
         mock_ari = AsyncMock()
         mock_ari.get_channel_variable = AsyncMock(return_value="invalid_scenario")
-        mock_ari.open = AsyncMock()
-        mock_ari.close = AsyncMock()
-
-        mock_settings = MagicMock()
-        mock_settings.ari.url = "http://localhost:8088/ari"
-        mock_settings.ari.user = "user"
-        mock_settings.ari.password = "pass"
-
-        with (
-            patch("src.main.get_settings", return_value=mock_settings),
-            patch("src.core.asterisk_ari.AsteriskARIClient", return_value=mock_ari),
-        ):
+
+        with patch("src.main._ari_client", mock_ari):
             from src.main import _resolve_ivr_intent
 
             result = await _resolve_ivr_intent("test-uuid")
@@ -79,10 +49,7 @@ class TestResolveIvrIntent:
 
     @pytest.mark.asyncio
     async def test_ari_not_configured(self) -> None:
-        mock_settings = MagicMock()
-        mock_settings.ari.url = ""
-
-        with patch("src.main.get_settings", return_value=mock_settings):
+        with patch("src.main._ari_client", None):
             from src.main import _resolve_ivr_intent
 
             result = await _resolve_ivr_intent("test-uuid")
@@ -93,18 +60,8 @@ class TestResolveIvrIntent:
     async def test_ari_returns_none(self) -> None:
         mock_ari = AsyncMock()
         mock_ari.get_channel_variable = AsyncMock(return_value=None)
-        mock_ari.open = AsyncMock()
-        mock_ari.close = AsyncMock()
-
-        mock_settings = MagicMock()
-        mock_settings.ari.url = "http://localhost:8088/ari"
-        mock_settings.ari.user = "user"
-        mock_settings.ari.password = "pass"
-
-        with (
-            patch("src.main.get_settings", return_value=mock_settings),
-            patch("src.core.asterisk_ari.AsteriskARIClient", return_value=mock_ari),
-        ):
+
+        with patch("src.main._ari_client", mock_ari):
             from src.main import _resolve_ivr_intent
 
             result = await _resolve_ivr_intent("test-uuid")
@@ -113,18 +70,10 @@ class TestResolveIvrIntent:
 
     @pytest.mark.asyncio
     async def test_ari_exception_returns_none(self) -> None:
-        mock_settings = MagicMock()
-        mock_settings.ari.url = "http://localhost:8088/ari"
-        mock_settings.ari.user = "user"
-        mock_settings.ari.password = "pass"
-
-        with (
-            patch("src.main.get_settings", return_value=mock_settings),
-            patch(
-                "src.core.asterisk_ari.AsteriskARIClient",
-                side_effect=RuntimeError("connection failed"),
-            ),
-        ):
+        mock_ari = AsyncMock()
+        mock_ari.get_channel_variable = AsyncMock(side_effect=RuntimeError("connection failed"))
+
+        with patch("src.main._ari_client", mock_ari):
             from src.main import _resolve_ivr_intent
 
             result = await _resolve_ivr_intent("test-uuid")
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+from datetime import UTC, date, datetime
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -51,6 +54,14 @@ def _row(**kwargs):
     return obj
 
 
+def _freshness_result(watermark: datetime | None = None) -> MagicMock:
+    """Result of the rollup freshness query (no rollup run yet by default)."""
+    result = MagicMock()
+    state = _row(watermark=watermark, updated_at=watermark) if watermark else None
+    result.first = MagicMock(return_value=state)
+    return result
+
+
 @pytest.fixture()
 def app():
     from fastapi import FastAPI
@@ -320,7 +331,12 @@ class TestUsageSummary:
                 total_cost=3.50,
             )
         ]
-        engine, _ = _make_mock_engine(rows=rows)
+        engine, mock_conn = _make_mock_engine(rows=rows)
+        watermark = datetime(2026, 2, 25, 14, 0, tzinfo=UTC)
+        mock_conn.execute.side_effect = [
+            _freshness_result(watermark),
+            mock_conn.execute.return_value,
+        ]
 
         with (
             patch("src.api.auth.require_admin", _fake_require_admin),
@@ -334,10 +350,18 @@ class TestUsageSummary:
         assert len(data["items"]) == 1
         assert data["items"][0]["task_type"] == "agent"
         assert data["items"][0]["total_cost"] == 3.50
+        assert data["freshness"]["aggregated_until"] == watermark.isoformat()
+
+        sql, params = mock_conn.execute.await_args.args
+        assert "FROM llm_usage_daily" in str(sql)
+        assert "LEFT JOIN llm_model_pricing" in str(sql)
+        assert params["date_from"] == date(2026, 2, 1)
+        assert params["date_to_end"] == date(2026, 2, 26)
 
     @pytest.mark.asyncio()
     async def test_empty_result(self, app: Any) -> None:
-        engine, _ = _make_mock_engine(rows=[])
+        engine, mock_conn = _make_mock_engine(rows=[])
+        mock_conn.execute.side_effect = [_freshness_result(), mock_conn.execute.return_value]
 
         with (
             patch("src.api.auth.require_admin", _fake_require_admin),
@@ -348,6 +372,7 @@ class TestUsageSummary:
 
         assert resp.status_code == 200
         assert resp.json()["items"] == []
+        assert resp.json()["freshness"]["aggregated_until"] is None
 
 
 class TestModelComparison:
@@ -355,10 +380,11 @@ class TestModelComparison:
     async def test_returns_comparison(self, app: Any) -> None:
         usage_rows = [
             _row(
-                actual_provider="gemini-flash",
+                provider_key="gemini-flash",
                 total_input_tokens=1000000,
                 total_output_tokens=200000,
                 call_count=50,
+                total_cost=0.8,
             )
         ]
         pricing_rows = [
@@ -375,10 +401,6 @@ class TestModelComparison:
                 output_price_per_1m=15.00,
             ),
         ]
-        all_pricing_rows = [
-            _row(provider_key="gemini-flash", input_price_per_1m=0.30, output_price_per_1m=2.50),
-            _row(provider_key="anthropic-sonnet", input_price_per_1m=3.00, output_price_per_1m=15.00),
-        ]
 
         engine, mock_conn = _make_mock_engine()
 
@@ -388,12 +410,7 @@ class TestModelComparison:
         pricing_result = MagicMock()
         pricing_result.fetchall = MagicMock(return_value=pricing_rows)
 
-        all_pricing_result = MagicMock()
-        all_pricing_result.fetchall = MagicMock(return_value=all_pricing_rows)
-
-        mock_conn.execute = AsyncMock(
-            side_effect=[agg_result, pricing_result, all_pricing_result]
-        )
+        mock_conn.execute = AsyncMock(side_effect=[_freshness_result(), agg_result, pricing_result])
 
         with (
             patch("src.api.auth.require_admin", _fake_require_admin),
@@ -407,6 +424,7 @@ class TestModelComparison:
         assert resp.status_code == 200
         data = resp.json()
         assert data["actual_provider"] == "gemini-flash"
+        assert data["actual_cost"] == 0.8
         assert data["total_input_tokens"] == 1000000
         assert len(data["comparisons"]) == 2
 
@@ -423,7 +441,7 @@ class TestModelComparison:
         agg_result = MagicMock()
         agg_result.fetchall = MagicMock(return_value=[])
 
-        mock_conn.execute = AsyncMock(return_value=agg_result)
+        mock_conn.execute = AsyncMock(side_effect=[_freshness_result(), agg_result])
 
         with (
             patch("src.api.auth.require_admin", _fake_require_admin),
@@ -841,53 +859,198 @@ class TestCatalogSync:
         assert "started" in resp.json()["message"].lower()
 
 
+_PATCH_USAGE_ENGINE = "src.monitoring.llm_usage_logger.create_async_engine"
+
+
+def _usage_row(**overrides: Any) -> dict[str, Any]:
+    row = {
+        "task_type": "agent",
+        "provider_key": "gemini-flash",
+        "model_name": "gemini-2.5-flash",
+        "input_tokens": 1000,
+        "output_tokens": 200,
+        "cached_input_tokens": 0,
+        "latency_ms": 300,
+        "call_id": None,
+        "tenant_id": None,
+        "created_at": datetime(2026, 10, 16, 12, 0, tzinfo=UTC),
+    }
+    row.update(overrides)
+    return row
+
+
+def _usage_engine(*fail: bool) -> tuple[MagicMock, AsyncMock]:
+    """Engine whose ``begin()`` raises for every True in ``fail``, then succeeds.
+
+    The reachability probe (``connect()``) always fails: the database is down.
+    """
+    conn = AsyncMock()
+    outcomes = iter(fail)
+
+    def begin() -> AsyncMock:
+        if next(outcomes, False):
+            raise ConnectionError("DB down")
+        ctx = AsyncMock()
+        ctx.__aenter__ = AsyncMock(return_value=conn)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        return ctx
+
+    engine = MagicMock()
+    engine.begin = MagicMock(side_effect=begin)
+    engine.connect = MagicMock(side_effect=ConnectionError("DB down"))
+    engine.dispose = AsyncMock()
+    return engine, conn
+
+
+def _rejecting_engine(bad_call_id: str) -> tuple[MagicMock, list[list[Any]]]:
+    """Reachable engine that rejects every insert containing *bad_call_id*.
+
+    Also returns the ``call_id`` column of each insert that succeeded.
+    """
+    written: list[list[Any]] = []
+
+    async def execute(sql: Any, params: dict[str, Any] | None = None) -> None:
+        if params is None:
+            return  # SELECT 1
+        if bad_call_id in params["call_id"]:
+            raise ValueError(f"invalid input syntax for type uuid: {bad_call_id!r}")
+        written.append(params["call_id"])
+
+    conn = AsyncMock()
+    conn.execute = AsyncMock(side_effect=execute)
+    ctx = AsyncMock()
+    ctx.__aenter__ = AsyncMock(return_value=conn)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    engine = MagicMock()
+    engine.begin = MagicMock(return_value=ctx)
+    engine.connect = MagicMock(return_value=ctx)
+    engine.dispose = AsyncMock()
+    return engine, written
+
+
 class TestLlmUsageLogger:
-    """Tests for the fire-and-forget logger module."""
+    """Tests for the buffered usage writer."""
 
     @pytest.mark.asyncio()
-    async def test_insert_usage_calls_db(self) -> None:
-        mock_conn = AsyncMock()
-        mock_conn.execute = AsyncMock()
+    async def test_flush_writes_buffer_as_one_insert(self) -> None:
+        from src.monitoring.llm_usage_logger import LlmUsageWriter
+
+        engine, conn = _usage_engine()
+        writer = LlmUsageWriter(batch_max_delay=60)
+        with patch(_PATCH_USAGE_ENGINE, return_value=engine):
+            for tokens in (100, 200, 300):
+                writer.add(_usage_row(input_tokens=tokens))
+            written = await writer.flush()
+
+        assert written == 3
+        conn.execute.assert_awaited_once()
+        sql, params = conn.execute.await_args.args
+        assert "unnest(" in str(sql)
+        assert params["input_tokens"] == [100, 200, 300]
+        await writer.close()
 
-        mock_ctx = AsyncMock()
-        mock_ctx.__aenter__ = AsyncMock(return_value=mock_conn)
-        mock_ctx.__aexit__ = AsyncMock(return_value=False)
+    @pytest.mark.asyncio()
+    async def test_full_batch_flushes_and_close_drains(self) -> None:
+        from src.monitoring.llm_usage_logger import LlmUsageWriter
 
-        mock_engine = MagicMock()
-        mock_engine.begin = MagicMock(return_value=mock_ctx)
+        engine, conn = _usage_engine()
+        writer = LlmUsageWriter(batch_max_rows=2, batch_max_delay=60)
+        with patch(_PATCH_USAGE_ENGINE, return_value=engine):
+            writer.add(_usage_row())
+            writer.add(_usage_row())
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert conn.execute.await_count == 1
 
-        with patch("src.monitoring.llm_usage_logger._get_engine", return_value=mock_engine):
-            from src.monitoring.llm_usage_logger import _insert_usage
+            writer.add(_usage_row())  # below the batch size: only close() writes it
+            await writer.close()
 
-            await _insert_usage(
-                task_type="agent",
-                provider_key="gemini-flash",
-                model_name="gemini-2.5-flash",
-                input_tokens=1000,
-                output_tokens=200,
-                latency_ms=300,
-                call_id="test-call-id",
-                tenant_id=None,
-            )
+        assert conn.execute.await_count == 2
+        engine.dispose.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_db_failure_spills_to_redis_and_replays(self) -> None:
+        from src.monitoring.llm_usage_logger import LlmUsageWriter
 
-        mock_conn.execute.assert_called_once()
+        engine, conn = _usage_engine(True)
+        redis = AsyncMock()
+        writer = LlmUsageWriter(redis, batch_max_delay=60)
+        with patch(_PATCH_USAGE_ENGINE, return_value=engine):
+            writer.add(_usage_row(call_id=str(uuid4())))
+            assert await writer.flush() == 0
+
+            spilled = redis.rpush.await_args.args[1:]
+            assert len(spilled) == 1
+            redis.lpop = AsyncMock(side_effect=[list(spilled), None])
+
+            writer.add(_usage_row())
+            assert await writer.flush() == 1
+
+        assert conn.execute.await_count == 2
+        replayed = conn.execute.await_args_list[1].args[1]
+        assert replayed["created_at"] == [datetime(2026, 10, 16, 12, 0, tzinfo=UTC)]
+        await writer.close()
 
     @pytest.mark.asyncio()
-    async def test_insert_usage_catches_errors(self) -> None:
-        with patch(
-            "src.monitoring.llm_usage_logger._get_engine",
-            side_effect=RuntimeError("DB down"),
-        ):
-            from src.monitoring.llm_usage_logger import _insert_usage
+    async def test_rejected_row_is_dropped_and_rest_written(self) -> None:
+        from src.monitoring.llm_usage_logger import LlmUsageWriter
+        from src.monitoring.metrics import llm_usage_rows_total
+
+        engine, written = _rejecting_engine("not-a-uuid")
+        redis = AsyncMock()
+        redis.lpop = AsyncMock(return_value=None)
+        writer = LlmUsageWriter(redis, batch_max_delay=60)
+        lost = llm_usage_rows_total.labels(outcome="lost")
+        lost_before = lost._value.get()
+        call_ids = [str(uuid4()) for _ in range(4)]
+        with patch(_PATCH_USAGE_ENGINE, return_value=engine):
+            for call_id in [*call_ids[:2], "not-a-uuid", *call_ids[2:]]:
+                writer.add(_usage_row(call_id=call_id))
+            assert await writer.flush() == 4
+            await writer.close()
+
+        assert sorted(cid for batch in written for cid in batch) == sorted(call_ids)
+        assert lost._value.get() - lost_before == 1
+        redis.rpush.assert_not_awaited()
 
-            # Should not raise
-            await _insert_usage(
-                task_type="agent",
-                provider_key="gemini-flash",
-                model_name="gemini-2.5-flash",
-                input_tokens=1000,
-                output_tokens=200,
-                latency_ms=None,
-                call_id=None,
-                tenant_id=None,
-            )
+    @pytest.mark.asyncio()
+    async def test_replay_drops_rejected_rows_instead_of_pushing_back(self) -> None:
+        from src.monitoring.llm_usage_logger import LlmUsageWriter
+
+        engine, written = _rejecting_engine("not-a-uuid")
+        good = str(uuid4())
+        rows = [_usage_row(call_id=call_id) for call_id in ("not-a-uuid", good)]
+        chunk = [json.dumps(row, default=str) for row in rows]
+        redis = AsyncMock()
+        redis.lpop = AsyncMock(side_effect=[chunk, None])
+        writer = LlmUsageWriter(redis, batch_max_delay=60)
+        with patch(_PATCH_USAGE_ENGINE, return_value=engine):
+            assert await writer.replay_redis_buffer() == 1
+            await writer.close()
+
+        assert written == [[good]]
+        redis.rpush.assert_not_awaited()
+
+    @pytest.mark.asyncio()
+    async def test_buffer_is_bounded(self) -> None:
+        from src.monitoring.llm_usage_logger import LlmUsageWriter
+
+        engine, _ = _usage_engine()
+        writer = LlmUsageWriter(batch_max_delay=60, buffer_max_rows=2)
+        with patch(_PATCH_USAGE_ENGINE, return_value=engine):
+            for _ in range(3):
+                writer.add(_usage_row())
+            assert await writer.flush() == 2
+            await writer.close()
+
+    def test_log_llm_usage_without_loop_is_skipped(self) -> None:
+        from src.monitoring.llm_usage_logger import log_llm_usage
+
+        # Should not raise
+        log_llm_usage(
+            task_type="agent",
+            provider_key="gemini-flash",
+            model_name="gemini-2.5-flash",
+            input_tokens=1000,
+            output_tokens=200,
+        )
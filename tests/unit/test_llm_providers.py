@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.llm.models import LLMResponse, ToolCall
+from src.llm.models import LLMResponse, SystemPrompt, ToolCall
 from src.llm.providers.anthropic_provider import AnthropicProvider
 from src.llm.providers.openai_compat import OpenAICompatProvider
 
@@ -72,6 +72,8 @@ class TestAnthropicProvider:
         mock_resp.stop_reason = stop_reason
         mock_resp.usage.input_tokens = 100
         mock_resp.usage.output_tokens = 50
+        mock_resp.usage.cache_read_input_tokens = 0
+        mock_resp.usage.cache_creation_input_tokens = 0
         return mock_resp
 
     @pytest.mark.asyncio()
@@ -116,6 +118,50 @@ class TestAnthropicProvider:
         assert result.tool_calls[0].arguments == {"q": "tires"}
         assert result.stop_reason == "tool_use"
 
+    @pytest.mark.asyncio()
+    async def test_system_prompt_gets_cache_breakpoint(self, provider: AnthropicProvider) -> None:
+        provider._client.messages.create = AsyncMock(return_value=self._make_mock_response())
+        tools = [
+            {"name": "a", "description": "A", "input_schema": {"type": "object"}},
+            {"name": "b", "description": "B", "input_schema": {"type": "object"}},
+        ]
+
+        await provider.complete_with_tools(
+            messages=[{"role": "user", "content": "Hi"}],
+            tools=tools,
+            system=SystemPrompt("stable rules", "## Stage"),
+        )
+
+        kwargs = provider._client.messages.create.call_args.kwargs
+        assert kwargs["system"] == [
+            {"type": "text", "text": "stable rules", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "## Stage"},
+        ]
+        assert "cache_control" not in kwargs["tools"][0]
+        assert kwargs["tools"][1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in tools[1]  # caller's schema untouched
+
+    @pytest.mark.asyncio()
+    async def test_plain_system_string_unchanged(self, provider: AnthropicProvider) -> None:
+        provider._client.messages.create = AsyncMock(return_value=self._make_mock_response())
+
+        await provider.complete(messages=[{"role": "user", "content": "Hi"}], system="Be helpful")
+
+        assert provider._client.messages.create.call_args.kwargs["system"] == "Be helpful"
+
+    @pytest.mark.asyncio()
+    async def test_usage_includes_cached_tokens(self, provider: AnthropicProvider) -> None:
+        mock_resp = self._make_mock_response()
+        mock_resp.usage.input_tokens = 40
+        mock_resp.usage.cache_read_input_tokens = 3000
+        mock_resp.usage.cache_creation_input_tokens = 200
+        provider._client.messages.create = AsyncMock(return_value=mock_resp)
+
+        result = await provider.complete(messages=[{"role": "user", "content": "Hi"}])
+
+        assert result.usage.input_tokens == 3240
+        assert result.usage.cached_input_tokens == 3000
+
     @pytest.mark.asyncio()
     async def test_health_check_success(self, provider: AnthropicProvider) -> None:
         provider._client.models.list = AsyncMock(return_value=[])
@@ -0,0 +1,104 @@
+"""Unit tests for the daily LLM usage rollup."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.reports.llm_usage import refresh_days
+from src.tasks import llm_usage_rollup
+from src.tasks.llm_usage_rollup import _rollup_chunk
+
+_NOW = datetime(2026, 10, 16, 14, 0, tzinfo=UTC)
+_TODAY = datetime(2026, 10, 16, tzinfo=UTC)
+
+
+def _state(start: datetime | None) -> MagicMock:
+    result = MagicMock()
+    result.one.return_value = SimpleNamespace(upto=_NOW, start=start)
+    return result
+
+
+def _dirty(*days: datetime) -> MagicMock:
+    result = MagicMock()
+    result.__iter__.return_value = iter(
+        [SimpleNamespace(day_start=d, day_end=d + timedelta(days=1)) for d in days]
+    )
+    return result
+
+
+async def _chunk(conn: AsyncMock) -> tuple[bool, dict[str, Any], AsyncMock]:
+    refresh = AsyncMock(return_value=5)
+    stats: dict[str, Any] = {"days_refreshed": 0, "dirty_days": 0, "rows_written": 0}
+    with (
+        patch.object(llm_usage_rollup, "lock_rollup", AsyncMock()),
+        patch.object(llm_usage_rollup, "refresh_days", refresh),
+    ):
+        done = await _rollup_chunk(conn, stats)
+    return done, stats, refresh
+
+
+class TestRollupChunk:
+    @pytest.mark.asyncio
+    async def test_recomputes_today_and_old_dirty_days(self) -> None:
+        dirty_old = _TODAY - timedelta(days=3)
+        conn = AsyncMock()
+        conn.execute = AsyncMock(
+            side_effect=[_state(_TODAY), _dirty(_TODAY, dirty_old), MagicMock()]
+        )
+
+        done, stats, refresh = await _chunk(conn)
+
+        assert done is True
+        assert refresh.await_args_list[0].args[1:] == (_TODAY, _NOW)
+        assert refresh.await_args_list[1].args[1:] == (dirty_old, dirty_old + timedelta(days=1))
+        assert refresh.await_count == 2
+        assert stats == {
+            "days_refreshed": 1,
+            "dirty_days": 1,
+            "rows_written": 10,
+            "watermark": _NOW.isoformat(),
+        }
+        assert conn.execute.await_args_list[-1].args[1]["watermark"] == _NOW
+
+    @pytest.mark.asyncio
+    async def test_first_run_backfills_in_chunks(self) -> None:
+        oldest = _TODAY - timedelta(days=30)
+        conn = AsyncMock()
+        conn.execute = AsyncMock(
+            side_effect=[
+                _state(None),
+                MagicMock(scalar=MagicMock(return_value=oldest)),
+                _dirty(),
+                MagicMock(),
+            ]
+        )
+
+        done, stats, refresh = await _chunk(conn)
+
+        assert done is False
+        chunk_end = oldest + llm_usage_rollup._CHUNK
+        refresh.assert_awaited_once()
+        assert refresh.await_args.args[1:] == (oldest, chunk_end)
+        assert stats["days_refreshed"] == 7
+        assert conn.execute.await_args_list[-1].args[1]["watermark"] == chunk_end
+
+
+class TestRefreshDays:
+    @pytest.mark.asyncio
+    async def test_replaces_days_with_range_predicates(self) -> None:
+        conn = AsyncMock()
+        conn.execute = AsyncMock(return_value=MagicMock(rowcount=4))
+
+        written = await refresh_days(conn, _TODAY, _NOW)
+
+        assert written == 4
+        delete_sql = str(conn.execute.await_args_list[0].args[0])
+        insert_sql = str(conn.execute.await_args_list[1].args[0])
+        assert delete_sql.startswith("DELETE FROM llm_usage_daily")
+        assert "INSERT INTO llm_usage_daily" in insert_sql
+        assert "created_at >= :start AND created_at < :end" in insert_sql
@@ -40,7 +40,7 @@ class TestRunAllSources:
 
         with (
             patch("src.tasks.scraper_tasks.get_settings") as mock_settings,
-            patch("src.tasks.scraper_tasks.create_async_engine", return_value=mock_engine),
+            patch("sqlalchemy.ext.asyncio.create_async_engine", return_value=mock_engine),
         ):
             mock_settings.return_value = MagicMock()
             mock_settings.return_value.database.url = "postgresql+asyncpg://localhost/test"
@@ -87,7 +87,7 @@ class TestRunAllSources:
 
         with (
             patch("src.tasks.scraper_tasks.get_settings") as mock_settings,
-            patch("src.tasks.scraper_tasks.create_async_engine", return_value=mock_engine),
+            patch("sqlalchemy.ext.asyncio.create_async_engine", return_value=mock_engine),
             patch("src.tasks.scraper_tasks.run_source") as mock_run_source,
         ):
             mock_settings.return_value = MagicMock()
@@ -123,7 +123,7 @@ class TestRunSource:
 
         with (
             patch("src.tasks.scraper_tasks.get_settings") as mock_settings,
-            patch("src.tasks.scraper_tasks.create_async_engine", return_value=mock_engine),
+            patch("sqlalchemy.ext.asyncio.create_async_engine", return_value=mock_engine),
         ):
             mock_settings.return_value = MagicMock()
             mock_settings.return_value.database.url = "postgresql+asyncpg://localhost/test"
@@ -166,7 +166,7 @@ class TestRunSource:
 
         with (
             patch("src.tasks.scraper_tasks.get_settings") as mock_settings,
-            patch("src.tasks.scraper_tasks.create_async_engine", return_value=mock_engine),
+            patch("sqlalchemy.ext.asyncio.create_async_engine", return_value=mock_engine),
         ):
             mock_settings.return_value = MagicMock()
             mock_settings.return_value.database.url = "postgresql+asyncpg://localhost/test"
@@ -223,7 +223,7 @@ class TestRunSource:
 
         with (
             patch("src.tasks.scraper_tasks.get_settings") as mock_settings,
-            patch("src.tasks.scraper_tasks.create_async_engine", return_value=mock_engine),
+            patch("sqlalchemy.ext.asyncio.create_async_engine", return_value=mock_engine),
             patch("src.knowledge.fetchers.create_fetcher", return_value=mock_fetcher),
         ):
             mock_settings.return_value = MagicMock()
@@ -0,0 +1,103 @@
+"""Unit tests for streamed parsing of 1C JSON payloads."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.onec_client.client import OneCClient
+from src.onec_client.stream import iter_batches, iter_json_array
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+_STOCK = {
+    "success": True,
+    "TradingNetwork": "ProKoleso",
+    "data": [
+        {"sku": "00000019835", "price": 1850, "stock": "24", "country": "Сербія"},
+        {"sku": "00000000023", "price": 2540.5, "stock": "8", "country": "Україна"},
+        {"sku": "00000000024", "price": 12, "stock": "0", "country": ""},
+    ],
+    "errors": [],
+}
+
+
+async def _chunks(raw: bytes, size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(raw), size):
+        yield raw[i : i + size]
+
+
+async def _collect(raw: bytes, size: int, key: str = "data") -> list[Any]:
+    return [item async for item in iter_json_array(_chunks(raw, size), key)]
+
+
+class TestIterJsonArray:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100_000])
+    async def test_utf8_any_chunking(self, size: int) -> None:
+        raw = json.dumps(_STOCK, ensure_ascii=False, indent=1).encode("utf-8")
+        assert await _collect(raw, size) == _STOCK["data"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 5, 64])
+    async def test_windows_1251_fallback(self, size: int) -> None:
+        raw = json.dumps(_STOCK, ensure_ascii=False).encode("windows-1251")
+        assert await _collect(raw, size) == _STOCK["data"]
+
+    @pytest.mark.asyncio
+    async def test_bare_array(self) -> None:
+        raw = json.dumps(_STOCK["data"]).encode()
+        assert await _collect(raw, 10) == _STOCK["data"]
+
+    @pytest.mark.asyncio
+    async def test_missing_or_empty_array_yields_nothing(self) -> None:
+        assert await _collect(b'{"success": true, "errors": []}', 4) == []
+        assert await _collect(b'{"success": true, "data": []}', 4) == []
+        assert await _collect(b'{"data": null}', 4) == []
+        assert await _collect(b"{}", 4) == []
+
+    @pytest.mark.asyncio
+    async def test_truncated_payload_raises(self) -> None:
+        raw = json.dumps(_STOCK).encode()[:-30]
+        with pytest.raises(ValueError):
+            await _collect(raw, 16)
+
+    @pytest.mark.asyncio
+    async def test_iter_batches(self) -> None:
+        async def items() -> AsyncIterator[int]:
+            for i in range(5):
+                yield i
+
+        assert [b async for b in iter_batches(items(), 2)] == [[0, 1], [2, 3], [4]]
+
+
+class TestOneCClientStream:
+    @pytest.mark.asyncio
+    async def test_iter_stock_batches_and_releases(self) -> None:
+        raw = json.dumps(_STOCK, ensure_ascii=False).encode("windows-1251")
+        resp = MagicMock(status=200)
+        resp.content.iter_chunked = MagicMock(return_value=_chunks(raw, 50))
+        client = OneCClient("http://host", "user", "pass")
+        client._session = MagicMock()
+
+        with patch.object(
+            client, "_open_stream", new_callable=AsyncMock, return_value=resp
+        ) as mock_open:
+            batches = [b async for b in client.iter_stock("ProKoleso", batch_size=2)]
+
+        mock_open.assert_awaited_once_with(
+            "http://host/Trade/hs/site/get_stock/", {"TradingNetwork": "ProKoleso"}
+        )
+        assert batches == [_STOCK["data"][:2], _STOCK["data"][2:]]
+        resp.release.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_before_open_raises(self) -> None:
+        client = OneCClient("http://host", "user", "pass")
+        with pytest.raises(RuntimeError, match="not opened"):
+            async for _ in client.iter_wares_full():
+                pass
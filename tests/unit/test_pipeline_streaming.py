@@ -14,6 +14,7 @@ from src.agent.streaming_loop import TurnResult
 from src.core.call_session import CallSession
 from src.core.pipeline import CallPipeline
 from src.llm.models import Usage
+from src.stt.base import STTConfig
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -362,3 +363,64 @@ class TestLLMHistoryPersists:
         assert pipeline._llm_history[0]["role"] == "user"
         assert pipeline._llm_history[0]["content"] == "Turn 0"
         assert pipeline._llm_history[1]["role"] == "assistant"
+
+
+class TestSpeculativeTurn:
+    def _spec(self, *, matches: bool = True, failed: bool = False) -> MagicMock:
+        spec = MagicMock()
+        spec.matches.return_value = matches
+        spec.failed = failed
+        spec.saved_ms = 400.0
+        spec.user_text = "Шукаю шини"
+        spec.cancel = AsyncMock(return_value=(Usage(3000, 12), "anthropic-sonnet"))
+        return spec
+
+    @pytest.mark.asyncio
+    async def test_matching_speculation_is_adopted(self) -> None:
+        pipeline = _make_pipeline(streaming_loop=AsyncMock())
+        spec = self._spec()
+        pipeline._speculation = spec
+
+        taken = await pipeline._take_speculation("Шукаю шини", {"order_id": None})
+
+        assert taken is spec
+        assert pipeline._speculation is None
+        spec.cancel.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_mismatch_is_discarded_and_costed(self) -> None:
+        pipeline = _make_pipeline(streaming_loop=AsyncMock())
+        pipeline._cost = MagicMock()
+        spec = self._spec(matches=False)
+        pipeline._speculation = spec
+
+        taken = await pipeline._take_speculation("Шукаю диски", {"order_id": None})
+
+        assert taken is None
+        spec.cancel.assert_awaited_once()
+        pipeline._cost.add_discarded_llm_usage.assert_called_once_with(
+            3000, 12, provider_key="anthropic-sonnet", cached_input_tokens=0
+        )
+
+    @pytest.mark.asyncio
+    async def test_stable_interim_starts_speculation(self) -> None:
+        mock_loop = MagicMock()
+        pipeline = _make_pipeline(streaming_loop=mock_loop)
+        pipeline._stt_config = STTConfig(speculative_turn_enabled=True, speculative_stable_ms=0)
+        pipeline._apply_stt_corrections = AsyncMock(side_effect=lambda t, **_: t)  # type: ignore[method-assign]
+        interim = MagicMock()
+        interim.text = "Шукаю шини"
+
+        pipeline._schedule_speculation(interim)
+        await pipeline._speculation_timer
+
+        mock_loop.speculate.assert_called_once()
+        args, kwargs = mock_loop.speculate.call_args
+        assert args == ("Шукаю шини", pipeline._llm_history)
+        assert kwargs == pipeline._turn_context(None)
+        assert pipeline._speculation is mock_loop.speculate.return_value
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self) -> None:
+        pipeline = _make_pipeline(streaming_loop=AsyncMock())
+        assert pipeline._speculation_enabled is False
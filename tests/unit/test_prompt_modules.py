@@ -27,6 +27,7 @@ from src.agent.prompts import (
     compute_order_stage,
     detect_scenario_from_text,
 )
+from src.llm.models import SystemPrompt
 
 # ---------------------------------------------------------------------------
 # TestAssemblePrompt
@@ -335,6 +336,37 @@ class TestBuildSystemPromptWithContext:
             "Stable sections must all appear before dynamic sections"
         )
 
+    def test_cache_split_between_stable_and_dynamic(self) -> None:
+        """The returned SystemPrompt marks where the stable prefix ends."""
+        result = build_system_prompt_with_context(
+            "base prompt",
+            is_modular=True,
+            order_stage="delivery_set",
+            safety_context="## Safety rules here",
+            promotions_context="## Active promotions",
+            order_id="DRAFT-999",
+            offered_slots=[{"date": "2026-10-20", "time": "10:00"}],
+        )
+        assert isinstance(result, SystemPrompt)
+        assert "Active promotions" in result.stable_prefix
+        assert "DRAFT-999" not in result.stable_prefix
+        assert "Підтвердження замовлення" in result.volatile_suffix
+        assert "2026-10-20" in result.volatile_suffix
+        assert result == result.stable_prefix + "\n" + result.volatile_suffix
+
+    def test_stable_prefix_identical_across_turns(self) -> None:
+        """Per-turn context changes must not touch the cached prefix."""
+        first = build_system_prompt_with_context("base prompt", safety_context="## Safety")
+        later = build_system_prompt_with_context(
+            "base prompt",
+            safety_context="## Safety",
+            order_id="DRAFT-1",
+            fitting_progress={"customer_name": "Іван"},
+        )
+        assert first.stable_prefix == later.stable_prefix
+        assert first.volatile_suffix == ""
+        assert first == first.stable_prefix
+
 
 # ---------------------------------------------------------------------------
 # TestBackwardCompatibility
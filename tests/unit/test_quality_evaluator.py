@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.llm.models import Usage
+from src.tasks import quality_evaluator
 from src.tasks.quality_evaluator import (
     QUALITY_CRITERIA,
     _build_transcription_text,
     _evaluate_call_quality_async,
+    _evaluate_quality_batch_async,
+    _fetch_unscored_calls,
+    _score_call,
+    _write_scores,
 )
 
 
@@ -140,7 +151,7 @@ class TestEvaluateCallQualityAsync:
 
         with (
             patch(
-                "src.tasks.quality_evaluator.create_async_engine",
+                "sqlalchemy.ext.asyncio.create_async_engine",
                 return_value=mock_engine,
             ),
             patch(
@@ -182,3 +193,165 @@ class TestEvaluateCallQualityAsync:
         stripped = response_text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
         parsed = json.loads(stripped)
         assert parsed["bot_greeted_properly"] == 0.9
+
+
+def _engine_with(conn: AsyncMock) -> MagicMock:
+    ctx = AsyncMock()
+    ctx.__aenter__ = AsyncMock(return_value=conn)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    engine = MagicMock()
+    engine.begin = MagicMock(return_value=ctx)
+    return engine
+
+
+def _batch_settings(**quality: Any) -> MagicMock:
+    settings = MagicMock()
+    settings.quality.score_threshold = 0.5
+    settings.quality.batch_size = 2
+    settings.quality.batch_concurrency = 2
+    settings.quality.batch_max_calls = 100
+    for key, value in quality.items():
+        setattr(settings.quality, key, value)
+    return settings
+
+
+class TestQualityBatch:
+    """Tests for batched evaluation of unscored calls."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_uses_one_query_per_table(self) -> None:
+        started = datetime(2026, 10, 16, 9, tzinfo=UTC)
+        a, b = uuid.uuid4(), uuid.uuid4()
+        calls = MagicMock()
+        calls.all.return_value = [
+            SimpleNamespace(
+                id=a,
+                started_at=started,
+                transferred_to_operator=True,
+                transfer_reason="complex",
+                scenario=None,
+            ),
+            SimpleNamespace(
+                id=b,
+                started_at=started,
+                transferred_to_operator=False,
+                transfer_reason=None,
+                scenario="tire_search",
+            ),
+        ]
+        turns = [
+            SimpleNamespace(call_id=a, speaker="customer", content="Привіт"),
+            SimpleNamespace(call_id=b, speaker="customer", content="Шини 205/55"),
+            SimpleNamespace(call_id=b, speaker="bot", content="Шукаю"),
+        ]
+        tools = [SimpleNamespace(call_id=b, tool_name="search_tires", success=True)]
+        conn = AsyncMock()
+        conn.execute = AsyncMock(side_effect=[calls, iter(turns), iter(tools)])
+
+        batch = await _fetch_unscored_calls(_engine_with(conn), 2, [])
+
+        assert conn.execute.await_count == 3
+        assert conn.execute.await_args_list[1].args[1]["ids"] == [a, b]
+        assert list(batch) == [(a, started), (b, started)]
+        assert batch[(a, started)].startswith("Call was transferred to operator")
+        transcription_b = batch[(b, started)]
+        assert "Customer: Шини 205/55\nBot: Шукаю" in transcription_b
+        assert "[Tool: search_tires" in transcription_b
+
+    @pytest.mark.asyncio
+    async def test_scores_written_with_single_values_update(self) -> None:
+        conn = AsyncMock()
+        started = datetime(2026, 10, 16, tzinfo=UTC)
+        rows = [
+            {"id": uuid.uuid4(), "started_at": started, "score": 0.9, "details": {"x": 1}},
+            {"id": uuid.uuid4(), "started_at": started, "score": 0.4, "details": {"x": 0}},
+        ]
+
+        await _write_scores(_engine_with(conn), rows)
+
+        conn.execute.assert_awaited_once()
+        sql, params = conn.execute.await_args.args
+        assert "FROM (VALUES" in str(sql)
+        assert str(sql).count("CAST(:id_") == 2
+        assert params["score_1"] == 0.4
+        assert json.loads(params["details_0"]) == {"x": 1}
+
+    @pytest.mark.asyncio
+    async def test_batch_run_bounds_concurrency_and_reports_throughput(self) -> None:
+        started = datetime(2026, 10, 16, tzinfo=UTC)
+        keys = [(uuid.uuid4(), started) for _ in range(3)]
+        fetch = AsyncMock(
+            side_effect=[
+                {keys[0]: "t0", keys[1]: "t1"},
+                {keys[2]: "broken"},
+                {},
+            ]
+        )
+        write = AsyncMock()
+        in_flight = 0
+        peak = 0
+
+        async def _fake_llm(_task: Any, messages: Any, **_kwargs: Any) -> tuple[str, Usage]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if messages[0]["content"].endswith("broken"):
+                return "not json", Usage(100, 5)
+            return json.dumps({c: 0.25 for c in QUALITY_CRITERIA}), Usage(1000, 50)
+
+        redis = AsyncMock()
+        redis.set.return_value = True
+        with (
+            patch.object(quality_evaluator, "get_settings", return_value=_batch_settings()),
+            patch("redis.asyncio.Redis.from_url", return_value=redis),
+            patch.object(quality_evaluator, "get_task_engine", return_value=MagicMock()),
+            patch.object(quality_evaluator, "release_task_engine", AsyncMock()),
+            patch.object(quality_evaluator, "_fetch_unscored_calls", fetch),
+            patch.object(quality_evaluator, "_write_scores", write),
+            patch.object(quality_evaluator, "llm_complete_with_usage", _fake_llm),
+        ):
+            stats = await _evaluate_quality_batch_async("manual")
+
+        assert peak == 2
+        assert fetch.await_args_list[-1].args[2] == keys  # attempted calls are excluded
+        written = [row for call in write.await_args_list for row in call.args[1]]
+        assert [(r["id"], r["score"]) for r in written] == [(keys[0][0], 0.25), (keys[1][0], 0.25)]
+        assert stats["scored"] == 2
+        assert stats["failed"] == 1
+        assert stats["flagged_for_review"] == 2
+        assert stats["input_tokens_per_call"] == 700
+        assert stats["calls_per_minute"] > 0
+        redis.delete.assert_awaited_once_with(quality_evaluator._BATCH_LOCK_KEY)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("score", ["high", None, [1]])
+    async def test_non_numeric_scores_leave_call_unscored(self, score: Any) -> None:
+        reply = json.dumps({c: score for c in QUALITY_CRITERIA})
+        llm = AsyncMock(return_value=(reply, Usage(100, 5)))
+        with patch.object(quality_evaluator, "llm_complete_with_usage", llm):
+            result, usage = await _score_call(asyncio.Semaphore(1), "t0")
+
+        assert result is None
+        assert usage == Usage(100, 5)
+
+    @pytest.mark.asyncio
+    async def test_beat_run_respects_schedule_and_lock(self) -> None:
+        redis = AsyncMock()
+        redis.get.return_value = json.dumps({"quality-batch-scoring": {"enabled": False}})
+        fetch = AsyncMock(return_value={})
+        with (
+            patch.object(quality_evaluator, "get_settings", return_value=_batch_settings()),
+            patch("redis.asyncio.Redis.from_url", return_value=redis),
+            patch.object(quality_evaluator, "get_task_engine", return_value=MagicMock()),
+            patch.object(quality_evaluator, "release_task_engine", AsyncMock()),
+            patch.object(quality_evaluator, "_fetch_unscored_calls", fetch),
+        ):
+            assert (await _evaluate_quality_batch_async("beat"))["reason"] == "not_scheduled"
+
+            redis.set.return_value = False
+            assert (await _evaluate_quality_batch_async("manual"))["reason"] == "already_running"
+
+        fetch.assert_not_awaited()
+        redis.delete.assert_not_awaited()
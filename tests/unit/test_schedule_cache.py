@@ -0,0 +1,213 @@
+"""Unit tests for the fitting station schedule cache."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import time
+from datetime import date
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.onec_client.schedule_cache import StationScheduleCache, next_business_days
+
+_SLOTS = [
+    {"StationID": "000000009", "Time": "0001-01-01T09:00:00", "Quantity": 0},
+    {"StationID": "000000009", "Time": "0001-01-01T10:00:00", "Quantity": 2},
+]
+
+
+class _FakeRedis:
+    """Just the dict-backed commands the cache uses (SETEX TTLs ignored)."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.expires_at: dict[str, float] = {}
+
+    def _expire_due(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, at in self.expires_at.items() if at <= now]:
+            del self.expires_at[key]
+            self.data.pop(key, None)
+
+    async def get(self, key: str) -> Any:
+        self._expire_due()
+        return self.data.get(key)
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        return [self.data.get(k) for k in keys]
+
+    async def setex(self, key: str, ttl: int, value: Any) -> None:
+        self.data[key] = value
+
+    async def set(self, key: str, value: Any, nx: bool = False, ex: float = 0) -> bool:
+        self._expire_due()
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        if ex:
+            self.expires_at[key] = time.monotonic() + ex
+        return True
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+        self.expires_at.pop(key, None)
+
+    async def pexpire(self, key: str, ms: int) -> None:
+        self._expire_due()
+        if key in self.data:
+            self.expires_at[key] = time.monotonic() + ms / 1000
+
+
+@pytest.fixture
+def onec() -> MagicMock:
+    client = MagicMock()
+    client.get_station_schedule = AsyncMock(return_value={"success": True, "data": _SLOTS})
+    return client
+
+
+@pytest.fixture
+def cache(onec: MagicMock) -> StationScheduleCache:
+    return StationScheduleCache(onec, _FakeRedis(), prefetch_days=2)  # type: ignore[arg-type]
+
+
+class TestStationScheduleCache:
+    @pytest.mark.asyncio
+    async def test_read_through(self, cache: StationScheduleCache, onec: MagicMock) -> None:
+        assert await cache.get("000000009", "2026-08-05") == _SLOTS
+        assert await cache.get("000000009", "2026-08-05") == _SLOTS
+
+        onec.get_station_schedule.assert_awaited_once_with(
+            station_id="000000009", date_from="2026-08-05", date_to="2026-08-05"
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_days_never_calls_1c(
+        self, cache: StationScheduleCache, onec: MagicMock
+    ) -> None:
+        await cache.fetch("000000009", "2026-08-06")
+        onec.get_station_schedule.reset_mock()
+
+        cached = await cache.cached_days("000000009", ["2026-08-05", "2026-08-06"])
+
+        assert cached == {"2026-08-06": _SLOTS}
+        onec.get_station_schedule.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, cache: StationScheduleCache, onec: MagicMock) -> None:
+        await cache.get("000000009", "2026-08-05")
+        await cache.invalidate("000000009", "2026-08-05T00:00:00")
+        await cache.get("000000009", "2026-08-05")
+
+        assert onec.get_station_schedule.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_invalidates_remembered_booking_day(
+        self, cache: StationScheduleCache
+    ) -> None:
+        await cache.fetch("000000009", "2026-08-05")
+        await cache.remember_booking("guid-1", "000000009", "2026-08-05T00:00:00")
+        await cache.invalidate_booking("unknown-guid")
+        assert await cache.cached_days("000000009", ["2026-08-05"])
+
+        await cache.invalidate_booking("guid-1")
+        assert await cache.cached_days("000000009", ["2026-08-05"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_prefetch_every_station_business_days(
+        self, cache: StationScheduleCache, onec: MagicMock
+    ) -> None:
+        stations = [{"station_id": "000000009"}, {"station_id": "000000012"}]
+        cache._redis.data["onec:fitting_stations"] = json.dumps(stations).encode()
+        onec.get_station_schedule.side_effect = [
+            {"data": _SLOTS},
+            {"data": []},
+            RuntimeError("1C timeout"),
+            {"data": _SLOTS},
+        ]
+
+        with patch("src.onec_client.schedule_cache.datetime") as mock_dt:
+            mock_dt.now.return_value.date.return_value = date(2026, 8, 7)  # Friday
+            fetched = await cache.prefetch()
+
+        assert fetched == 3
+        requested = {
+            (c.kwargs["station_id"], c.kwargs["date_from"])
+            for c in onec.get_station_schedule.await_args_list
+        }
+        assert requested == {
+            (sid, day) for sid in ("000000009", "000000012") for day in ("2026-08-10", "2026-08-11")
+        }
+
+    @staticmethod
+    async def _round_starts(
+        cache: StationScheduleCache, round_time: float, rounds: int
+    ) -> tuple[list[float], list[bool]]:
+        """Run ``run()`` for *rounds* rounds; start times, and whether the lock was held at each end."""
+        starts: list[float] = []
+        held: list[bool] = []
+        done = asyncio.Event()
+
+        async def prefetch() -> int:
+            starts.append(time.monotonic())
+            await asyncio.sleep(round_time)
+            held.append(await cache._redis.get("onec:schedule:prefetch_lock") is not None)
+            if len(starts) == rounds:
+                done.set()
+            return 0
+
+        cache.prefetch = prefetch  # type: ignore[method-assign]
+        runner = asyncio.create_task(cache.run())
+        await asyncio.wait_for(done.wait(), timeout=5)
+        runner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await runner
+        return starts, held
+
+    @pytest.mark.asyncio
+    async def test_rounds_start_an_interval_apart(self, onec: MagicMock) -> None:
+        cache = StationScheduleCache(
+            onec,
+            _FakeRedis(),  # type: ignore[arg-type]
+            ttl=0.2,  # type: ignore[arg-type]
+            prefetch_interval=0.1,  # type: ignore[arg-type]
+        )
+        starts, _ = await self._round_starts(cache, round_time=0.06, rounds=4)
+
+        gaps = [b - a for a, b in itertools.pairwise(starts)]
+        # Spaced from the round start, not from its end (0.16 s), well inside the TTL
+        assert all(0.09 < gap < 0.14 for gap in gaps), gaps
+
+    @pytest.mark.asyncio
+    async def test_overrunning_round_holds_lock_then_next_starts(self, onec: MagicMock) -> None:
+        cache = StationScheduleCache(
+            onec,
+            _FakeRedis(),  # type: ignore[arg-type]
+            ttl=0.2,  # type: ignore[arg-type]
+            prefetch_interval=0.1,  # type: ignore[arg-type]
+        )
+        starts, held = await self._round_starts(cache, round_time=0.3, rounds=2)
+
+        # The lock outlived its 0.1 s expiry for the whole round ...
+        assert held[0]
+        # ... and was released at its end instead of holding the next round back
+        assert starts[1] - starts[0] < 0.35
+
+    def test_next_business_days_skip_weekend(self) -> None:
+        assert next_business_days(date(2026, 8, 7), 3) == [
+            date(2026, 8, 10),
+            date(2026, 8, 11),
+            date(2026, 8, 12),
+        ]
+
+
+class TestFreeSlotTimes:
+    def test_only_slots_with_a_free_post(self) -> None:
+        from src.main import _free_slot_times
+
+        assert _free_slot_times(_SLOTS, count_posts=2) == ["09:00"]
+        assert _free_slot_times(_SLOTS, count_posts=3) == ["09:00", "10:00"]
+        assert _free_slot_times([], count_posts=2) == []
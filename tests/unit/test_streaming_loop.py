@@ -464,3 +464,71 @@ class TestErrorHandling:
         assert result.spoken_text == ""
         assert result.stop_reason == "error"
         assert result.tool_calls_made == 0
+
+
+# ── Speculative turns ────────────────────────────────────────────────
+
+
+class TestSpeculation:
+    @pytest.mark.asyncio
+    async def test_speculation_holds_output_until_adopted(self):
+        """speculate() buffers the LLM stream; run_turn replays it without a 2nd request."""
+        loop, router, _, conn = _build_loop([_text_stream("Так, є в наявності.")])
+        history: list[dict[str, Any]] = []
+
+        spec = loop.speculate("Чи є шини", history, order_id="ORD-1")
+        await asyncio.sleep(0.05)
+
+        assert conn.sent_chunks == []
+        assert history == []
+        assert spec.matches("чи є шини?", history, {"order_id": "ORD-1"})
+
+        result = await loop.run_turn(
+            "Чи є шини?", history, order_id="ORD-1", speculation=spec
+        )
+
+        assert router.call_count == 1
+        assert "в наявності" in result.spoken_text
+        assert len(conn.sent_chunks) > 0
+        assert history[0] == {"role": "user", "content": "Чи є шини"}
+        assert history[1]["role"] == "assistant"
+
+    @pytest.mark.asyncio
+    async def test_matches_rejects_other_words_or_context(self):
+        loop, _, _, _ = _build_loop([_text_stream("Добре.")])
+        history: list[dict[str, Any]] = [{"role": "assistant", "content": "Вітаю"}]
+
+        spec = loop.speculate("на пʼятницю", history, order_stage=None)
+        await spec.cancel()
+
+        assert not spec.matches("на пʼятницю вранці", history, {"order_stage": None})
+        assert not spec.matches("на пʼятницю", history, {"order_stage": "draft"})
+        assert not spec.matches("на пʼятницю", [], {"order_stage": None})
+
+    @pytest.mark.asyncio
+    async def test_cancel_reports_exact_usage_when_done(self):
+        loop, _, _, _ = _build_loop([_text_stream("Добре.", input_tokens=1200, output_tokens=7)])
+
+        spec = loop.speculate("Привіт", [])
+        await asyncio.sleep(0.05)
+        usage, _ = await spec.cancel()
+
+        assert (usage.input_tokens, usage.output_tokens) == (1200, 7)
+
+    @pytest.mark.asyncio
+    async def test_cancel_estimates_usage_mid_stream(self):
+        loop, _, _, _ = _build_loop([])
+
+        async def _slow_stream(*args: Any, **kwargs: Any) -> AsyncIterator[StreamEvent]:
+            yield TextDelta(text="Зараз перевірю")
+            await asyncio.sleep(10)
+            yield _done()  # pragma: no cover
+
+        loop._llm_router.complete_stream = _slow_stream  # type: ignore[method-assign]
+        spec = loop.speculate("Привіт", [])
+        await asyncio.sleep(0.05)
+        usage, provider_key = await spec.cancel()
+
+        assert usage.input_tokens > 0
+        assert usage.output_tokens == len("Зараз перевірю") // 4
+        assert provider_key == ""
@@ -8,9 +8,15 @@ from unittest.mock import patch
 
 import pytest
 
+from src.core.audio_socket import AUDIO_FRAME_BYTES, FramedAudio
 from src.core.sentence_buffer import SentenceReady
 from src.llm.models import StreamDone, ToolCallDelta, ToolCallEnd, ToolCallStart, Usage
-from src.tts.streaming_tts import AudioReady, StreamingTTSSynthesizer, synthesize_stream
+from src.tts.streaming_tts import (
+    AudioChunk,
+    AudioReady,
+    StreamingTTSSynthesizer,
+    synthesize_stream,
+)
 from tests.unit.mocks.mock_tts import MockTTSEngine
 
 
@@ -369,3 +375,153 @@ class TestParallelPrefetch:
         assert len(audio_events) == 1
         assert audio_events[0].text == "Друге — ок."
         assert any(isinstance(e, StreamDone) for e in events)
+
+
+# ---------------------------------------------------------------------------
+# Chunked (sub-sentence) streaming
+# ---------------------------------------------------------------------------
+
+
+class ChunkedTTS:
+    """Engine with synthesize_chunks(): yields fixed-size chunks with a delay."""
+
+    def __init__(self, chunk: bytes = b"\x01" * 500, chunks: int = 3, delay: float = 0.0) -> None:
+        self._chunk = chunk
+        self._chunks = chunks
+        self._delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def synthesize(self, text: str) -> bytes:
+        return self._chunk * self._chunks
+
+    async def synthesize_chunks(self, text: str):  # type: ignore[no-untyped-def]
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            for _ in range(self._chunks):
+                await asyncio.sleep(self._delay)
+                yield self._chunk
+        finally:
+            self.active -= 1
+
+
+class TestChunkedSynthesis:
+    @pytest.mark.asyncio
+    async def test_chunks_recut_on_frame_boundaries(self):
+        synth = StreamingTTSSynthesizer(ChunkedTTS(), chunked=True)  # type: ignore[arg-type]
+        events = await _collect(synth.process(_aiter(SentenceReady(text="Привіт."))))
+
+        assert all(isinstance(e, AudioChunk) for e in events)
+        assert [e.first for e in events] == [True] + [False] * (len(events) - 1)
+        assert [e.last for e in events] == [False] * (len(events) - 1) + [True]
+        assert all(len(e.audio) % AUDIO_FRAME_BYTES == 0 for e in events[:-1])
+        assert b"".join(e.audio for e in events) == b"\x01" * 1500
+
+    @pytest.mark.asyncio
+    async def test_order_preserved_with_control_events(self):
+        synth = StreamingTTSSynthesizer(ChunkedTTS(delay=0.005), chunked=True, lookahead=2)  # type: ignore[arg-type]
+        tc_start = ToolCallStart(id="t1", name="search_tires")
+        done = StreamDone(stop_reason="tool_use", usage=Usage(0, 0))
+        events = await _collect(
+            synth.process(
+                _aiter(
+                    SentenceReady(text="Перше."),
+                    SentenceReady(text="Друге."),
+                    tc_start,
+                    done,
+                )
+            )
+        )
+
+        texts = [e.text for e in events if isinstance(e, AudioChunk) and e.last]
+        assert texts == ["Перше.", "Друге."]
+        assert events[-2] is tc_start
+        assert events[-1] is done
+
+    @pytest.mark.asyncio
+    async def test_first_chunk_before_next_sentence_arrives(self):
+        """Playback starts without waiting for the LLM to finish the next sentence."""
+        gate = asyncio.Event()
+
+        async def _slow_llm():
+            yield SentenceReady(text="Перше.")
+            await gate.wait()
+            yield StreamDone(stop_reason="end_turn", usage=Usage(0, 0))
+
+        synth = StreamingTTSSynthesizer(ChunkedTTS(), chunked=True)  # type: ignore[arg-type]
+        gen = synth.process(_slow_llm())
+        first = await asyncio.wait_for(gen.__anext__(), timeout=1.0)
+        gate.set()
+        rest = await _collect(gen)
+
+        assert isinstance(first, AudioChunk) and first.first
+        assert isinstance(rest[-1], StreamDone)
+
+    @pytest.mark.asyncio
+    async def test_lookahead_bounds_concurrent_syntheses(self):
+        tts = ChunkedTTS(delay=0.01)
+        synth = StreamingTTSSynthesizer(tts, chunked=True, lookahead=1)  # type: ignore[arg-type]
+        sentences = [SentenceReady(text=f"Речення {i}.") for i in range(5)]
+        await _collect(synth.process(_aiter(*sentences)))
+
+        assert tts.max_active == 2  # the playing sentence + 1 lookahead
+
+    @pytest.mark.asyncio
+    async def test_engine_without_chunks_yields_whole_clip(self):
+        tts = MockTTSEngine()
+        synth = StreamingTTSSynthesizer(tts, chunked=True)
+        events = await _collect(synth.process(_aiter(SentenceReady(text="Два слова."))))
+
+        assert events[-1].last
+        assert b"".join(e.audio for e in events) == await tts.synthesize("Два слова.")
+
+    @pytest.mark.asyncio
+    async def test_cached_clip_passed_through_unsplit(self):
+        clip = FramedAudio(b"\x02" * 650)
+
+        class CachedTTS:
+            async def synthesize(self, text: str) -> bytes:
+                return clip
+
+            async def synthesize_chunks(self, text: str):  # type: ignore[no-untyped-def]
+                yield clip
+
+        synth = StreamingTTSSynthesizer(CachedTTS(), chunked=True)  # type: ignore[arg-type]
+        events = await _collect(synth.process(_aiter(SentenceReady(text="Так."))))
+
+        assert events[0].audio is clip
+        assert events[-1].last and events[-1].audio == b""
+
+    @pytest.mark.asyncio
+    async def test_failed_sentence_skipped(self):
+        class FailingTTS:
+            async def synthesize(self, text: str) -> bytes:
+                raise RuntimeError("TTS down")
+
+        synth = StreamingTTSSynthesizer(FailingTTS(), chunked=True)  # type: ignore[arg-type]
+        done = StreamDone(stop_reason="end_turn", usage=Usage(0, 0))
+        events = await _collect(synth.process(_aiter(SentenceReady(text="Ой."), done)))
+
+        assert events == [done]
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_propagates(self):
+        async def _broken_llm():
+            yield SentenceReady(text="Перше.")
+            raise RuntimeError("LLM stream broke")
+
+        synth = StreamingTTSSynthesizer(ChunkedTTS(), chunked=True)  # type: ignore[arg-type]
+        with pytest.raises(RuntimeError, match="LLM stream broke"):
+            await _collect(synth.process(_broken_llm()))
+
+
+class TestPrefetchLookahead:
+    @pytest.mark.asyncio
+    async def test_lookahead_two_keeps_order(self):
+        tts = MockTTSEngine(delay=0.01)
+        synth = StreamingTTSSynthesizer(tts, lookahead=2)
+        sentences = [SentenceReady(text=f"Речення номер {i}.") for i in range(4)]
+        events = await _collect(synth.process(_aiter(*sentences)))
+
+        assert [e.text for e in events] == [s.text for s in sentences]
@@ -5,15 +5,30 @@ Covers:
   * validate_rule() — regex validity, length, context_hint whitelist
   * enabled=False rules are skipped
   * empty inputs
+  * CompiledCorrections — literal prefilter, context buckets
+  * pub/sub invalidation of the in-process bundle
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import re
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
+from src.stt import corrections as corr_mod
 from src.stt.corrections import (
+    INVALIDATE_CHANNEL,
+    REDIS_KEY,
     VALID_CONTEXTS,
+    CompiledCorrections,
     apply_rules,
+    listen_for_invalidations,
+    load_corrections,
+    save_corrections,
     validate_rule,
 )
 
@@ -169,3 +184,130 @@ class TestValidateRule:
     @pytest.mark.parametrize("ctx", VALID_CONTEXTS)
     def test_all_whitelisted_contexts_accepted(self, ctx: str) -> None:
         validate_rule({"pattern": "foo", "replacement": "bar", "context_hint": ctx})
+
+
+class TestCompiledCorrections:
+    def test_prefilter_skips_rules_without_their_literal(self) -> None:
+        bundle = CompiledCorrections(
+            [_rule(r"\bвифт\b", "вівторок", id="a"), _rule(r"(\d+)\s*лет\b", r"\1 липня", id="b")]
+        )
+        bucket = bundle._bucket("")
+
+        assert bucket.candidates("28 лет") == {1}
+        assert bucket.candidates("добрий день") == set()
+
+    def test_alternation_literals(self) -> None:
+        bundle = CompiledCorrections([_rule(r"\b(вифт|віфт)\b", "вівторок", id="alt")])
+
+        assert bundle.apply("на ВІФТ", None) == ("на вівторок", ["alt"])
+
+    def test_rule_without_literal_always_runs(self) -> None:
+        bundle = CompiledCorrections([_rule(r"(\d{2})(\d{2})", r"\1:\2", id="t")])
+
+        assert bundle._bucket("")._unfiltered == {0}
+        assert bundle.apply("о 1120", None) == ("о 11:20", ["t"])
+
+    def test_replacement_feeds_later_rules(self) -> None:
+        rules = [
+            _rule("до сливного", "Дослідне", id="a"),
+            _rule("Дослідне", "Дослідне (с.)", id="b"),
+        ]
+
+        assert CompiledCorrections(rules).apply("до сливного", None) == (
+            "Дослідне (с.)",
+            ["a", "b"],
+        )
+
+    def test_buckets_per_context(self) -> None:
+        rules = [
+            _rule("лет", "липня", context_hint="date", id="d"),
+            _rule("лет", "літ", context_hint="city", id="c"),
+        ]
+        bundle = CompiledCorrections(rules)
+
+        assert bundle.apply("лет", "date") == ("липня", ["d"])
+        assert bundle.apply("лет", "city") == ("літ", ["c"])
+        assert bundle.apply("лет", None) == ("лет", [])
+
+    def test_matches_per_rule_application(self) -> None:
+        rules = [
+            _rule("ab+c", "X", id="1"),
+            _rule("x", "y", flags="", id="2"),
+            _rule("Y", "z", id="3"),
+            _rule("ı", "i", id="4"),
+        ]
+        for text in ("ABBC", "abc x", "İSTANBUL", "ıabc"):
+            expected = text
+            applied = []
+            for rule in rules:
+                flags = re.IGNORECASE if rule["flags"] else 0
+                new, n = re.subn(
+                    str(rule["pattern"]), str(rule["replacement"]), expected, flags=flags
+                )
+                if n and new != expected:
+                    expected = new
+                    applied.append(rule["id"])
+            assert CompiledCorrections(rules).apply(text, None) == (expected, applied)
+
+
+class _FakePubSub:
+    def __init__(self) -> None:
+        self.messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.subscribe = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def listen(self):  # type: ignore[no-untyped-def]
+        while True:
+            yield await self.messages.get()
+
+
+class TestInvalidation:
+    @pytest.fixture(autouse=True)
+    def _isolate_cache(self) -> Any:
+        corr_mod.invalidate_cache()
+        yield
+        corr_mod.invalidate_cache()
+
+    @pytest.mark.asyncio
+    async def test_save_publishes_invalidation(self) -> None:
+        redis = AsyncMock()
+
+        await save_corrections(redis, [_rule("foo", "bar")])
+
+        redis.publish.assert_awaited_once_with(INVALIDATE_CHANNEL, "1")
+
+    @pytest.mark.asyncio
+    async def test_listener_reloads_on_message(self) -> None:
+        store = {REDIS_KEY: json.dumps([_rule("foo", "bar", id="v1")])}
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=lambda key: store.get(key))
+        pubsub = _FakePubSub()
+        redis.pubsub.return_value = pubsub
+
+        task = asyncio.create_task(listen_for_invalidations(redis))
+        await asyncio.sleep(0.01)
+        assert corr_mod._subscribed
+        assert await corr_mod.apply_corrections(redis, "foo") == ("bar", ["v1"])
+
+        # Another process rewrites the rules and publishes
+        store[REDIS_KEY] = json.dumps([_rule("foo", "baz", id="v2")])
+        await pubsub.messages.put({"type": "message", "data": "1"})
+        await asyncio.sleep(0.01)
+        assert await corr_mod.apply_corrections(redis, "foo") == ("baz", ["v2"])
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not corr_mod._subscribed
+
+    @pytest.mark.asyncio
+    async def test_subscribed_cache_ignores_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        redis = AsyncMock()
+        redis.get.return_value = json.dumps([_rule("foo", "bar")])
+        await load_corrections(redis)
+        monkeypatch.setattr(corr_mod, "_subscribed", True)
+        monkeypatch.setattr(corr_mod, "_cache_ts", -1e9)
+
+        await load_corrections(redis)
+
+        assert redis.get.await_count == 1
@@ -0,0 +1,278 @@
+"""Unit tests for the per-tenant call-setup context snapshot."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agent.prompt_manager import inject_pronunciation_rules
+from src.agent.prompts import assemble_prompt
+from src.core import tenant_context
+from src.core.tenant_context import (
+    INVALIDATE_CHANNEL,
+    TenantContextStore,
+    build_tenant_context,
+    is_history_disabled,
+)
+from src.main import _SCENARIO_EMPHASIS, _SCENARIO_TOOLS, _VALID_IVR_INTENTS
+
+_TOOLS = [
+    {"name": "search_tires"},
+    {"name": "transfer_to_operator"},
+    {"name": "create_callback_request"},
+    {"name": "get_fitting_slots"},
+    {"name": "book_fitting"},
+]
+
+
+def _tenant(**overrides: Any) -> dict[str, Any]:
+    row = {
+        "id": uuid.uuid4(),
+        "slug": "prokoleso",
+        "name": "ProKoleso",
+        "agent_name": "Олена",
+        "greeting": None,
+        "enabled_tools": [],
+        "extensions": [],
+        "prompt_suffix": None,
+        "config": {},
+        "is_active": True,
+    }
+    row.update(overrides)
+    return row
+
+
+def _context(tenant: dict[str, Any] | None, **overrides: Any) -> Any:
+    kwargs: dict[str, Any] = {
+        "templates": {"greeting": ["Вітаю!"], "farewell": ["До побачення", "Гарного дня"]},
+        "tools": _TOOLS,
+        "few_shot_examples": {},
+        "safety_rules": [],
+        "promotions": [],
+        "pronunciation": "ПРАВИЛА ВИМОВИ",
+        "scenario_tools": _SCENARIO_TOOLS,
+        "scenario_emphasis": _SCENARIO_EMPHASIS,
+    }
+    kwargs.update(overrides)
+    return build_tenant_context(tenant, **kwargs)
+
+
+class TestTenantContext:
+    def test_prompt_matches_per_call_assembly(self) -> None:
+        tenant = _tenant(enabled_tools=["search_tires", "book_fitting"], prompt_suffix="СУФІКС")
+        ctx = _context(tenant)
+
+        rendered = ctx.scenario("fitting").system_prompt
+
+        expected = assemble_prompt(
+            scenario="fitting",
+            include_pronunciation=False,
+            compact=False,
+            enabled_tools={"search_tires", "book_fitting"},
+        )
+        expected = inject_pronunciation_rules(expected, "ПРАВИЛА ВИМОВИ")
+        expected = expected + "\n\nСУФІКС" + _SCENARIO_EMPHASIS.get("fitting", "")
+        assert rendered == expected
+        assert ctx.scenario("fitting") is ctx.scenario("fitting")
+
+    def test_tools_filtered_by_tenant_then_scenario(self) -> None:
+        ctx = _context(_tenant(enabled_tools=["search_tires", "transfer_to_operator"]))
+
+        tools = ctx.scenario(None).tools
+
+        # create_callback_request rides along with transfer_to_operator
+        assert [t["name"] for t in tools] == [
+            "search_tires",
+            "transfer_to_operator",
+            "create_callback_request",
+        ]
+        scenario_tools = ctx.scenario("tire_search").tools
+        assert {t["name"] for t in scenario_tools} <= _SCENARIO_TOOLS["tire_search"]
+
+    def test_ab_variant_prompt_gets_same_decoration(self) -> None:
+        ctx = _context(_tenant(prompt_suffix="СУФІКС"), pronunciation="")
+
+        assert ctx.decorate_prompt("VARIANT", None) == "VARIANT\n\nСУФІКС"
+
+    def test_tenant_greeting_replaces_template_variants(self) -> None:
+        ctx = _context(_tenant(greeting="Привіт від мережі"))
+
+        templates = ctx.pick_templates()
+
+        assert templates["greeting"] == "Привіт від мережі"
+        assert templates["farewell"] in ("До побачення", "Гарного дня")
+        assert _context(None, templates=None).pick_templates() is None
+
+    def test_few_shot_prefers_scenario_dialogues(self) -> None:
+        dialogue = [{"role": "customer", "text": "Потрібні шини"}]
+        examples = {
+            "tire_search": [{"scenario_type": "tire_search", "dialogue": dialogue}],
+            "order_status": [{"scenario_type": "order_status", "dialogue": dialogue}],
+        }
+        ctx = _context(None, few_shot_examples=examples)
+
+        assert "### tire_search" in ctx.scenario("tire_search").pick_few_shot()
+        assert ctx.scenario("fitting").pick_few_shot() is not None
+        assert _context(None).scenario("fitting").pick_few_shot() is None
+
+
+class TestSnapshotLookups:
+    def _snapshot(self, tenants: list[dict[str, Any]]) -> Any:
+        return tenant_context.TenantContextSnapshot(
+            version=1,
+            built_at=0.0,
+            tenants=tenants,
+            contexts={str(t["id"]): _context(t) for t in tenants},
+            default=_context(None),
+            phrase_hints=(),
+            test_phones={},
+        )
+
+    def test_resolve_tenant_precedence(self) -> None:
+        first = _tenant(slug="first", extensions=["7001"])
+        second = _tenant(slug="second", extensions=["7002"])
+        snapshot = self._snapshot([first, second])
+
+        assert snapshot.resolve_tenant(slug="second", exten="7001") is second
+        assert snapshot.resolve_tenant(slug=None, exten="7002") is second
+        assert snapshot.resolve_tenant(slug=None, exten=None) is first
+        assert snapshot.resolve_tenant(slug="gone", exten=None) is None
+        assert snapshot.context(second).tenant is second
+        assert snapshot.context(None) is snapshot.default
+
+    def test_history_disabled_for_test_phone(self) -> None:
+        tid = str(uuid.uuid4())
+        phones = {"0501234567": [{"mode": "no_history", "tenant_id": tid}]}
+
+        assert is_history_disabled(phones, "0501234567", tid) is True
+        assert is_history_disabled(phones, "0501234567", str(uuid.uuid4())) is False
+        assert is_history_disabled({"0501234567": "no_history"}, "0501234567", None)
+
+
+class _FakePubSub:
+    def __init__(self) -> None:
+        self.channels: list[str] = []
+        self.messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        self.channels.append(channel)
+
+    async def get_message(
+        self, ignore_subscribe_messages: bool = False, timeout: float | None = None
+    ) -> dict[str, Any] | None:
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _make_store(tenants: list[dict[str, Any]]) -> tuple[TenantContextStore, MagicMock]:
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=json.dumps({"0501234567": "no_history"}))
+    redis.pubsub.return_value = _FakePubSub()
+    store = TenantContextStore(
+        MagicMock(),
+        redis,
+        scenarios=_VALID_IVR_INTENTS,
+        scenario_tools=_SCENARIO_TOOLS,
+        scenario_emphasis=_SCENARIO_EMPHASIS,
+    )
+    store._load_tenants = AsyncMock(return_value=tenants)  # type: ignore[method-assign]
+    return store, redis
+
+
+@pytest.fixture
+def _loaders():  # type: ignore[no-untyped-def]
+    pm = MagicMock()
+    pm.get_template_variants = AsyncMock(return_value={"greeting": ["Вітаю!"]})
+    with (
+        patch.object(tenant_context, "PromptManager", return_value=pm),
+        patch.object(tenant_context, "get_tools_with_overrides", AsyncMock(return_value=_TOOLS)),
+        patch.object(tenant_context, "get_few_shot_examples", AsyncMock(return_value={})),
+        patch.object(
+            tenant_context,
+            "get_safety_rules_for_prompt",
+            AsyncMock(return_value=[{"severity": "high", "expected_behavior": "Без PII"}]),
+        ),
+        patch.object(tenant_context, "get_pronunciation_rules", AsyncMock(return_value="ВИМОВА")),
+        patch.object(
+            tenant_context,
+            "fetch_tenant_promotions",
+            AsyncMock(return_value=[{"title": "Акція", "content": "-10%"}]),
+        ),
+        patch("src.stt.phrase_hints.get_all_phrases_flat", AsyncMock(return_value=("шини",))),
+    ):
+        yield
+
+
+class TestTenantContextStore:
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("_loaders")
+    async def test_rebuild_prerenders_every_tenant_and_scenario(self) -> None:
+        tenant = _tenant()
+        store, _ = _make_store([tenant])
+
+        snapshot = await store.rebuild()
+
+        assert snapshot is store.snapshot
+        assert snapshot.version == 1
+        ctx = snapshot.context(tenant)
+        assert set(ctx._scenarios) == _VALID_IVR_INTENTS
+        assert "Акція" in ctx.promotions_context
+        assert "Без PII" in ctx.safety_context
+        assert snapshot.default.promotions_context is None
+        assert snapshot.phrase_hints == ("шини",)
+        assert snapshot.test_phones == {"0501234567": "no_history"}
+        assert (await store.rebuild()).version == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("_loaders")
+    async def test_failed_rebuild_keeps_previous_snapshot(self) -> None:
+        store, _ = _make_store([_tenant()])
+        first = await store.rebuild()
+        store._load_tenants = AsyncMock(side_effect=ConnectionError("pg down"))  # type: ignore[method-assign]
+
+        assert await store.rebuild() is first
+        assert store.snapshot is first
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("_loaders")
+    async def test_published_change_triggers_rebuild(self) -> None:
+        store, redis = _make_store([_tenant()])
+        pubsub = redis.pubsub.return_value
+        task = asyncio.create_task(store.run())
+        try:
+            for _ in range(100):
+                if store.snapshot is not None:
+                    break
+                await asyncio.sleep(0.01)
+            assert pubsub.channels == [INVALIDATE_CHANNEL]
+            assert store.snapshot.version == 1
+
+            await pubsub.messages.put({"type": "message", "data": b"tenants"})
+            for _ in range(100):
+                if store.snapshot.version == 2:
+                    break
+                await asyncio.sleep(0.01)
+            assert store.snapshot.version == 2
+        finally:
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    @pytest.mark.asyncio
+    async def test_publish_change_is_best_effort(self) -> None:
+        redis = AsyncMock()
+        await tenant_context.publish_change("tenants", redis)
+        redis.publish.assert_awaited_once_with(INVALIDATE_CHANNEL, "tenants")
+
+        redis.publish.side_effect = ConnectionError("down")
+        await tenant_context.publish_change("tenants", redis)
@@ -65,18 +65,8 @@ class TestResolveTenant:
 
         mock_ari = AsyncMock()
         mock_ari.get_channel_variable = AsyncMock(return_value="prokoleso")
-        mock_ari.open = AsyncMock()
-        mock_ari.close = AsyncMock()
 
-        mock_settings = MagicMock()
-        mock_settings.ari.url = "http://localhost:8088/ari"
-        mock_settings.ari.user = "user"
-        mock_settings.ari.password = "pass"
-
-        with (
-            patch("src.main.get_settings", return_value=mock_settings),
-            patch("src.core.asterisk_ari.AsteriskARIClient", return_value=mock_ari),
-        ):
+        with patch("src.main._ari_client", mock_ari):
             from src.main import _resolve_tenant
 
             result = await _resolve_tenant("test-uuid", engine)
@@ -236,6 +236,27 @@ class TestSSMLFallback:
         assert actual_input.text == "Дякую за дзвінок!"
 
 
+class TestFramedCache:
+    """Cached clips are stored pre-framed for AudioSocket."""
+
+    @pytest.mark.asyncio
+    async def test_cached_clip_is_framed_and_reused(self) -> None:
+        from unittest.mock import AsyncMock
+
+        from src.core.audio_socket import FramedAudio
+
+        engine = GoogleTTSEngine()
+        engine._synthesize_uncached = AsyncMock(return_value=b"\x00" * 960)  # type: ignore[method-assign]
+
+        first = await engine.synthesize("Привіт")
+        second = await engine.synthesize("Привіт")
+
+        assert isinstance(first, FramedAudio)
+        assert first is second
+        assert first == b"\x00" * 960
+        engine._synthesize_uncached.assert_awaited_once()
+
+
 class TestTTSEngineHotReload:
     """Test that get_engine()/set_engine() hot-reload works correctly."""
 
@@ -0,0 +1,291 @@
+"""Unit tests for the shared (Redis) TTS audio cache and the two-tier engine cache."""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.tts.audio_cache import (
+    ACTIVE_KEY,
+    SharedTTSAudioCache,
+    normalize_text,
+    text_hash,
+    voice_fingerprint,
+)
+from src.tts.base import TTSConfig
+from src.tts.google_tts import GoogleTTSEngine
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _queue(*args: Any, **kwargs: Any) -> _FakePipeline:
+            self._ops.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    async def execute(self) -> list[Any]:
+        return [await getattr(self._redis, n)(*a, **kw) for n, a, kw in self._ops]
+
+
+class _FakeRedis:
+    """Just enough of redis.asyncio (binary client) for SharedTTSAudioCache."""
+
+    def __init__(self) -> None:
+        self.kv: dict[str, Any] = {}
+        self.zsets: dict[str, dict[Any, float]] = {}
+        self.hashes: dict[str, dict[Any, Any]] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def get(self, key: str) -> Any:
+        return self.kv.get(key)
+
+    async def set(self, key: str, value: Any, ex: int | None = None) -> bool:
+        self.kv[key] = value
+        return True
+
+    async def getset(self, key: str, value: str) -> Any:
+        old = self.kv.get(key)
+        self.kv[key] = value.encode()
+        return old
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        return [self.kv.get(k) for k in keys]
+
+    async def incrby(self, key: str, amount: int) -> int:
+        self.kv[key] = int(self.kv.get(key, 0)) + amount
+        return self.kv[key]
+
+    async def zadd(self, key: str, mapping: dict[Any, float]) -> int:
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def zpopmin(self, key: str, count: int) -> list[tuple[Any, float]]:
+        zset = self.zsets.get(key, {})
+        popped = sorted(zset.items(), key=lambda kv: kv[1])[:count]
+        for member, _ in popped:
+            del zset[member]
+        return popped
+
+    async def hget(self, key: str, field: Any) -> Any:
+        return self.hashes.get(key, {}).get(field)
+
+    async def hmget(self, key: str, fields: list[Any]) -> list[Any]:
+        return [self.hashes.get(key, {}).get(f) for f in fields]
+
+    async def hset(self, key: str, field: Any, value: Any) -> int:
+        self.hashes.setdefault(key, {})[field] = value
+        return 1
+
+    async def hdel(self, key: str, *fields: Any) -> int:
+        h = self.hashes.get(key, {})
+        return sum(1 for f in fields if h.pop(f, None) is not None)
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for k in keys if self.kv.pop(k, None) is not None)
+
+    async def unlink(self, *keys: str) -> int:
+        removed = 0
+        for k in keys:
+            for store in (self.kv, self.zsets, self.hashes):
+                removed += store.pop(k, None) is not None
+        return removed
+
+    async def scan_iter(self, match: str, count: int = 10):  # type: ignore[no-untyped-def]
+        for key in [*self.kv, *self.zsets, *self.hashes]:
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+
+class TestKeys:
+    def test_normalize_strips_stress_and_whitespace(self) -> None:
+        assert normalize_text("  До́брий   день ") == "Добрий день"
+        assert text_hash("До́брий день") == text_hash("Добрий  день")
+
+    def test_fingerprint_changes_with_voice_rate_and_breaks(self) -> None:
+        base = voice_fingerprint(TTSConfig())
+        assert base == voice_fingerprint(TTSConfig())
+        assert base != voice_fingerprint(TTSConfig(voice_name="uk-UA-Standard-A"))
+        assert base != voice_fingerprint(TTSConfig(speaking_rate=1.1))
+        assert base != voice_fingerprint(TTSConfig(break_comma_ms=300))
+
+
+class TestSharedTTSAudioCache:
+    @pytest.mark.asyncio
+    async def test_put_then_get(self) -> None:
+        redis = _FakeRedis()
+        cache = SharedTTSAudioCache(redis, "fp1")
+        await cache.put("k1", b"\x01" * 100)
+
+        assert await cache.get("k1") == b"\x01" * 100
+        assert await cache.get_many(["k1", "missing"]) == [b"\x01" * 100, None]
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_over_budget(self) -> None:
+        redis = _FakeRedis()
+        cache = SharedTTSAudioCache(redis, "fp1", max_bytes=250)
+        await cache.put("old", b"a" * 100)
+        await asyncio.sleep(0.01)
+        await cache.put("mid", b"b" * 100)
+        await asyncio.sleep(0.01)
+        await cache.get("old")  # touch → "mid" becomes the LRU clip
+        await asyncio.sleep(0.01)
+        await cache.put("new", b"c" * 100)
+
+        assert await cache.get("mid") is None
+        assert await cache.get("old") == b"a" * 100
+        assert await cache.get("new") == b"c" * 100
+        assert redis.kv["tts:audio:fp1:_bytes"] == 200
+
+    @pytest.mark.asyncio
+    async def test_voice_change_purges_previous_namespace(self) -> None:
+        redis = _FakeRedis()
+        old = SharedTTSAudioCache(redis, "fp-old")
+        await old.activate()
+        await old.put("k1", b"x" * 10)
+
+        new = SharedTTSAudioCache(redis, "fp-new")
+        await new.activate()
+
+        assert redis.kv[ACTIVE_KEY] == b"fp-new"
+        assert not any(k.startswith("tts:audio:fp-old") for k in redis.kv)
+        assert "tts:audio:fp-old:_lru" not in redis.zsets
+
+    @pytest.mark.asyncio
+    async def test_same_voice_keeps_namespace(self) -> None:
+        redis = _FakeRedis()
+        first = SharedTTSAudioCache(redis, "fp1")
+        await first.activate()
+        await first.put("k1", b"x" * 10)
+
+        await SharedTTSAudioCache(redis, "fp1").activate()
+
+        assert await first.get("k1") == b"x" * 10
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self) -> None:
+        redis = AsyncMock()
+        redis.mget.side_effect = ConnectionError("down")
+        cache = SharedTTSAudioCache(redis, "fp1")
+
+        assert await cache.get("k1") is None
+
+
+class TestTwoTierEngine:
+    @pytest.mark.asyncio
+    async def test_miss_writes_both_tiers(self) -> None:
+        redis = _FakeRedis()
+        shared = SharedTTSAudioCache(redis, "fp1")
+        engine = GoogleTTSEngine(shared_cache=shared)
+        engine._synthesize_uncached = AsyncMock(return_value=b"\x02" * 640)  # type: ignore[method-assign]
+
+        await engine.synthesize("Привіт")
+        await asyncio.gather(*engine._shared_writes)
+
+        assert await shared.get(text_hash("Привіт")) == b"\x02" * 640
+
+    @pytest.mark.asyncio
+    async def test_shared_hit_skips_synthesis(self) -> None:
+        redis = _FakeRedis()
+        shared = SharedTTSAudioCache(redis, "fp1")
+        await shared.put(text_hash("Привіт"), b"\x03" * 640)
+
+        engine = GoogleTTSEngine(shared_cache=shared)
+        engine._synthesize_uncached = AsyncMock()  # type: ignore[method-assign]
+
+        audio = await engine.synthesize("Привіт")
+
+        assert audio == b"\x03" * 640
+        engine._synthesize_uncached.assert_not_awaited()
+        # Promoted to the memory tier
+        assert await engine.synthesize("Привіт") is audio
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_is_byte_bounded(self) -> None:
+        engine = GoogleTTSEngine(memory_cache_max_bytes=1000)
+        engine._synthesize_uncached = AsyncMock(return_value=b"\x00" * 400)  # type: ignore[method-assign]
+
+        for text in ("один", "два", "три"):
+            await engine.synthesize(text)
+
+        assert len(engine._cache) == 2
+        assert engine._cache.currsize <= 1000
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_bytes", [0, 500])
+    async def test_oversize_clip_skips_memory_tier(self, max_bytes: int) -> None:
+        redis = _FakeRedis()
+        shared = SharedTTSAudioCache(redis, "fp1")
+        engine = GoogleTTSEngine(shared_cache=shared, memory_cache_max_bytes=max_bytes)
+        engine._synthesize_uncached = AsyncMock(return_value=b"\x04" * 640)  # type: ignore[method-assign]
+
+        assert await engine.synthesize("Привіт") == b"\x04" * 640
+        await asyncio.gather(*engine._shared_writes)
+        assert len(engine._cache) == 0
+
+        # Served from the shared tier without touching the memory tier
+        assert await engine.synthesize("Привіт") == b"\x04" * 640
+        engine._synthesize_uncached.assert_awaited_once()
+
+
+class TestSynthesizeChunks:
+    @pytest.mark.asyncio
+    async def test_cached_clip_yielded_whole(self) -> None:
+        engine = GoogleTTSEngine()
+        engine._synthesize_uncached = AsyncMock(return_value=b"\x05" * 640)  # type: ignore[method-assign]
+        clip = await engine.synthesize("Привіт")
+
+        chunks = [c async for c in engine.synthesize_chunks("Привіт")]
+
+        assert chunks == [clip]
+        assert chunks[0] is clip
+
+    @pytest.mark.asyncio
+    async def test_streaming_voice_chunks_are_cached(self) -> None:
+        engine = GoogleTTSEngine(TTSConfig(voice_name="uk-UA-Chirp3-HD-Achernar"))
+
+        async def _stream(text: str):  # type: ignore[no-untyped-def]
+            yield b"\x01" * 100
+            yield b"\x02" * 100
+
+        engine._stream_uncached = _stream  # type: ignore[method-assign]
+
+        chunks = [c async for c in engine.synthesize_chunks("Привіт")]
+
+        assert chunks == [b"\x01" * 100, b"\x02" * 100]
+        assert await engine.synthesize("Привіт") == b"\x01" * 100 + b"\x02" * 100
+
+    @pytest.mark.asyncio
+    async def test_streaming_failure_falls_back_to_unary(self) -> None:
+        engine = GoogleTTSEngine(TTSConfig(voice_name="uk-UA-Chirp3-HD-Achernar"))
+
+        async def _broken(text: str):  # type: ignore[no-untyped-def]
+            raise RuntimeError("streaming not supported")
+            yield b""  # pragma: no cover
+
+        engine._stream_uncached = _broken  # type: ignore[method-assign]
+        engine._synthesize_uncached = AsyncMock(return_value=b"\x03" * 640)  # type: ignore[method-assign]
+
+        chunks = [c async for c in engine.synthesize_chunks("Привіт")]
+
+        assert chunks == [b"\x03" * 640]
+        assert engine._streaming_supported is False
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_voice_uses_unary(self) -> None:
+        engine = GoogleTTSEngine()
+        engine._synthesize_uncached = AsyncMock(return_value=b"\x04" * 640)  # type: ignore[method-assign]
+
+        chunks = [c async for c in engine.synthesize_chunks("Нова фраза")]
+
+        assert chunks == [b"\x04" * 640]
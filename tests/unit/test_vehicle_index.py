@@ -0,0 +1,217 @@
+"""Unit tests for the in-memory vehicle tire-size index."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.store_client.client import StoreClient
+from src.store_client.index_store import IndexStore
+from src.store_client.vehicle_index import (
+    VehicleIndex,
+    VehicleIndexStore,
+    _NameMatcher,
+    phonetic_key,
+    select_year,
+    similarity,
+)
+
+_BRANDS = [(1, "Toyota"), (2, "Volkswagen"), (3, "Kia"), (4, "Skoda"), (5, "Hyundai")]
+_MODELS = [
+    (10, 1, "Camry"),
+    (11, 1, "Corolla"),
+    (12, 1, "RAV4"),
+    (20, 2, "Golf"),
+    (21, 2, "Passat"),
+    (30, 3, "Sportage"),
+    (31, 3, "Ceed"),
+    (40, 4, "Octavia"),
+]
+_SIZES = [
+    # model_id, year, width, height, diameter, type, axle
+    (30, 2022, 235, 65, Decimal("17.0"), 1, 0),
+    (30, 2022, 235, 60, Decimal("18.0"), 1, 0),
+    (30, 2022, 245, 50, Decimal("19.0"), 2, 0),
+    (30, 2022, 235, 65, Decimal("17.0"), 1, 0),  # same size in a second kit
+    (30, 2018, 225, 60, Decimal("17.0"), 1, 0),
+    (30, 2015, 215, 70, Decimal("16.0"), 1, 0),
+    (20, 2020, 225, 40, Decimal("18.0"), 1, 1),
+    (20, 2020, 255, 35, Decimal("18.0"), 1, 2),
+    (31, 2019, None, None, None, None, None),  # kit without sizes
+]
+
+
+@pytest.fixture(scope="module")
+def index() -> VehicleIndex:
+    return VehicleIndex(_BRANDS, _MODELS, _SIZES)
+
+
+class TestMatching:
+    def test_similarity_matches_pg_trgm(self) -> None:
+        # Values from the pg_trgm documentation / psql
+        assert similarity("word", "two words") == pytest.approx(0.363636, abs=1e-6)
+        assert similarity("Kia", "kia") == 1.0
+        assert similarity("", "kia") == 0.0
+
+    @pytest.mark.parametrize(
+        ("spoken", "written"),
+        [
+            ("Тойота", "Toyota"),
+            ("Фольксваген", "Volkswagen"),
+            ("Шкода", "Skoda"),
+            ("Хюндай", "Hyundai"),
+            ("Камрі", "Camry"),
+            ("Октавія", "Octavia"),
+            ("рав 4", "RAV-4"),
+        ],
+    )
+    def test_phonetic_key_across_scripts(self, spoken: str, written: str) -> None:
+        assert phonetic_key(spoken) == phonetic_key(written)
+
+    def test_match_kinds(self) -> None:
+        matcher = _NameMatcher(_BRANDS)
+
+        assert matcher.match("TOYOTA")[:3] == (1, "Toyota", "exact")
+        assert matcher.match("Тойота")[:3] == (1, "Toyota", "phonetic")
+        fuzzy = matcher.match("Volkswagn")
+        assert fuzzy[:3] == (2, "Volkswagen", "fuzzy")
+        assert fuzzy.similarity > 0.3
+        assert matcher.match("Zaporozhets") is None
+        assert matcher.match("") is None
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("2008 ", "2008"),
+            ("  3008", "3008"),
+            ("3-008", "3008"),
+            ("208", "208"),
+            ("GLC ", "GLC"),
+            ("glk", "GLK"),
+        ],
+    )
+    def test_similar_model_names_stay_apart(self, query: str, expected: str) -> None:
+        matcher = _NameMatcher(
+            [(1, "208"), (2, "308"), (3, "2008"), (4, "3008"), (5, "GLC"), (6, "GLK")]
+        )
+        assert matcher.match(query).name == expected
+
+    def test_shared_phonetic_key_falls_through_to_trigrams(self) -> None:
+        matcher = _NameMatcher([(5, "GLC"), (6, "GLK")])
+        assert phonetic_key("GLC") == phonetic_key("GLK")
+        # "ГЛК" has no exact match and its key is ambiguous: ranked by trigrams
+        assert matcher.match("ГЛК").kind == "fuzzy"
+
+    def test_ties_go_to_lowest_id(self) -> None:
+        matcher = _NameMatcher([(7, "Kia"), (3, "KIA")])
+        assert matcher.match("kia").id == 3
+
+    @pytest.mark.parametrize(
+        ("years", "year", "expected"),
+        [
+            ([2022, 2018, 2015], 2018, 2018),
+            ([2022, 2018, 2015], 2020, 2022),
+            ([2022, 2018, 2015], 2016, 2015),
+            ([2022, 2018, 2015], 0, 2022),
+            ([], 2020, 0),
+        ],
+    )
+    def test_select_year(self, years: list[int], year: int, expected: int) -> None:
+        assert select_year(years, year) == expected
+
+
+class TestLookup:
+    def test_found_for_year(self, index: VehicleIndex) -> None:
+        assert index.lookup("kia", "sportage", 2022) == {
+            "found": True,
+            "brand": "Kia",
+            "model": "Sportage",
+            "years": [2022, 2018, 2015],
+            "stock_sizes": ["235/60 R18", "235/65 R17"],
+            "acceptable_sizes": ["245/50 R19"],
+            "selected_year": 2022,
+        }
+
+    def test_closest_and_newest_year(self, index: VehicleIndex) -> None:
+        closest = index.lookup("Kia", "Sportage", 2017)
+        assert closest["selected_year"] == 2018
+        assert closest["stock_sizes"] == ["225/60 R17"]
+        assert "acceptable_sizes" not in closest
+
+        assert index.lookup("Kia", "Sportage")["selected_year"] == 2022
+
+    def test_cyrillic_names_and_axles(self, index: VehicleIndex) -> None:
+        result = index.lookup("Фольксваген", "Гольф", 2020)
+        assert result["brand"] == "Volkswagen"
+        assert result["stock_sizes"] == ["225/40 R18 (перед)", "255/35 R18 (зад)"]
+
+    def test_misses(self, index: VehicleIndex) -> None:
+        assert index.lookup("Zaporozhets", "965") == {
+            "found": False,
+            "message": "Марку 'Zaporozhets' не знайдено в базі",
+        }
+        assert index.lookup("Kia", "Stinger") == {
+            "found": False,
+            "brand": "Kia",
+            "message": "Модель 'Stinger' не знайдено для Kia",
+        }
+        # Brand without models; model with a kit but no sizes; model without kits
+        assert index.lookup("Hyundai", "Tucson")["brand"] == "Hyundai"
+        for brand, model in (("Kia", "Ceed"), ("Toyota", "Camry")):
+            assert index.lookup(brand, model)["message"] == "Розміри шин не знайдено"
+
+    def test_years_capped(self) -> None:
+        sizes = [(30, year, 205, 55, Decimal("16"), 1, 0) for year in range(2000, 2015)]
+        result = VehicleIndex(_BRANDS, _MODELS, sizes).lookup("Kia", "Sportage")
+        assert result["years"] == list(range(2014, 2004, -1))
+
+
+class TestStoreClientWithIndex:
+    @pytest.mark.asyncio
+    async def test_answered_without_db(self, index: VehicleIndex) -> None:
+        client = StoreClient(
+            base_url="http://localhost",
+            api_key="test",
+            db_engine=MagicMock(),
+            vehicle_index=MagicMock(index=index),
+        )
+        result = await client.get_vehicle_tire_sizes(brand="Кіа", model="Спортейдж", year=2022)
+
+        assert result["found"] is True
+        assert result["model"] == "Sportage"
+        client._db_engine.connect.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_db_path_before_first_build(self) -> None:
+        client = StoreClient(
+            base_url="http://localhost",
+            api_key="test",
+            db_engine=None,
+            vehicle_index=MagicMock(index=None),
+        )
+        result = await client.get_vehicle_tire_sizes(brand="Kia", model="Sportage")
+        assert "недоступна" in result["message"]
+
+
+class TestVehicleIndexStore:
+    @pytest.mark.asyncio
+    async def test_failed_rebuild_keeps_previous_index(self) -> None:
+        store = VehicleIndexStore(MagicMock(), MagicMock())
+        with patch.object(store, "_load", AsyncMock(return_value=(_BRANDS, _MODELS, _SIZES))):
+            first = await store.rebuild()
+        with patch.object(store, "_load", AsyncMock(side_effect=RuntimeError("db down"))):
+            assert await store.rebuild() is first
+
+        assert first is not None
+        assert first.version == 1
+        assert len(first) == len(_MODELS)
+
+    def test_store_without_build_fails_at_construction(self) -> None:
+        class _NoBuild(IndexStore):
+            channel = "test:index"
+            refresh_interval = 60.0
+
+        with pytest.raises(TypeError, match="_build"):
+            _NoBuild(MagicMock(), MagicMock())  # type: ignore[abstract]
@@ -217,7 +217,7 @@ class TestRescrapeWatchedPages:
 
         with (
             patch("src.tasks.scraper_tasks.get_settings") as mock_settings,
-            patch("src.tasks.scraper_tasks.create_async_engine", return_value=mock_engine),
+            patch("sqlalchemy.ext.asyncio.create_async_engine", return_value=mock_engine),
             patch("src.tasks.scraper_tasks._get_scraper_config") as mock_config,
         ):
             mock_settings.return_value = MagicMock()
@@ -293,7 +293,7 @@ class TestRescrapeWatchedPages:
 
         with (
             patch("src.tasks.scraper_tasks.get_settings") as mock_settings,
-            patch("src.tasks.scraper_tasks.create_async_engine", return_value=mock_engine),
+            patch("sqlalchemy.ext.asyncio.create_async_engine", return_value=mock_engine),
             patch("src.tasks.scraper_tasks._get_scraper_config") as mock_config,
         ):
             mock_settings.return_value = MagicMock()
@@ -0,0 +1,93 @@
+"""Unit tests for the per-process Celery async runtime."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.tasks import worker_runtime
+from src.tasks.worker_runtime import (
+    get_task_engine,
+    init_worker_runtime,
+    release_task_engine,
+    run_async,
+    shutdown_worker_runtime,
+)
+
+_PATCH_ENGINE = "sqlalchemy.ext.asyncio.create_async_engine"
+
+
+def _new_engine(*_args: Any, **_kwargs: Any) -> MagicMock:
+    engine = MagicMock()
+    engine.dispose = AsyncMock()
+    return engine
+
+
+async def _use_engine() -> tuple[Any, asyncio.AbstractEventLoop]:
+    engine = get_task_engine()
+    try:
+        return engine, asyncio.get_running_loop()
+    finally:
+        await release_task_engine(engine)
+
+
+@pytest.fixture
+def runtime():  # type: ignore[no-untyped-def]
+    init_worker_runtime()
+    yield
+    shutdown_worker_runtime()
+
+
+class TestWithoutRuntime:
+    def test_each_task_gets_its_own_engine_and_loop(self) -> None:
+        with patch(_PATCH_ENGINE, side_effect=_new_engine) as create:
+            first, _ = run_async(_use_engine())
+            second, _ = run_async(_use_engine())
+
+        assert first is not second
+        assert create.call_count == 2
+        first.dispose.assert_awaited_once()
+        second.dispose.assert_awaited_once()
+
+
+class TestWorkerRuntime:
+    @pytest.mark.usefixtures("runtime")
+    def test_tasks_share_loop_and_pooled_engine(self) -> None:
+        with patch(_PATCH_ENGINE, side_effect=_new_engine) as create:
+            first, loop_a = run_async(_use_engine())
+            second, loop_b = run_async(_use_engine())
+
+        assert first is second
+        assert loop_a is loop_b
+        create.assert_called_once()
+        assert create.call_args.kwargs["pool_size"] >= 1
+        first.dispose.assert_not_awaited()
+
+        shutdown_worker_runtime()
+
+        first.dispose.assert_awaited_once()
+        assert worker_runtime._engine is None
+
+    @pytest.mark.usefixtures("runtime")
+    def test_interrupted_task_is_cancelled_before_next_task(self) -> None:
+        cancelled = []
+
+        async def _slow() -> None:
+            asyncio.get_running_loop().call_later(0.01, _interrupt)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        def _interrupt() -> None:
+            raise KeyboardInterrupt  # stands in for SoftTimeLimitExceeded from the signal
+
+        with pytest.raises(KeyboardInterrupt):
+            run_async(_slow())
+
+        assert cancelled == [True]
+        assert run_async(asyncio.sleep(0, result="next")) == "next"